@@ -46,6 +46,11 @@ async def get_db(request: Request) -> InfrahubDatabase:
     return request.app.state.db.start_session()
 
 
+async def get_read_db(request: Request) -> InfrahubDatabase:
+    """Return a read-only session, routed to the read replicas if some are configured."""
+    return request.app.state.db.start_session(read_only=True)
+
+
 async def get_access_token(
     request: Request, jwt_header: HTTPAuthorizationCredentials = Depends(jwt_scheme)
 ) -> AccountSession:
@@ -96,6 +101,13 @@ async def get_branch_dep(
     return await registry.get_branch(db=db, branch=branch_name)
 
 
+async def get_read_branch_dep(
+    db: InfrahubDatabase = Depends(get_read_db),
+    branch_name: Optional[str] = Query(None, alias="branch", description="Name of the branch to use for the query"),
+) -> Branch:
+    return await registry.get_branch(db=db, branch=branch_name)
+
+
 async def get_current_user(
     request: Request,
     jwt_header: HTTPAuthorizationCredentials = Depends(jwt_scheme),
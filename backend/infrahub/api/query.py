@@ -1,16 +1,16 @@
 from __future__ import annotations
 
+import hashlib
 from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, Body, Depends, Path, Query, Request
-from graphql import graphql
 from pydantic import BaseModel, Field
 
 from infrahub.api.dependencies import BranchParams, get_branch_params, get_current_user, get_db
 from infrahub.core import registry
 from infrahub.core.constants import InfrahubKind
 from infrahub.database import InfrahubDatabase  # noqa: TCH001
-from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
+from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer, stored_query_cache
 from infrahub.graphql.api.dependencies import build_graphql_query_permission_checker
 from infrahub.graphql.initialization import prepare_graphql_params
 from infrahub.graphql.metrics import (
@@ -51,17 +51,30 @@ async def execute_query(
     permission_checker: GraphQLQueryPermissionChecker,
     account_session: AccountSession,
 ) -> dict[str, Any]:
+    # Only the name and the text of the query are required to execute it, the other attributes are not loaded
     gql_query = await registry.manager.get_one_by_id_or_default_filter(
-        db=db, id=query_id, kind=InfrahubKind.GRAPHQLQUERY, branch=branch_params.branch, at=branch_params.at
+        db=db,
+        id=query_id,
+        kind=InfrahubKind.GRAPHQLQUERY,
+        fields={"name": {"value": None}, "query": {"value": None}},
+        branch=branch_params.branch,
+        at=branch_params.at,
     )
+    query_value: str = gql_query.query.value  # type: ignore[attr-defined]
 
     gql_params = prepare_graphql_params(
         db=db, branch=branch_params.branch, at=branch_params.at, account_session=account_session
     )
+
+    # The query is compiled once per version of the stored query and per schema, any update of the query changes its checksum
+    query_checksum = hashlib.md5(query_value.encode(), usedforsecurity=False).hexdigest()
+    schema_hash = registry.schema.get_schema_branch(name=branch_params.branch.name).get_hash()
     analyzed_query = InfrahubGraphQLQueryAnalyzer(
-        query=gql_query.query.value,  # type: ignore[attr-defined]
+        query=query_value,
+        query_variables=params,
         schema=gql_params.schema,
         branch=branch_params.branch,
+        data=stored_query_cache.get(key=(gql_query.id, query_checksum, schema_hash), query=query_value),
     )
     await permission_checker.check(
         db=db,
@@ -80,13 +93,7 @@ async def execute_query(
     }
 
     with GRAPHQL_DURATION_METRICS.labels(**labels).time():
-        result = await graphql(
-            schema=gql_params.schema,
-            source=gql_query.query.value,  # type: ignore[attr-defined]
-            context_value=gql_params.context,
-            root_value=None,
-            variable_values=params,
-        )
+        result = await analyzed_query.execute(context_value=gql_params.context, variable_values=params)
 
     data = extract_data(query_name=gql_query.name.value, result=result)  # type: ignore[attr-defined]
 
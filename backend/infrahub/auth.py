@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+import time
 import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import TYPE_CHECKING, Callable, Optional
 
 import bcrypt
 import jwt
+from prometheus_client import Counter, Histogram
 from pydantic import BaseModel
 
 from infrahub import config, models
@@ -24,6 +29,25 @@ if TYPE_CHECKING:
 
 # from ..datatypes import AuthResult
 
+METRIC_PREFIX = "infrahub_auth"
+
+AUTH_VALIDATION_TIME_METRICS = Histogram(
+    f"{METRIC_PREFIX}_validation_seconds",
+    "Time to validate the credentials of a request",
+    labelnames=["type"],
+    buckets=[0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1],
+)
+
+API_KEY_CACHE_HITS = Counter(
+    f"{METRIC_PREFIX}_api_key_cache_hits",
+    "Number of API keys found in the cache of the API keys validated recently",
+)
+
+API_KEY_CACHE_MISSES = Counter(
+    f"{METRIC_PREFIX}_api_key_cache_misses",
+    "Number of API keys that had to be validated with the database",
+)
+
 
 class AuthType(str, Enum):
     NONE = "none"
@@ -47,6 +71,66 @@ class AccountSession(BaseModel):
         return self.auth_type == AuthType.JWT
 
 
+@dataclass
+class CachedApiKey:
+    account_id: str
+    role: str
+    expires_at: float
+
+
+class ApiKeyCache:
+    """Size-bounded cache of the API keys validated recently, with the active account they belong to.
+
+    The entries expire after a short time, they are also evicted when the account or the tokens are modified.
+    The API keys are only stored hashed.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, CachedApiKey] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _get_key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[CachedApiKey]:
+        key = self._get_key(token=token)
+        entry = self._entries.get(key)
+        if entry and entry.expires_at > time.monotonic():
+            self._entries.move_to_end(key)
+            API_KEY_CACHE_HITS.inc()
+            return entry
+
+        if entry:
+            del self._entries[key]
+        API_KEY_CACHE_MISSES.inc()
+        return None
+
+    def set(self, token: str, account_id: str, role: str) -> None:
+        ttl = config.SETTINGS.security.api_key_cache_ttl
+        max_size = config.SETTINGS.security.api_key_cache_size
+        if not ttl or not max_size:
+            return
+
+        key = self._get_key(token=token)
+        self._entries[key] = CachedApiKey(account_id=account_id, role=role, expires_at=time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > max_size:
+            self._entries.popitem(last=False)
+
+    def evict_account(self, account_id: str) -> None:
+        for key in [key for key, entry in self._entries.items() if entry.account_id == account_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+api_key_cache = ApiKeyCache()
+
+
 async def validate_active_account(db: InfrahubDatabase, account_id: str) -> None:
     account: CoreGenericAccount = await NodeManager.get_one(db=db, id=account_id, raise_on_error=True)
     if account.status.value != AccountStatus.ACTIVE.value:
@@ -202,6 +286,11 @@ async def authentication_token(
 
 
 async def validate_jwt_access_token(token: str) -> AccountSession:
+    with AUTH_VALIDATION_TIME_METRICS.labels(AuthType.JWT.value).time():
+        return _validate_jwt_access_token(token=token)
+
+
+def _validate_jwt_access_token(token: str) -> AccountSession:
     try:
         payload = jwt.decode(token, config.SETTINGS.security.secret_key, algorithms=["HS256"])
         account_id = payload["sub"]
@@ -237,11 +326,16 @@ async def validate_jwt_refresh_token(db: InfrahubDatabase, token: str) -> models
 
 
 async def validate_api_key(db: InfrahubDatabase, token: str) -> AccountSession:
-    account_id, role = await validate_token(token=token, db=db)
-    if not account_id:
-        raise AuthorizationError("Invalid token")
-
-    await validate_active_account(db=db, account_id=str(account_id))
+    with AUTH_VALIDATION_TIME_METRICS.labels(AuthType.API.value).time():
+        if cached_api_key := api_key_cache.get(token=token):
+            account_id, role = cached_api_key.account_id, cached_api_key.role
+        else:
+            account_id, role = await validate_token(token=token, db=db)
+            if not account_id:
+                raise AuthorizationError("Invalid token")
+
+            await validate_active_account(db=db, account_id=str(account_id))
+            api_key_cache.set(token=token, account_id=account_id, role=role)
 
     # The read-only account role is deprecated and will only be used for anonymous access
     role = "read-write" if role == "read-only" else role
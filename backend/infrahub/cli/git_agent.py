@@ -140,7 +140,7 @@ async def start(
     initialize_lock(service=service)
 
     async with service.database.start_session() as db:
-        await initialization(db=db)
+        await initialization(db=db, cache=service.cache)
 
     await service.component.refresh_schema_hash()
 
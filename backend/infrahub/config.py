@@ -182,6 +182,15 @@ class StorageSettings(BaseSettings):
     s3: S3StorageSettings = S3StorageSettings()
 
 
+class DatabaseReadReplicaSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="INFRAHUB_DB_READ_REPLICA_")
+    addresses: list[str] = Field(
+        default_factory=list,
+        description="List of read replicas (address:port) used for the read-only sessions, "
+        "the protocol and the credentials of the main database are used to connect to them",
+    )
+
+
 class DatabaseSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="INFRAHUB_DB_")
     db_type: DatabaseType = Field(
@@ -210,6 +219,17 @@ class DatabaseSettings(BaseSettings):
     retry_limit: int = Field(
         default=3, description="Maximum number of times a transient issue in a transaction should be retried."
     )
+    read_replica: DatabaseReadReplicaSettings = DatabaseReadReplicaSettings()
+    diff_partitions: int = Field(
+        default=1,
+        ge=1,
+        description="Number of partitions, based on the kind of the nodes, the calculation of a diff is split into.",
+    )
+    diff_parallelism: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of diff partitions calculated, or batches of diff nodes saved, concurrently, each in its own session.",
+    )
 
     @property
     def database_name(self) -> str:
@@ -320,6 +340,11 @@ class ApiSettings(BaseSettings):
     cors_allow_credentials: bool = Field(
         default=True, description="If True, cookies will be allowed to be included in cross-site HTTP requests"
     )
+    schema_history_cache_size: int = Field(
+        default=256,
+        ge=0,
+        description="Maximum size, in MB, of the schemas loaded to query the graph at a time in the past kept in memory",
+    )
 
 
 class GitSettings(BaseSettings):
@@ -531,6 +556,12 @@ class SecuritySettings(BaseSettings):
     secret_key: str = Field(
         default_factory=generate_uuid, description="The secret key used to validate authentication tokens"
     )
+    api_key_cache_ttl: int = Field(
+        default=30,
+        ge=0,
+        description="Time (in seconds) an API key validated is kept in the cache, 0 to disable the cache",
+    )
+    api_key_cache_size: int = Field(default=10000, ge=0, description="Maximum number of API keys kept in the cache")
     oauth2_providers: list[Oauth2Provider] = Field(default_factory=list, description="The selected OAuth2 providers")
     oidc_providers: list[OIDCProvider] = Field(default_factory=list, description="The selected OIDC providers")
     _oauth2_settings: dict[str, SecurityOAuth2Settings] = PrivateAttr(default_factory=dict)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import ipaddress
 import re
 from enum import Enum
@@ -16,12 +17,7 @@ from infrahub import config
 from infrahub.core import registry
 from infrahub.core.constants import NULL_VALUE, AttributeDBNodeType, BranchSupportType, RelationshipStatus
 from infrahub.core.property import FlagPropertyMixin, NodePropertyData, NodePropertyMixin
-from infrahub.core.query.attribute import (
-    AttributeGetQuery,
-    AttributeUpdateFlagQuery,
-    AttributeUpdateNodePropertyQuery,
-    AttributeUpdateValueQuery,
-)
+from infrahub.core.query.attribute import AttributeGetQuery, AttributeUpdateBatchQuery
 from infrahub.core.query.node import AttributeFromDB, NodeListGetAttributeQuery
 from infrahub.core.timestamp import Timestamp
 from infrahub.core.utils import add_relationship, convert_ip_to_binary_str, update_relationships_to
@@ -34,6 +30,7 @@ from .constants.relationship_label import RELATIONSHIP_TO_NODE_LABEL, RELATIONSH
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
     from infrahub.core.node import Node
+    from infrahub.core.query import QueryResult
     from infrahub.core.schema import AttributeSchema
     from infrahub.database import InfrahubDatabase
 
@@ -75,6 +72,21 @@ class AttributeCreateData(BaseModel):
     node_type: AttributeDBNodeType = AttributeDBNodeType.DEFAULT
 
 
+class AttributeUpdateData(BaseModel):
+    uuid: str
+    branch: str
+    branch_level: int
+    node_type: AttributeDBNodeType = AttributeDBNodeType.DEFAULT
+    content: Optional[dict[str, Any]] = None
+    flag_properties: dict[str, bool] = Field(default_factory=dict)
+    node_properties: dict[str, str] = Field(default_factory=dict)
+    rel_ids_to_close: list[str] = Field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return self.content is not None or bool(self.flag_properties) or bool(self.node_properties)
+
+
 class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
     type: Optional[Union[type, tuple[type]]] = None
 
@@ -154,6 +166,8 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         if self.is_visible is None:
             self.is_visible = True
 
+        self._initial_state: Optional[tuple[Any, ...]] = None
+
     @property
     def is_enum(self) -> bool:
         return bool(self.schema.enum)
@@ -374,17 +388,26 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
 
         return True
 
-    async def _update(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> bool:
-        """Update the attribute in the database.
+    def _get_state(self) -> tuple[Any, ...]:
+        return (
+            copy.deepcopy(self.value),
+            self.is_default,
+            self.is_from_profile,
+            *(getattr(self, flag_name) for flag_name in self._flag_properties),
+            *(getattr(self, f"{prop_name}_id") for prop_name in self._node_properties),
+        )
 
-        Get the current value
-         - If the value is the same, do nothing
-         - If the value is inherited and is different, raise error (for now just ignore)
-         - If the value is different, create new node and update relationship
+    def reset_changes(self) -> None:
+        """Flag the current value and properties of the attribute as matching the database."""
+        self._initial_state = self._get_state()
 
-        """
+    @property
+    def has_changed(self) -> bool:
+        """Indicate if the value or the properties of the attribute might have changed since it has been loaded or saved."""
+        return self._initial_state is None or self._initial_state != self._get_state()
 
-        update_at = Timestamp(at)
+    def prepare_update(self) -> None:
+        """Validate the value of the attribute before an update and check if the value is still the default one."""
 
         # Validate if the value is still correct, will raise a ValidationError if not
         self.validate(value=self.value, name=self.name, schema=self.schema)
@@ -397,30 +420,29 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         ):
             self.is_default = False
 
-        query = await NodeListGetAttributeQuery.init(
-            db=db,
-            ids=[self.node.id],
-            fields={self.name: True},
-            branch=self.branch,
-            at=update_at,
-            include_source=True,
-            include_owner=True,
-        )
-        await query.execute(db=db)
-        current_attr_data, current_attr_result = query.get_result_by_id_and_name(self.node.id, self.name)
+    def get_update_data(
+        self, current_attr_data: AttributeFromDB, current_attr_result: QueryResult
+    ) -> AttributeUpdateData:
+        """Compare the attribute with its current version in the database and return the changes to apply.
 
+        Get the current value
+         - If the value is the same, do nothing
+         - If the value is inherited and is different, raise error (for now just ignore)
+         - If the value is different, create new node and update relationship
+        """
         branch = self.get_branch_based_on_support_type()
+        update_data = AttributeUpdateData(
+            uuid=self.id, branch=branch.name, branch_level=branch.hierarchy_level, node_type=self.get_db_node_type()
+        )
 
         # ---------- Update the Value ----------
-        if current_attr_data.content != self.to_db():
-            # Create the new AttributeValue and update the existing relationship
-            query = await AttributeUpdateValueQuery.init(db=db, attr=self, at=update_at)
-            await query.execute(db=db)
+        content = self.to_db()
+        if current_attr_data.content != content:
+            update_data.content = content
 
-            # TODO check that everything went well
             rel = current_attr_result.get_rel("r2")
             if rel.get("branch") == branch.name:
-                await update_relationships_to([rel.element_id], to=update_at, db=db)
+                update_data.rel_ids_to_close.append(rel.element_id)
 
         # ---------- Update the Flags ----------
         SUPPORTED_FLAGS = (
@@ -430,12 +452,11 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
 
         for flag_name, _, rel_name in SUPPORTED_FLAGS:
             if current_attr_data.flag_properties[flag_name] != getattr(self, flag_name):
-                query = await AttributeUpdateFlagQuery.init(db=db, attr=self, at=update_at, flag_name=flag_name)
-                await query.execute(db=db)
+                update_data.flag_properties[flag_name] = getattr(self, flag_name)
 
                 rel = current_attr_result.get(rel_name)
                 if rel.get("branch") == branch.name:
-                    await update_relationships_to([rel.element_id], to=update_at, db=db)
+                    update_data.rel_ids_to_close.append(rel.element_id)
 
         # ---------- Update the Node Properties ----------
         for prop_name in self._node_properties:
@@ -443,15 +464,39 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
                 prop_name in current_attr_data.node_properties
                 and current_attr_data.node_properties[prop_name].uuid == getattr(self, f"{prop_name}_id")
             ):
-                query = await AttributeUpdateNodePropertyQuery.init(
-                    db=db, attr=self, at=update_at, prop_name=prop_name, prop_id=getattr(self, f"{prop_name}_id")
-                )
-                await query.execute(db=db)
+                update_data.node_properties[prop_name] = getattr(self, f"{prop_name}_id")
 
                 rel = current_attr_result.get(f"rel_{prop_name}")
                 if rel and rel.get("branch") == branch.name:
-                    await update_relationships_to([rel.element_id], to=update_at, db=db)
+                    update_data.rel_ids_to_close.append(rel.element_id)
+
+        return update_data
+
+    async def _update(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> bool:
+        """Update the attribute in the database."""
+
+        update_at = Timestamp(at)
+
+        self.prepare_update()
+
+        query = await NodeListGetAttributeQuery.init(
+            db=db,
+            ids=[self.node.id],
+            fields={self.name: True},
+            branch=self.branch,
+            at=update_at,
+            include_source=True,
+            include_owner=True,
+        )
+        await query.execute(db=db)
+        current_attr_data, current_attr_result = query.get_result_by_id_and_name(self.node.id, self.name)
+
+        update_data = self.get_update_data(current_attr_data=current_attr_data, current_attr_result=current_attr_result)
+        if update_data.has_changes:
+            query = await AttributeUpdateBatchQuery.init(db=db, updates=[update_data], at=update_at)
+            await query.execute(db=db)
 
+        self.reset_changes()
         return True
 
     async def to_graphql(
@@ -1,13 +1,15 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from infrahub.core.branch import Branch
 from infrahub.core.node import Node
 from infrahub.core.node.constraints.interface import NodeConstraintInterface
 from infrahub.core.relationship.constraints.interface import RelationshipManagerConstraintInterface
 from infrahub.database import InfrahubDatabase
+from infrahub.exceptions import ValidationError
 
 if TYPE_CHECKING:
     from infrahub.core.relationship.model import RelationshipManager
+    from infrahub.core.schema import SchemaAttributePath
 
 
 class NodeConstraintRunner:
@@ -36,3 +38,45 @@ class NodeConstraintRunner:
             await relationship_manager.fetch_relationship_ids(db=self.db, force_refresh=True)
             for relationship_constraint in self.relationship_manager_constraints:
                 await relationship_constraint.check(relm=relationship_manager, node_schema=node.get_schema())
+
+    async def check_many(self, nodes: list[Node], field_filters: Optional[list[str]] = None) -> None:
+        """Run the constraints on each node, then make sure the nodes don't violate a uniqueness constraint between themselves.
+
+        The nodes are expected to be saved together, the checks against the database can't detect a conflict between them.
+        """
+        for node in nodes:
+            await self.check(node=node, field_filters=field_filters)
+
+        schema_branch = self.db.schema.get_schema_branch(name=self.branch.name)
+        existing_values: dict[tuple[str, tuple[str, ...], tuple[str, ...]], str] = {}
+        for node in nodes:
+            node_schema = node.get_schema()
+            path_groups = node_schema.get_unique_constraint_schema_attribute_paths(
+                schema_branch=schema_branch, include_unique_attributes=True
+            )
+            for path_group in path_groups:
+                field_names = tuple(
+                    path.relationship_schema.name if path.relationship_schema else path.attribute_schema.name  # type: ignore[union-attr]
+                    for path in path_group
+                )
+                if field_filters and not set(field_names) & set(field_filters):
+                    continue
+                values = await self._get_path_group_values(node=node, path_group=path_group)
+                if any(value is None for value in values):
+                    continue
+                key = (node_schema.kind, field_names, tuple(str(value) for value in values))
+                if existing_values.setdefault(key, node.get_id()) != node.get_id():
+                    error_msg = f"Violates uniqueness constraint '{'-'.join(field_names)}'"
+                    raise ValidationError([ValidationError({field_name: error_msg}) for field_name in field_names])
+
+    async def _get_path_group_values(self, node: Node, path_group: list["SchemaAttributePath"]) -> tuple[Any, ...]:
+        values = []
+        for path in path_group:
+            if path.relationship_schema:
+                relationship_manager: RelationshipManager = getattr(node, path.relationship_schema.name)
+                peer = await relationship_manager.get_peer(db=self.db)
+                values.append(peer.get_id() if peer else None)
+            elif path.attribute_schema:
+                attribute = getattr(node, path.attribute_schema.name)
+                values.append(getattr(attribute, path.attribute_property_name or "value"))
+        return tuple(values)
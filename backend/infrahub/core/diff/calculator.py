@@ -1,16 +1,45 @@
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Optional
+
+from infrahub import config
 from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.diff.query_parser import DiffQueryParser
-from infrahub.core.query.diff import DiffAllPathsQuery
+from infrahub.core.query.diff import DiffAllPathsQuery, DiffChangedFieldsQuery
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 
 from .model.path import CalculatedDiffs, NodeFieldSpecifier
 
 
+@dataclass
+class DiffKindPartition:
+    """Subset of the nodes of a diff, defined by their kind.
+
+    A partition without node_kinds includes all the kinds that are not excluded.
+    """
+
+    node_kinds: Optional[list[str]] = None
+    excluded_node_kinds: Optional[list[str]] = None
+
+
+@dataclass
+class DiffChangeJournal:
+    """Attributes and relationships changed on each branch of a diff during its timeframe."""
+
+    diff_branch_node_specifiers: set[NodeFieldSpecifier]
+    base_branch_node_specifiers: set[NodeFieldSpecifier]
+
+
 class DiffCalculator:
-    def __init__(self, db: InfrahubDatabase) -> None:
+    def __init__(
+        self, db: InfrahubDatabase, nb_partitions: Optional[int] = None, parallelism: Optional[int] = None
+    ) -> None:
         self.db = db
+        self.nb_partitions = nb_partitions or config.SETTINGS.database.diff_partitions
+        self.parallelism = parallelism or config.SETTINGS.database.diff_parallelism
 
     async def calculate_diff(
         self,
@@ -20,6 +49,109 @@ class DiffCalculator:
         to_time: Timestamp,
         previous_node_specifiers: set[NodeFieldSpecifier] | None = None,
     ) -> CalculatedDiffs:
+        partitions = self._get_partitions(base_branch=base_branch, diff_branch=diff_branch)
+        change_journal = None
+        # When the diff extends a previous one, only the fields changed during the timeframe have to be calculated
+        # instead of checking every field of the previous diff
+        if previous_node_specifiers and base_branch.name != diff_branch.name:
+            change_journal = await self._get_change_journal(
+                base_branch=base_branch, diff_branch=diff_branch, from_time=from_time, to_time=to_time
+            )
+
+        # The partitions are calculated in their own sessions, which wouldn't see the changes of an ongoing transaction
+        if len(partitions) == 1 or self.db.is_transaction:
+            diff_parser = await self._calculate_partition(
+                db=self.db,
+                base_branch=base_branch,
+                diff_branch=diff_branch,
+                from_time=from_time,
+                to_time=to_time,
+                previous_node_specifiers=previous_node_specifiers,
+                change_journal=change_journal,
+            )
+        else:
+            semaphore = asyncio.Semaphore(self.parallelism)
+
+            # The calculated diffs are stored, the partitions are read from the primary
+            # because a read replica could still be missing the latest changes of the branches
+            async def calculate_partition(partition: DiffKindPartition) -> DiffQueryParser:
+                async with semaphore, self.db.start_session(read_only=False) as db:
+                    return await self._calculate_partition(
+                        db=db,
+                        base_branch=base_branch,
+                        diff_branch=diff_branch,
+                        from_time=from_time,
+                        to_time=to_time,
+                        previous_node_specifiers=previous_node_specifiers,
+                        change_journal=change_journal,
+                        partition=partition,
+                    )
+
+            partition_parsers = await asyncio.gather(*[calculate_partition(partition) for partition in partitions])
+            diff_parser = partition_parsers[0]
+            for partition_parser in partition_parsers[1:]:
+                diff_parser.merge(partition_parser)
+
+        diff_parser.parse()
+        return CalculatedDiffs(
+            base_branch_name=base_branch.name,
+            diff_branch_name=diff_branch.name,
+            base_branch_diff=diff_parser.get_diff_root_for_branch(branch=base_branch.name),
+            diff_branch_diff=diff_parser.get_diff_root_for_branch(branch=diff_branch.name),
+        )
+
+    async def _get_change_journal(
+        self, base_branch: Branch, diff_branch: Branch, from_time: Timestamp, to_time: Timestamp
+    ) -> DiffChangeJournal:
+        node_specifiers_by_branch: dict[str, set[NodeFieldSpecifier]] = {}
+        for branch in (diff_branch, base_branch):
+            query = await DiffChangedFieldsQuery.init(db=self.db, branch=branch, diff_from=from_time, diff_to=to_time)
+            await query.execute(db=self.db)
+            node_specifiers_by_branch[branch.name] = {
+                NodeFieldSpecifier(node_uuid=node_uuid, field_name=field_name)
+                for node_uuid, field_name in query.get_node_field_specifiers()
+            }
+        return DiffChangeJournal(
+            diff_branch_node_specifiers=node_specifiers_by_branch[diff_branch.name],
+            base_branch_node_specifiers=node_specifiers_by_branch[base_branch.name],
+        )
+
+    def _get_partitions(self, base_branch: Branch, diff_branch: Branch) -> list[DiffKindPartition]:
+        """Split the kinds of the nodes of both branches into partitions of similar sizes.
+
+        The last partition excludes the kinds of all the other ones, to include the nodes with a kind no longer in the schema.
+        """
+        if self.nb_partitions <= 1:
+            return [DiffKindPartition()]
+
+        kinds: set[str] = set()
+        for branch in (base_branch, diff_branch):
+            schema_branch = registry.schema.get_schema_branch(name=branch.name)
+            kinds.update(schema_branch.node_names)
+            kinds.update(schema_branch.profile_names)
+
+        sorted_kinds = sorted(kinds)
+        partitions = [
+            DiffKindPartition(node_kinds=sorted_kinds[idx :: self.nb_partitions])
+            for idx in range(self.nb_partitions - 1)
+            if sorted_kinds[idx :: self.nb_partitions]
+        ]
+        excluded_node_kinds = [kind for partition in partitions for kind in partition.node_kinds or []]
+        partitions.append(DiffKindPartition(excluded_node_kinds=excluded_node_kinds))
+        return partitions
+
+    async def _calculate_partition(
+        self,
+        db: InfrahubDatabase,
+        base_branch: Branch,
+        diff_branch: Branch,
+        from_time: Timestamp,
+        to_time: Timestamp,
+        previous_node_specifiers: set[NodeFieldSpecifier] | None = None,
+        change_journal: Optional[DiffChangeJournal] = None,
+        partition: Optional[DiffKindPartition] = None,
+    ) -> DiffQueryParser:
+        partition = partition or DiffKindPartition()
         if diff_branch.name == registry.default_branch:
             diff_branch_from_time = from_time
         else:
@@ -32,41 +164,95 @@ class DiffCalculator:
             to_time=to_time,
         )
         branch_diff_query = await DiffAllPathsQuery.init(
-            db=self.db,
+            db=db,
             branch=diff_branch,
             base_branch=base_branch,
             diff_branch_from_time=diff_branch_from_time,
             diff_from=from_time,
             diff_to=to_time,
+            current_node_field_specifiers=[
+                (nfs.node_uuid, nfs.field_name) for nfs in change_journal.diff_branch_node_specifiers
+            ]
+            if change_journal
+            else None,
+            node_kinds=partition.node_kinds,
+            excluded_node_kinds=partition.excluded_node_kinds,
         )
-        await branch_diff_query.execute(db=self.db)
-        for query_result in branch_diff_query.get_results():
-            diff_parser.read_result(query_result=query_result)
+        previous_specifiers_by_node: dict[str, set[NodeFieldSpecifier]] = defaultdict(set)
+        for node_specifier in previous_node_specifiers or set():
+            previous_specifiers_by_node[node_specifier.node_uuid].add(node_specifier)
 
-        if base_branch.name != diff_branch.name:
-            branch_node_specifiers = diff_parser.get_node_field_specifiers_for_branch(branch_name=diff_branch.name)
-            new_node_field_specifiers = branch_node_specifiers - (previous_node_specifiers or set())
-            current_node_field_specifiers = (previous_node_specifiers or set()) - new_node_field_specifiers
-            base_diff_query = await DiffAllPathsQuery.init(
-                db=self.db,
-                branch=base_branch,
+        # The pages of results are grouped by node, so the nodes of a page can be completed with the paths
+        # of the base branch and finalized before reading the next page
+        async for query_results in branch_diff_query.stream_pages(db=db):
+            for query_result in query_results:
+                diff_parser.read_result(query_result=query_result)
+            if base_branch.name != diff_branch.name:
+                branch_node_specifiers = diff_parser.get_node_field_specifiers_for_branch(branch_name=diff_branch.name)
+                current_node_field_specifiers: set[NodeFieldSpecifier] = set()
+                for node_uuid in {nfs.node_uuid for nfs in branch_node_specifiers}:
+                    current_node_field_specifiers.update(previous_specifiers_by_node.pop(node_uuid, set()))
+                await self._read_base_branch_paths(
+                    db=db,
+                    diff_parser=diff_parser,
+                    base_branch=base_branch,
+                    diff_branch_from_time=diff_branch_from_time,
+                    from_time=from_time,
+                    to_time=to_time,
+                    new_node_field_specifiers=branch_node_specifiers - current_node_field_specifiers,
+                    current_node_field_specifiers=current_node_field_specifiers,
+                    change_journal=change_journal,
+                    partition=partition,
+                )
+            diff_parser.flush_nodes()
+
+        # Nodes of the previous diff without any change on the branch in this timeframe
+        if base_branch.name != diff_branch.name and previous_specifiers_by_node:
+            await self._read_base_branch_paths(
+                db=db,
+                diff_parser=diff_parser,
                 base_branch=base_branch,
                 diff_branch_from_time=diff_branch_from_time,
-                diff_from=from_time,
-                diff_to=to_time,
-                current_node_field_specifiers=[
-                    (nfs.node_uuid, nfs.field_name) for nfs in current_node_field_specifiers
-                ],
-                new_node_field_specifiers=[(nfs.node_uuid, nfs.field_name) for nfs in new_node_field_specifiers],
+                from_time=from_time,
+                to_time=to_time,
+                new_node_field_specifiers=set(),
+                current_node_field_specifiers=set().union(*previous_specifiers_by_node.values()),
+                change_journal=change_journal,
+                partition=partition,
             )
-            await base_diff_query.execute(db=self.db)
-            for query_result in base_diff_query.get_results():
-                diff_parser.read_result(query_result=query_result)
+            diff_parser.flush_nodes()
 
-        diff_parser.parse()
-        return CalculatedDiffs(
-            base_branch_name=base_branch.name,
-            diff_branch_name=diff_branch.name,
-            base_branch_diff=diff_parser.get_diff_root_for_branch(branch=base_branch.name),
-            diff_branch_diff=diff_parser.get_diff_root_for_branch(branch=diff_branch.name),
+        return diff_parser
+
+    async def _read_base_branch_paths(
+        self,
+        db: InfrahubDatabase,
+        diff_parser: DiffQueryParser,
+        base_branch: Branch,
+        diff_branch_from_time: Timestamp,
+        from_time: Timestamp,
+        to_time: Timestamp,
+        new_node_field_specifiers: set[NodeFieldSpecifier],
+        current_node_field_specifiers: set[NodeFieldSpecifier],
+        partition: DiffKindPartition,
+        change_journal: Optional[DiffChangeJournal] = None,
+    ) -> None:
+        # The fields of the previous diff can only have new changes if they were changed on the base branch
+        if change_journal:
+            current_node_field_specifiers &= change_journal.base_branch_node_specifiers
+        if not new_node_field_specifiers and not current_node_field_specifiers:
+            return
+        base_diff_query = await DiffAllPathsQuery.init(
+            db=db,
+            branch=base_branch,
+            base_branch=base_branch,
+            diff_branch_from_time=diff_branch_from_time,
+            diff_from=from_time,
+            diff_to=to_time,
+            current_node_field_specifiers=[(nfs.node_uuid, nfs.field_name) for nfs in current_node_field_specifiers],
+            new_node_field_specifiers=[(nfs.node_uuid, nfs.field_name) for nfs in new_node_field_specifiers],
+            node_kinds=partition.node_kinds,
+            excluded_node_kinds=partition.excluded_node_kinds,
         )
+        async for query_result in base_diff_query.stream(db=db):
+            diff_parser.read_result(query_result=query_result)
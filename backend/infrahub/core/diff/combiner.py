@@ -58,31 +58,41 @@ class DiffCombiner:
             raise RuntimeError("DiffCombiner is not initialized")
         return self._diff_branch_name
 
-    def _filter_nodes_to_keep(self, earlier_diff: EnrichedDiffRoot, later_diff: EnrichedDiffRoot) -> list[NodePair]:
-        filtered_node_pairs: list[NodePair] = []
-        for earlier_node in earlier_diff.nodes:
-            later_node: EnrichedDiffNode | None = None
-            if earlier_node.uuid in self._common_node_uuids:
-                later_node = self._later_nodes_by_uuid[earlier_node.uuid]
-            # this is an out-of-date parent
-            if (
-                earlier_node.action is DiffAction.UNCHANGED
-                and (later_node is None or later_node.action is DiffAction.UNCHANGED)
-                and earlier_node.uuid not in self._parent_node_uuids
-            ):
-                continue
-            if later_node is None:
-                filtered_node_pairs.append(NodePair(earlier=earlier_node))
-                continue
-            # if node was added and removed or vice-versa, remove it from the diff
-            if {earlier_node.action, later_node.action} == {DiffAction.ADDED, DiffAction.REMOVED}:
-                continue
-            filtered_node_pairs.append(NodePair(earlier=earlier_node, later=later_node))
-        for later_node in later_diff.nodes:
-            # these have already been handled
-            if later_node.uuid in self._common_node_uuids:
-                continue
-            filtered_node_pairs.append(NodePair(later=later_node))
+    @staticmethod
+    def _get_uuids_by_action(nodes_by_uuid: dict[str, EnrichedDiffNode]) -> dict[DiffAction, set[str]]:
+        uuids_by_action: dict[DiffAction, set[str]] = {action: set() for action in DiffAction}
+        for node_uuid, node in nodes_by_uuid.items():
+            uuids_by_action[node.action].add(node_uuid)
+        return uuids_by_action
+
+    def _filter_nodes_to_keep(self) -> list[NodePair]:
+        """Match the nodes of both diffs and drop the ones that cancel out, with set operations over their uuids."""
+        earlier_uuids_by_action = self._get_uuids_by_action(nodes_by_uuid=self._earlier_nodes_by_uuid)
+        later_uuids_by_action = self._get_uuids_by_action(nodes_by_uuid=self._later_nodes_by_uuid)
+        earlier_only_uuids = self._earlier_nodes_by_uuid.keys() - self._common_node_uuids
+        later_only_uuids = self._later_nodes_by_uuid.keys() - self._common_node_uuids
+
+        # these are out-of-date parents
+        uuids_to_drop = (
+            earlier_uuids_by_action[DiffAction.UNCHANGED]
+            & (earlier_only_uuids | later_uuids_by_action[DiffAction.UNCHANGED])
+        ) - self._parent_node_uuids
+        # if node was added and removed or vice-versa, remove it from the diff
+        uuids_to_drop |= self._common_node_uuids & (
+            (earlier_uuids_by_action[DiffAction.ADDED] & later_uuids_by_action[DiffAction.REMOVED])
+            | (earlier_uuids_by_action[DiffAction.REMOVED] & later_uuids_by_action[DiffAction.ADDED])
+        )
+
+        filtered_node_pairs = [
+            NodePair(earlier=self._earlier_nodes_by_uuid[node_uuid]) for node_uuid in earlier_only_uuids - uuids_to_drop
+        ]
+        filtered_node_pairs.extend(
+            NodePair(earlier=self._earlier_nodes_by_uuid[node_uuid], later=self._later_nodes_by_uuid[node_uuid])
+            for node_uuid in self._common_node_uuids - uuids_to_drop
+        )
+        filtered_node_pairs.extend(
+            NodePair(later=self._later_nodes_by_uuid[node_uuid]) for node_uuid in later_only_uuids
+        )
         return filtered_node_pairs
 
     def _should_include(self, earlier: DiffAction, later: DiffAction) -> bool:
@@ -314,24 +324,30 @@ class DiffCombiner:
             combined_relationships.add(copied)
         return combined_relationships
 
+    @staticmethod
+    def _copy_without_linked_nodes(node: EnrichedDiffNode) -> EnrichedDiffNode:
+        """Copy a node that is only in one of the diffs, without the nodes linked to its relationships.
+
+        The node has nothing to combine, so its attributes and relationship elements are shared with the given diff
+        instead of being copied. The linked nodes are linked again once all the nodes are combined.
+        """
+        copied_relationships = set()
+        for rel in node.relationships:
+            copied_rel = replace(rel, relationships=set(rel.relationships), nodes=set())
+            copied_rel.reset_summaries()
+            copied_relationships.add(copied_rel)
+        return replace(node, attributes=set(node.attributes), relationships=copied_relationships)
+
     def _combine_nodes(self, node_pairs: list[NodePair]) -> set[EnrichedDiffNode]:
         combined_nodes: set[EnrichedDiffNode] = set()
         for node_pair in node_pairs:
             if node_pair.earlier is None:
                 if node_pair.later is not None:
-                    copied = deepcopy(node_pair.later)
-                    for rel in copied.relationships:
-                        rel.nodes = set()
-                        rel.reset_summaries()
-                    combined_nodes.add(copied)
+                    combined_nodes.add(self._copy_without_linked_nodes(node=node_pair.later))
                 continue
             if node_pair.later is None:
                 if node_pair.earlier is not None:
-                    copied = deepcopy(node_pair.earlier)
-                    for rel in copied.relationships:
-                        rel.nodes = set()
-                        rel.reset_summaries()
-                    combined_nodes.add(copied)
+                    combined_nodes.add(self._copy_without_linked_nodes(node=node_pair.earlier))
                 continue
             combined_attributes = self._combine_attributes(
                 earlier_attributes=node_pair.earlier.attributes, later_attributes=node_pair.later.attributes
@@ -373,7 +389,7 @@ class DiffCombiner:
             (earlier_diffs.diff_branch_diff, later_diffs.diff_branch_diff),
         ):
             self._initialize(earlier_diff=earlier, later_diff=later)
-            filtered_node_pairs = self._filter_nodes_to_keep(earlier_diff=earlier, later_diff=later)
+            filtered_node_pairs = self._filter_nodes_to_keep()
             combined_nodes = self._combine_nodes(node_pairs=filtered_node_pairs)
             self._link_child_nodes(nodes=combined_nodes)
             combined_diffs.append(
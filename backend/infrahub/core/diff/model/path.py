@@ -16,6 +16,9 @@ from infrahub.core.timestamp import Timestamp
 
 from ..exceptions import InvalidCypherPathError
 
+# Separates the fields of the sort key of a diff node, lower than any printable character to sort on the kind first
+SORT_KEY_SEPARATOR = "\x1f"
+
 if TYPE_CHECKING:
     from neo4j.graph import Node as Neo4jNode
     from neo4j.graph import Path as Neo4jPath
@@ -281,6 +284,11 @@ class EnrichedDiffNode(BaseSummary):
     def __hash__(self) -> int:
         return hash(self.uuid)
 
+    @property
+    def sort_key(self) -> str:
+        """Position of the node in the pages of a diff, ordered by kind, label and uuid."""
+        return SORT_KEY_SEPARATOR.join((self.kind, self.label or "", self.uuid))
+
     def get_all_conflicts(self) -> list[EnrichedDiffConflict]:
         all_conflicts = []
         if self.conflict:
@@ -496,6 +504,12 @@ class EnrichedDiffs:
         )
 
 
+@dataclass
+class EnrichedDiffRootsPage:
+    diff_roots: list[EnrichedDiffRoot]
+    next_cursor: str | None = None
+
+
 @dataclass
 class CalculatedDiffs:
     base_branch_name: str
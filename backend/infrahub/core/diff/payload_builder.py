@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import copy
 from collections import defaultdict
 from typing import TYPE_CHECKING, Optional, Union
 
+from infrahub_sdk.utils import deep_merge_dict
+
 from infrahub.core.constants import DiffAction, RelationshipCardinality
 from infrahub.core.manager import NodeManager
 from infrahub.core.registry import registry
@@ -45,24 +48,55 @@ async def get_display_labels_per_kind(
     kind: str, ids: list[str], branch_name: str, db: InfrahubDatabase
 ) -> dict[str, str]:
     """Return the display_labels of a list of nodes of a specific kind."""
+    return await get_display_labels_per_branch(ids_per_kind={kind: ids}, branch_name=branch_name, db=db)
+
+
+async def get_display_labels_per_branch(
+    ids_per_kind: dict[str, list[str]], branch_name: str, db: InfrahubDatabase
+) -> dict[str, str]:
+    """Return the display_labels of a list of nodes of different kinds in a branch.
+
+    The attributes required by the display_labels of all the kinds are merged, to query all the nodes at once.
+    """
     branch = await registry.get_branch(branch=branch_name, db=db)
     schema_branch = db.schema.get_schema_branch(name=branch.name)
-    fields = schema_branch.generate_fields_for_display_label(name=kind)
-    nodes = await NodeManager.get_many(ids=ids, fields=fields, db=db, branch=branch)
+    fields: dict = {}
+    for kind in ids_per_kind:
+        kind_fields = schema_branch.generate_fields_for_display_label(name=kind)
+        if kind_fields:
+            fields = deep_merge_dict(dicta=fields, dictb=kind_fields)
+
+    ids = [node_id for kind_ids in ids_per_kind.values() for node_id in kind_ids]
+    # Without any attribute in the display_labels, the labels are generated from the kind and the id of the nodes
+    nodes = await NodeManager.get_many(ids=ids, fields=fields, include_attributes=bool(fields), db=db, branch=branch)
     return {node_id: await node.render_display_label(db=db) for node_id, node in nodes.items()}
 
 
 async def get_display_labels(nodes: dict[str, dict[str, list[str]]], db: InfrahubDatabase) -> dict[str, dict[str, str]]:
-    """Query the display_labels of a group of nodes organized per branch and per kind."""
-    response: dict[str, dict[str, str]] = {}
-    for branch_name, items in nodes.items():
-        if branch_name not in response:
-            response[branch_name] = {}
-        for kind, ids in items.items():
-            labels = await get_display_labels_per_kind(kind=kind, ids=ids, db=db, branch_name=branch_name)
-            response[branch_name].update(labels)
-
-    return response
+    """Query the display_labels of a group of nodes organized per branch and per kind.
+
+    The branches are queried concurrently, each in its own session, unless a transaction is in progress
+    in which case they are queried one after the other within the transaction. The labels are saved with
+    the diff, so the sessions read from the primary database and not from a replica that could be lagging.
+    """
+    if db.is_transaction:
+        return {
+            branch_name: await get_display_labels_per_branch(ids_per_kind=ids_per_kind, branch_name=branch_name, db=db)
+            for branch_name, ids_per_kind in nodes.items()
+        }
+
+    async def get_branch_display_labels(branch_name: str, ids_per_kind: dict[str, list[str]]) -> dict[str, str]:
+        async with db.start_session(read_only=False) as dbs:
+            return await get_display_labels_per_branch(ids_per_kind=ids_per_kind, branch_name=branch_name, db=dbs)
+
+    branch_names = list(nodes.keys())
+    labels_per_branch = await asyncio.gather(
+        *[
+            get_branch_display_labels(branch_name=branch_name, ids_per_kind=nodes[branch_name])
+            for branch_name in branch_names
+        ]
+    )
+    return dict(zip(branch_names, labels_per_branch))
 
 
 class DiffPayloadBuilder:
@@ -1,11 +1,13 @@
 from typing import Any
 
+from typing_extensions import Self
+
 from infrahub import config
 from infrahub.core.query import Query, QueryType
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 
-from ..model.path import TrackingId
+from ..model.path import SORT_KEY_SEPARATOR, TrackingId
 from .filters import EnrichedDiffQueryFilters
 
 QUERY_MATCH_NODES = """
@@ -41,6 +43,7 @@ class EnrichedDiffGetQuery(Query):
         to_time: Timestamp | None = None,
         tracking_id: TrackingId | None = None,
         diff_ids: list[str] | None = None,
+        after: str | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -51,6 +54,8 @@ class EnrichedDiffGetQuery(Query):
         self.max_depth = max_depth
         self.tracking_id = tracking_id
         self.diff_ids = diff_ids
+        self.after = after
+        self.next_cursor: str | None = None
         self.filters = filters or EnrichedDiffQueryFilters()
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
@@ -63,6 +68,8 @@ class EnrichedDiffGetQuery(Query):
             "diff_ids": self.diff_ids,
             "limit": self.limit or config.SETTINGS.database.query_size_limit,
             "offset": self.offset,
+            "after": self.after,
+            "sort_key_separator": SORT_KEY_SEPARATOR,
         }
         # ruff: noqa: E501
         self.add_to_query(query=QUERY_MATCH_NODES)
@@ -79,26 +86,26 @@ class EnrichedDiffGetQuery(Query):
             self.add_to_query(query=query_filters)
 
         query_2 = """
-        // group by diff node uuid for pagination
-        WITH diff_node.uuid AS diff_node_uuid, diff_node.kind AS diff_node_kind, collect([diff_root, diff_node]) AS node_root_tuples
-        // order by kind and latest label for each diff_node uuid
-        CALL {
-            WITH node_root_tuples
-            UNWIND node_root_tuples AS nrt
-            WITH nrt[0] AS diff_root, nrt[1] AS diff_node
-            ORDER BY diff_root.from_time DESC
-            RETURN diff_node.label AS latest_node_label
-            LIMIT 1
-        }
-        WITH diff_node_kind, node_root_tuples, latest_node_label
-        ORDER BY diff_node_kind, latest_node_label
+        // the sort key (kind, label and uuid) of the nodes of the diffs saved without one is computed
+        WITH diff_root, diff_node, COALESCE(
+            diff_node.sort_key,
+            diff_node.kind + $sort_key_separator + COALESCE(diff_node.label, "") + $sort_key_separator + diff_node.uuid
+        ) AS sort_key
+        // group by diff node uuid for pagination, ordered by the sort key of the latest version of each diff_node uuid
+        // the cursor is applied after grouping, the versions of a node can have different sort keys
+        WITH diff_root, diff_node, sort_key
+        ORDER BY diff_root.from_time DESC
+        WITH diff_node.uuid AS diff_node_uuid, collect([diff_root, diff_node]) AS node_root_tuples, head(collect(sort_key)) AS latest_sort_key
+        WHERE $after IS NULL OR latest_sort_key > $after
+        ORDER BY latest_sort_key
         SKIP COALESCE($offset, 0)
-        LIMIT $limit
+        // one more node than the limit to know if there is a next page
+        LIMIT $limit + 1
         UNWIND node_root_tuples AS nrt
-        WITH nrt[0] AS diff_root, nrt[1] AS diff_node
-        WITH diff_root, diff_node
+        WITH nrt[0] AS diff_root, nrt[1] AS diff_node, latest_sort_key
+        WITH diff_root, diff_node, latest_sort_key
         // if depth limit, make sure not to exceed it when traversing linked nodes
-        WITH diff_root, diff_node
+        WITH diff_root, diff_node, latest_sort_key
         // -------------------------------------
         // Retrieve Parents
         // -------------------------------------
@@ -109,12 +116,12 @@ class EnrichedDiffGetQuery(Query):
             ORDER BY size(nodes(parents_path)) DESC
             LIMIT 1
         }
-        WITH diff_root, diff_node, parents_path
+        WITH diff_root, diff_node, latest_sort_key, parents_path
         // -------------------------------------
         // Retrieve conflicts
         // -------------------------------------
         OPTIONAL MATCH (diff_node)-[:DIFF_HAS_CONFLICT]->(diff_node_conflict:DiffConflict)
-        WITH diff_root, diff_node, parents_path, diff_node_conflict
+        WITH diff_root, diff_node, latest_sort_key, parents_path, diff_node_conflict
         // -------------------------------------
         // Retrieve Attributes
         // -------------------------------------
@@ -128,7 +135,7 @@ class EnrichedDiffGetQuery(Query):
             RETURN diff_attribute, diff_attr_property, diff_attr_property_conflict
             ORDER BY diff_attribute.name, diff_attr_property.property_type
         }
-        WITH diff_root, diff_node, parents_path, diff_node_conflict, collect([diff_attribute, diff_attr_property, diff_attr_property_conflict]) as diff_attributes
+        WITH diff_root, diff_node, latest_sort_key, parents_path, diff_node_conflict, collect([diff_attribute, diff_attr_property, diff_attr_property_conflict]) as diff_attributes
         // -------------------------------------
         // Retrieve Relationships
         // -------------------------------------
@@ -150,6 +157,7 @@ class EnrichedDiffGetQuery(Query):
         WITH
             diff_root,
             diff_node,
+            latest_sort_key,
             parents_path,
             diff_node_conflict,
             diff_attributes,
@@ -161,9 +169,31 @@ class EnrichedDiffGetQuery(Query):
         self.return_labels = [
             "diff_root",
             "diff_node",
+            "latest_sort_key",
             "parents_path",
             "diff_node_conflict",
             "diff_attributes",
             "diff_relationships",
         ]
         self.order_by = ["diff_root.diff_branch_name ASC", "diff_root.from_time ASC", "diff_node.label ASC"]
+
+    async def execute(self, db: InfrahubDatabase) -> Self:
+        await super().execute(db=db)
+
+        # The query returns the nodes of one more sort key than the limit, only to find out if there is a next page
+        self.next_cursor = None
+        sort_keys = sorted(
+            {sort_key for result in self.results if (sort_key := result.get_as_str(label="latest_sort_key"))}
+        )
+        if len(sort_keys) > self.params["limit"]:
+            self.next_cursor = sort_keys[self.params["limit"] - 1]
+            self.results = [
+                result
+                for result in self.results
+                if (result.get_as_str(label="latest_sort_key") or "") <= self.next_cursor
+            ]
+        return self
+
+    def get_next_cursor(self) -> str | None:
+        """Return the cursor of the next page, or None if this page is the last one."""
+        return self.next_cursor
@@ -96,6 +96,8 @@ WITH node_details.root_uuid AS root_uuid, node_details.node_map AS node_map
 CALL {
     WITH root_uuid, node_map
     MATCH (diff_root {uuid: root_uuid})
+    // skip the nodes already saved by a previous attempt
+    WHERE NOT exists((diff_root)-[:DIFF_HAS_NODE]->(:DiffNode {uuid: node_map.node_properties.uuid}))
     CREATE (diff_root)-[:DIFF_HAS_NODE]->(diff_node:DiffNode)
     SET diff_node = node_map.node_properties
     // -------------------------
@@ -291,6 +293,7 @@ CALL {
                 "uuid": enriched_node.uuid,
                 "kind": enriched_node.kind,
                 "label": enriched_node.label,
+                "sort_key": enriched_node.sort_key,
                 "changed_at": enriched_node.changed_at.to_string() if enriched_node.changed_at else None,
                 "action": enriched_node.action.value,
                 "path_identifier": enriched_node.path_identifier,
@@ -322,15 +325,18 @@ class EnrichedNodesLinkQuery(Query):
     type = QueryType.WRITE
     insert_return = False
 
-    def __init__(self, enriched_diffs: EnrichedDiffs, **kwargs: Any) -> None:
+    def __init__(self, node_create_batch: list[EnrichedNodeCreateRequest], **kwargs: Any) -> None:
         super().__init__(**kwargs)
-        self.enriched_diffs = enriched_diffs
+        self.node_create_batch = node_create_batch
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
         parent_links_list = []
-        for diff_root in (self.enriched_diffs.base_branch_diff, self.enriched_diffs.diff_branch_diff):
-            for node in diff_root.nodes:
-                parent_links_list.extend(self._build_node_parent_links(enriched_node=node, root_uuid=diff_root.uuid))
+        for node_create_request in self.node_create_batch:
+            parent_links_list.extend(
+                self._build_node_parent_links(
+                    enriched_node=node_create_request.node, root_uuid=node_create_request.root_uuid
+                )
+            )
         self.params = {"node_links_list": parent_links_list}
         query = """
 UNWIND $node_links_list AS node_link_details
@@ -351,8 +357,7 @@ CALL {
         self.add_to_query(query)
 
     def _build_node_parent_links(self, enriched_node: EnrichedDiffNode, root_uuid: str) -> list[dict[str, str]]:
-        if not enriched_node.relationships:
-            return []
+        """Return the links to the children of the node, the links of the children are built with their own batch."""
         parent_links = []
         for relationship in enriched_node.relationships:
             for child_node in relationship.nodes:
@@ -364,5 +369,4 @@ CALL {
                         "root_uuid": root_uuid,
                     }
                 )
-                parent_links.extend(self._build_node_parent_links(enriched_node=child_node, root_uuid=root_uuid))
         return parent_links
@@ -404,7 +404,8 @@ class DiffRootIntermediate:
     branch: str
     nodes_by_id: dict[str, DiffNodeIntermediate] = field(default_factory=dict)
 
-    def to_diff_root(self, from_time: Timestamp, to_time: Timestamp) -> DiffRoot:
+    def pop_diff_nodes(self, from_time: Timestamp) -> list[DiffNode]:
+        """Finalize the nodes read so far and release their intermediate representation."""
         nodes = []
         for node in self.nodes_by_id.values():
             if node.is_empty:
@@ -412,7 +413,8 @@ class DiffRootIntermediate:
             diff_node = node.to_diff_node(from_time=from_time)
             if diff_node.action is not DiffAction.UNCHANGED:
                 nodes.append(diff_node)
-        return DiffRoot(uuid=self.uuid, branch=self.branch, nodes=nodes, from_time=from_time, to_time=to_time)
+        self.nodes_by_id = {}
+        return nodes
 
 
 class DiffQueryParser:
@@ -435,7 +437,9 @@ class DiffQueryParser:
         else:
             self.diff_branched_from_time = Timestamp(diff_branch.get_branched_from())
         self._diff_root_by_branch: dict[str, DiffRootIntermediate] = {}
+        self._final_nodes_by_branch: dict[str, list[DiffNode]] = {}
         self._final_diff_root_by_branch: dict[str, DiffRoot] = {}
+        self._base_diff_has_changes = False
 
     def get_branches(self) -> set[str]:
         return set(self._final_diff_root_by_branch.keys())
@@ -463,15 +467,36 @@ class DiffQueryParser:
             )
         return node_field_specifiers
 
+    def merge(self, other: DiffQueryParser) -> None:
+        """Merge the nodes read by another parser of the same diff, the two parsers must have read distinct nodes."""
+        other.flush_nodes()
+        for branch, other_diff_root in other._diff_root_by_branch.items():
+            self._diff_root_by_branch.setdefault(branch, other_diff_root)
+            self._final_nodes_by_branch.setdefault(branch, []).extend(other._final_nodes_by_branch.get(branch, []))
+        self._base_diff_has_changes = self._base_diff_has_changes or other._base_diff_has_changes
+
     def read_result(self, query_result: QueryResult) -> None:
         path = query_result.get_path(label="diff_path")
         database_path = DatabasePath.from_cypher_path(cypher_path=path)
         self._parse_path(database_path=database_path)
 
+    def flush_nodes(self) -> None:
+        """Finalize the nodes read so far and release their intermediate representation.
+
+        All the paths of these nodes, on every branch, must have been read already. When the results are
+        grouped by node, calling this method between groups keeps the memory bounded by the size of a group.
+        """
+        self._apply_base_branch_previous_values()
+        self._track_base_diff_changes()
+        for branch, diff_root_intermediate in self._diff_root_by_branch.items():
+            diff_nodes = diff_root_intermediate.pop_diff_nodes(from_time=self._get_from_time(branch=branch))
+            self._final_nodes_by_branch.setdefault(branch, []).extend(diff_nodes)
+
     def parse(self) -> None:
-        if len(self._diff_root_by_branch) > 1:
-            self._apply_base_branch_previous_values()
-            self._remove_empty_base_diff_root()
+        self.flush_nodes()
+        if len(self._diff_root_by_branch) > 1 and not self._base_diff_has_changes:
+            self._diff_root_by_branch.pop(self.base_branch_name, None)
+            self._final_nodes_by_branch.pop(self.base_branch_name, None)
         self._finalize()
 
     def _parse_path(self, database_path: DatabasePath) -> None:
@@ -635,9 +660,9 @@ class DiffQueryParser:
                         base_diff_property_by_type[prop_type] = base_diff_property
                 property_set.update({bdp for bdp in base_diff_property_by_type.values() if bdp})
 
-    def _remove_empty_base_diff_root(self) -> None:
+    def _track_base_diff_changes(self) -> None:
         base_diff_root = self._diff_root_by_branch.get(self.base_branch_name)
-        if not base_diff_root:
+        if not base_diff_root or self._base_diff_has_changes:
             return
         for node_diff in base_diff_root.nodes_by_id.values():
             for attribute_diff in node_diff.attributes_by_name.values():
@@ -646,20 +671,26 @@ class DiffQueryParser:
                     if not ordered_diff_values:
                         continue
                     if ordered_diff_values[-1].changed_at >= self.diff_branched_from_time:
+                        self._base_diff_has_changes = True
                         return
             for relationship_diff in node_diff.relationships_by_name.values():
                 for diff_relationship_property_list in relationship_diff.properties_by_db_id.values():
                     for diff_relationship_property in diff_relationship_property_list:
                         if diff_relationship_property.changed_at >= self.diff_branched_from_time:
+                            self._base_diff_has_changes = True
                             return
-        del self._diff_root_by_branch[self.base_branch_name]
+
+    def _get_from_time(self, branch: str) -> Timestamp:
+        if branch == self.base_branch_name:
+            return self.diff_branched_from_time
+        return self.from_time
 
     def _finalize(self) -> None:
         for branch, diff_root_intermediate in self._diff_root_by_branch.items():
-            if branch == self.base_branch_name:
-                from_time = self.diff_branched_from_time
-            else:
-                from_time = self.from_time
-            self._final_diff_root_by_branch[branch] = diff_root_intermediate.to_diff_root(
-                from_time=from_time, to_time=self.to_time
+            self._final_diff_root_by_branch[branch] = DiffRoot(
+                uuid=diff_root_intermediate.uuid,
+                branch=branch,
+                nodes=self._final_nodes_by_branch.pop(branch, []),
+                from_time=self._get_from_time(branch=branch),
+                to_time=self.to_time,
             )
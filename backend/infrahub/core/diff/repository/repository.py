@@ -1,15 +1,19 @@
-from typing import Generator
+import asyncio
+import time
+from typing import Awaitable, Callable, Generator
 
 from infrahub import config
 from infrahub.core import registry
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase, retry_db_transaction
+from infrahub.database.metrics import DIFF_SAVE_THROUGHPUT
 from infrahub.exceptions import ResourceNotFoundError
 
 from ..model.path import (
     ConflictSelection,
     EnrichedDiffConflict,
     EnrichedDiffRoot,
+    EnrichedDiffRootsPage,
     EnrichedDiffs,
     EnrichedNodeCreateRequest,
     TimeRange,
@@ -30,9 +34,12 @@ from .deserializer import EnrichedDiffDeserializer
 class DiffRepository:
     MAX_SAVE_BATCH_SIZE: int = 100
 
-    def __init__(self, db: InfrahubDatabase, deserializer: EnrichedDiffDeserializer):
+    def __init__(
+        self, db: InfrahubDatabase, deserializer: EnrichedDiffDeserializer, parallelism: int | None = None
+    ) -> None:
         self.db = db
         self.deserializer = deserializer
+        self.parallelism = parallelism or config.SETTINGS.database.diff_parallelism
 
     async def get(
         self,
@@ -48,6 +55,40 @@ class DiffRepository:
         diff_ids: list[str] | None = None,
         include_empty: bool = False,
     ) -> list[EnrichedDiffRoot]:
+        diff_page = await self.get_page(
+            base_branch_name=base_branch_name,
+            diff_branch_names=diff_branch_names,
+            from_time=from_time,
+            to_time=to_time,
+            filters=filters,
+            include_parents=include_parents,
+            limit=limit,
+            offset=offset,
+            tracking_id=tracking_id,
+            diff_ids=diff_ids,
+            include_empty=include_empty,
+        )
+        return diff_page.diff_roots
+
+    async def get_page(
+        self,
+        base_branch_name: str,
+        diff_branch_names: list[str],
+        from_time: Timestamp | None = None,
+        to_time: Timestamp | None = None,
+        filters: dict | None = None,
+        include_parents: bool = True,
+        limit: int | None = None,
+        offset: int | None = None,
+        tracking_id: TrackingId | None = None,
+        diff_ids: list[str] | None = None,
+        include_empty: bool = False,
+        after: str | None = None,
+    ) -> EnrichedDiffRootsPage:
+        """Get a page of the nodes of the diffs, starting after the cursor of the previous page.
+
+        Only the nodes of the page are deserialized, along with their parents if include_parents is set.
+        """
         final_max_depth = config.SETTINGS.database.max_depth_search_hierarchy
         final_limit = limit or config.SETTINGS.database.query_size_limit
         query = await EnrichedDiffGetQuery.init(
@@ -62,6 +103,7 @@ class DiffRepository:
             offset=offset,
             tracking_id=tracking_id,
             diff_ids=diff_ids,
+            after=after,
         )
         await query.execute(db=self.db)
         diff_roots = await self.deserializer.deserialize(
@@ -69,7 +111,7 @@ class DiffRepository:
         )
         if not include_empty:
             diff_roots = [dr for dr in diff_roots if len(dr.nodes) > 0]
-        return diff_roots
+        return EnrichedDiffRootsPage(diff_roots=diff_roots, next_cursor=query.get_next_cursor())
 
     async def get_pairs(
         self,
@@ -155,15 +197,56 @@ class DiffRepository:
         if node_requests:
             yield node_requests
 
-    @retry_db_transaction(name="enriched_diff_save")
     async def save(self, enriched_diffs: EnrichedDiffs) -> None:
-        root_query = await EnrichedDiffRootsCreateQuery.init(db=self.db, enriched_diffs=enriched_diffs)
-        await root_query.execute(db=self.db)
-        for node_create_batch in self._get_node_create_request_batch(enriched_diffs=enriched_diffs):
-            node_query = await EnrichedNodeBatchCreateQuery.init(db=self.db, node_create_batch=node_create_batch)
-            await node_query.execute(db=self.db)
-        link_query = await EnrichedNodesLinkQuery.init(db=self.db, enriched_diffs=enriched_diffs)
-        await link_query.execute(db=self.db)
+        """Save the roots of the diffs, then their nodes and finally the links between them, batch by batch.
+
+        Each batch is retried on its own and saving it again is a no-op, so a failed save can simply be run again.
+        """
+        start_time = time.monotonic()
+        await self._save_roots(db=self.db, enriched_diffs=enriched_diffs)
+        node_create_batches = list(self._get_node_create_request_batch(enriched_diffs=enriched_diffs))
+        # The links between the nodes can only be created once both the parents and the children exist
+        await self._save_batches(save_batch=self._save_node_batch, node_create_batches=node_create_batches)
+        await self._save_batches(save_batch=self._save_node_links, node_create_batches=node_create_batches)
+
+        duration = time.monotonic() - start_time
+        if duration > 0:
+            nb_nodes = sum(len(node_create_batch) for node_create_batch in node_create_batches)
+            DIFF_SAVE_THROUGHPUT.observe(nb_nodes / duration)
+
+    async def _save_batches(
+        self,
+        save_batch: Callable[[InfrahubDatabase, list[EnrichedNodeCreateRequest]], Awaitable[None]],
+        node_create_batches: list[list[EnrichedNodeCreateRequest]],
+    ) -> None:
+        # The batches saved in their own sessions wouldn't see the roots created in an ongoing transaction
+        if len(node_create_batches) <= 1 or self.db.is_transaction:
+            for node_create_batch in node_create_batches:
+                await save_batch(self.db, node_create_batch)
+            return
+
+        semaphore = asyncio.Semaphore(self.parallelism)
+
+        async def save_batch_in_session(node_create_batch: list[EnrichedNodeCreateRequest]) -> None:
+            async with semaphore, self.db.start_session(read_only=False) as db:
+                await save_batch(db, node_create_batch)
+
+        await asyncio.gather(*[save_batch_in_session(node_create_batch) for node_create_batch in node_create_batches])
+
+    @retry_db_transaction(name="enriched_diff_save_roots")
+    async def _save_roots(self, db: InfrahubDatabase, enriched_diffs: EnrichedDiffs) -> None:
+        root_query = await EnrichedDiffRootsCreateQuery.init(db=db, enriched_diffs=enriched_diffs)
+        await root_query.execute(db=db)
+
+    @retry_db_transaction(name="enriched_diff_save_nodes")
+    async def _save_node_batch(self, db: InfrahubDatabase, node_create_batch: list[EnrichedNodeCreateRequest]) -> None:
+        node_query = await EnrichedNodeBatchCreateQuery.init(db=db, node_create_batch=node_create_batch)
+        await node_query.execute(db=db)
+
+    @retry_db_transaction(name="enriched_diff_save_links")
+    async def _save_node_links(self, db: InfrahubDatabase, node_create_batch: list[EnrichedNodeCreateRequest]) -> None:
+        link_query = await EnrichedNodesLinkQuery.init(db=db, node_create_batch=node_create_batch)
+        await link_query.execute(db=db)
 
     async def summary(
         self,
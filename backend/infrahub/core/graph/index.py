@@ -8,6 +8,7 @@ node_indexes: list[IndexItem] = [
     IndexItem(name="node_kind", label="Node", properties=["kind"], type=IndexType.RANGE),
     IndexItem(name="attr_name", label="Attribute", properties=["name"], type=IndexType.RANGE),
     IndexItem(name="attr_uuid", label="Attribute", properties=["uuid"], type=IndexType.RANGE),
+    IndexItem(name="attr_value", label="AttributeValue", properties=["value"], type=IndexType.FULLTEXT),
     IndexItem(name="attr_ipnet_bin", label="AttributeIPNetwork", properties=["binary_address"], type=IndexType.RANGE),
     IndexItem(name="attr_iphost_bin", label="AttributeIPHost", properties=["binary_address"], type=IndexType.RANGE),
     IndexItem(name="rel_uuid", label="Relationship", properties=["uuid"], type=IndexType.RANGE),
@@ -19,4 +20,6 @@ rel_indexes: list[IndexItem] = [
     IndexItem(name="attr_branch", label="HAS_ATTRIBUTE", properties=["branch"], type=IndexType.RANGE),
     IndexItem(name="value_from", label="HAS_VALUE", properties=["from"], type=IndexType.RANGE),
     IndexItem(name="value_branch", label="HAS_VALUE", properties=["branch"], type=IndexType.RANGE),
+    IndexItem(name="part_of_from", label="IS_PART_OF", properties=["from"], type=IndexType.RANGE),
+    IndexItem(name="related_from", label="IS_RELATED", properties=["from"], type=IndexType.RANGE),
 ]
@@ -31,6 +31,7 @@ from infrahub.log import get_logger
 from infrahub.menu.menu import default_menu
 from infrahub.menu.utils import create_menu_children
 from infrahub.permissions import PermissionBackend
+from infrahub.services.adapters.cache import InfrahubCache
 from infrahub.storage import InfrahubObjectStorage
 from infrahub.utils import format_label
 
@@ -68,19 +69,23 @@ async def get_default_ipnamespace(db: InfrahubDatabase) -> Optional[Node]:
     return nodes[0]
 
 
-def initialize_permission_backends() -> list[PermissionBackend]:
+def initialize_permission_backends(cache: Optional[InfrahubCache] = None) -> list[PermissionBackend]:
     permission_backends: list[PermissionBackend] = []
     for backend_module_path in config.SETTINGS.main.permission_backends:
         log.info("Loading permission backend", backend=backend_module_path)
 
         module, class_name = backend_module_path.rsplit(".", maxsplit=1)
         Backend = getattr(importlib.import_module(module), class_name)
-        permission_backends.append(Backend())
+        backend: PermissionBackend = Backend()
+        backend.cache = cache
+        permission_backends.append(backend)
 
     return permission_backends
 
 
-async def initialize_registry(db: InfrahubDatabase, initialize: bool = False) -> None:
+async def initialize_registry(
+    db: InfrahubDatabase, initialize: bool = False, cache: Optional[InfrahubCache] = None
+) -> None:
     # ---------------------------------------------------
     # Initialize the database and Load the Root node
     # ---------------------------------------------------
@@ -114,10 +119,10 @@ async def initialize_registry(db: InfrahubDatabase, initialize: bool = False) ->
     # ---------------------------------------------------
     # Instantiate permission backends
     # ---------------------------------------------------
-    registry.permission_backends = initialize_permission_backends()
+    registry.permission_backends = initialize_permission_backends(cache=cache)
 
 
-async def initialization(db: InfrahubDatabase) -> None:
+async def initialization(db: InfrahubDatabase, cache: Optional[InfrahubCache] = None) -> None:
     if config.SETTINGS.database.db_type == config.DatabaseType.MEMGRAPH:
         session = await db.session()
         await session.run(query="SET DATABASE SETTING 'log.level' TO 'INFO'")
@@ -129,7 +134,7 @@ async def initialization(db: InfrahubDatabase) -> None:
     # ---------------------------------------------------
     async with lock.registry.initialization():
         log.debug("Checking Root Node")
-        await initialize_registry(db=db, initialize=True)
+        await initialize_registry(db=db, initialize=True, cache=cache)
 
         # Add Indexes to the database
         if db.manager.index.initialized:
@@ -150,7 +155,13 @@ async def initialization(db: InfrahubDatabase) -> None:
         # Import the default branch
         default_branch: Branch = registry.get_branch_from_registry(branch=registry.default_branch)
         hash_in_db = default_branch.active_schema_hash.main
-        schema_default_branch = await registry.schema.load_schema_from_db(db=db, branch=default_branch)
+        schema_default_branch = None
+        if cache:
+            schema_default_branch = await registry.schema.load_schema_snapshot(cache=cache, schema_hash=hash_in_db)
+        if not schema_default_branch:
+            schema_default_branch = await registry.schema.load_schema_from_db(db=db, branch=default_branch)
+            if cache:
+                await registry.schema.save_schema_snapshot(cache=cache, schema=schema_default_branch)
         registry.schema.set_schema_branch(name=default_branch.name, schema=schema_default_branch)
 
         if default_branch.update_schema_hash():
@@ -167,7 +178,7 @@ async def initialization(db: InfrahubDatabase) -> None:
 
             hash_in_db = branch.active_schema_hash.main
             log.info("Importing schema", branch=branch.name)
-            await registry.schema.load_schema(db=db, branch=branch)
+            await registry.schema.load_schema(db=db, branch=branch, cache=cache)
 
             if branch.update_schema_hash():
                 log.warning(
@@ -6,6 +6,11 @@ IPNetworkType = Union[ipaddress.IPv6Network, ipaddress.IPv4Network]
 IPAddressType = Union[ipaddress.IPv6Interface, ipaddress.IPv4Interface]
 AllIPTypes = Union[IPNetworkType, IPAddressType]
 
+# Number of changed nodes in a namespace above which the whole namespace is reconciled at once
+BULK_RECONCILIATION_THRESHOLD = 50
+# Number of nodes updated in a single transaction during a bulk reconciliation
+BULK_RECONCILIATION_BATCH_SIZE = 500
+
 
 class PrefixMemberType(Enum):
     PREFIX = "prefix"
@@ -5,12 +5,13 @@ from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
-from infrahub.core.query.ipam import IPPrefixReconcileQuery
+from infrahub.core.query.ipam import IPNamespaceReconcileQuery, IPPrefixReconcileQuery
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.exceptions import NodeNotFoundError
 
-from .constants import AllIPTypes
+from .constants import BULK_RECONCILIATION_BATCH_SIZE, AllIPTypes
+from .trie import calculate_parents
 
 if TYPE_CHECKING:
     from infrahub.core.relationship.model import RelationshipManager
@@ -151,7 +152,71 @@ class IpamReconciler:
 
         return reconcile_nodes.node
 
-    async def _update_node_parent(self, node: Node, new_parent_uuid: Optional[str]) -> None:
+    async def reconcile_namespace(
+        self,
+        namespace: Optional[Union[Node, str]] = None,
+        deleted_uuids: Optional[set[str]] = None,
+        at: Optional[Timestamp] = None,
+    ) -> set[str]:
+        """Reconcile the parent of all the prefixes and addresses of a namespace at once.
+
+        All the prefixes and addresses are loaded with a single query and their parents are calculated in memory,
+        only the nodes with a different parent are then updated, in batches. The nodes in deleted_uuids are
+        ignored during the calculation and deleted at the end. Return the UUIDs of the nodes updated.
+        """
+        self.at = Timestamp(at)
+        deleted_uuids = deleted_uuids or set()
+
+        query = await IPNamespaceReconcileQuery.init(db=self.db, branch=self.branch, namespace=namespace, at=self.at)
+        await query.execute(db=self.db)
+        ip_nodes = [ip_node for ip_node in query.get_ip_nodes() if ip_node.id not in deleted_uuids]
+
+        calculated_parents = calculate_parents(ip_nodes=ip_nodes)
+        new_parents = {
+            ip_node.id: calculated_parents[ip_node.id]
+            for ip_node in ip_nodes
+            if ip_node.current_parent_id != calculated_parents[ip_node.id]
+        }
+
+        # Each batch is read, re-parented and saved within its own transaction
+        updated_uuids = list(new_parents.keys())
+        for offset in range(0, len(updated_uuids), BULK_RECONCILIATION_BATCH_SIZE):
+            batch_uuids = updated_uuids[offset : offset + BULK_RECONCILIATION_BATCH_SIZE]
+            parent_uuids = {new_parents[uuid] for uuid in batch_uuids if new_parents[uuid]}
+            async with self.db.start_transaction() as dbt:
+                nodes = await NodeManager.get_many(
+                    db=dbt, branch=self.branch, ids=list(set(batch_uuids) | parent_uuids)
+                )
+                for uuid in batch_uuids:
+                    if uuid not in nodes:
+                        continue
+                    parent_uuid = new_parents[uuid]
+                    parent = nodes.get(parent_uuid) if parent_uuid else None
+                    await self._update_node_parent(
+                        node=nodes[uuid], new_parent_uuid=parent_uuid, new_parent=parent, db=dbt
+                    )
+                    await nodes[uuid].save(db=dbt, at=self.at)
+
+        deleted_uuids_list = list(deleted_uuids)
+        for offset in range(0, len(deleted_uuids_list), BULK_RECONCILIATION_BATCH_SIZE):
+            async with self.db.start_transaction() as dbt:
+                deleted_nodes = await NodeManager.get_many(
+                    db=dbt,
+                    branch=self.branch,
+                    ids=deleted_uuids_list[offset : offset + BULK_RECONCILIATION_BATCH_SIZE],
+                )
+                for node in deleted_nodes.values():
+                    await node.delete(db=dbt, at=self.at)
+
+        return set(updated_uuids)
+
+    async def _update_node_parent(
+        self,
+        node: Node,
+        new_parent_uuid: Optional[str],
+        new_parent: Optional[Node] = None,
+        db: Optional[InfrahubDatabase] = None,
+    ) -> None:
         node_kinds = {node.get_kind()} | set(node.get_schema().inherit_from)
         is_prefix = False
         if InfrahubKind.IPADDRESS in node_kinds:
@@ -162,7 +227,7 @@ class IpamReconciler:
         else:
             return
 
-        await rel_manager.update(db=self.db, data=new_parent_uuid)
+        await rel_manager.update(db=db or self.db, data=new_parent or new_parent_uuid)
         if not is_prefix:
             return
         node.is_top_level.value = new_parent_uuid is None  # type: ignore[attr-defined]
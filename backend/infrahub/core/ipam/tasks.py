@@ -1,9 +1,11 @@
 import ipaddress
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from prefect import flow
 
 from infrahub.core import registry
+from infrahub.core.ipam.constants import BULK_RECONCILIATION_THRESHOLD
 from infrahub.core.ipam.reconciler import IpamReconciler
 from infrahub.services import services
 
@@ -19,14 +21,26 @@ async def ipam_reconciliation(branch: str, ipam_node_details: list[IpamNodeDetai
     branch_obj = await registry.get_branch(db=service.database, branch=branch)
     ipam_reconciler = IpamReconciler(db=service.database, branch=branch_obj)
 
+    details_by_namespace: dict[str, list[IpamNodeDetails]] = defaultdict(list)
     for ipam_node_detail_item in ipam_node_details:
-        if ipam_node_detail_item.is_address:
-            ip_value: AllIPTypes = ipaddress.ip_interface(ipam_node_detail_item.ip_value)
-        else:
-            ip_value = ipaddress.ip_network(ipam_node_detail_item.ip_value)
-        await ipam_reconciler.reconcile(
-            ip_value=ip_value,
-            namespace=ipam_node_detail_item.namespace_id,
-            node_uuid=ipam_node_detail_item.node_uuid,
-            is_delete=ipam_node_detail_item.is_delete,
-        )
+        details_by_namespace[ipam_node_detail_item.namespace_id].append(ipam_node_detail_item)
+
+    for namespace_id, namespace_details in details_by_namespace.items():
+        if len(namespace_details) >= BULK_RECONCILIATION_THRESHOLD:
+            await ipam_reconciler.reconcile_namespace(
+                namespace=namespace_id,
+                deleted_uuids={detail.node_uuid for detail in namespace_details if detail.is_delete},
+            )
+            continue
+
+        for ipam_node_detail_item in namespace_details:
+            if ipam_node_detail_item.is_address:
+                ip_value: AllIPTypes = ipaddress.ip_interface(ipam_node_detail_item.ip_value)
+            else:
+                ip_value = ipaddress.ip_network(ipam_node_detail_item.ip_value)
+            await ipam_reconciler.reconcile(
+                ip_value=ip_value,
+                namespace=ipam_node_detail_item.namespace_id,
+                node_uuid=ipam_node_detail_item.node_uuid,
+                is_delete=ipam_node_detail_item.is_delete,
+            )
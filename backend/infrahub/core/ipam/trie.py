@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+if TYPE_CHECKING:
+    from infrahub.core.query.ipam import IPNodeData
+
+# Position of the elements in the list representing a node of the trie
+_ZERO = 0
+_ONE = 1
+_VALUE = 2
+
+
+class IPPrefixTrie:
+    """Binary trie of the prefixes of one IP version, indexed on the bits of their network address.
+
+    A prefix of length N is stored at depth N, the most specific prefix containing an address or a prefix
+    is the last value found while walking down the bits of its address.
+    """
+
+    def __init__(self) -> None:
+        self._root: list[Any] = [None, None, None]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, binary_address: str, prefixlen: int, value: str) -> None:
+        """Store a prefix, if the same prefix is already stored the first value is kept."""
+        node = self._root
+        for bit in binary_address[:prefixlen]:
+            index = _ONE if bit == "1" else _ZERO
+            if node[index] is None:
+                node[index] = [None, None, None]
+            node = node[index]
+
+        if node[_VALUE] is None:
+            node[_VALUE] = value
+            self._size += 1
+
+    def get_parent(self, binary_address: str, max_prefixlen: int) -> Optional[str]:
+        """Return the most specific prefix containing the address with a length lower or equal to max_prefixlen.
+
+        Like in IPPrefixReconcileQuery, a prefix of length 0 is never returned as a parent.
+        """
+        if max_prefixlen < 1:
+            return None
+
+        node = self._root
+        parent: Optional[str] = None
+        for bit in binary_address[:max_prefixlen]:
+            node = node[_ONE if bit == "1" else _ZERO]
+            if node is None:
+                break
+            if node[_VALUE] is not None:
+                parent = node[_VALUE]
+        return parent
+
+
+def calculate_parents(ip_nodes: Iterable[IPNodeData]) -> dict[str, Optional[str]]:
+    """Calculate the parent prefix of all the prefixes and the addresses of a namespace.
+
+    The parent of a prefix is the most specific prefix with a smaller length containing it, the parent of an address
+    is the most specific prefix containing it with a length lower or equal to the one of the address.
+    """
+    ip_nodes = list(ip_nodes)
+    tries: dict[int, IPPrefixTrie] = {}
+    for ip_node in ip_nodes:
+        if ip_node.is_address:
+            continue
+        tries.setdefault(ip_node.version, IPPrefixTrie()).insert(
+            binary_address=ip_node.binary_address, prefixlen=ip_node.prefixlen, value=ip_node.id
+        )
+
+    parents: dict[str, Optional[str]] = {}
+    for ip_node in ip_nodes:
+        trie = tries.get(ip_node.version)
+        if not trie:
+            parents[ip_node.id] = None
+            continue
+        max_prefixlen = ip_node.prefixlen if ip_node.is_address else ip_node.prefixlen - 1
+        parents[ip_node.id] = trie.get_parent(binary_address=ip_node.binary_address, max_prefixlen=max_prefixlen)
+
+    return parents
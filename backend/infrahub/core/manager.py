@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from functools import reduce
 from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, overload
 
 from infrahub_sdk.utils import deep_merge_dict, is_valid_uuid
 
+from infrahub.core.constraint.node.runner import NodeConstraintRunner
 from infrahub.core.node import Node
 from infrahub.core.node.delete_validator import NodeDeleteValidator
+from infrahub.core.query.attribute import AttributeUpdateBatchQuery
 from infrahub.core.query.node import (
     AttributeFromDB,
     AttributeNodePropertyFromDB,
     NodeAttributesFromDB,
+    NodeCreateManyQuery,
+    NodeDeleteFieldsManyQuery,
+    NodeDeleteManyQuery,
     NodeGetHierarchyQuery,
     NodeGetListQuery,
     NodeListGetAttributeQuery,
@@ -23,11 +29,13 @@ from infrahub.core.registry import registry
 from infrahub.core.relationship import Relationship
 from infrahub.core.schema import GenericSchema, MainSchemaTypes, NodeSchema, ProfileSchema, RelationshipSchema
 from infrahub.core.timestamp import Timestamp
+from infrahub.core.utils import update_relationships_to
 from infrahub.exceptions import NodeNotFoundError, ProcessingError, SchemaNotFoundError
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
     from infrahub.core.constants import RelationshipHierarchyDirection
+    from infrahub.core.query.relationship import RelationshipPeerData
     from infrahub.database import InfrahubDatabase
 
 SchemaProtocol = TypeVar("SchemaProtocol")
@@ -57,9 +65,9 @@ def get_schema(
     db: InfrahubDatabase, branch: Branch, node_schema: type[SchemaProtocol] | MainSchemaTypes | str
 ) -> MainSchemaTypes:
     if isinstance(node_schema, str):
-        return db.schema.get(name=node_schema, branch=branch.name)
+        return db.schema.get(name=node_schema, branch=branch.name, read_only=True)
     if hasattr(node_schema, "_is_runtime_protocol") and getattr(node_schema, "_is_runtime_protocol"):
-        return db.schema.get(name=node_schema.__name__, branch=branch.name)
+        return db.schema.get(name=node_schema.__name__, branch=branch.name, read_only=True)
     if not isinstance(node_schema, (MainSchemaTypes)):
         raise ValueError(f"Invalid schema provided {node_schema}")
 
@@ -360,7 +368,110 @@ class NodeManager:
         )
         await query.execute(db=db)
 
-        peers_info = list(query.get_peers())
+        return await cls._load_peers(
+            db=db,
+            peers_info=list(query.get_peers()),
+            schema=schema,
+            fields=fields,
+            at=at,
+            branch=branch,
+            branch_agnostic=branch_agnostic,
+            fetch_peers=fetch_peers,
+        )
+
+    @classmethod
+    async def query_peers_per_source(
+        cls,
+        db: InfrahubDatabase,
+        ids: list[str],
+        source_kind: str,
+        schema: RelationshipSchema,
+        filters: dict,
+        fields: Optional[dict] = None,
+        at: Optional[Union[Timestamp, str]] = None,
+        branch: Optional[Union[Branch, str]] = None,
+        branch_agnostic: bool = False,
+        fetch_peers: bool = False,
+    ) -> dict[str, list[Relationship]]:
+        """Query the peers of multiple source nodes at once and return them grouped by source node.
+
+        Unlike query_peers, a peer shared by multiple source nodes is returned for each of them.
+        """
+        branch = await registry.get_branch(branch=branch, db=db)
+        at = Timestamp(at)
+
+        rel = Relationship(schema=schema, branch=branch, node_id="PLACEHOLDER")
+
+        query = await RelationshipGetPeerQuery.init(
+            db=db,
+            source_ids=ids,
+            source_kind=source_kind,
+            schema=schema,
+            filters=filters,
+            rel=rel,
+            at=at,
+            branch_agnostic=branch_agnostic,
+        )
+        await query.execute(db=db)
+
+        peers = await cls._load_peers(
+            db=db,
+            peers_info=list(query.get_peers(per_source=True)),
+            schema=schema,
+            fields=fields,
+            at=at,
+            branch=branch,
+            branch_agnostic=branch_agnostic,
+            fetch_peers=fetch_peers,
+        )
+
+        peers_per_source: dict[str, list[Relationship]] = {source_id: [] for source_id in ids}
+        for peer in peers:
+            peers_per_source[peer.node_id].append(peer)
+        return peers_per_source
+
+    @classmethod
+    async def count_peers_per_source(
+        cls,
+        ids: list[str],
+        source_kind: str,
+        schema: RelationshipSchema,
+        filters: dict,
+        db: InfrahubDatabase,
+        at: Optional[Union[Timestamp, str]] = None,
+        branch: Optional[Union[Branch, str]] = None,
+        branch_agnostic: bool = False,
+    ) -> dict[str, int]:
+        branch = await registry.get_branch(branch=branch, db=db)
+        at = Timestamp(at)
+
+        rel = Relationship(schema=schema, branch=branch, node_id="PLACEHOLDER")
+
+        query = await RelationshipGetPeerQuery.init(
+            db=db,
+            source_ids=ids,
+            source_kind=source_kind,
+            schema=schema,
+            filters=filters,
+            rel=rel,
+            at=at,
+            branch_agnostic=branch_agnostic,
+        )
+        counts = await query.count_per_source(db=db)
+        return {source_id: counts.get(source_id, 0) for source_id in ids}
+
+    @classmethod
+    async def _load_peers(
+        cls,
+        db: InfrahubDatabase,
+        peers_info: list[RelationshipPeerData],
+        schema: RelationshipSchema,
+        fields: Optional[dict],
+        at: Timestamp,
+        branch: Branch,
+        branch_agnostic: bool,
+        fetch_peers: bool,
+    ) -> list[Relationship]:
         if not peers_info:
             return []
 
@@ -1088,8 +1199,12 @@ class NodeManager:
         prefetch_relationships: bool = False,
         account=None,
         branch_agnostic: bool = False,
+        include_attributes: bool = True,
     ) -> dict[str, Node]:
-        """Return a list of nodes based on their IDs."""
+        """Return a list of nodes based on their IDs.
+
+        Without include_attributes, the attributes of the nodes are not queried and keep their default value.
+        """
 
         branch = await registry.get_branch(branch=branch, db=db)
         at = Timestamp(at)
@@ -1112,19 +1227,21 @@ class NodeManager:
                 fields["profile_priority"]["value"] = None
 
         # Query list of all Attributes
-        query = await NodeListGetAttributeQuery.init(
-            db=db,
-            ids=list(nodes_info_by_id.keys()) + list(all_profile_ids),
-            fields=fields,
-            branch=branch,
-            include_source=include_source,
-            include_owner=include_owner,
-            account=account,
-            at=at,
-            branch_agnostic=branch_agnostic,
-        )
-        await query.execute(db=db)
-        all_node_attributes = query.get_attributes_group_by_node()
+        all_node_attributes: dict[str, NodeAttributesFromDB] = {}
+        if include_attributes:
+            query = await NodeListGetAttributeQuery.init(
+                db=db,
+                ids=list(nodes_info_by_id.keys()) + list(all_profile_ids),
+                fields=fields,
+                branch=branch,
+                include_source=include_source,
+                include_owner=include_owner,
+                account=account,
+                at=at,
+                branch_agnostic=branch_agnostic,
+            )
+            await query.execute(db=db)
+            all_node_attributes = query.get_attributes_group_by_node()
         profile_attributes: dict[str, dict[str, AttributeFromDB]] = {}
         node_attributes: dict[str, dict[str, AttributeFromDB]] = {}
         for node_id, attribute_dict in all_node_attributes.items():
@@ -1212,6 +1329,192 @@ class NodeManager:
 
         return nodes
 
+    @classmethod
+    async def create_many(
+        cls,
+        db: InfrahubDatabase,
+        nodes: list[Node],
+        at: Optional[Union[Timestamp, str]] = None,
+        batch_size: int = 500,
+    ) -> list[Node]:
+        """Validate and create new nodes in a single transaction.
+
+        The nodes must have been initialized with `Node.new`, the nodes of the same kind are created together,
+        `batch_size` nodes at a time.
+        """
+        create_at = Timestamp(at)
+        await cls._check_constraints(db=db, nodes=nodes)
+
+        if db.is_transaction:
+            await cls._create_many(db=db, nodes=nodes, at=create_at, batch_size=batch_size)
+        else:
+            async with db.start_transaction() as dbt:
+                await cls._create_many(db=dbt, nodes=nodes, at=create_at, batch_size=batch_size)
+
+        return nodes
+
+    @classmethod
+    async def _create_many(cls, db: InfrahubDatabase, nodes: list[Node], at: Timestamp, batch_size: int) -> None:
+        nodes_per_kind: dict[tuple[str, str], list[Node]] = defaultdict(list)
+        for node in nodes:
+            if not _supports_batch_create(node):
+                await node.save(db=db, at=at)
+                continue
+            nodes_per_kind[node.get_kind(), node.get_branch_based_on_support_type().name].append(node)
+
+        for kind_nodes in nodes_per_kind.values():
+            branch = kind_nodes[0].get_branch_based_on_support_type()
+            for idx in range(0, len(kind_nodes), batch_size):
+                batch = kind_nodes[idx : idx + batch_size]
+                query = await NodeCreateManyQuery.init(db=db, nodes=batch, branch=branch, at=at)
+                await query.execute(db=db)
+                ids_per_node = query.get_ids_per_node()
+                for node in batch:
+                    db_id, new_ids = ids_per_node[node.id]
+                    node._set_created_ids(db_id=db_id, new_ids=new_ids, at=at)
+
+    @classmethod
+    async def update_many(
+        cls,
+        db: InfrahubDatabase,
+        nodes: list[Node],
+        at: Optional[Union[Timestamp, str]] = None,
+        batch_size: int = 500,
+    ) -> list[Node]:
+        """Validate and save existing nodes in a single transaction.
+
+        The attributes of the nodes of the same kind are updated together, `batch_size` nodes at a time,
+        the relationships that have changed are saved node by node.
+        """
+        update_at = Timestamp(at)
+        await cls._check_constraints(db=db, nodes=nodes)
+
+        if db.is_transaction:
+            await cls._update_many(db=db, nodes=nodes, at=update_at, batch_size=batch_size)
+        else:
+            async with db.start_transaction() as dbt:
+                await cls._update_many(db=dbt, nodes=nodes, at=update_at, batch_size=batch_size)
+
+        return nodes
+
+    @classmethod
+    async def _update_many(cls, db: InfrahubDatabase, nodes: list[Node], at: Timestamp, batch_size: int) -> None:
+        nodes_per_kind: dict[tuple[str, str], list[Node]] = defaultdict(list)
+        for node in nodes:
+            if not node._existing or not _supports_batch_update(node):
+                await node.save(db=db, at=at)
+                continue
+            nodes_per_kind[node.get_kind(), node._branch.name].append(node)
+
+        for kind_nodes in nodes_per_kind.values():
+            for idx in range(0, len(kind_nodes), batch_size):
+                batch = kind_nodes[idx : idx + batch_size]
+                attributes_per_node = {node.id: node._get_changed_attributes() for node in batch}
+
+                if node_ids := [node_id for node_id, attributes in attributes_per_node.items() if attributes]:
+                    query = await NodeListGetAttributeQuery.init(
+                        db=db,
+                        ids=node_ids,
+                        fields={attr.name: True for attributes in attributes_per_node.values() for attr in attributes},
+                        branch=batch[0]._branch,
+                        at=at,
+                        include_source=True,
+                        include_owner=True,
+                    )
+                    await query.execute(db=db)
+
+                    updates = [
+                        update
+                        for node in batch
+                        for update in node._get_attribute_updates(query=query, attributes=attributes_per_node[node.id])
+                    ]
+                    if updates:
+                        update_query = await AttributeUpdateBatchQuery.init(db=db, updates=updates, at=at)
+                        await update_query.execute(db=db)
+
+                    for attributes in attributes_per_node.values():
+                        for attr in attributes:
+                            attr.reset_changes()
+
+                for node in batch:
+                    await node._update_relationships(db=db, at=at)
+
+    @classmethod
+    async def _check_constraints(cls, db: InfrahubDatabase, nodes: list[Node]) -> None:
+        nodes_per_branch: dict[str, list[Node]] = defaultdict(list)
+        for node in nodes:
+            nodes_per_branch[node._branch.name].append(node)
+
+        from infrahub.dependencies.registry import get_component_registry  # pylint: disable=import-outside-toplevel
+
+        component_registry = get_component_registry()
+        for branch_nodes in nodes_per_branch.values():
+            node_constraint_runner = await component_registry.get_component(
+                NodeConstraintRunner, db=db, branch=branch_nodes[0]._branch
+            )
+            await node_constraint_runner.check_many(nodes=branch_nodes)
+
+    @classmethod
+    async def delete_many(
+        cls,
+        db: InfrahubDatabase,
+        nodes: list[Node],
+        branch: Optional[Union[Branch, str]] = None,
+        at: Optional[Union[Timestamp, str]] = None,
+    ) -> list[Node]:
+        """Delete nodes in a single transaction, the nodes themselves are deleted together.
+
+        Returns list of deleted nodes because of cascading deletes"""
+        branch = await registry.get_branch(branch=branch, db=db)
+        delete_at = Timestamp(at)
+        node_delete_validator = NodeDeleteValidator(db=db, branch=branch)
+        ids_to_delete = await node_delete_validator.get_ids_to_delete(nodes=nodes, at=delete_at)
+        node_ids = {node.get_id() for node in nodes}
+        missing_ids_to_delete = ids_to_delete - node_ids
+        if missing_ids_to_delete:
+            node_map = await cls.get_many(db=db, ids=list(missing_ids_to_delete), branch=branch, at=delete_at)
+            nodes = [*nodes, *node_map.values()]
+
+        if db.is_transaction:
+            await cls._delete_many(db=db, nodes=nodes, at=delete_at)
+        else:
+            async with db.start_transaction() as dbt:
+                await cls._delete_many(db=dbt, nodes=nodes, at=delete_at)
+
+        return nodes
+
+    @classmethod
+    async def _delete_many(cls, db: InfrahubDatabase, nodes: list[Node], at: Timestamp) -> None:
+        nodes_per_kind: dict[tuple[str, str], list[Node]] = defaultdict(list)
+        for node in nodes:
+            if not _supports_batch_delete(node):
+                await node.delete(db=db, at=at)
+                continue
+            nodes_per_kind[node.get_kind(), node._branch.name].append(node)
+
+        for kind_nodes in nodes_per_kind.values():
+            first_node = kind_nodes[0]
+            branch = first_node.get_branch_based_on_support_type()
+            node_ids = [node.get_id() for node in kind_nodes]
+
+            fields_query = await NodeDeleteFieldsManyQuery.init(
+                db=db, nodes=kind_nodes, branch=first_node._branch, at=at
+            )
+            await fields_query.execute(db=db)
+
+            # Update the relationship to the branch itself
+            query = await NodeGetListQuery.init(
+                db=db, schema=first_node._schema, filters={"ids": node_ids}, branch=first_node._branch, at=at
+            )
+            await query.execute(db=db)
+            if rel_ids_to_update := [
+                result.get("rb_id") for result in query.get_results() if result.get("rb.branch") == branch.name
+            ]:
+                await update_relationships_to(rel_ids_to_update, to=at, db=db)
+
+            delete_query = await NodeDeleteManyQuery.init(db=db, node_ids=node_ids, branch=branch, at=at)
+            await delete_query.execute(db=db)
+
     @classmethod
     async def delete(
         cls,
@@ -1237,4 +1540,19 @@ class NodeManager:
         return deleted_nodes
 
 
+def _supports_batch_create(node: Node) -> bool:
+    """Nodes with a custom logic to create themselves must be saved one by one."""
+    return type(node).save is Node.save and type(node)._create is Node._create
+
+
+def _supports_batch_update(node: Node) -> bool:
+    """Nodes with a custom logic to update themselves must be saved one by one."""
+    return type(node).save is Node.save and type(node)._update is Node._update
+
+
+def _supports_batch_delete(node: Node) -> bool:
+    """Nodes with a custom logic to delete themselves must be deleted one by one."""
+    return type(node).delete is Node.delete
+
+
 registry.manager = NodeManager
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import Self
+
+from infrahub.core.constants import SchemaPathType
+from infrahub.core.migrations.shared import MigrationResult
+from infrahub.core.path import SchemaPath
+
+from ..schema.node_attribute_add import NodeAttributeAddMigration
+from ..shared import InternalSchemaMigration
+
+if TYPE_CHECKING:
+    from infrahub.database import InfrahubDatabase
+
+
+class Migration017(InternalSchemaMigration):
+    name: str = "017_add_attr_searchable"
+    minimum_version: int = 16
+
+    @classmethod
+    def init(cls, **kwargs: dict[str, Any]) -> Self:
+        internal_schema = cls.get_internal_schema()
+        schema_attr = internal_schema.get_node(name="SchemaAttribute")
+
+        migrations = [
+            NodeAttributeAddMigration(
+                new_node_schema=schema_attr,
+                previous_node_schema=schema_attr,
+                schema_path=SchemaPath(
+                    schema_kind="SchemaAttribute", path_type=SchemaPathType.ATTRIBUTE, field_name="searchable"
+                ),
+            ),
+        ]
+        return cls(migrations=migrations, **kwargs)  # type: ignore[arg-type]
+
+    async def validate_migration(self, db: InfrahubDatabase) -> MigrationResult:
+        result = MigrationResult()
+        return result
@@ -315,10 +315,47 @@ class HashableModel(BaseModel):
 
     _exclude_from_hash: list[str] = []
     _sort_by: list[str] = []
+    _read_only: bool = False
 
     def __hash__(self) -> int:
         return hash(self.get_hash())
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, HashableModel) or self._read_only is other._read_only:
+            return super().__eq__(other)
+        # A read-only object is equal to a copy of it that can be modified
+        return (
+            self.__class__ is other.__class__
+            and self.__dict__ == other.__dict__
+            and {**(self.__pydantic_private__ or {}), "_read_only": False}
+            == {**(other.__pydantic_private__ or {}), "_read_only": False}
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._read_only and name in self.model_fields:
+            raise TypeError(
+                f"{self.__class__.__name__} is read-only, use duplicate() to get a copy that can be modified"
+            )
+        super().__setattr__(name, value)
+
+    @property
+    def is_read_only(self) -> bool:
+        return self._read_only
+
+    def _set_read_only(self, read_only: bool) -> None:
+        self._read_only = read_only
+        for field_name in self.model_fields:
+            value = getattr(self, field_name)
+            items = value if isinstance(value, list) else [value]
+            for item in items:
+                if isinstance(item, HashableModel):
+                    item._set_read_only(read_only)
+
+    def freeze(self) -> Self:
+        """Mark the object and all its sub-objects as read-only, so that it can be shared safely."""
+        self._set_read_only(True)
+        return self
+
     def get_hash(self, display_values: bool = False) -> str:
         """Generate a hash for the object.
 
@@ -404,8 +441,14 @@ class HashableModel(BaseModel):
         return tuple(self_sort_keys) >= tuple(other_sort_keys)
 
     def duplicate(self) -> Self:
-        """Duplicate the current object by doing a deep copy of everything and recreating a new object."""
-        return self.model_copy(deep=True)
+        """Duplicate the current object by doing a deep copy of everything and recreating a new object.
+
+        The copy can always be modified, even if the current object is read-only.
+        """
+        new_object = self.model_copy(deep=True)
+        if self._read_only:
+            new_object._set_read_only(False)
+        return new_object
 
     @staticmethod
     def is_list_composed_of_hashable_model(items: list[Any]) -> bool:
@@ -9,7 +9,14 @@ from infrahub_sdk.uuidt import UUIDT
 from infrahub.core import registry
 from infrahub.core.constants import BranchSupportType, InfrahubKind, RelationshipCardinality
 from infrahub.core.protocols import CoreNumberPool
-from infrahub.core.query.node import NodeCheckIDQuery, NodeCreateAllQuery, NodeDeleteQuery, NodeGetListQuery
+from infrahub.core.query.attribute import AttributeUpdateBatchQuery
+from infrahub.core.query.node import (
+    NodeCheckIDQuery,
+    NodeCreateAllQuery,
+    NodeDeleteQuery,
+    NodeGetListQuery,
+    NodeListGetAttributeQuery,
+)
 from infrahub.core.schema import AttributeSchema, NodeSchema, ProfileSchema, RelationshipSchema
 from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import InitializationError, NodeNotFoundError, PoolExhaustedError, ValidationError
@@ -25,7 +32,7 @@ if TYPE_CHECKING:
     from infrahub.core.branch import Branch
     from infrahub.database import InfrahubDatabase
 
-    from ..attribute import BaseAttribute
+    from ..attribute import AttributeUpdateData, BaseAttribute
 
 SchemaProtocol = TypeVar("SchemaProtocol")
 
@@ -203,9 +210,9 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
             attrs["schema"] = schema
         elif isinstance(schema, str):
             # TODO need to raise a proper exception for this, right now it will raise a generic ValueError
-            attrs["schema"] = db.schema.get(name=schema, branch=branch)
+            attrs["schema"] = db.schema.get(name=schema, branch=branch, read_only=True)
         elif hasattr(schema, "_is_runtime_protocol") and getattr(schema, "_is_runtime_protocol"):
-            attrs["schema"] = db.schema.get(name=schema.__name__, branch=branch)
+            attrs["schema"] = db.schema.get(name=schema.__name__, branch=branch, read_only=True)
         else:
             raise ValueError(f"Invalid schema provided {type(schema)}, expected NodeSchema or ProfileSchema")
 
@@ -435,26 +442,40 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
             self._updated_at = Timestamp(updated_at)
 
         await self._process_fields(db=db, fields=kwargs)
+        self.reset_changes()
         return self
 
+    def reset_changes(self) -> None:
+        """Flag all the attributes and relationships of the node as matching the database."""
+        for name in self._attributes:
+            attr: BaseAttribute = getattr(self, name)
+            attr.reset_changes()
+
+        for name in self._relationships:
+            relm: RelationshipManager = getattr(self, name)
+            relm.reset_changes()
+
     async def _create(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> None:
         create_at = Timestamp(at)
 
         query = await NodeCreateAllQuery.init(db=db, node=self, at=create_at)
         await query.execute(db=db)
 
-        _, self.db_id = query.get_self_ids()
-        self._at = create_at
-        self._updated_at = create_at
-        self._existing = True
+        _, db_id = query.get_self_ids()
+        self._set_created_ids(db_id=db_id, new_ids=query.get_ids(), at=create_at)
 
-        new_ids = query.get_ids()
+    def _set_created_ids(self, db_id: str, new_ids: dict[str, tuple[str, str]], at: Timestamp) -> None:
+        """Flag the node as existing and assign the IDs generated by the database to its attributes and relationships."""
+        self.db_id = db_id
+        self._at = at
+        self._updated_at = at
+        self._existing = True
 
         # Go over the list of Attribute and assign the new IDs one by one
         for name in self._attributes:
             attr: BaseAttribute = getattr(self, name)
             attr.id, attr.db_id = new_ids[name]
-            attr.at = create_at
+            attr.at = at
 
         # Go over the list of relationships and assign the new IDs one by one
         for name in self._relationships:
@@ -463,20 +484,72 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
                 identifier = f"{rel.schema.identifier}::{rel.peer_id}"
                 rel.id, rel.db_id = new_ids[identifier]
 
+        self.reset_changes()
+
     async def _update(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> None:
-        """Update the node in the database if needed."""
+        """Update the node in the database if needed.
+
+        Only the attributes and the relationships that have changed since the node has been loaded or saved are considered,
+        the current state of the attributes is fetched once and the changes of all the attributes are written
+        with a single query, the relationships that have changed are saved one by one.
+        """
 
         update_at = Timestamp(at)
 
-        # Go over the list of Attribute and update them one by one
+        attributes = self._get_changed_attributes()
+        if attributes:
+            query = await NodeListGetAttributeQuery.init(
+                db=db,
+                ids=[self.id],
+                fields={attr.name: True for attr in attributes},
+                branch=self._branch,
+                at=update_at,
+                include_source=True,
+                include_owner=True,
+            )
+            await query.execute(db=db)
+
+            if updates := self._get_attribute_updates(query=query, attributes=attributes):
+                update_query = await AttributeUpdateBatchQuery.init(db=db, updates=updates, at=update_at)
+                await update_query.execute(db=db)
+
+            for attr in attributes:
+                attr.reset_changes()
+
+        await self._update_relationships(db=db, at=update_at)
+
+    def _get_changed_attributes(self) -> list[BaseAttribute]:
+        """Return the attributes that have changed since the node has been loaded or saved, ready to be updated."""
+        attributes: list[BaseAttribute] = []
         for name in self._attributes:
             attr: BaseAttribute = getattr(self, name)
-            await attr.save(at=update_at, db=db)
+            if attr.id and not attr.is_from_profile and attr.has_changed:
+                attr.prepare_update()
+                attributes.append(attr)
+
+        return attributes
+
+    def _get_attribute_updates(
+        self, query: NodeListGetAttributeQuery, attributes: list[BaseAttribute]
+    ) -> list[AttributeUpdateData]:
+        """Compare the attributes with their current state in the database, as returned by the query."""
+        updates: list[AttributeUpdateData] = []
+        for attr in attributes:
+            current_attr_data, current_attr_result = query.get_result_by_id_and_name(self.id, attr.name)
+            update_data = attr.get_update_data(
+                current_attr_data=current_attr_data, current_attr_result=current_attr_result
+            )
+            if update_data.has_changes:
+                updates.append(update_data)
 
-        # Go over the list of relationships and update them one by one
+        return updates
+
+    async def _update_relationships(self, db: InfrahubDatabase, at: Timestamp) -> None:
+        # Go over the list of relationships that have changed and update them one by one
         for name in self._relationships:
             rel: RelationshipManager = getattr(self, name)
-            await rel.save(at=update_at, db=db)
+            if rel.has_changed:
+                await rel.save(at=at, db=db)
 
     async def save(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> Self:
         """Create or Update the Node in the database."""
@@ -495,15 +568,7 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
 
         delete_at = Timestamp(at)
 
-        # Go over the list of Attribute and update them one by one
-        for name in self._attributes:
-            attr: BaseAttribute = getattr(self, name)
-            await attr.delete(at=delete_at, db=db)
-
-        # Go over the list of relationships and update them one by one
-        for name in self._relationships:
-            rel: RelationshipManager = getattr(self, name)
-            await rel.delete(at=delete_at, db=db)
+        await self._delete_fields(db=db, at=delete_at)
 
         # Need to check if there are some unidirectional relationship as well
         # For example, if we delete a tag, we must check the permissions and update all the relationships pointing at it
@@ -522,6 +587,19 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
         query = await NodeDeleteQuery.init(db=db, node=self, at=delete_at)
         await query.execute(db=db)
 
+    async def _delete_fields(self, db: InfrahubDatabase, at: Timestamp) -> None:
+        """Delete all the attributes and the relationships of the node."""
+
+        # Go over the list of Attribute and update them one by one
+        for name in self._attributes:
+            attr: BaseAttribute = getattr(self, name)
+            await attr.delete(at=at, db=db)
+
+        # Go over the list of relationships and update them one by one
+        for name in self._relationships:
+            rel: RelationshipManager = getattr(self, name)
+            await rel.delete(at=at, db=db)
+
     async def to_graphql(
         self,
         db: InfrahubDatabase,
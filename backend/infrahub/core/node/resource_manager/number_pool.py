@@ -1,9 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
-from infrahub.core.query.resource_manager import NumberPoolGetReserved, NumberPoolGetUsed, NumberPoolSetReserved
+from infrahub_sdk.uuidt import UUIDT
+
+from infrahub.core.query.resource_manager import (
+    NumberPoolGetReservations,
+    NumberPoolGetUsed,
+    NumberPoolSetReservedMany,
+)
+from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import PoolExhaustedError
+from infrahub.pools.number import NumberRanges, number_pool_cache
 
 from .. import Node
 
@@ -21,46 +29,99 @@ class CoreNumberPool(Node):
         identifier: Optional[str] = None,
     ) -> int:
         identifier = identifier or node.get_id()
-        # Check if there is already a resource allocated with this identifier
-        # if not, pull all existing prefixes and allocated the next available
         # TODO add support for branch, if the node is reserved with this id in another branch we should return an error
-        query_get = await NumberPoolGetReserved.init(db=db, branch=branch, pool_id=self.id, identifier=identifier)
-        await query_get.execute(db=db)
-        reservation = query_get.get_reservation()
-        if reservation is not None:
-            return reservation
+        numbers = await self.get_resources(db=db, branch=branch, count=1, identifiers=[identifier])
+        return numbers[0]
 
-        # If we have not returned a value we need to find one if avaiable
-        number = await self.get_next(db=db, branch=branch)
+    async def get_resources(
+        self,
+        db: InfrahubDatabase,
+        branch: Branch,
+        count: int,
+        identifiers: Optional[list[str]] = None,
+    ) -> list[int]:
+        """Allocate count numbers at once, in the order of the identifiers.
 
-        query_set = await NumberPoolSetReserved.init(
-            db=db, pool_id=self.get_id(), identifier=identifier, reserved=number
+        The numbers already reserved for some of the identifiers are returned as is,
+        the other ones are reserved with a single query.
+        """
+        identifiers = identifiers or [str(UUIDT()) for _ in range(count)]
+        if len(identifiers) != count:
+            raise ValueError(f"{len(identifiers)} identifiers provided to allocate {count} numbers")
+
+        query_get = await NumberPoolGetReservations.init(
+            db=db, branch=branch, pool_id=self.get_id(), identifiers=identifiers
         )
-        await query_set.execute(db=db)
+        await query_get.execute(db=db)
+        reservations = query_get.get_reservations()
+
+        # The free ranges in cache are only a hint, the query reserving the numbers skips the ones
+        # that are already reserved in the database, those are removed from the cache before trying the next ones
+        missing = list(dict.fromkeys(identifier for identifier in identifiers if identifier not in reservations))
+        while missing:
+            numbers = await self.get_next_many(db=db, branch=branch, count=len(missing))
+            query_set = await NumberPoolSetReservedMany.init(
+                db=db, pool_id=self.get_id(), reservations=dict(zip(missing, numbers))
+            )
+            await query_set.execute(db=db)
+            new_reservations = query_set.get_reservations()
+
+            self._reserve_in_cache(numbers=set(numbers) - set(new_reservations.values()))
+            reservations.update(new_reservations)
+            missing = [identifier for identifier in missing if identifier not in new_reservations]
 
-        return number
+        return [reservations[identifier] for identifier in identifiers]
 
     async def get_next(self, db: InfrahubDatabase, branch: Branch) -> int:
-        query = await NumberPoolGetUsed.init(db=db, branch=branch, pool=self, branch_agnostic=True)
-        await query.execute(db=db)
-        taken = [result.get_as_optional_type("av.value", return_type=int) for result in query.results]
-        next_number = find_next_free(
-            start=self.start_range.value,  # type: ignore[attr-defined]
-            end=self.end_range.value,  # type: ignore[attr-defined]
-            taken=taken,
-        )
-        if next_number is None:
-            raise PoolExhaustedError("There are no more addresses available in this pool.")
+        return (await self.get_next_many(db=db, branch=branch, count=1))[0]
 
-        return next_number
+    async def get_next_many(self, db: InfrahubDatabase, branch: Branch, count: int) -> list[int]:
+        """Return the lowest free numbers of the pool, without reserving them."""
+        free_ranges = await self.get_free_ranges(db=db, branch=branch)
+        if free_ranges.available < count:
+            # The cache doesn't follow the reservations that are removed, rebuild it before giving up
+            free_ranges = await self.get_free_ranges(db=db, branch=branch, reload=True)
+            if free_ranges.available < count:
+                raise PoolExhaustedError("There are no more addresses available in this pool.")
 
+        return free_ranges.get_first(count=count)
 
-def find_next_free(start: int, end: int, taken: list[int | None]) -> Optional[int]:
-    used_numbers = [number for number in taken if number is not None]
-    used_set = set(used_numbers)
+    async def get_free_ranges(self, db: InfrahubDatabase, branch: Branch, reload: bool = False) -> NumberRanges:
+        """Return the free ranges of the pool, only the numbers reserved since the last call are read from the database."""
+        start = int(self.start_range.value)  # type: ignore[attr-defined]
+        end = int(self.end_range.value)  # type: ignore[attr-defined]
+        synced_at = Timestamp()
 
-    for num in range(start, end + 1):
-        if num not in used_set:
-            return num
+        cached = None if reload else number_pool_cache.get(pool_id=self.get_id(), start=start, end=end)
+        if cached is None:
+            used = await self._get_used(db=db, branch=branch)
+            return number_pool_cache.set(
+                pool_id=self.get_id(), free_ranges=NumberRanges(start=start, end=end, used=used), synced_at=synced_at
+            ).free_ranges
 
-    return None
+        used = await self._get_used(db=db, branch=branch, reserved_since=cached.synced_at)
+        for number in used:
+            cached.free_ranges.reserve(number)
+        cached.synced_at = synced_at
+        return cached.free_ranges
+
+    async def _get_used(
+        self, db: InfrahubDatabase, branch: Branch, reserved_since: Optional[Timestamp] = None
+    ) -> list[int]:
+        query = await NumberPoolGetUsed.init(
+            db=db, branch=branch, pool=self, reserved_since=reserved_since, branch_agnostic=True
+        )
+        await query.execute(db=db)
+        taken = [result.get_as_optional_type("av.value", return_type=int) for result in query.results]
+        return [number for number in taken if number is not None]
+
+    def _reserve_in_cache(self, numbers: Iterable[int]) -> None:
+        cached = number_pool_cache.get(
+            pool_id=self.get_id(),
+            start=int(self.start_range.value),  # type: ignore[attr-defined]
+            end=int(self.end_range.value),  # type: ignore[attr-defined]
+        )
+        if cached is None:
+            return
+        for number in numbers:
+            cached.free_ranges.reserve(number)
@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Generator, Iterator, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Generator, Hashable, Iterator, Optional, TypeVar, Union
 
 import ujson
 from neo4j.graph import Node as Neo4jNode
@@ -13,6 +13,7 @@ from neo4j.graph import Relationship as Neo4jRelationship
 
 from infrahub import config
 from infrahub.core.constants import PermissionLevel
+from infrahub.core.query.cache import QueryCacheEntry, query_text_cache
 from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import QueryError
 
@@ -343,6 +344,13 @@ class Query(ABC):
     insert_return: bool = True
     insert_limit: bool = True
 
+    # Cypher expression, evaluated on the returned variables, used to paginate unbounded READ queries
+    # on a set of keys instead of SKIP/LIMIT, each page only reads the results of its own keys.
+    # A query opts in by defining this key and by including the filter returned by get_cursor_filter() in its MATCH
+    # clauses, get_cursor_keys() returns all the keys that can be part of the results.
+    cursor_key: Optional[str] = None
+    cursor_label: str = "query_cursor"
+
     def __init__(
         self,
         branch: Optional[Branch] = None,
@@ -376,6 +384,9 @@ class Query(ABC):
         self.has_been_executed: bool = False
         self.has_errors: bool = False
 
+        self._query_cache_key: Optional[Hashable] = None
+        self._query_cache_entry: Optional[QueryCacheEntry] = None
+
         self.stats: QueryStats = QueryStats()
 
     def update_return_labels(self, value: Union[str, list[str]]) -> None:
@@ -412,12 +423,73 @@ class Query(ABC):
         A string with multiple lines will be broken down into multiple entries in self.query_lines
         Trailing and leading spaces per line will be removed."""
 
+        self._query_cache_entry = None
+
         if isinstance(query, list):
             for item in query:
                 self.add_to_query(query=item)
         else:
             self.query_lines.extend([line.strip() for line in query.split("\n") if line.strip()])
 
+    def load_query_from_cache(self, db: InfrahubDatabase, key: Hashable) -> bool:
+        """Restore the text of the query from the process-wide cache.
+
+        The key must capture all the inputs that define the structure of the query, the parameters
+        that depend on the values must be defined before. Returns False if the query must be generated,
+        in which case save_query_to_cache() must be called once it is complete.
+        """
+        self._query_cache_key = (self.__class__, db.db_type, key)
+        entry = query_text_cache.get(key=self._query_cache_key, name=self.name)
+        if not entry:
+            return False
+
+        self.query_lines = list(entry.query_lines)
+        self.return_labels = list(entry.return_labels)
+        self.order_by = list(entry.order_by) if entry.order_by is not None else None
+        self.params.update(entry.params)
+        self._query_cache_entry = entry
+        return True
+
+    def save_query_to_cache(self, params: Optional[dict[str, Any]] = None) -> None:
+        """Store the text of the query in the cache.
+
+        params must only contain the parameters that are defined by the structure of the query."""
+        if self._query_cache_key is None:
+            raise ValueError(f"load_query_from_cache() must be called first for {self.name}")
+
+        self._query_cache_entry = QueryCacheEntry(
+            query_lines=tuple(self.query_lines),
+            return_labels=tuple(self.return_labels),
+            order_by=tuple(self.order_by) if self.order_by is not None else None,
+            params=params or {},
+        )
+        query_text_cache.set(key=self._query_cache_key, entry=self._query_cache_entry)
+
+    def get_cursor_filter(self, key: str) -> str:
+        """Return the condition to only keep the entries whose key is part of the current page.
+
+        The key must be the variable or property, bound early in the query, whose values are returned by get_cursor_keys().
+        When the query is not paginated with a cursor the parameter is null and the filter has no effect.
+        """
+        self.params.setdefault("cursor_keys", None)
+        return f"($cursor_keys IS NULL OR {key} IN $cursor_keys)"
+
+    @property
+    def supports_cursor(self) -> bool:
+        return bool(self.cursor_key) and self.insert_return and "cursor_keys" in self.params
+
+    async def get_cursor_keys(self, db: InfrahubDatabase) -> list[Any]:
+        """Return all the values of the key filtered by get_cursor_filter() that can be part of the results.
+
+        By default the query is executed once to only return its distinct keys,
+        a query can override this method with a cheaper way to list a superset of its keys.
+        """
+        query_str = "\n".join(self.query_lines + [f"RETURN DISTINCT {self.cursor_key} AS {self.cursor_label}"])
+        return [
+            record[self.cursor_label]
+            async for record in db.stream_query(query=query_str, params=self.params, name=f"{self.name}_cursor_keys")
+        ]
+
     def add_subquery(self, subquery: str, with_clause: Optional[str] = None) -> None:
         self.add_to_query("CALL {")
         self.add_to_query(subquery)
@@ -431,32 +503,71 @@ class Query(ABC):
         inline: bool = False,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        cursor: bool = False,
     ) -> str:
+        """Return the text of the query, the limit and the offset are parameters provided by get_params()."""
         # Make a local copy of the _query_lines
         limit = limit or self.limit
         offset = offset or self.offset
-        tmp_query_lines = self.query_lines.copy()
 
-        if self.insert_return:
-            tmp_query_lines.append("RETURN " + ",".join(self.return_labels))
+        if not var and self._query_cache_entry:
+            rendered_key = (bool(limit), bool(offset), cursor)
+            if rendered_key not in self._query_cache_entry.rendered:
+                self._query_cache_entry.rendered[rendered_key] = self._render_query(
+                    limit=limit, offset=offset, cursor=cursor
+                )
+            return self._query_cache_entry.rendered[rendered_key]
 
-        if self.order_by:
-            tmp_query_lines.append("ORDER BY " + ",".join(self.order_by))
+        query_str = self._render_query(limit=limit, offset=offset, cursor=cursor)
 
-        if offset and self.insert_limit:
-            tmp_query_lines.append(f"SKIP {offset}")
+        if var and not inline:
+            return "\n" + self.get_params_for_shell(limit=limit, offset=offset) + "\n\n" + query_str
+        if var and inline:
+            return self.insert_variables_in_query(
+                query=query_str, variables=self.get_params(limit=limit, offset=offset)
+            )
+
+        return query_str
+
+    def get_params(self, limit: Optional[int] = None, offset: Optional[int] = None) -> dict[str, Any]:
+        """Return the parameters of the query, including the limit and the offset used to render it."""
+        limit = limit or self.limit
+        offset = offset or self.offset
+        if not limit and not offset:
+            return self.params
 
+        params = dict(self.params)
         if limit and self.insert_limit:
-            tmp_query_lines.append(f"LIMIT {limit}")
+            params["query_limit"] = limit
+        if offset and self.insert_limit:
+            params["query_offset"] = offset
+        return params
 
-        query_str = "\n".join(tmp_query_lines)
+    def _render_query(self, limit: Optional[int], offset: Optional[int], cursor: bool) -> str:
+        tmp_query_lines = self.query_lines.copy()
+        order_by = self.order_by.copy() if self.order_by else []
+
+        if cursor:
+            if not self.supports_cursor:
+                raise ValueError(f"Query {self.name} doesn't support cursor pagination")
+            if self.insert_return:
+                tmp_query_lines.append(
+                    "RETURN " + ",".join(self.return_labels + [f"{self.cursor_key} AS {self.cursor_label}"])
+                )
+            order_by.insert(0, self.cursor_label)
+        elif self.insert_return:
+            tmp_query_lines.append("RETURN " + ",".join(self.return_labels))
 
-        if var and not inline:
-            return "\n" + self.get_params_for_shell() + "\n\n" + query_str
-        if var and inline:
-            return self.insert_variables_in_query(query=query_str, variables=self.params)
+        if order_by:
+            tmp_query_lines.append("ORDER BY " + ",".join(order_by))
 
-        return query_str
+        if offset and self.insert_limit:
+            tmp_query_lines.append("SKIP $query_offset")
+
+        if limit and self.insert_limit:
+            tmp_query_lines.append("LIMIT $query_limit")
+
+        return "\n".join(tmp_query_lines)
 
     def get_count_query(self, var: bool = False) -> str:
         tmp_query_lines = self.query_lines.copy()
@@ -495,28 +606,29 @@ class Query(ABC):
 
         return query
 
-    def get_params_for_shell(self) -> str:
+    def get_params_for_shell(self, limit: Optional[int] = None, offset: Optional[int] = None) -> str:
+        params = self.get_params(limit=limit, offset=offset)
         if config.SETTINGS.database.db_type.value == "memgraph":
-            return ujson.dumps(self.params)
+            return ujson.dumps(params)
 
-        return self._get_params_for_neo4j_shell()
+        return self._get_params_for_neo4j_shell(params=params)
 
-    def _get_params_for_neo4j_shell(self) -> str:
+    def _get_params_for_neo4j_shell(self, params: dict[str, Any]) -> str:
         """Generate string to define some parameters in Neo4j browser interface.
         It's especially useful to later execute a query that includes some variables.
 
         The params string must be executed on its own window in Neo4j, before executing the query.
         """
 
-        params = []
+        params_str = []
 
-        for key, value in self.params.items():
+        for key, value in params.items():
             if isinstance(value, (int, list)):
-                params.append(f"{key}: {str(value)}")
+                params_str.append(f"{key}: {str(value)}")
             else:
-                params.append(f'{key}: "{value}"')
+                params_str.append(f'{key}: "{value}"')
 
-        return ":params { " + ", ".join(params) + " }"
+        return ":params { " + ", ".join(params_str) + " }"
 
     async def execute(self, db: InfrahubDatabase) -> Self:
         # Ensure all mandatory params have been provided
@@ -529,13 +641,15 @@ class Query(ABC):
 
         if self.type == QueryType.READ:
             if self.limit or self.offset:
-                results = await db.execute_query(query=query_str, params=self.params, name=self.name)
+                results = await db.execute_query(query=query_str, params=self.get_params(), name=self.name)
+            elif self.supports_cursor:
+                results = await self.query_with_cursor(db=db)
             else:
                 results = await self.query_with_size_limit(db=db)
 
         elif self.type == QueryType.WRITE:
             results, metadata = await db.execute_query_with_metadata(
-                query=query_str, params=self.params, name=self.name
+                query=query_str, params=self.get_params(), name=self.name
             )
             if "stats" in metadata:
                 self.stats.add(metadata.get("stats"))
@@ -550,6 +664,32 @@ class Query(ABC):
 
         return self
 
+    async def stream(self, db: InfrahubDatabase) -> AsyncIterator[QueryResult]:
+        """Execute a READ query and yield the results as they are produced by the database.
+
+        Unlike execute(), the results are not stored in self.results and the query is not paginated,
+        the memory used by the caller is bounded by the number of results it decides to keep.
+        """
+
+        if self.type == QueryType.WRITE:
+            raise TypeError("Unable to stream the results of a Write query.")
+        if self.type != QueryType.READ:
+            raise ValueError(f"unknown value for {self.type}")
+
+        if config.SETTINGS.miscellaneous.print_query_details:
+            self.print(include_var=True)
+
+        query_str = self.get_query()
+        has_results = False
+        async for record in db.stream_query(query=query_str, params=self.get_params(), name=self.name):
+            has_results = True
+            yield QueryResult(data=record, labels=self.return_labels)
+
+        if not has_results and self.raise_error_if_empty:
+            raise QueryError(query=query_str, params=self.params)
+
+        self.has_been_executed = True
+
     async def query_with_size_limit(self, db: InfrahubDatabase) -> list[Record]:
         query_limit = config.SETTINGS.database.query_size_limit
         offset = 0
@@ -558,7 +698,7 @@ class Query(ABC):
         while remaining:
             offset_results, metadata = await db.execute_query_with_metadata(
                 query=self.get_query(limit=query_limit, offset=offset),
-                params=self.params,
+                params=self.get_params(limit=query_limit, offset=offset),
                 name=self.name,
             )
             if "stats" in metadata:
@@ -571,6 +711,58 @@ class Query(ABC):
 
         return results
 
+    async def query_with_cursor(self, db: InfrahubDatabase) -> list[Record]:
+        """Paginate through all the results, each page is limited to a subset of the keys returned by get_cursor_keys().
+
+        Unlike SKIP, the database doesn't have to walk again all the records of the previous pages.
+        """
+        results: list[Record] = []
+        async for page_results in self._iter_cursor_pages(db=db):
+            results.extend(page_results)
+        return results
+
+    async def stream_pages(self, db: InfrahubDatabase) -> AsyncIterator[list[QueryResult]]:
+        """Execute a READ query paginated with a cursor and yield the results one page at a time.
+
+        The results are ordered by cursor_key and all the results sharing the same key are part of the same page,
+        which lets the caller process the results of a key completely before moving to the next page.
+        """
+        if not self.supports_cursor:
+            raise ValueError(f"Query {self.name} doesn't support cursor pagination")
+
+        if config.SETTINGS.miscellaneous.print_query_details:
+            self.print(include_var=True)
+
+        has_results = False
+        async for page_results in self._iter_cursor_pages(db=db):
+            has_results = has_results or bool(page_results)
+            yield [QueryResult(data=result, labels=self.return_labels) for result in page_results]
+
+        if not has_results and self.raise_error_if_empty:
+            raise QueryError(query=self.get_query(), params=self.params)
+
+        self.has_been_executed = True
+
+    async def _iter_cursor_pages(self, db: InfrahubDatabase) -> AsyncIterator[list[Record]]:
+        """Yield the pages of results of the query paginated with a cursor.
+
+        The keys are sorted and split in pages of query_size_limit keys, the query only reads the results
+        of the keys of the page so a page always contains all the results of its keys.
+        """
+        keys = sorted({key for key in await self.get_cursor_keys(db=db) if key is not None})
+        page_size = config.SETTINGS.database.query_size_limit
+        query_str = self.get_query(cursor=True)
+        for offset in range(0, len(keys), page_size):
+            page_results, metadata = await db.execute_query_with_metadata(
+                query=query_str,
+                params={**self.get_params(), "cursor_keys": keys[offset : offset + page_size]},
+                name=self.name,
+            )
+            if "stats" in metadata:
+                self.stats.add(metadata.get("stats"))
+
+            yield page_results
+
     async def count(self, db: InfrahubDatabase) -> int:
         """Count the number of results matching a READ query.
         OFFSET and LIMIT are automatically excluded when counting.
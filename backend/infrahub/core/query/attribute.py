@@ -9,7 +9,7 @@ from infrahub.core.query import Query, QueryNode, QueryRel, QueryType
 from infrahub.core.timestamp import Timestamp
 
 if TYPE_CHECKING:
-    from infrahub.core.attribute import BaseAttribute
+    from infrahub.core.attribute import AttributeUpdateData, BaseAttribute
     from infrahub.core.branch import Branch
     from infrahub.core.query import QueryElement
     from infrahub.database import InfrahubDatabase
@@ -40,121 +40,117 @@ class AttributeQuery(Query):
         super().__init__(**kwargs)
 
 
-class AttributeUpdateValueQuery(AttributeQuery):
-    name = "attribute_update_value"
-    type: QueryType = QueryType.WRITE
-
-    raise_error_if_empty: bool = True
-
-    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
-        at = self.at or self.attr.at
-
-        self.params["attr_uuid"] = self.attr.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = at.to_string()
-        content = self.attr.to_db()
-        self.params.update(self.attr.to_db())
+class AttributeUpdateBatchQuery(Query):
+    """Update the value, the flags and the node properties of multiple attributes in a single query.
 
-        prop_list = [f"{key}: ${key}" for key in content.keys()]
+    Only the changes provided in `updates` are written, the relationships listed in `rel_ids_to_close` are closed at the same time.
+    Nothing is written and the query fails if one of the attributes or one of the nodes used as property is not found.
+    """
 
-        labels = ["AttributeValue"]
-        node_type = self.attr.get_db_node_type()
-        if node_type == AttributeDBNodeType.IPHOST:
-            labels.append("AttributeIPHost")
-        elif node_type == AttributeDBNodeType.IPNETWORK:
-            labels.append("AttributeIPNetwork")
-
-        query = """
-        MATCH (a:Attribute { uuid: $attr_uuid })
-        MERGE (av:%(labels)s { %(props)s } )
-        CREATE (a)-[r:%(rel_label)s { branch: $branch, branch_level: $branch_level, status: "active", from: $at }]->(av)
-        """ % {"rel_label": self.attr._rel_to_value_label, "labels": ":".join(labels), "props": ", ".join(prop_list)}
-
-        self.add_to_query(query)
-        self.return_labels = ["a", "av", "r"]
-
-
-class AttributeUpdateFlagQuery(AttributeQuery):
-    name = "attribute_update_flag"
+    name = "attribute_update_batch"
     type: QueryType = QueryType.WRITE
 
     raise_error_if_empty: bool = True
 
-    def __init__(
-        self,
-        flag_name: str,
-        **kwargs,
-    ):
-        SUPPORTED_FLAGS = ["is_visible", "is_protected"]
-
-        if flag_name not in SUPPORTED_FLAGS:
-            raise ValueError(f"Only {SUPPORTED_FLAGS} are supported for now.")
-
-        self.flag_name = flag_name
-
+    def __init__(self, updates: list[AttributeUpdateData], **kwargs: Any) -> None:
+        self.updates = updates
         super().__init__(**kwargs)
 
-    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
-        at = self.at or self.attr.at
-
-        self.params["attr_uuid"] = self.attr.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = at.to_string()
-        self.params["flag_value"] = getattr(self.attr, self.flag_name)
-        self.params["flag_type"] = self.attr.get_kind()
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params["at"] = self.at.to_string()
+        self.params["attr_uuids"] = list({update.uuid for update in self.updates})
+        self.params["peer_ids"] = list(
+            {peer_id for update in self.updates for peer_id in update.node_properties.values()}
+        )
 
         query = """
-        MATCH (a:Attribute { uuid: $attr_uuid })
-        MERGE (flag:Boolean { value: $flag_value })
-        CREATE (a)-[r:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at }]->(flag)
-        """ % self.flag_name.upper()
-
-        self.add_to_query(query)
-        self.return_labels = ["a", "flag", "r"]
-
-
-class AttributeUpdateNodePropertyQuery(AttributeQuery):
-    name = "attribute_update_node_property"
-    type: QueryType = QueryType.WRITE
-
-    raise_error_if_empty: bool = True
-
-    def __init__(
-        self,
-        prop_name: str,
-        prop_id: str,
-        **kwargs,
-    ):
-        self.prop_name = prop_name
-        self.prop_id = prop_id
-
-        super().__init__(**kwargs)
-
-    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
-        at = self.at or self.attr.at
-
-        self.params["attr_uuid"] = self.attr.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = at.to_string()
-        self.params["prop_name"] = self.prop_name
-        self.params["prop_id"] = self.prop_id
-
-        rel_name = f"HAS_{self.prop_name.upper()}"
-
-        query = (
-            """
-        MATCH (a:Attribute { uuid: $attr_uuid })
-        MATCH (np:Node { uuid: $prop_id })
-        CREATE (a)-[r:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at }]->(np)
+        MATCH (a:Attribute)
+        WHERE a.uuid IN $attr_uuids
+        WITH collect(a) AS attrs, count(DISTINCT a.uuid) AS nb_attributes
+        OPTIONAL MATCH (np:Node)
+        WHERE np.uuid IN $peer_ids
+        WITH attrs, nb_attributes, collect(np) AS peers, count(DISTINCT np.uuid) AS nb_peers
+        WHERE nb_attributes = size($attr_uuids) AND nb_peers = size($peer_ids)
         """
-            % rel_name
-        )
-
         self.add_to_query(query)
-        self.return_labels = ["a", "np", "r"]
+
+        values_per_group: dict[tuple[AttributeDBNodeType, tuple[str, ...]], list[dict[str, Any]]] = {}
+        flags_per_name: dict[str, list[dict[str, Any]]] = {}
+        props_per_name: dict[str, list[dict[str, Any]]] = {}
+        for update in self.updates:
+            update_data = {"uuid": update.uuid, "branch": update.branch, "branch_level": update.branch_level}
+            if update.content is not None:
+                group = (update.node_type, tuple(update.content.keys()))
+                values_per_group.setdefault(group, []).append({**update_data, "content": update.content})
+            for flag_name, flag_value in update.flag_properties.items():
+                flags_per_name.setdefault(flag_name, []).append({**update_data, "value": flag_value})
+            for prop_name, peer_id in update.node_properties.items():
+                props_per_name.setdefault(prop_name, []).append({**update_data, "peer_id": peer_id})
+
+        rel_prop_str = '{ branch: data.branch, branch_level: data.branch_level, status: "active", from: $at }'
+
+        for idx, ((node_type, content_keys), values) in enumerate(values_per_group.items()):
+            labels = ["AttributeValue"]
+            if node_type == AttributeDBNodeType.IPHOST:
+                labels.append("AttributeIPHost")
+            elif node_type == AttributeDBNodeType.IPNETWORK:
+                labels.append("AttributeIPNetwork")
+
+            self.params[f"values_{idx}"] = values
+            query = """
+            FOREACH ( data IN $values_%(idx)s |
+                FOREACH ( a IN [attr IN attrs WHERE attr.uuid = data.uuid] |
+                    MERGE (av:%(labels)s { %(props)s })
+                    CREATE (a)-[:%(rel_label)s %(rel_prop)s ]->(av)
+                )
+            )
+            """ % {
+                "idx": idx,
+                "labels": ":".join(labels),
+                "props": ", ".join(f"{key}: data.content.{key}" for key in content_keys),
+                "rel_label": RELATIONSHIP_TO_VALUE_LABEL,
+                "rel_prop": rel_prop_str,
+            }
+            self.add_to_query(query)
+
+        for flag_name, flags in flags_per_name.items():
+            self.params[f"flags_{flag_name}"] = flags
+            query = """
+            FOREACH ( data IN $flags_%(flag_name)s |
+                FOREACH ( a IN [attr IN attrs WHERE attr.uuid = data.uuid] |
+                    MERGE (flag:Boolean { value: data.value })
+                    CREATE (a)-[:%(rel_label)s %(rel_prop)s ]->(flag)
+                )
+            )
+            """ % {"flag_name": flag_name, "rel_label": flag_name.upper(), "rel_prop": rel_prop_str}
+            self.add_to_query(query)
+
+        for prop_name, props in props_per_name.items():
+            self.params[f"props_{prop_name}"] = props
+            query = """
+            FOREACH ( data IN $props_%(prop_name)s |
+                FOREACH ( a IN [attr IN attrs WHERE attr.uuid = data.uuid] |
+                    FOREACH ( np IN [peer IN peers WHERE peer.uuid = data.peer_id] |
+                        CREATE (a)-[:%(rel_label)s %(rel_prop)s ]->(np)
+                    )
+                )
+            )
+            """ % {"prop_name": prop_name, "rel_label": f"HAS_{prop_name.upper()}", "rel_prop": rel_prop_str}
+            self.add_to_query(query)
+
+        rel_ids_to_close = [db.to_database_id(rel_id) for update in self.updates for rel_id in update.rel_ids_to_close]
+        if rel_ids_to_close:
+            self.params["rel_ids_to_close"] = rel_ids_to_close
+            query = """
+            WITH attrs
+            OPTIONAL MATCH ()-[r]->()
+            WHERE %(id_func)s(r) IN $rel_ids_to_close
+            WITH attrs, collect(r) AS rels_to_close
+            FOREACH ( r IN rels_to_close | SET r.to = $at )
+            """ % {"id_func": db.get_id_function_name()}
+            self.add_to_query(query)
+
+        self.return_labels = ["size(attrs) AS nb_attributes"]
 
 
 class AttributeGetQuery(AttributeQuery):
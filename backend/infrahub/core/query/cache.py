@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Hashable, Optional
+
+from infrahub.database.metrics import QUERY_TEXT_CACHE_HITS, QUERY_TEXT_CACHE_MISSES
+
+
+@dataclass
+class QueryCacheEntry:
+    """Structure of a query, independent of the values of its parameters."""
+
+    query_lines: tuple[str, ...]
+    return_labels: tuple[str, ...]
+    order_by: Optional[tuple[str, ...]] = None
+    params: dict[str, Any] = field(default_factory=dict)
+    rendered: dict[tuple, str] = field(default_factory=dict)
+
+
+class QueryTextCache:
+    """Process-wide LRU cache of the Cypher text generated by the queries.
+
+    The entries are indexed by the class of the query and by the structural inputs that define its text,
+    the queries with the same structure only differ by the values of their parameters.
+    """
+
+    def __init__(self, max_size: int = 2048) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, QueryCacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, name: str) -> Optional[QueryCacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            QUERY_TEXT_CACHE_MISSES.labels(name).inc()
+            return None
+
+        QUERY_TEXT_CACHE_HITS.labels(name).inc()
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: Hashable, entry: QueryCacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+query_text_cache = QueryTextCache()
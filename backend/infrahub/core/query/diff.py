@@ -499,10 +499,70 @@ class DiffCountChanges(Query):
         return branch_count_map
 
 
+class DiffChangedFieldsQuery(DiffQuery):
+    """Get the attributes and relationships with a change on the branch during the timeframe.
+
+    Every change writes edges with the branch and the time of the change, this query reads them back as a journal
+    of the (node uuid, field name) changed. The result is a superset of the fields included in a diff of the same
+    timeframe, it is used to limit DiffAllPathsQuery to these fields. The nodes added or deleted without any
+    attribute or relationship are returned without a field name.
+    """
+
+    name: str = "diff_changed_fields"
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        self.params = {
+            "branch_name": self.branch.name,
+            "from_time": self.diff_from.to_string(),
+            "to_time": self.diff_to.to_string(),
+        }
+        query = """
+        CALL {
+            // nodes added or deleted
+            MATCH (n:Node)-[r_root:IS_PART_OF {branch: $branch_name}]->(:Root)
+            WHERE $from_time <= r_root.from < $to_time
+            OPTIONAL MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(field)
+            WHERE any(l in labels(field) WHERE l in ["Attribute", "Relationship"])
+            RETURN n.uuid AS node_uuid, field.name AS field_name
+            UNION
+            // attributes and relationships added or deleted
+            MATCH (n:Node)-[r_node:HAS_ATTRIBUTE|IS_RELATED {branch: $branch_name}]-(field)
+            WHERE $from_time <= r_node.from < $to_time
+            AND any(l in labels(field) WHERE l in ["Attribute", "Relationship"])
+            RETURN n.uuid AS node_uuid, field.name AS field_name
+            UNION
+            // properties of attributes and relationships updated
+            MATCH (field)-[r_prop:HAS_VALUE|IS_VISIBLE|IS_PROTECTED|HAS_SOURCE|HAS_OWNER {branch: $branch_name}]->()
+            WHERE $from_time <= r_prop.from < $to_time
+            AND any(l in labels(field) WHERE l in ["Attribute", "Relationship"])
+            MATCH (n:Node)-[:HAS_ATTRIBUTE|IS_RELATED]-(field)
+            RETURN n.uuid AS node_uuid, field.name AS field_name
+        }
+        """
+        self.add_to_query(query=query)
+        self.order_by = ["node_uuid", "field_name"]
+        self.return_labels = ["DISTINCT node_uuid AS node_uuid", "field_name AS field_name"]
+
+    def get_node_field_specifiers(self) -> set[tuple[str, str]]:
+        return {
+            (
+                result.get_as_type(label="node_uuid", return_type=str),
+                result.get_as_type(label="field_name", return_type=str),
+            )
+            for result in self.results
+            if result.get("field_name") is not None
+        }
+
+    def get_node_uuids(self) -> set[str]:
+        """Return the uuid of all the nodes changed, including the ones without any attribute or relationship."""
+        return {result.get_as_type(label="node_uuid", return_type=str) for result in self.results}
+
+
 class DiffAllPathsQuery(DiffQuery):
     """Gets the required Cypher paths for a diff"""
 
     name: str = "diff_node"
+    cursor_key: str = "nodes(diff_path)[1].uuid"
 
     def __init__(
         self,
@@ -511,6 +571,8 @@ class DiffAllPathsQuery(DiffQuery):
         branch_support: list[BranchSupportType] | None = None,
         current_node_field_specifiers: list[tuple[str, str]] | None = None,
         new_node_field_specifiers: list[tuple[str, str]] | None = None,
+        node_kinds: list[str] | None = None,
+        excluded_node_kinds: list[str] | None = None,
         **kwargs: Any,
     ):
         self.base_branch = base_branch
@@ -518,6 +580,8 @@ class DiffAllPathsQuery(DiffQuery):
         self.branch_support = branch_support or [BranchSupportType.AWARE]
         self.current_node_field_specifiers = current_node_field_specifiers
         self.new_node_field_specifiers = new_node_field_specifiers
+        self.node_kinds = node_kinds
+        self.excluded_node_kinds = excluded_node_kinds
 
         super().__init__(**kwargs)
 
@@ -534,6 +598,8 @@ class DiffAllPathsQuery(DiffQuery):
                 "branch_support": [item.value for item in self.branch_support],
                 "new_node_field_specifiers": self.new_node_field_specifiers,
                 "current_node_field_specifiers": self.current_node_field_specifiers,
+                "node_kinds": self.node_kinds,
+                "excluded_node_kinds": self.excluded_node_kinds,
             }
         )
         query = """
@@ -555,6 +621,8 @@ CALL {
         // -------------------------------------
         MATCH (q:Root)<-[diff_rel:IS_PART_OF {branch: $branch_name}]-(p:Node)
         WHERE (node_ids_list IS NULL OR p.uuid IN node_ids_list)
+        AND %(cursor_filter_p)s
+        AND %(kind_filter_p)s
         AND (from_time <= diff_rel.from < $to_time)
         AND (diff_rel.to IS NULL OR (from_time <= diff_rel.to < $to_time))
         AND (p.branch_support IN $branch_support OR q.branch_support IN $branch_support)
@@ -634,6 +702,8 @@ CALL {
             MATCH (root:Root)<-[r_root:IS_PART_OF]-(p:Node)-[diff_rel:HAS_ATTRIBUTE {branch: $branch_name}]->(q:Attribute)
             // exclude attributes and relationships under added/removed nodes b/c they are covered above
             WHERE (node_field_specifiers_list IS NULL OR [p.uuid, q.name] IN node_field_specifiers_list)
+            AND %(cursor_filter_p)s
+            AND %(kind_filter_p)s
             AND r_root.branch IN [$branch_name, $base_branch_name, $global_branch_name]
             AND (p.branch_support IN $branch_support OR q.branch_support IN $branch_support)
             // if p has a different type of branch support and was addded within our timeframe
@@ -650,6 +720,8 @@ CALL {
             MATCH (root:Root)<-[r_root:IS_PART_OF]-(p:Node)-[diff_rel:IS_RELATED {branch: $branch_name}]-(q:Relationship)
             // exclude attributes and relationships under added/removed nodes b/c they are covered above
             WHERE (node_field_specifiers_list IS NULL OR [p.uuid, q.name] IN node_field_specifiers_list)
+            AND %(cursor_filter_p)s
+            AND %(kind_filter_p)s
             AND r_root.branch IN [$branch_name, $base_branch_name, $global_branch_name]
             AND (p.branch_support IN $branch_support OR q.branch_support IN $branch_support)
             // if p has a different type of branch support and was addded within our timeframe
@@ -746,6 +818,8 @@ CALL {
         // -------------------------------------
         MATCH diff_rel_path = (root:Root)<-[r_root:IS_PART_OF]-(n:Node)-[r_node]-(p)-[diff_rel {branch: $branch_name}]->(q)
         WHERE (node_field_specifiers_list IS NULL OR [n.uuid, p.name] IN node_field_specifiers_list)
+        AND %(cursor_filter_n)s
+        AND %(kind_filter_n)s
         AND (from_time <= diff_rel.from < $to_time)
         AND (diff_rel.to IS NULL OR (from_time <= diff_rel.to < $to_time))
         // exclude attributes and relationships under added/removed nodes, attrs, and rels b/c they are covered above
@@ -886,6 +960,38 @@ WITH reduce(
     CASE WHEN item IS NULL THEN diff_rel_paths ELSE diff_rel_paths + [item] END
 ) AS diff_rel_paths
 UNWIND diff_rel_paths AS diff_path
-        """ % {"id_func": db.get_id_function_name()}
+        """ % {
+            "id_func": db.get_id_function_name(),
+            "cursor_filter_p": self.get_cursor_filter(key="p.uuid"),
+            "cursor_filter_n": self.get_cursor_filter(key="n.uuid"),
+            "kind_filter_p": self._get_kind_filter(key="p.kind"),
+            "kind_filter_n": self._get_kind_filter(key="n.kind"),
+        }
         self.add_to_query(query)
         self.return_labels = ["DISTINCT diff_path AS diff_path"]
+
+    async def get_cursor_keys(self, db: InfrahubDatabase) -> list[Any]:
+        """Return the uuid of the nodes that can be part of the diff.
+
+        The nodes of the field specifiers when the diff is limited to them,
+        otherwise the nodes with a change on the branch during the timeframe.
+        """
+        if self.new_node_field_specifiers is not None or self.current_node_field_specifiers is not None:
+            return [
+                node_uuid
+                for node_uuid, _ in (self.new_node_field_specifiers or []) + (self.current_node_field_specifiers or [])
+            ]
+
+        query = await DiffChangedFieldsQuery.init(
+            db=db, branch=self.branch, diff_from=self.diff_from, diff_to=self.diff_to
+        )
+        await query.execute(db=db)
+        return list(query.get_node_uuids())
+
+    @staticmethod
+    def _get_kind_filter(key: str) -> str:
+        """Filter on the kind of the nodes, used to split the diff into partitions of kinds."""
+        return (
+            f"($node_kinds IS NULL OR {key} IN $node_kinds) "
+            f"AND ($excluded_node_kinds IS NULL OR NOT {key} IN $excluded_node_kinds)"
+        )
@@ -36,6 +36,16 @@ class IPAddressData:
     address: IPAddressType
 
 
+@dataclass
+class IPNodeData:
+    id: str
+    is_address: bool
+    version: int
+    binary_address: str
+    prefixlen: int
+    current_parent_id: Optional[str] = None
+
+
 def _get_namespace_id(
     namespace: Optional[Union[Node, str]] = None,
 ) -> str:
@@ -573,3 +583,95 @@ class IPPrefixReconcileQuery(Query):
 
     def get_calculated_children_uuids(self) -> list[str]:
         return self._get_uuids_from_query_list("new_children")
+
+
+class IPNamespaceReconcileQuery(Query):
+    """Get all the prefixes and addresses of a namespace, with their value and their current parent prefix."""
+
+    name: str = "ip_namespace_reconcile"
+
+    def __init__(
+        self,
+        namespace: Optional[Union[Node, str]] = None,
+        **kwargs,
+    ):
+        self.namespace_id = _get_namespace_id(namespace)
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        branch_filter, branch_params = self.branch.get_query_filter_path(at=self.at.to_string())
+        self.params.update(branch_params)
+        self.params["namespace_id"] = self.namespace_id
+        self.params["ip_address_kind"] = InfrahubKind.IPADDRESS
+        self.params["ip_prefix_attribute_kind"] = PREFIX_ATTRIBUTE_LABEL
+        self.params["ip_address_attribute_kind"] = ADDRESS_ATTRIBUTE_LABEL
+
+        # ruff: noqa: E501
+        query = """
+        MATCH (ip_namespace:%(namespace_kind)s {uuid: $namespace_id})-[r:IS_PART_OF]->(root:Root)
+        WHERE %(branch_filter)s
+        // Get the prefixes and the addresses of the namespace that are active on the branch
+        MATCH ns_path = (ip_namespace)-[:IS_RELATED]-(ns_rel:Relationship)-[:IS_RELATED]-(ip_node:Node)
+        WHERE ns_rel.name IN ["ip_namespace__ip_prefix", "ip_namespace__ip_address"]
+        AND all(r IN relationships(ns_path) WHERE (%(branch_filter)s) AND r.status = "active")
+        WITH DISTINCT ip_node
+        CALL {
+            WITH ip_node
+            MATCH (root:Root)<-[r:IS_PART_OF]-(ip_node)
+            WHERE %(branch_filter)s
+            RETURN r AS rb
+            ORDER BY r.branch_level DESC, r.from DESC
+            LIMIT 1
+        }
+        WITH ip_node, rb
+        WHERE rb.status = "active"
+        // Get the latest value of the prefix or of the address
+        CALL {
+            WITH ip_node
+            MATCH value_path = (ip_node)-[har:HAS_ATTRIBUTE]->(a:Attribute)-[hvr:HAS_VALUE]->(av:AttributeValue)
+            WHERE a.name IN ["prefix", "address"]
+            AND any(attr_kind IN [$ip_prefix_attribute_kind, $ip_address_attribute_kind] WHERE attr_kind IN labels(av))
+            AND all(r IN relationships(value_path) WHERE (%(branch_filter)s))
+            WITH
+                av,
+                (har.status = "active" AND hvr.status = "active") AS is_active,
+                har.branch_level + hvr.branch_level AS branch_level
+            ORDER BY branch_level DESC, har.from DESC, hvr.from DESC
+            RETURN head(collect([av, is_active])) AS latest_value
+        }
+        WITH ip_node, latest_value[0] AS av
+        WHERE latest_value[1] = TRUE
+        // Get the current parent of the prefix or of the address, if it exists
+        OPTIONAL MATCH parent_prefix_path = (ip_node)-[:IS_RELATED]->(:Relationship {name: "parent__child"})-[:IS_RELATED]->(prefix_parent:%(ip_prefix_kind)s)
+        WHERE all(r IN relationships(parent_prefix_path) WHERE (%(branch_filter)s) and r.status = "active")
+        OPTIONAL MATCH parent_address_path = (ip_node)-[:IS_RELATED]-(:Relationship {name: "ip_prefix__ip_address"})-[:IS_RELATED]-(address_parent:%(ip_prefix_kind)s)
+        WHERE all(r IN relationships(parent_address_path) WHERE (%(branch_filter)s) and r.status = "active")
+        WITH ip_node, av, collect(coalesce(prefix_parent.uuid, address_parent.uuid)) AS current_parent_uuids
+        """ % {
+            "branch_filter": branch_filter,
+            "namespace_kind": InfrahubKind.IPNAMESPACE,
+            "ip_prefix_kind": InfrahubKind.IPPREFIX,
+        }
+        self.add_to_query(query)
+        self.return_labels = [
+            "ip_node.uuid AS node_uuid",
+            "$ip_address_kind IN labels(ip_node) AS is_address",
+            "av.version AS version",
+            "av.binary_address AS binary_address",
+            "av.prefixlen AS prefixlen",
+            "head(current_parent_uuids) AS current_parent_uuid",
+        ]
+        self.order_by = ["node_uuid"]
+
+    def get_ip_nodes(self) -> list[IPNodeData]:
+        return [
+            IPNodeData(
+                id=str(result.get("node_uuid")),
+                is_address=bool(result.get("is_address")),
+                version=int(result.get("version")),
+                binary_address=str(result.get("binary_address")),
+                prefixlen=int(result.get("prefixlen")),
+                current_parent_id=result.get_as_optional_type(label="current_parent_uuid", return_type=str),
+            )
+            for result in self.get_results()
+        ]
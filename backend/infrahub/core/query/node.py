@@ -25,6 +25,7 @@ if TYPE_CHECKING:
     from infrahub.core.schema.attribute_schema import AttributeSchema
     from infrahub.core.schema.profile_schema import ProfileSchema
     from infrahub.core.schema.relationship_schema import RelationshipSchema
+    from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
 
 # pylint: disable=consider-using-f-string,redefined-builtin,too-many-lines
@@ -115,95 +116,82 @@ class NodeQuery(Query):
         super().__init__(**kwargs)
 
 
-class NodeCreateAllQuery(NodeQuery):
-    name = "node_create_all"
-
-    type: QueryType = QueryType.WRITE
-
-    raise_error_if_empty: bool = True
+async def get_node_create_data(db: InfrahubDatabase, node: Node, branch: Branch, at: Timestamp) -> dict[str, Any]:
+    """Return the parameters required to create a new node, its attributes and its relationships."""
+    attributes: list[AttributeCreateData] = []
+    attributes_iphost: list[AttributeCreateData] = []
+    attributes_ipnetwork: list[AttributeCreateData] = []
 
-    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
-        at = self.at or self.node._at
-        self.params["uuid"] = self.node.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["kind"] = self.node.get_kind()
-        self.params["branch_support"] = self.node._schema.branch
+    for attr_name in node._attributes:
+        attr: BaseAttribute = getattr(node, attr_name)
+        attr_data = attr.get_create_data()
 
-        attributes: list[AttributeCreateData] = []
-        attributes_iphost: list[AttributeCreateData] = []
-        attributes_ipnetwork: list[AttributeCreateData] = []
-
-        for attr_name in self.node._attributes:
-            attr: BaseAttribute = getattr(self.node, attr_name)
-            attr_data = attr.get_create_data()
-
-            if attr_data.node_type == AttributeDBNodeType.IPHOST:
-                attributes_iphost.append(attr_data)
-            elif attr_data.node_type == AttributeDBNodeType.IPNETWORK:
-                attributes_ipnetwork.append(attr_data)
-            else:
-                attributes.append(attr_data)
-
-        relationships: list[RelationshipCreateData] = []
-        for rel_name in self.node._relationships:
-            rel_manager: RelationshipManager = getattr(self.node, rel_name)
-            for rel in rel_manager._relationships:
-                relationships.append(await rel.get_create_data(db=db))
-
-        self.params["attrs"] = [attr.model_dump() for attr in attributes]
-        self.params["attrs_iphost"] = [attr.model_dump() for attr in attributes_iphost]
-        self.params["attrs_ipnetwork"] = [attr.model_dump() for attr in attributes_ipnetwork]
-        self.params["rels_bidir"] = [
-            rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.BIDIR.value
-        ]
-        self.params["rels_out"] = [
+        if attr_data.node_type == AttributeDBNodeType.IPHOST:
+            attributes_iphost.append(attr_data)
+        elif attr_data.node_type == AttributeDBNodeType.IPNETWORK:
+            attributes_ipnetwork.append(attr_data)
+        else:
+            attributes.append(attr_data)
+
+    relationships: list[RelationshipCreateData] = []
+    for rel_name in node._relationships:
+        rel_manager: RelationshipManager = getattr(node, rel_name)
+        for rel in rel_manager._relationships:
+            relationships.append(await rel.get_create_data(db=db))
+
+    return {
+        "attrs": [attr.model_dump() for attr in attributes],
+        "attrs_iphost": [attr.model_dump() for attr in attributes_iphost],
+        "attrs_ipnetwork": [attr.model_dump() for attr in attributes_ipnetwork],
+        "rels_bidir": [rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.BIDIR.value],
+        "rels_out": [
             rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.OUTBOUND.value
-        ]
-        self.params["rels_in"] = [
-            rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.INBOUND.value
-        ]
-
-        self.params["node_prop"] = {
-            "uuid": self.node.id,
-            "kind": self.node.get_kind(),
-            "namespace": self.node._schema.namespace,
-            "branch_support": self.node._schema.branch,
-        }
-        self.params["node_branch_prop"] = {
-            "branch": self.branch.name,
-            "branch_level": self.branch.hierarchy_level,
+        ],
+        "rels_in": [rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.INBOUND.value],
+        "node_prop": {
+            "uuid": node.id,
+            "kind": node.get_kind(),
+            "namespace": node._schema.namespace,
+            "branch_support": node._schema.branch,
+        },
+        "node_branch_prop": {
+            "branch": branch.name,
+            "branch_level": branch.hierarchy_level,
             "status": "active",
             "from": at.to_string(),
-        }
+        },
+    }
 
-        rel_prop_str = "{ branch: rel.branch, branch_level: rel.branch_level, status: rel.status, hierarchy: rel.hierarchical, from: $at }"
 
-        iphost_prop = {
-            "value": "attr.content.value",
-            "is_default": "attr.content.is_default",
-            "binary_address": "attr.content.binary_address",
-            "version": "attr.content.version",
-            "prefixlen": "attr.content.prefixlen",
-        }
-        iphost_prop_list = [f"{key}: {value}" for key, value in iphost_prop.items()]
-
-        ipnetwork_prop = {
-            "value": "attr.content.value",
-            "is_default": "attr.content.is_default",
-            "binary_address": "attr.content.binary_address",
-            "version": "attr.content.version",
-            "prefixlen": "attr.content.prefixlen",
-            # "num_addresses": "attr.content.num_addresses",
-        }
-        ipnetwork_prop_list = [f"{key}: {value}" for key, value in ipnetwork_prop.items()]
+def get_node_create_fields_query(source: str) -> str:
+    """Return the clauses creating the attributes and the relationships of the node `n`.
 
-        query = """
-        MATCH (root:Root)
-        CREATE (n:Node:%(labels)s $node_prop )
-        CREATE (n)-[r:IS_PART_OF $node_branch_prop ]->(root)
-        WITH distinct n
-        FOREACH ( attr IN $attrs |
+    `source` is the prefix used to access the lists generated by `get_node_create_data`,
+    either `$` when they are provided as parameters or a variable followed by a dot when they are unwound.
+    """
+    rel_prop_str = "{ branch: rel.branch, branch_level: rel.branch_level, status: rel.status, hierarchy: rel.hierarchical, from: $at }"
+
+    iphost_prop = {
+        "value": "attr.content.value",
+        "is_default": "attr.content.is_default",
+        "binary_address": "attr.content.binary_address",
+        "version": "attr.content.version",
+        "prefixlen": "attr.content.prefixlen",
+    }
+    iphost_prop_list = [f"{key}: {value}" for key, value in iphost_prop.items()]
+
+    ipnetwork_prop = {
+        "value": "attr.content.value",
+        "is_default": "attr.content.is_default",
+        "binary_address": "attr.content.binary_address",
+        "version": "attr.content.version",
+        "prefixlen": "attr.content.prefixlen",
+        # "num_addresses": "attr.content.num_addresses",
+    }
+    ipnetwork_prop_list = [f"{key}: {value}" for key, value in ipnetwork_prop.items()]
+
+    return """
+        FOREACH ( attr IN %(source)sattrs |
             CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
             CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
             MERGE (av:AttributeValue { value: attr.content.value, is_default: attr.content.is_default })
@@ -221,7 +209,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
             )
         )
-        FOREACH ( attr IN $attrs_iphost |
+        FOREACH ( attr IN %(source)sattrs_iphost |
             CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
             CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
             MERGE (av:AttributeValue:AttributeIPHost { %(iphost_prop)s })
@@ -239,7 +227,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
             )
         )
-        FOREACH ( attr IN $attrs_ipnetwork |
+        FOREACH ( attr IN %(source)sattrs_ipnetwork |
             CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
             CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
             MERGE (av:AttributeValue:AttributeIPNetwork { %(ipnetwork_prop)s })
@@ -257,7 +245,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
             )
         )
-        FOREACH ( rel IN $rels_bidir |
+        FOREACH ( rel IN %(source)srels_bidir |
             MERGE (d:Node { uuid: rel.destination_id })
             CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
             CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
@@ -275,7 +263,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
             )
         )
-        FOREACH ( rel IN $rels_out |
+        FOREACH ( rel IN %(source)srels_out |
             MERGE (d:Node { uuid: rel.destination_id })
             CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
             CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
@@ -293,7 +281,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
             )
         )
-        FOREACH ( rel IN $rels_in |
+        FOREACH ( rel IN %(source)srels_in |
             MERGE (d:Node { uuid: rel.destination_id })
             CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
             CREATE (n)<-[:IS_RELATED %(rel_prop)s ]-(rl)
@@ -311,13 +299,41 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
             )
         )
+    """ % {
+        "source": source,
+        "rel_prop": rel_prop_str,
+        "iphost_prop": ", ".join(iphost_prop_list),
+        "ipnetwork_prop": ", ".join(ipnetwork_prop_list),
+    }
+
+
+class NodeCreateAllQuery(NodeQuery):
+    name = "node_create_all"
+
+    type: QueryType = QueryType.WRITE
+
+    raise_error_if_empty: bool = True
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        at = self.at or self.node._at
+        self.params["uuid"] = self.node.id
+        self.params["branch"] = self.branch.name
+        self.params["branch_level"] = self.branch.hierarchy_level
+        self.params["kind"] = self.node.get_kind()
+        self.params["branch_support"] = self.node._schema.branch
+        self.params.update(await get_node_create_data(db=db, node=self.node, branch=self.branch, at=at))
+
+        query = """
+        MATCH (root:Root)
+        CREATE (n:Node:%(labels)s $node_prop )
+        CREATE (n)-[r:IS_PART_OF $node_branch_prop ]->(root)
+        WITH distinct n
+        %(fields)s
         WITH distinct n
         MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(rn)-[:HAS_VALUE|IS_RELATED]-(rv)
         """ % {
             "labels": ":".join(self.node.get_labels()),
-            "rel_prop": rel_prop_str,
-            "iphost_prop": ", ".join(iphost_prop_list),
-            "ipnetwork_prop": ", ".join(ipnetwork_prop_list),
+            "fields": get_node_create_fields_query(source="$"),
         }
 
         self.params["at"] = at.to_string()
@@ -337,17 +353,94 @@ class NodeCreateAllQuery(NodeQuery):
     def get_ids(self) -> dict[str, tuple[str, str]]:
         data = {}
         for result in self.get_results():
-            node = result.get("rn")
-            if "Relationship" in node.labels:
-                peer = result.get("rv")
-                name = f"{node.get('name')}::{peer.get('uuid')}"
-            elif "Attribute" in node.labels:
-                name = node.get("name")
-            data[name] = (node["uuid"], node.element_id)
+            name, ids = get_created_field_ids(result=result)
+            data[name] = ids
+
+        return data
+
+
+class NodeCreateManyQuery(Query):
+    """Create multiple nodes of the same kind, along with their attributes and relationships, in a single query."""
+
+    name = "node_create_many"
+
+    type: QueryType = QueryType.WRITE
+
+    raise_error_if_empty: bool = True
+
+    def __init__(self, nodes: list[Node], **kwargs: Any) -> None:
+        self.nodes = nodes
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        kinds = {node.get_kind() for node in self.nodes}
+        if len(kinds) != 1:
+            raise ValueError(f"{self.name} requires nodes of a single kind, found {sorted(kinds)}")
+        # The fields are read with the branch filter of the query
+        branches = {node._branch.name for node in self.nodes}
+        if branches != {self.branch.name}:
+            raise ValueError(f"{self.name} requires nodes of the branch {self.branch.name}, found {sorted(branches)}")
+
+        first_node = self.nodes[0]
+        if not hasattr(self, "branch"):
+            self.branch = first_node.get_branch_based_on_support_type()
+
+        self.params["nodes"] = [
+            await get_node_create_data(db=db, node=node, branch=self.branch, at=self.at) for node in self.nodes
+        ]
+        self.params["at"] = self.at.to_string()
+
+        # All the nodes are created before their attributes and relationships
+        # so that a relationship between two nodes of the batch doesn't create a placeholder for its peer
+        query = """
+        MATCH (root:Root)
+        UNWIND $nodes AS node_data
+        CREATE (n:Node:%(labels)s)
+        SET n = node_data.node_prop
+        CREATE (n)-[r:IS_PART_OF]->(root)
+        SET r = node_data.node_branch_prop
+        WITH collect([n, node_data]) AS created_nodes
+        UNWIND created_nodes AS created_node
+        WITH created_node[0] AS n, created_node[1] AS node_data
+        %(fields)s
+        WITH distinct n
+        MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(rn)-[:HAS_VALUE|IS_RELATED]-(rv)
+        """ % {
+            "labels": ":".join(first_node.get_labels()),
+            "fields": get_node_create_fields_query(source="node_data."),
+        }
+
+        self.add_to_query(query)
+        self.return_labels = ["n", "rn", "rv"]
+
+    def get_ids_per_node(self) -> dict[str, tuple[str, dict[str, tuple[str, str]]]]:
+        """Return the database id of each new node and the ids of its attributes and relationships, indexed by uuid."""
+        data: dict[str, tuple[str, dict[str, tuple[str, str]]]] = {}
+        for result in self.get_results():
+            node = result.get_node("n")
+            _, field_ids = data.setdefault(node["uuid"], (node.element_id, {}))
+            name, ids = get_created_field_ids(result=result)
+            field_ids[name] = ids
+
+        if missing_ids := {node.id for node in self.nodes} - set(data):
+            raise QueryError(
+                query=self.get_query(), params=self.params, message=f"Unable to create {sorted(missing_ids)}"
+            )
 
         return data
 
 
+def get_created_field_ids(result: QueryResult) -> tuple[str, tuple[str, str]]:
+    """Return the identifier of the attribute or the relationship created in this result, along with its ids."""
+    node = result.get("rn")
+    if "Relationship" in node.labels:
+        peer = result.get("rv")
+        name = f"{node.get('name')}::{peer.get('uuid')}"
+    elif "Attribute" in node.labels:
+        name = node.get("name")
+    return name, (node["uuid"], node.element_id)
+
+
 class NodeDeleteQuery(NodeQuery):
     name = "node_delete"
 
@@ -372,6 +465,184 @@ class NodeDeleteQuery(NodeQuery):
         self.return_labels = ["n"]
 
 
+class NodeDeleteManyQuery(Query):
+    name = "node_delete_many"
+
+    type: QueryType = QueryType.WRITE
+
+    def __init__(self, node_ids: list[str], branch: Branch, **kwargs: Any) -> None:
+        self.node_ids = node_ids
+        super().__init__(branch=branch, **kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params["uuids"] = self.node_ids
+        self.params["branch"] = self.branch.name
+        self.params["branch_level"] = self.branch.hierarchy_level
+        self.params["at"] = self.at.to_string()
+
+        query = """
+        MATCH (root:Root)
+        UNWIND $uuids AS node_uuid
+        MATCH (n:Node { uuid: node_uuid })
+        CREATE (n)-[r:IS_PART_OF { branch: $branch, branch_level: $branch_level, status: "deleted", from: $at }]->(root)
+        """
+
+        self.add_to_query(query)
+        self.return_labels = ["n"]
+
+
+class NodeDeleteFieldsManyQuery(Query):
+    """Delete the attributes and the relationships of multiple nodes of the same kind in a single query."""
+
+    name = "node_delete_fields_many"
+
+    type: QueryType = QueryType.WRITE
+
+    def __init__(self, nodes: list[Node], **kwargs: Any) -> None:
+        self.nodes = nodes
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        kinds = {node.get_kind() for node in self.nodes}
+        if len(kinds) != 1:
+            raise ValueError(f"{self.name} requires nodes of a single kind, found {sorted(kinds)}")
+        # The fields are read with the branch filter of the query
+        branches = {node._branch.name for node in self.nodes}
+        if branches != {self.branch.name}:
+            raise ValueError(f"{self.name} requires nodes of the branch {self.branch.name}, found {sorted(branches)}")
+
+        at = self.at.to_string()
+
+        self.params["uuids"] = [node.get_id() for node in self.nodes]
+        self.params["at"] = at
+        self.params["attributes"] = {
+            node.get_id(): [
+                {
+                    "uuid": attr.id,
+                    "rel_prop": self._get_deleted_rel_prop(branch=attr.get_branch_based_on_support_type()),
+                }
+                for attr in (getattr(node, name) for name in node._attributes)
+                if attr.db_id
+            ]
+            for node in self.nodes
+        }
+        self.params["rel_props"] = {
+            node.get_id(): self._get_deleted_relationships_props(node=node) for node in self.nodes
+        }
+
+        branch_filter, branch_params = self.branch.get_query_filter_path(at=at)
+        self.params.update(branch_params)
+
+        create_attr_props = "\n".join(
+            """
+                FOREACH ( i IN CASE WHEN type(r2) = "%(rel_type)s" THEN [1] ELSE [] END |
+                    CREATE (a)-[deleted_prop:%(rel_type)s]->(ap)
+                    SET deleted_prop = attr_data.rel_prop
+                )"""
+            % {"rel_type": rel_type}
+            for rel_type in ("HAS_VALUE", "IS_VISIBLE", "IS_PROTECTED", "HAS_SOURCE", "HAS_OWNER")
+        )
+        create_rel_props = "\n".join(
+            """
+                FOREACH ( i IN CASE WHEN type(edge) = "%(rel_type)s" THEN [1] ELSE [] END |
+                    CREATE (rl)-[deleted_prop:%(rel_type)s]->(prop)
+                    SET deleted_prop = rel_prop
+                )"""
+            % {"rel_type": rel_type}
+            for rel_type in ("IS_VISIBLE", "IS_PROTECTED", "HAS_SOURCE", "HAS_OWNER")
+        )
+        create_rel_edges = "\n".join(
+            """
+            FOREACH ( i IN CASE WHEN startNode(rels[%(idx)s]) = %(start)s THEN [1] ELSE [] END |
+                CREATE (%(start)s)-[deleted_edge:IS_RELATED]->(%(end)s)
+                SET deleted_edge = rel_prop
+            )
+            FOREACH ( i IN CASE WHEN startNode(rels[%(idx)s]) = %(start)s THEN [] ELSE [1] END |
+                CREATE (%(start)s)<-[deleted_edge:IS_RELATED]-(%(end)s)
+                SET deleted_edge = rel_prop
+            )"""
+            % {"idx": idx, "start": start, "end": end}
+            for idx, (start, end) in enumerate((("n", "rl"), ("rl", "peer")))
+        )
+
+        # A relationship between two nodes of the batch is deleted for the first one,
+        # it is then seen as deleted for the second one
+        query = """
+        MATCH (n:Node)
+        WHERE n.uuid IN $uuids
+        CALL {
+            WITH n
+            UNWIND $attributes[n.uuid] AS attr_data
+            MATCH (a:Attribute { uuid: attr_data.uuid })
+            CREATE (n)-[deleted_attr:HAS_ATTRIBUTE]->(a)
+            SET deleted_attr = attr_data.rel_prop
+            WITH a, attr_data
+            CALL {
+                WITH a, attr_data
+                MATCH (a)-[r2:HAS_VALUE|IS_VISIBLE|IS_PROTECTED|HAS_SOURCE|HAS_OWNER]->(ap)
+                WHERE all(r IN [r2] WHERE (%(branch_filter)s))
+                FOREACH ( i IN CASE WHEN r2.branch = attr_data.rel_prop.branch THEN [1] ELSE [] END | SET r2.to = $at )
+                %(create_attr_props)s
+            }
+        }
+        CALL {
+            WITH n
+            MATCH (n)-[:IS_RELATED]-(rl:Relationship)
+            WHERE rl.name IN keys($rel_props[n.uuid])
+            WITH DISTINCT n, rl
+            CALL {
+                WITH n, rl
+                MATCH path = (n)-[:IS_RELATED]-(rl)-[:IS_RELATED]-(peer:Node)
+                WHERE peer.uuid <> n.uuid AND all(r IN relationships(path) WHERE (%(branch_filter)s))
+                WITH peer, relationships(path) AS rels, %(branch_level)s AS branch_level, %(froms)s AS froms
+                RETURN peer, rels
+                ORDER BY branch_level DESC, froms[-1] DESC, froms[-2] DESC
+                LIMIT 1
+            }
+            WITH n, rl, peer, rels, $rel_props[n.uuid][rl.name] AS rel_prop
+            WHERE all(r IN rels WHERE r.status = "active")
+            FOREACH ( r IN [r IN rels WHERE r.branch = rel_prop.branch] | SET r.to = $at )
+            %(create_rel_edges)s
+            WITH rl, rel_prop
+            CALL {
+                WITH rl, rel_prop
+                MATCH (rl)-[edge:IS_VISIBLE|IS_PROTECTED|HAS_SOURCE|HAS_OWNER]->(prop)
+                WHERE all(r IN [edge] WHERE (%(branch_filter)s))
+                %(create_rel_props)s
+            }
+        }
+        """ % {
+            "branch_filter": branch_filter,
+            "branch_level": "reduce(br_lvl = 0, r in relationships(path) | br_lvl + r.branch_level)",
+            "froms": db.render_list_comprehension(items="relationships(path)", item_name="from"),
+            "create_attr_props": create_attr_props,
+            "create_rel_edges": create_rel_edges,
+            "create_rel_props": create_rel_props,
+        }
+
+        self.add_to_query(query)
+        self.return_labels = ["n"]
+
+    def _get_deleted_relationships_props(self, node: Node) -> dict[str, dict[str, Any]]:
+        """Properties of the edges created to delete the relationships of a node, indexed by relationship identifier."""
+        rel_props: dict[str, dict[str, Any]] = {}
+        for name in node._relationships:
+            relm: RelationshipManager = getattr(node, name)
+            rel_prop = self._get_deleted_rel_prop(branch=relm.get_branch_based_on_support_type())
+            if relm.schema.hierarchical:
+                rel_prop["hierarchy"] = relm.schema.hierarchical
+            rel_props[relm.schema.identifier] = rel_prop
+        return rel_props
+
+    def _get_deleted_rel_prop(self, branch: Branch) -> dict[str, Any]:
+        return {
+            "branch": branch.name,
+            "branch_level": branch.hierarchy_level,
+            "status": "deleted",
+            "from": self.at.to_string(),
+        }
+
+
 class NodeCheckIDQuery(Query):
     name = "node_check_id"
 
@@ -398,6 +669,7 @@ class NodeCheckIDQuery(Query):
 
 class NodeListGetAttributeQuery(Query):
     name: str = "node_list_get_attribute"
+    cursor_key: str = "n.uuid"
 
     property_type_mapping = {
         "HAS_VALUE": ("r2", "av"),
@@ -431,14 +703,21 @@ class NodeListGetAttributeQuery(Query):
             at=self.at, branch_agnostic=self.branch_agnostic
         )
         self.params.update(branch_params)
+        cursor_filter = self.get_cursor_filter(key="n.uuid")
+        if self.fields:
+            self.params["field_names"] = list(self.fields.keys())
+
+        if self.load_query_from_cache(
+            db=db, key=(branch_filter, bool(self.fields), self.include_source, self.include_owner)
+        ):
+            return
 
         query = """
-        MATCH (n:Node) WHERE n.uuid IN $ids
+        MATCH (n:Node) WHERE n.uuid IN $ids AND %(cursor_filter)s
         MATCH (n)-[:HAS_ATTRIBUTE]-(a:Attribute)
-        """
+        """ % {"cursor_filter": cursor_filter}
         if self.fields:
             query += "\n WHERE a.name IN $field_names"
-            self.params["field_names"] = list(self.fields.keys())
 
         self.add_to_query(query)
 
@@ -497,6 +776,11 @@ class NodeListGetAttributeQuery(Query):
             self.add_to_query(query)
             self.return_labels.extend(["owner", "rel_owner"])
 
+        self.save_query_to_cache()
+
+    async def get_cursor_keys(self, db: InfrahubDatabase) -> list[Any]:
+        return list(self.ids)
+
     def get_attributes_group_by_node(self) -> dict[str, NodeAttributesFromDB]:
         attrs_by_node: dict[str, NodeAttributesFromDB] = {}
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import inspect
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Generator, Optional, Union
+from typing import TYPE_CHECKING, Any, Generator, Optional, Union
 
 from infrahub_sdk.uuidt import UUIDT
 
@@ -547,6 +547,27 @@ class RelationshipGetPeerQuery(Query):
         self.params["peer_kind"] = self.schema.peer
         self.params["source_kind"] = self.source_kind
 
+        clean_filters = extract_field_filters(field_name=self.schema.name, filters=self.filters)
+        filter_by_ids = bool(clean_filters and "id" in clean_filters or "ids" in clean_filters)
+        if filter_by_ids:
+            self.params["peer_ids"] = clean_filters.get("ids", [])
+            if clean_filters.get("id", None):
+                self.params["peer_ids"].append(clean_filters.get("id"))
+
+        # The filters on the attributes and the relationships of the peer depend on their values so they are not cached
+        if not any("__" in peer_filter_name for peer_filter_name in clean_filters) and self.load_query_from_cache(
+            db=db,
+            key=(
+                db.schema.get_schema_branch(name=self.branch.name).get_hash(),
+                self.schema.direction,
+                branch_filter,
+                filter_by_ids,
+                peer_schema.kind,
+                tuple(getattr(peer_schema, "order_by", None) or []),
+            ),
+        ):
+            return
+
         arrows = self.schema.get_query_arrows()
 
         path_str = (
@@ -555,34 +576,34 @@ class RelationshipGetPeerQuery(Query):
 
         branch_level_str = "reduce(br_lvl = 0, r in relationships(path) | br_lvl + r.branch_level)"
         froms_str = db.render_list_comprehension(items="relationships(path)", item_name="from")
+        # The latest path is selected per relationship and source node, a relationship between two of the
+        # source nodes must be returned for each of them
         query = """
-        MATCH (rl:Relationship { name: $rel_identifier })
+        MATCH (source_node:Node)-[:IS_RELATED]-(rl:Relationship { name: $rel_identifier })
+        WHERE
+            source_node.uuid IN $source_ids AND
+            $source_kind IN LABELS(source_node)
+        WITH DISTINCT source_node, rl
         CALL {
-            WITH rl
-            MATCH path = (source_node:Node)%(path)s(peer:Node)
+            WITH source_node, rl
+            MATCH path = (source_node)%(path)s(peer:Node)
             WHERE
-                source_node.uuid IN $source_ids AND
-                $source_kind IN LABELS(source_node) AND
                 peer.uuid <> source_node.uuid AND
                 $peer_kind IN LABELS(peer) AND
                 all(r IN relationships(path) WHERE (%(branch_filter)s))
-            WITH source_node, peer, rl, relationships(path) as rels, %(branch_level)s AS branch_level, %(froms)s AS froms
-            RETURN source_node, peer as peer, rels, rl as rl1
+            WITH peer, relationships(path) as rels, %(branch_level)s AS branch_level, %(froms)s AS froms
+            RETURN peer as peer, rels
             ORDER BY branch_level DESC, froms[-1] DESC, froms[-2] DESC
             LIMIT 1
         }
-        WITH peer, rl1 as rl, rels, source_node
+        WITH peer, rl, rels, source_node
         """ % {"path": path_str, "branch_filter": branch_filter, "branch_level": branch_level_str, "froms": froms_str}
 
         self.add_to_query(query)
         where_clause = ['all(r IN rels WHERE r.status = "active")']
-        clean_filters = extract_field_filters(field_name=self.schema.name, filters=self.filters)
 
-        if clean_filters and "id" in clean_filters or "ids" in clean_filters:
+        if filter_by_ids:
             where_clause.append("peer.uuid IN $peer_ids")
-            self.params["peer_ids"] = clean_filters.get("ids", [])
-            if clean_filters.get("id", None):
-                self.params["peer_ids"].append(clean_filters.get("id"))
 
         self.add_to_query("WHERE " + " AND ".join(where_clause))
 
@@ -657,6 +678,7 @@ class RelationshipGetPeerQuery(Query):
         # ----------------------------------------------------------------------------
         # ORDER Results
         # ----------------------------------------------------------------------------
+        order_params: dict[str, Any] = {}
         if hasattr(peer_schema, "order_by") and peer_schema.order_by:
             order_cnt = 1
 
@@ -677,6 +699,7 @@ class RelationshipGetPeerQuery(Query):
                 )
                 self.order_by.append(subquery_result_name)
                 self.params.update(subquery_params)
+                order_params.update(subquery_params)
 
                 self.add_subquery(subquery=subquery)
 
@@ -685,13 +708,32 @@ class RelationshipGetPeerQuery(Query):
         else:
             self.order_by.append("peer.uuid")
 
+        if filter_cnt == 0:
+            self.save_query_to_cache(params=order_params)
+
+    async def count_per_source(self, db: InfrahubDatabase) -> dict[str, int]:
+        """Count the number of peers of each source node, OFFSET and LIMIT are excluded."""
+
+        query_lines = self.query_lines.copy()
+        query_lines.append("RETURN source_node.uuid AS source_id, count(*) AS count")
+        results = await db.execute_query(
+            query="\n".join(query_lines), params=self.params, name=f"{self.name}_count_per_source"
+        )
+        return {result["source_id"]: result["count"] for result in results}
+
     def get_peer_ids(self) -> list[str]:
         """Return a list of UUID of nodes associated with this relationship."""
 
         return [peer.peer_id for peer in self.get_peers()]
 
-    def get_peers(self) -> Generator[RelationshipPeerData, None, None]:
-        for result in self.get_results_group_by(("peer", "uuid")):
+    def get_peers(self, per_source: bool = False) -> Generator[RelationshipPeerData, None, None]:
+        """Return the peers of the relationship, deduplicated by peer.
+
+        With per_source the peers are deduplicated per source node instead, so that a peer shared by multiple
+        source nodes is returned once for each of them.
+        """
+        group_by = (("source_node", "uuid"), ("peer", "uuid")) if per_source else (("peer", "uuid"),)
+        for result in self.get_results_group_by(*group_by):
             rels = result.get("rels")
             data = RelationshipPeerData(
                 source_id=result.get_node("source_node").get("uuid"),
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from infrahub.core import registry
 from infrahub.core.constants import InfrahubKind, RelationshipStatus
-from infrahub.core.query import Query
+from infrahub.core.query import Query, QueryType
 
 if TYPE_CHECKING:
     from infrahub.core.protocols import CoreNumberPool
+    from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
 
 
@@ -144,23 +145,25 @@ class NumberPoolGetAllocated(Query):
         self.order_by = ["av.value"]
 
 
-class NumberPoolGetReserved(Query):
-    name: str = "numberpool_get_reserved"
+class NumberPoolGetReservations(Query):
+    """Return the numbers reserved in a pool for a list of identifiers."""
+
+    name: str = "numberpool_get_reservations"
 
     def __init__(
         self,
         pool_id: str,
-        identifier: str,
+        identifiers: list[str],
         **kwargs: dict[str, Any],
     ) -> None:
         self.pool_id = pool_id
-        self.identifier = identifier
+        self.identifiers = identifiers
 
         super().__init__(**kwargs)  # type: ignore[arg-type]
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: dict[str, Any]) -> None:
         self.params["pool_id"] = self.pool_id
-        self.params["identifier"] = self.identifier
+        self.params["identifiers"] = self.identifiers
 
         branch_filter, branch_params = self.branch.get_query_filter_path(
             at=self.at.to_string(), branch_agnostic=self.branch_agnostic
@@ -171,18 +174,20 @@ class NumberPoolGetReserved(Query):
         query = """
         MATCH (pool:%(number_pool)s { uuid: $pool_id })-[r:IS_RESERVED]->(reservation:AttributeValue)
         WHERE
-            r.identifier = $identifier
+            r.identifier IN $identifiers
             AND
             %(branch_filter)s
         """ % {"branch_filter": branch_filter, "number_pool": InfrahubKind.NUMBERPOOL}
         self.add_to_query(query)
-        self.return_labels = ["reservation.value"]
+        self.return_labels = ["r.identifier AS identifier", "reservation.value AS value"]
 
-    def get_reservation(self) -> int | None:
-        result = self.get_result()
-        if result:
-            return result.get_as_optional_type("reservation.value", return_type=int)
-        return None
+    def get_reservations(self) -> dict[str, int]:
+        reservations: dict[str, int] = {}
+        for result in self.get_results():
+            value = result.get_as_optional_type("value", return_type=int)
+            if value is not None:
+                reservations.setdefault(result.get_as_type("identifier", return_type=str), value)
+        return reservations
 
 
 class NumberPoolGetUsed(Query):
@@ -191,9 +196,11 @@ class NumberPoolGetUsed(Query):
     def __init__(
         self,
         pool: CoreNumberPool,
+        reserved_since: Optional[Timestamp] = None,
         **kwargs: dict[str, Any],
     ) -> None:
         self.pool = pool
+        self.reserved_since = reserved_since
 
         super().__init__(**kwargs)  # type: ignore[arg-type]
 
@@ -208,39 +215,52 @@ class NumberPoolGetUsed(Query):
 
         self.params.update(branch_params)
 
+        # Only return the numbers reserved after a given time, to update a list of used numbers already known
+        since_filter = ""
+        if self.reserved_since:
+            self.params["reserved_since"] = self.reserved_since.to_string()
+            since_filter = "AND r.from >= $reserved_since"
+
         query = """
         MATCH (pool:%(number_pool)s { uuid: $pool_id })-[r:IS_RESERVED]->(av:AttributeValue )
         WHERE
             toInteger(av.value) >= $start_range and toInteger(av.value) <= $end_range
             AND
             %(branch_filter)s
-        """ % {"branch_filter": branch_filter, "number_pool": InfrahubKind.NUMBERPOOL}
+            %(since_filter)s
+        """ % {"branch_filter": branch_filter, "number_pool": InfrahubKind.NUMBERPOOL, "since_filter": since_filter}
 
         self.add_to_query(query)
         self.return_labels = ["av.value"]
         self.order_by = ["av.value"]
 
 
-class NumberPoolSetReserved(Query):
-    name: str = "numberpool_set_reserved"
+class NumberPoolSetReservedMany(Query):
+    """Reserve several numbers of a pool in a single query, reservations maps each identifier to its number.
+
+    The numbers already reserved in the pool are skipped, only the reservations that have been made are returned.
+    """
+
+    name: str = "numberpool_set_reserved_many"
+    type: QueryType = QueryType.WRITE
 
     def __init__(
         self,
         pool_id: str,
-        reserved: int,
-        identifier: str,
+        reservations: dict[str, int],
         **kwargs: dict[str, Any],
     ) -> None:
         self.pool_id = pool_id
-        self.reserved = reserved
-        self.identifier = identifier
+        self.reservations = reservations
 
         super().__init__(**kwargs)  # type: ignore[arg-type]
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: dict[str, Any]) -> None:
         self.params["pool_id"] = self.pool_id
-        self.params["reserved"] = self.reserved
-        self.params["identifier"] = self.identifier
+        self.params["reservations"] = [
+            {"identifier": identifier, "reserved": reserved} for identifier, reserved in self.reservations.items()
+        ]
+        self.params["active"] = RelationshipStatus.ACTIVE.value
 
         global_branch = registry.get_global_branch()
         self.params["rel_prop"] = {
@@ -248,17 +268,37 @@ class NumberPoolSetReserved(Query):
             "branch_level": global_branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
             "from": self.at.to_string(),
-            "identifier": self.identifier,
         }
 
+        # Writing on the pool locks it until the end of the transaction, the reservations made by concurrent
+        # transactions are committed before the existing reservations of the pool are checked
         query = """
         MATCH (pool:%(number_pool)s { uuid: $pool_id })
-        MERGE (value:AttributeValue { value: $reserved, is_default: false })
+        SET pool._reservation_lock = true
+        REMOVE pool._reservation_lock
+        WITH pool
+        UNWIND $reservations AS reservation
+        CALL {
+            WITH pool, reservation
+            OPTIONAL MATCH (:AttributeValue { value: reservation.reserved })<-[r:IS_RESERVED { status: $active }]-(pool)
+            WHERE r.to IS NULL
+            RETURN count(r) AS nbr_reservations
+        }
+        WITH pool, reservation, nbr_reservations
+        WHERE nbr_reservations = 0
+        MERGE (value:AttributeValue { value: reservation.reserved, is_default: false })
         CREATE (pool)-[rel:IS_RESERVED $rel_prop]->(value)
+        SET rel.identifier = reservation.identifier
         """ % {"number_pool": InfrahubKind.NUMBERPOOL}
 
         self.add_to_query(query)
-        self.return_labels = ["value"]
+        self.return_labels = ["reservation.identifier AS identifier", "reservation.reserved AS reserved"]
+
+    def get_reservations(self) -> dict[str, int]:
+        return {
+            result.get_as_type("identifier", return_type=str): result.get_as_type("reserved", return_type=int)
+            for result in self.get_results()
+        }
 
 
 class PrefixPoolGetIdentifiers(Query):
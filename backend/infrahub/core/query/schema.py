@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from infrahub.core.query import Query
+from infrahub.core.schema.constants import INTERNAL_SCHEMA_NODE_KINDS
+
+if TYPE_CHECKING:
+    from infrahub.database import InfrahubDatabase
+
+
+class SchemaLastChangeQuery(Query):
+    """Get the time of the last change of the schema visible on the branch at a given time.
+
+    Every update of the schema writes edges, with the time of the change, around the nodes defining the schema,
+    two points in time with the same last change have the same schema.
+    """
+
+    name: str = "schema_last_change"
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        rels_filter, rels_params = self.branch.get_query_filter_path(at=self.at)
+        self.params.update(rels_params)
+
+        query = """
+        MATCH (n:%(schema_kinds)s)
+        CALL {
+            WITH n
+            MATCH (n)-[r]-()
+            WHERE %(rels_filter)s
+            RETURN r.from AS changed_at
+            UNION
+            WITH n
+            MATCH (n)-[:HAS_ATTRIBUTE]-(:Attribute)-[r]-()
+            WHERE %(rels_filter)s
+            RETURN r.from AS changed_at
+        }
+        """ % {"schema_kinds": "|".join(INTERNAL_SCHEMA_NODE_KINDS), "rels_filter": rels_filter}
+        self.add_to_query(query)
+        self.return_labels = ["max(changed_at) AS changed_at"]
+
+    def get_changed_at(self) -> Optional[str]:
+        result = self.get_result()
+        if not result:
+            return None
+        return result.get_as_optional_type(label="changed_at", return_type=str)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, Optional
+
+from infrahub.core.query import Query, QueryType
+
+if TYPE_CHECKING:
+    from infrahub.database import InfrahubDatabase
+
+# Name of the full-text index on the values of the attributes, defined in infrahub.core.graph.index
+SEARCH_INDEX_NAME = "node_fulltext_attr_value_value"
+
+# Number of values to read from the full-text index for each result requested,
+# some values will be filtered out because they are not visible on the branch or not searchable
+SEARCH_INDEX_LIMIT_FACTOR = 20
+
+# Approximation of the words extracted by the standard analyzer of the index, dots are kept
+# between letters and digits so that IP addresses or FQDN are a single word
+SEARCH_TOKEN_REGEX = re.compile(r"\w+(?:[.']\w+)*")
+
+
+def build_fulltext_query(q: str, partial_match: bool = True) -> Optional[str]:
+    """Convert the text provided by a user into a query for the full-text index.
+
+    With partial_match, each word is matched as a prefix and the exact matches are ranked first,
+    otherwise the text is matched as a phrase. Returns None if the text doesn't contain any word.
+    """
+    tokens = [token.lower() for token in SEARCH_TOKEN_REGEX.findall(q)]
+    if not tokens:
+        return None
+
+    if not partial_match:
+        return '"{}"'.format(" ".join(tokens))
+
+    return " AND ".join(f"({token} OR {token}*)" for token in tokens)
+
+
+class SearchQuery(Query):
+    """Search the nodes with a searchable attribute matching a text, using the full-text index of the attribute values.
+
+    The results are ranked by the best score of the values of each node.
+    """
+
+    name: str = "search"
+    type: QueryType = QueryType.READ
+
+    def __init__(self, search_query: str, searchable_attributes: dict[str, list[str]], **kwargs: Any) -> None:
+        self.search_query = search_query
+        self.searchable_attributes = searchable_attributes
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        branch_filter, branch_params = self.branch.get_query_filter_path(
+            at=self.at, branch_agnostic=self.branch_agnostic
+        )
+        self.params.update(branch_params)
+        self.params["index_name"] = SEARCH_INDEX_NAME
+        self.params["search_query"] = self.search_query
+        self.params["index_limit"] = (self.limit or 1) * SEARCH_INDEX_LIMIT_FACTOR
+        self.params["searchable_attributes"] = self.searchable_attributes
+
+        branch_level_str = "reduce(br_lvl = 0, r in relationships(path) | br_lvl + r.branch_level)"
+        froms_str = db.render_list_comprehension(items="relationships(path)", item_name="from")
+        # A value matching the search can be an older value of the attribute that is still linked to it on
+        # another branch, the latest value of the attribute is resolved and the match is only kept if it's the same
+        query = """
+        CALL db.index.fulltext.queryNodes($index_name, $search_query, {limit: $index_limit}) YIELD node AS av, score
+        MATCH (n:Node)-[:HAS_ATTRIBUTE]-(attr:Attribute)-[:HAS_VALUE]-(av)
+        WHERE attr.name IN $searchable_attributes[n.kind]
+        WITH DISTINCT n, attr, av, score
+        CALL {
+            WITH n, attr
+            MATCH path = (n)-[:HAS_ATTRIBUTE]-(attr)-[:HAS_VALUE]-(current_av:AttributeValue)
+            WHERE all(r IN relationships(path) WHERE (%(branch_filter)s))
+            WITH
+                current_av,
+                %(branch_level)s AS branch_level,
+                %(froms)s AS froms,
+                all(r IN relationships(path) WHERE r.status = "active") AS is_active
+            RETURN current_av, is_active
+            ORDER BY branch_level DESC, froms[-1] DESC, froms[-2] DESC
+            LIMIT 1
+        }
+        WITH n, av, score, current_av, is_active
+        WHERE is_active = TRUE AND current_av = av
+        CALL {
+            WITH n
+            MATCH (root:Root)<-[r:IS_PART_OF]-(n)
+            WHERE %(branch_filter)s
+            RETURN r AS rb
+            ORDER BY r.branch_level DESC, r.from DESC
+            LIMIT 1
+        }
+        WITH n, score, rb
+        WHERE rb.status = "active"
+        WITH n, max(score) AS score
+        """ % {"branch_filter": branch_filter, "branch_level": branch_level_str, "froms": froms_str}
+        self.add_to_query(query)
+
+        self.return_labels = ["n.uuid AS node_id", "n.kind AS node_kind", "score"]
+        self.order_by = ["score DESC", "node_id"]
+
+    def get_matches(self) -> list[tuple[str, str, float]]:
+        """Return the id, the kind and the score of the nodes matching the search, best match first."""
+        return [
+            (str(result.get("node_id")), str(result.get("node_kind")), float(result.get("score")))
+            for result in self.get_results()
+        ]
@@ -709,6 +709,7 @@ class RelationshipManager:
         )
         self._relationship_id_details: Optional[RelationshipUpdateDetails] = None
         self.has_fetched_relationships: bool = False
+        self._initial_state: Optional[list[tuple[Any, ...]]] = None
 
     @classmethod
     async def init(
@@ -752,6 +753,30 @@ class RelationshipManager:
     def get_kind(self) -> str:
         return self.schema.kind
 
+    def _get_state(self) -> list[tuple[Any, ...]]:
+        return [
+            (
+                rel.peer_id,
+                *(getattr(rel, flag_name) for flag_name in rel._flag_properties),
+                *(getattr(rel, f"{prop_name}_id") for prop_name in rel._node_properties),
+            )
+            for rel in self._relationships
+        ]
+
+    def reset_changes(self) -> None:
+        """Flag the current list of relationships as matching the database."""
+        self._initial_state = self._get_state()
+
+    @property
+    def has_changed(self) -> bool:
+        """Indicate if the peers or their properties might have changed since they have been fetched or saved.
+
+        The relationships that have never been fetched or assigned can't have changed.
+        """
+        if not self.has_fetched_relationships:
+            return False
+        return self._initial_state is None or self._initial_state != self._get_state()
+
     def __iter__(self) -> Iterator[Relationship]:
         if self.schema.cardinality == "one":
             raise TypeError("relationship with single cardinality are not iterable")
@@ -943,6 +968,8 @@ class RelationshipManager:
         for peer_id in details.peer_ids_present_local_only:
             await self.remove(peer_id=peer_id, db=db)
 
+        self.reset_changes()
+
     async def get(self, db: InfrahubDatabase) -> Union[Relationship, list[Relationship]]:
         rels = await self.get_relationships(db=db)
 
@@ -1130,6 +1157,7 @@ class RelationshipManager:
                         db=db,
                     )
 
+        self.reset_changes()
         return self
 
     async def delete(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> None:
@@ -887,7 +887,7 @@ core_models: dict[str, Any] = {
             "uniqueness_constraints": [["name__value"]],
             "attributes": [
                 {"name": "name", "kind": "Text", "unique": True},
-                {"name": "password", "kind": "HashedPassword", "unique": False},
+                {"name": "password", "kind": "HashedPassword", "unique": False, "searchable": False},
                 {"name": "label", "kind": "Text", "optional": True},
                 {"name": "description", "kind": "Text", "optional": True},
                 {
@@ -1084,7 +1084,7 @@ core_models: dict[str, Any] = {
             "documentation": "/topics/auth",
             "attributes": [
                 {"name": "name", "kind": "Text", "optional": True},
-                {"name": "token", "kind": "Text", "unique": True},
+                {"name": "token", "kind": "Text", "unique": True, "searchable": False},
                 {"name": "expiration", "kind": "DateTime", "optional": True},
             ],
             "relationships": [
@@ -1118,6 +1118,7 @@ core_models: dict[str, Any] = {
                     "name": "password",
                     "kind": "Password",
                     "optional": True,
+                    "searchable": False,
                     "branch": BranchSupportType.AGNOSTIC.value,
                     "order_weight": 7000,
                 },
@@ -1974,7 +1975,7 @@ core_models: dict[str, Any] = {
             "generate_profile": False,
             "inherit_from": [InfrahubKind.WEBHOOK, InfrahubKind.TASKTARGET],
             "attributes": [
-                {"name": "shared_key", "kind": "Password", "unique": False, "order_weight": 4000},
+                {"name": "shared_key", "kind": "Password", "unique": False, "order_weight": 4000, "searchable": False},
             ],
         },
         {
@@ -599,6 +599,14 @@ attribute_schema = SchemaNode(
             optional=True,
             extra={"update": UpdateSupport.ALLOWED},
         ),
+        SchemaAttribute(
+            name="searchable",
+            kind="Boolean",
+            description="Indicate if the value of this attribute should be returned by the global search.",
+            default_value=True,
+            optional=True,
+            extra={"update": UpdateSupport.ALLOWED},
+        ),
     ],
     relationships=[
         SchemaRelationship(
@@ -109,3 +109,8 @@ class GeneratedAttributeSchema(HashableModel):
         description="Type of allowed override for the attribute.",
         json_schema_extra={"update": "allowed"},
     )
+    searchable: bool = Field(
+        default=True,
+        description="Indicate if the value of this attribute should be returned by the global search.",
+        json_schema_extra={"update": "allowed"},
+    )
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+import ujson
+
+from infrahub import config
+
+from .metrics import (
+    SCHEMA_HISTORY_CACHE_EVICTIONS,
+    SCHEMA_HISTORY_CACHE_HITS,
+    SCHEMA_HISTORY_CACHE_MISSES,
+    SCHEMA_HISTORY_CACHE_SIZE,
+)
+
+if TYPE_CHECKING:
+    from .schema_branch import SchemaBranch
+
+
+class SchemaHistoryCache:
+    """LRU cache of the schema branches loaded from the database to query the graph at a time in the past.
+
+    The schema branches are stored by hash, so all the points in time with the same schema share the same object,
+    along with its GraphQL schema once it has been generated.
+    Each point in time is identified by the branch and the time of the last change of the schema before it.
+    The cache is bounded by the approximate size of the schemas it holds, based on their serialized size,
+    and by the number of points in time it keeps track of.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, max_points: int = 4096) -> None:
+        self._max_size = max_size
+        self.max_points = max_points
+        self._schemas: OrderedDict[str, tuple[SchemaBranch, int]] = OrderedDict()
+        self._hashes: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return config.SETTINGS.api.schema_history_cache_size * 1024 * 1024
+
+    def get(self, branch_name: str, changed_at: str) -> Optional[SchemaBranch]:
+        schema_hash = self._hashes.get((branch_name, changed_at))
+        if schema_hash is None or schema_hash not in self._schemas:
+            SCHEMA_HISTORY_CACHE_MISSES.labels(branch_name).inc()
+            return None
+
+        SCHEMA_HISTORY_CACHE_HITS.labels(branch_name).inc()
+        self._schemas.move_to_end(schema_hash)
+        self._hashes.move_to_end((branch_name, changed_at))
+        return self._get_for_branch(schema=self._schemas[schema_hash][0], branch_name=branch_name)
+
+    def set(self, branch_name: str, changed_at: str, schema: SchemaBranch) -> SchemaBranch:
+        """Store the schema of a branch at a point in time and return the schema to use.
+
+        If a schema with the same hash is already in the cache, this one is returned instead.
+        """
+        schema_hash = schema.get_hash()
+        if schema_hash in self._schemas:
+            self._schemas.move_to_end(schema_hash)
+            self._set_hash(branch_name=branch_name, changed_at=changed_at, schema_hash=schema_hash)
+            return self._get_for_branch(schema=self._schemas[schema_hash][0], branch_name=branch_name)
+
+        schema_size = self._get_size(schema=schema)
+        if schema_size > self.max_size:
+            return schema
+
+        self._schemas[schema_hash] = (schema, schema_size)
+        self._set_hash(branch_name=branch_name, changed_at=changed_at, schema_hash=schema_hash)
+        self.size += schema_size
+        while self.size > self.max_size:
+            self._evict()
+        SCHEMA_HISTORY_CACHE_SIZE.set(self.size)
+        return schema
+
+    def clear(self) -> None:
+        self._schemas.clear()
+        self._hashes.clear()
+        self.size = 0
+        SCHEMA_HISTORY_CACHE_SIZE.set(self.size)
+
+    def _evict(self) -> None:
+        schema_hash, (_, schema_size) = self._schemas.popitem(last=False)
+        self.size -= schema_size
+        self._hashes = OrderedDict((key, value) for key, value in self._hashes.items() if value != schema_hash)
+        SCHEMA_HISTORY_CACHE_EVICTIONS.inc()
+
+    def _set_hash(self, branch_name: str, changed_at: str, schema_hash: str) -> None:
+        self._hashes[branch_name, changed_at] = schema_hash
+        self._hashes.move_to_end((branch_name, changed_at))
+        while len(self._hashes) > self.max_points:
+            self._hashes.popitem(last=False)
+
+    @staticmethod
+    def _get_for_branch(schema: SchemaBranch, branch_name: str) -> SchemaBranch:
+        if schema.name == branch_name:
+            return schema
+        # The schema branches only reference the schemas of the cache, renaming a copy is cheap
+        return schema.duplicate(name=branch_name)
+
+    @staticmethod
+    def _get_size(schema: SchemaBranch) -> int:
+        return sum(
+            len(ujson.dumps(node.model_dump(mode="json")))
+            for node in schema.get_all(include_internal=True, duplicate=False).values()
+        )
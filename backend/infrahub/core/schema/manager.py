@@ -13,6 +13,7 @@ from infrahub.core.models import (
     SchemaDiff,
 )
 from infrahub.core.node import Node
+from infrahub.core.query.schema import SchemaLastChangeQuery
 from infrahub.core.registry import registry
 from infrahub.core.schema import (
     AttributeSchema,
@@ -26,8 +27,10 @@ from infrahub.core.schema import (
 from infrahub.core.utils import parse_node_kind
 from infrahub.exceptions import SchemaNotFoundError
 from infrahub.log import get_logger
+from infrahub.message_bus.types import KVTTL
 
 from .constants import IGNORE_FOR_NODE
+from .history import SchemaHistoryCache
 from .schema_branch import SchemaBranch
 
 log = get_logger()
@@ -36,6 +39,9 @@ if TYPE_CHECKING:
     from infrahub.core.branch import Branch
     from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
+    from infrahub.services.adapters.cache import InfrahubCache
+
+SCHEMA_SNAPSHOT_KEY_PREFIX = "schema:snapshot"
 
 
 # pylint: disable=too-many-public-methods
@@ -43,6 +49,7 @@ class SchemaManager(NodeManager):
     def __init__(self) -> None:
         self._cache: dict[int, Any] = {}
         self._branches: dict[str, SchemaBranch] = {}
+        self._history = SchemaHistoryCache()
 
     def _get_from_cache(self, key: int) -> Any:
         return self._cache[key]
@@ -70,6 +77,7 @@ class SchemaManager(NodeManager):
         branch: Optional[Union[Branch, str]] = None,
         duplicate: bool = True,
         check_branch_only: bool = False,
+        read_only: bool = False,
     ) -> MainSchemaTypes:
         # For now we assume that all branches are present, will see how we need to pull new branches later.
         check_branch_only = check_branch_only and bool(branch)
@@ -77,7 +85,7 @@ class SchemaManager(NodeManager):
 
         if branch.name in self._branches:
             try:
-                return self._branches[branch.name].get(name=name, duplicate=duplicate)
+                return self._branches[branch.name].get(name=name, duplicate=duplicate, read_only=read_only)
             except SchemaNotFoundError:
                 pass
 
@@ -87,7 +95,7 @@ class SchemaManager(NodeManager):
             )
 
         default_branch = registry.default_branch
-        return self._branches[default_branch].get(name=name, duplicate=duplicate)
+        return self._branches[default_branch].get(name=name, duplicate=duplicate, read_only=read_only)
 
     def get_node_schema(
         self, name: str, branch: Optional[Union[Branch, str]] = None, duplicate: bool = True
@@ -541,8 +549,13 @@ class SchemaManager(NodeManager):
         self,
         db: InfrahubDatabase,
         branch: Optional[Union[str, Branch]] = None,
+        cache: Optional[InfrahubCache] = None,
     ) -> SchemaBranch:
-        """Load the schema either from the cache or from the database"""
+        """Load the schema either from the cache or from the database
+
+        If a cache is provided, the schema is loaded from the snapshot stored by another worker for the same hash,
+        and the schema loaded from the database is stored as a snapshot for the other workers.
+        """
         branch = await registry.get_branch(branch=branch, db=db)
 
         if not branch.is_default and branch.origin_branch:
@@ -555,6 +568,13 @@ class SchemaManager(NodeManager):
                 log.info("Loading schema from cache")
                 return new_branch_schema
 
+        if cache and branch.schema_hash:
+            snapshot_schema = await self.load_schema_snapshot(cache=cache, schema_hash=branch.schema_hash.main)
+            if snapshot_schema:
+                self.set_schema_branch(name=branch.name, schema=snapshot_schema)
+                log.info("Loading schema from snapshot", branch=branch.name, schema_hash=branch.schema_hash.main)
+                return snapshot_schema
+
         current_schema = self.get_schema_branch(name=branch.name)
         schema_diff = current_schema.get_hash_full().compare(branch.schema_hash)
         branch_schema = await self.load_schema_from_db(
@@ -562,8 +582,52 @@ class SchemaManager(NodeManager):
         )
         branch_schema.clear_cache()
         self.set_schema_branch(name=branch.name, schema=branch_schema)
+        if cache:
+            await self.save_schema_snapshot(cache=cache, schema=branch_schema)
         return branch_schema
 
+    async def load_schema_snapshot(self, cache: InfrahubCache, schema_hash: str) -> Optional[SchemaBranch]:
+        """Return the processed schema matching this hash from its snapshot in the cache, if it has been stored."""
+        snapshot = await cache.get(key=f"{SCHEMA_SNAPSHOT_KEY_PREFIX}:{schema_hash}")
+        if not snapshot:
+            return None
+
+        schema = SchemaBranch.from_snapshot(snapshot=snapshot, cache=self._cache)
+        if schema.get_hash() != schema_hash:
+            log.warning("Ignoring schema snapshot not matching its hash", schema_hash=schema_hash)
+            return None
+        return schema
+
+    async def save_schema_snapshot(self, cache: InfrahubCache, schema: SchemaBranch) -> None:
+        """Store a processed schema in the cache, indexed by its hash, for the other workers to load."""
+        await cache.set(
+            key=f"{SCHEMA_SNAPSHOT_KEY_PREFIX}:{schema.get_hash()}",
+            value=schema.to_snapshot(),
+            expires=KVTTL.TWO_HOURS,
+        )
+
+    async def load_schema_at(self, db: InfrahubDatabase, branch: Branch, at: Timestamp) -> SchemaBranch:
+        """Return the schema of a branch as it was at a given time.
+
+        The schemas loaded from the database are kept in a cache and reused for all the points in time
+        between the same two changes of the schema.
+        """
+        query = await SchemaLastChangeQuery.init(db=db, branch=branch, at=at)
+        await query.execute(db=db)
+        changed_at = query.get_changed_at()
+        if changed_at:
+            schema = self._history.get(branch_name=branch.name, changed_at=changed_at)
+            if schema:
+                return schema
+
+        # The historical schemas have their own cache of objects to release all of them when they are evicted
+        schema = await self.load_schema_from_db(
+            db=db, branch=branch, at=at, schema=SchemaBranch(cache={}, name=branch.name)
+        )
+        if changed_at:
+            schema = self._history.set(branch_name=branch.name, changed_at=changed_at, schema=schema)
+        return schema
+
     async def load_schema_from_db(
         self,
         db: InfrahubDatabase,
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge
+
+METRIC_PREFIX = "infrahub_schema"
+
+SCHEMA_HISTORY_CACHE_HITS = Counter(
+    f"{METRIC_PREFIX}_history_cache_hits",
+    "Number of schemas in the past found in the cache of the historical schemas",
+    labelnames=["branch"],
+)
+
+SCHEMA_HISTORY_CACHE_MISSES = Counter(
+    f"{METRIC_PREFIX}_history_cache_misses",
+    "Number of schemas in the past that had to be loaded from the database",
+    labelnames=["branch"],
+)
+
+SCHEMA_HISTORY_CACHE_EVICTIONS = Counter(
+    f"{METRIC_PREFIX}_history_cache_evictions",
+    "Number of schemas removed from the cache of the historical schemas to free memory",
+)
+
+SCHEMA_HISTORY_CACHE_SIZE = Gauge(
+    f"{METRIC_PREFIX}_history_cache_size_bytes",
+    "Approximate size of the schemas held by the cache of the historical schemas, in bytes",
+)
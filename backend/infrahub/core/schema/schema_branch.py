@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import base64
 import copy
 import hashlib
+import zlib
 from collections import defaultdict
 from itertools import chain
 from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Union
 
+import ujson
 from infrahub_sdk.topological_sort import DependencyCycleExistsError, topological_sort
 from infrahub_sdk.utils import compare_lists, deep_merge_dict, duplicates, intersection
 from typing_extensions import Self
@@ -45,7 +48,7 @@ from infrahub.core.schema import (
 from infrahub.core.schema.definitions.core import core_profile_schema_definition
 from infrahub.core.validators import CONSTRAINT_VALIDATOR_MAP
 from infrahub.exceptions import SchemaNotFoundError, ValidationError
-from infrahub.graphql.manager import GraphQLSchemaManager
+from infrahub.graphql.manager import GraphQLSchemaEntry, GraphQLSchemaManager, graphql_schema_registry
 from infrahub.log import get_logger
 from infrahub.types import ATTRIBUTE_TYPES
 from infrahub.utils import format_label
@@ -70,8 +73,8 @@ class SchemaBranch:
         self.nodes: dict[str, str] = {}
         self.generics: dict[str, str] = {}
         self.profiles: dict[str, str] = {}
-        self._graphql_schema: Optional[GraphQLSchema] = None
-        self._graphql_manager: Optional[GraphQLSchemaManager] = None
+        self._views: dict[str, MainSchemaTypes] = {}
+        self._graphql_schema_entry: Optional[GraphQLSchemaEntry] = None
 
         if data:
             self.nodes = data.get("nodes", {})
@@ -115,6 +118,19 @@ class SchemaBranch:
             kind_id_map[name] = item.id
         return kind_id_map
 
+    def get_searchable_attributes(self) -> dict[str, list[str]]:
+        """Return the name of the searchable attributes of each kind of node returned by the global search."""
+        if not self.has(name=InfrahubKind.NODE):
+            return {}
+
+        searchable: dict[str, list[str]] = {}
+        for kind in self.get_generic(name=InfrahubKind.NODE, duplicate=False).used_by:
+            node = self.get(name=kind, duplicate=False)
+            attribute_names = [attribute.name for attribute in node.attributes if attribute.searchable]
+            if attribute_names:
+                searchable[kind] = attribute_names
+        return searchable
+
     @property
     def all_names(self) -> list[str]:
         return self.node_names + self.generic_names + self.profile_names
@@ -165,14 +181,33 @@ class SchemaBranch:
 
         return cls(cache=cache, data=nodes)
 
+    def to_snapshot(self) -> str:
+        """Serialize the schema, once processed, into a compressed string that can be stored in the cache."""
+        data = {
+            node_type: {name: schema.model_dump(mode="json") for name, schema in schemas.items()}
+            for node_type, schemas in self.to_dict_schema_object().items()
+        }
+        return base64.b64encode(zlib.compress(ujson.dumps(data).encode())).decode()
+
+    @classmethod
+    def from_snapshot(cls, snapshot: str, cache: dict, name: str | None = None) -> Self:
+        """Rebuild a processed schema from its snapshot, the schema objects are added to the provided cache."""
+        data = ujson.loads(zlib.decompress(base64.b64decode(snapshot)))
+        schema = cls.from_dict_schema_object(data=data)
+        for schema_hash, node in schema._cache.items():
+            cache.setdefault(schema_hash, node)
+        return cls(cache=cache, name=name, data=schema.to_dict())
+
     def clear_cache(self) -> None:
-        self._graphql_manager = None
-        self._graphql_schema = None
+        self._graphql_schema_entry = None
+
+    def _get_graphql_schema_entry(self) -> GraphQLSchemaEntry:
+        if not self._graphql_schema_entry:
+            self._graphql_schema_entry = graphql_schema_registry.get(schema=self)
+        return self._graphql_schema_entry
 
     def get_graphql_manager(self) -> GraphQLSchemaManager:
-        if not self._graphql_manager:
-            self._graphql_manager = GraphQLSchemaManager(schema=self)
-        return self._graphql_manager
+        return self._get_graphql_schema_entry().manager
 
     def get_graphql_schema(
         self,
@@ -181,14 +216,16 @@ class SchemaBranch:
         include_subscription: bool = True,
         include_types: bool = True,
     ) -> GraphQLSchema:
-        if not self._graphql_schema:
-            self._graphql_schema = self.get_graphql_manager().generate(
+        """Return the GraphQL schema, shared with the other schema branches with the same hash."""
+        entry = self._get_graphql_schema_entry()
+        if not entry.schema:
+            entry.schema = entry.manager.generate(
                 include_query=include_query,
                 include_mutation=include_mutation,
                 include_subscription=include_subscription,
                 include_types=include_types,
             )
-        return self._graphql_schema
+        return entry.schema
 
     def diff(self, other: SchemaBranch) -> SchemaDiff:
         # Identify the nodes or generics that have been added or removed
@@ -284,12 +321,14 @@ class SchemaBranch:
 
         return schema_hash
 
-    def get(self, name: str, duplicate: bool = True) -> MainSchemaTypes:
+    def get(self, name: str, duplicate: bool = True, read_only: bool = False) -> MainSchemaTypes:
         """Access a specific NodeSchema or GenericSchema, defined by its kind.
 
         To ensure that no-one will ever change an object in the cache,
         by default the function always returns a copy of the object, not the object itself
 
+        If read_only is set to true, a read-only view of the object shared by all the callers will be returned,
+        call duplicate() on it to get a copy that can be modified.
         If duplicate is set to false, the real object will be returned.
         """
         key = None
@@ -300,6 +339,8 @@ class SchemaBranch:
         elif name in self.profiles:
             key = self.profiles[name]
 
+        if key and read_only:
+            return self._get_view(key=key)
         if key and duplicate:
             return self._cache[key].duplicate()
         if key and not duplicate:
@@ -309,6 +350,11 @@ class SchemaBranch:
             branch_name=self.name, identifier=name, message=f"Unable to find the schema {name!r} in the registry"
         )
 
+    def _get_view(self, key: str) -> MainSchemaTypes:
+        if key not in self._views:
+            self._views[key] = self._cache[key].duplicate().freeze()
+        return self._views[key]
+
     def get_node(self, name: str, duplicate: bool = True) -> NodeSchema:
         """Access a specific NodeSchema, defined by its kind."""
         item = self.get(name=name, duplicate=duplicate)
@@ -473,6 +519,8 @@ class SchemaBranch:
         if validate_schema:
             self.process_validate()
         self.process_post_validation()
+        # Some steps update the objects in the cache in place, the views created earlier might be outdated
+        self._views = {}
 
     def process_pre_validation(self) -> None:
         self.generate_identifiers()
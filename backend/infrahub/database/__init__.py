@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import random
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Coroutine, Optional, TypeVar, Union
 
 from neo4j import (
     READ_ACCESS,
@@ -31,14 +31,16 @@ from infrahub.exceptions import DatabaseError
 from infrahub.log import get_logger
 from infrahub.utils import InfrahubStringEnum
 
-from .constants import DatabaseType, Neo4jRuntime
+from .constants import DatabaseRoute, DatabaseType, Neo4jRuntime
 from .memgraph import DatabaseManagerMemgraph
-from .metrics import QUERY_EXECUTION_METRICS, TRANSACTION_RETRIES
+from .metrics import QUERY_EXECUTION_METRICS, QUERY_ROUTE_METRICS, SESSION_ROUTE_METRICS, TRANSACTION_RETRIES
 from .neo4j import DatabaseManagerNeo4j
 
 if TYPE_CHECKING:
     from types import TracebackType
 
+    from neo4j import Bookmarks
+
     from infrahub.core.branch import Branch
     from infrahub.core.schema import MainSchemaTypes, NodeSchema
     from infrahub.core.schema.schema_branch import SchemaBranch
@@ -81,11 +83,17 @@ class DatabaseSchemaManager:
     def __init__(self, db: InfrahubDatabase) -> None:
         self._db = db
 
-    def get(self, name: str, branch: Optional[Union[Branch, str]] = None, duplicate: bool = True) -> MainSchemaTypes:
+    def get(
+        self,
+        name: str,
+        branch: Optional[Union[Branch, str]] = None,
+        duplicate: bool = True,
+        read_only: bool = False,
+    ) -> MainSchemaTypes:
         branch_name = get_branch_name(branch=branch)
         if branch_name not in self._db._schemas:
-            return registry.schema.get(name=name, branch=branch, duplicate=duplicate)
-        return self._db._schemas[branch_name].get(name=name, duplicate=duplicate)
+            return registry.schema.get(name=name, branch=branch, duplicate=duplicate, read_only=read_only)
+        return self._db._schemas[branch_name].get(name=name, duplicate=duplicate, read_only=read_only)
 
     def get_node_schema(
         self, name: str, branch: Optional[Union[Branch, str]] = None, duplicate: bool = True
@@ -128,6 +136,20 @@ class DatabaseSchemaManager:
         return self._db._schemas[name]
 
 
+class DatabaseBookmarks:
+    """Bookmarks of the transactions committed by the write sessions of a request.
+
+    They are passed to the read-only sessions of the same request, a read replica then waits to have applied
+    these transactions before it runs the queries of the session.
+    """
+
+    def __init__(self) -> None:
+        self.bookmarks: Optional[Bookmarks] = None
+
+    def update(self, bookmarks: Bookmarks) -> None:
+        self.bookmarks = bookmarks if self.bookmarks is None else self.bookmarks + bookmarks
+
+
 class InfrahubDatabase:
     """Base class for database access"""
 
@@ -142,9 +164,15 @@ class InfrahubDatabase:
         session_mode: InfrahubDatabaseSessionMode = InfrahubDatabaseSessionMode.WRITE,
         transaction: Optional[AsyncTransaction] = None,
         queries_names_to_config: Optional[dict[str, QueryConfig]] = None,
+        read_drivers: Optional[list[AsyncDriver]] = None,
+        bookmarks: Optional[DatabaseBookmarks] = None,
     ):
         self._mode: InfrahubDatabaseMode = mode
         self._driver: AsyncDriver = driver
+        self._read_drivers: list[AsyncDriver] = read_drivers or []
+        # The bookmarks are shared by the sessions and the transactions started from the same session,
+        # a new session started from the driver (i.e. for a new request) starts with its own bookmarks
+        self._bookmarks: DatabaseBookmarks = bookmarks or DatabaseBookmarks()
         self._session: Optional[AsyncSession] = session
         self._session_mode: InfrahubDatabaseSessionMode = session_mode
         self._is_session_local: bool = False
@@ -182,6 +210,16 @@ class InfrahubDatabase:
             return True
         return False
 
+    @property
+    def has_read_replicas(self) -> bool:
+        return bool(self._read_drivers)
+
+    @property
+    def route(self) -> DatabaseRoute:
+        if self._session_mode == InfrahubDatabaseSessionMode.READ and self._read_drivers:
+            return DatabaseRoute.REPLICA
+        return DatabaseRoute.PRIMARY
+
     def get_context(self) -> dict[str, Any]:
         """
         This method is meant to be overridden by subclasses in order to fill in subclass attributes
@@ -193,11 +231,19 @@ class InfrahubDatabase:
     def add_schema(self, schema: SchemaBranch, name: Optional[str] = None) -> None:
         self._schemas[name or schema.name] = schema
 
+    @property
+    def is_read_only(self) -> bool:
+        return self._session_mode == InfrahubDatabaseSessionMode.READ
+
     def start_session(self, read_only: bool = False, schemas: Optional[list[SchemaBranch]] = None) -> InfrahubDatabase:
-        """Create a new InfrahubDatabase object in Session mode."""
-        session_mode = InfrahubDatabaseSessionMode.WRITE
-        if read_only:
-            session_mode = InfrahubDatabaseSessionMode.READ
+        """Create a new InfrahubDatabase object in Session mode.
+
+        The read-only sessions are routed to the read replicas when some are configured,
+        a nested session must ask for read_only explicitly to keep the access mode of its parent.
+        The read-only sessions wait for the transactions committed by the previous write sessions
+        started from the same session.
+        """
+        session_mode = InfrahubDatabaseSessionMode.READ if read_only else InfrahubDatabaseSessionMode.WRITE
 
         context = self.get_context()
 
@@ -209,6 +255,8 @@ class InfrahubDatabase:
             driver=self._driver,
             session_mode=session_mode,
             queries_names_to_config=self.queries_names_to_config,
+            read_drivers=self._read_drivers,
+            bookmarks=self._get_shared_bookmarks(),
             **context,
         )
 
@@ -224,6 +272,8 @@ class InfrahubDatabase:
             session=self._session,
             session_mode=self._session_mode,
             queries_names_to_config=self.queries_names_to_config,
+            read_drivers=self._read_drivers,
+            bookmarks=self._get_shared_bookmarks(),
             **context,
         )
 
@@ -231,18 +281,36 @@ class InfrahubDatabase:
         if self._session:
             return self._session
 
-        if self._session_mode == InfrahubDatabaseSessionMode.READ:
-            self._session = self._driver.session(
-                database=config.SETTINGS.database.database_name, default_access_mode=READ_ACCESS
-            )
-        else:
-            self._session = self._driver.session(
-                database=config.SETTINGS.database.database_name, default_access_mode=WRITE_ACCESS
-            )
-
+        self._session = self._open_session()
         self._is_session_local = True
         return self._session
 
+    def _get_shared_bookmarks(self) -> Optional[DatabaseBookmarks]:
+        if self._mode == InfrahubDatabaseMode.DRIVER:
+            return None
+        return self._bookmarks
+
+    def _open_session(self) -> AsyncSession:
+        driver = self._driver
+        access_mode = WRITE_ACCESS
+        bookmarks = None
+        if self._session_mode == InfrahubDatabaseSessionMode.READ:
+            access_mode = READ_ACCESS
+            bookmarks = self._bookmarks.bookmarks
+            if self._read_drivers:
+                driver = random.choice(self._read_drivers)
+
+        SESSION_ROUTE_METRICS.labels(self._session_mode.value, self.route.value).inc()
+        return driver.session(
+            database=config.SETTINGS.database.database_name,
+            default_access_mode=access_mode,
+            bookmarks=bookmarks,
+        )
+
+    async def _save_bookmarks(self) -> None:
+        if self._session_mode == InfrahubDatabaseSessionMode.WRITE:
+            self._bookmarks.update(await self._session.last_bookmarks())
+
     async def transaction(self, name: Optional[str]) -> AsyncTransaction:
         if self._transaction:
             return self._transaction
@@ -255,14 +323,7 @@ class InfrahubDatabase:
 
     async def __aenter__(self) -> Self:
         if self._mode == InfrahubDatabaseMode.SESSION:
-            if self._session_mode == InfrahubDatabaseSessionMode.READ:
-                self._session = self._driver.session(
-                    database=config.SETTINGS.database.database_name, default_access_mode=READ_ACCESS
-                )
-            else:
-                self._session = self._driver.session(
-                    database=config.SETTINGS.database.database_name, default_access_mode=WRITE_ACCESS
-                )
+            self._session = self._open_session()
 
         elif self._mode == InfrahubDatabaseMode.TRANSACTION:
             session = await self.session()
@@ -277,6 +338,7 @@ class InfrahubDatabase:
         traceback: Optional[TracebackType],
     ):
         if self._mode == InfrahubDatabaseMode.SESSION:
+            await self._save_bookmarks()
             return await self._session.close()
 
         if self._mode == InfrahubDatabaseMode.TRANSACTION:
@@ -289,12 +351,15 @@ class InfrahubDatabase:
                     raise exc
                 finally:
                     await self._transaction.close()
+                await self._save_bookmarks()
 
             if self._is_session_local:
                 await self._session.close()
 
     async def close(self) -> None:
         await self._driver.close()
+        for driver in self._read_drivers:
+            await driver.close()
 
     async def execute_query(
         self, query: str, params: Optional[dict[str, Any]] = None, name: Optional[str] = "undefined"
@@ -310,22 +375,50 @@ class InfrahubDatabase:
             if name:
                 span.set_attribute("query_name", name)
 
-            try:
-                query_config = self.queries_names_to_config[name]
-                if self.db_type == DatabaseType.NEO4J:
-                    runtime = self.queries_names_to_config[name].neo4j_runtime
-                    if runtime != Neo4jRuntime.DEFAULT:
-                        query = f"CYPHER runtime = {runtime.value}\n" + query
-                if query_config.profile_memory:
-                    query = "PROFILE\n" + query
-            except KeyError:
-                pass  # No specific config for this query
+            query = self._apply_query_config(query=query, name=name)
 
             with QUERY_EXECUTION_METRICS.labels(self._session_mode.value, name).time():
                 response = await self.run_query(query=query, params=params, name=name)
                 results = [item async for item in response]
                 return results, response._metadata or {}
 
+    async def stream_query(
+        self, query: str, params: Optional[dict[str, Any]] = None, name: Optional[str] = "undefined"
+    ) -> AsyncIterator[Record]:
+        """Execute a query and yield the records as they are received from the database.
+
+        The driver only pulls the next batch of records (fetch_size) once the previous one has been consumed,
+        so the memory used doesn't depend on the total number of records returned by the query.
+        No other query should be executed on the same session or transaction until the iteration is complete.
+        """
+        # The span is not set as the current one because the context would have to be detached from another task
+        # if the iteration is interrupted by the caller
+        with trace.get_tracer(__name__).start_span("stream_db_query") as span:
+            span.set_attribute("query", query)
+            if name:
+                span.set_attribute("query_name", name)
+
+            query = self._apply_query_config(query=query, name=name)
+
+            with QUERY_EXECUTION_METRICS.labels(self._session_mode.value, name).time():
+                response = await self.run_query(query=query, params=params, name=name)
+                async for record in response:
+                    yield record
+
+    def _apply_query_config(self, query: str, name: Optional[str]) -> str:
+        try:
+            query_config = self.queries_names_to_config[name]
+            if self.db_type == DatabaseType.NEO4J:
+                runtime = self.queries_names_to_config[name].neo4j_runtime
+                if runtime != Neo4jRuntime.DEFAULT:
+                    query = f"CYPHER runtime = {runtime.value}\n" + query
+            if query_config.profile_memory:
+                query = "PROFILE\n" + query
+        except KeyError:
+            pass  # No specific config for this query
+
+        return query
+
     async def run_query(
         self, query: str, params: Optional[dict[str, Any]] = None, name: Optional[str] = "undefined"
     ) -> AsyncResult:
@@ -339,6 +432,7 @@ class InfrahubDatabase:
             )
             execution_method = await self.session()
 
+        QUERY_ROUTE_METRICS.labels(self._session_mode.value, self.route.value).inc()
         try:
             response = await execution_method.run(query=_query, parameters=params)
         except ServiceUnavailable as exc:
@@ -416,17 +510,15 @@ async def validate_database(
     return True
 
 
-async def get_db(retry: int = 0) -> AsyncDriver:
-    URI = f"{config.SETTINGS.database.protocol}://{config.SETTINGS.database.address}:{config.SETTINGS.database.port}"
-
+def _get_driver(uri: str) -> AsyncDriver:
     trusted_certificates = TrustSystemCAs()
     if config.SETTINGS.database.tls_insecure:
         trusted_certificates = TrustAll()
     elif config.SETTINGS.database.tls_ca_file:
         trusted_certificates = TrustCustomCAs(config.SETTINGS.database.tls_ca_file)
 
-    driver = AsyncGraphDatabase.driver(
-        URI,
+    return AsyncGraphDatabase.driver(
+        uri,
         auth=(config.SETTINGS.database.username, config.SETTINGS.database.password),
         encrypted=config.SETTINGS.database.tls_enabled,
         trusted_certificates=trusted_certificates,
@@ -434,6 +526,20 @@ async def get_db(retry: int = 0) -> AsyncDriver:
         notifications_min_severity=NotificationMinimumSeverity.WARNING,
     )
 
+
+def get_read_replica_drivers() -> list[AsyncDriver]:
+    """Return one driver per read replica defined in the configuration."""
+    return [
+        _get_driver(uri=f"{config.SETTINGS.database.protocol}://{address}")
+        for address in config.SETTINGS.database.read_replica.addresses
+    ]
+
+
+async def get_db(retry: int = 0) -> AsyncDriver:
+    URI = f"{config.SETTINGS.database.protocol}://{config.SETTINGS.database.address}:{config.SETTINGS.database.port}"
+
+    driver = _get_driver(uri=URI)
+
     if config.SETTINGS.database.database_name not in validated_database:
         await validate_database(
             driver=driver, database_name=config.SETTINGS.database.database_name, retry=retry, create_db=True
@@ -6,6 +6,11 @@ class DatabaseType(str, Enum):
     MEMGRAPH = "memgraph"
 
 
+class DatabaseRoute(str, Enum):
+    PRIMARY = "primary"
+    REPLICA = "replica"
+
+
 class Neo4jRuntime(str, Enum):
     DEFAULT = "default"
     INTERPRETED = "interpreted"
@@ -16,6 +21,7 @@ class Neo4jRuntime(str, Enum):
 
 class IndexType(str, Enum):
     TEXT = "text"
+    FULLTEXT = "fulltext"
     RANGE = "range"
     LOOKUP = "lookup"
     NOT_APPLICABLE = "not_applicable"
@@ -22,7 +22,8 @@ class IndexNodeMemgraph(IndexItem):
 
 class IndexManagerMemgraph(IndexManagerBase):
     def init(self, nodes: list[IndexItem], rels: list[IndexItem]) -> None:
-        self.nodes = [IndexNodeMemgraph(**item.model_dump()) for item in nodes]
+        # Full-text indexes are not supported by Memgraph without experimental features
+        self.nodes = [IndexNodeMemgraph(**item.model_dump()) for item in nodes if item.type != IndexType.FULLTEXT]
         self.initialized = True
 
     async def add(self) -> None:
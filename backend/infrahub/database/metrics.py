@@ -16,3 +16,33 @@ TRANSACTION_RETRIES = Counter(
     "Number of transaction that have been retried due to transcient error",
     labelnames=["name"],
 )
+
+SESSION_ROUTE_METRICS = Counter(
+    f"{METRIC_PREFIX}_sessions",
+    "Number of sessions opened per access mode and per route (primary or read replica)",
+    labelnames=["type", "route"],
+)
+
+QUERY_ROUTE_METRICS = Counter(
+    f"{METRIC_PREFIX}_query_route",
+    "Number of queries executed per route (primary or read replica)",
+    labelnames=["type", "route"],
+)
+
+QUERY_TEXT_CACHE_HITS = Counter(
+    f"{METRIC_PREFIX}_query_text_cache_hits",
+    "Number of queries for which the Cypher text was found in the cache",
+    labelnames=["query"],
+)
+
+QUERY_TEXT_CACHE_MISSES = Counter(
+    f"{METRIC_PREFIX}_query_text_cache_misses",
+    "Number of queries for which the Cypher text had to be generated",
+    labelnames=["query"],
+)
+
+DIFF_SAVE_THROUGHPUT = Histogram(
+    f"{METRIC_PREFIX}_diff_save_nodes_per_second",
+    "Number of nodes per second written by the saves of the enriched diffs",
+    buckets=[10, 50, 100, 500, 1000, 5000, 10000, 50000],
+)
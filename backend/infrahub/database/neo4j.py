@@ -33,6 +33,11 @@ class IndexNodeNeo4j(IndexItem):
 
     def get_add_query(self) -> str:
         properties_str = ", ".join([f"n.{prop}" for prop in self.properties])
+        if self.type == IndexType.FULLTEXT:
+            return (
+                f"CREATE {self.type.value.upper()} INDEX {self._index_name} IF NOT EXISTS "
+                f"FOR (n:{self.label}) ON EACH [{properties_str}]"
+            )
         return (
             f"CREATE {self.type.value.upper()} INDEX {self._index_name} IF NOT EXISTS "
             f"FOR (n:{self.label}) ON ({properties_str})"
@@ -1,12 +1,76 @@
-from typing import Any, Optional
+from __future__ import annotations
 
-from graphql import GraphQLSchema, OperationType
-from infrahub_sdk.analyzer import GraphQLQueryAnalyzer
+from collections import OrderedDict
+from dataclasses import dataclass
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any, Awaitable, Hashable, Optional, cast
+
+from graphql import ExecutionResult, GraphQLSchema, OperationType, execute, parse
+from infrahub_sdk.analyzer import GraphQLOperation, GraphQLQueryAnalyzer, GraphQLQueryVariable
 from infrahub_sdk.utils import extract_fields
 
-from infrahub.core.branch import Branch
+from infrahub.graphql.metrics import GRAPHQL_QUERY_CACHE_HITS, GRAPHQL_QUERY_CACHE_MISSES
 from infrahub.graphql.utils import extract_schema_models
 
+if TYPE_CHECKING:
+    from graphql import DocumentNode, ExecutionContext, GraphQLError, Middleware
+
+    from infrahub.core.branch import Branch
+
+
+@dataclass
+class AnalyzedQueryData:
+    """Parsed document of a query and the data derived from it, independent of the variables of a request."""
+
+    document: DocumentNode
+    validated: bool = False
+    errors: Optional[list[GraphQLError]] = None
+    fields: Optional[dict[str, Any]] = None
+    depth: Optional[int] = None
+    height: Optional[int] = None
+    models_in_use: Optional[set[str]] = None
+    operations: Optional[list[GraphQLOperation]] = None
+    variables: Optional[list[GraphQLQueryVariable]] = None
+
+
+class GraphQLQueryCache:
+    """Process-wide LRU cache of the parsed and validated GraphQL queries.
+
+    The entries are indexed by a key that must include the hash of the schema the query is validated against.
+    """
+
+    def __init__(self, name: str, max_size: int = 1024) -> None:
+        self.name = name
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, AnalyzedQueryData] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, query: str) -> AnalyzedQueryData:
+        """Return the entry of a query, the query is parsed and added to the cache if it's not already present."""
+        entry = self._entries.get(key)
+        if entry is None:
+            GRAPHQL_QUERY_CACHE_MISSES.labels(self.name).inc()
+            entry = AnalyzedQueryData(document=parse(query))
+            self._entries[key] = entry
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            return entry
+
+        GRAPHQL_QUERY_CACHE_HITS.labels(self.name).inc()
+        self._entries.move_to_end(key)
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Queries sent to the GraphQL endpoint, indexed by the text of the query and the hash of the schema
+graphql_query_cache = GraphQLQueryCache(name="query")
+# Stored queries executed with /api/query, indexed by the id of the query, its checksum and the hash of the schema
+stored_query_cache = GraphQLQueryCache(name="stored_query", max_size=256)
+
 
 class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
     def __init__(
@@ -16,18 +80,77 @@ class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
         schema: Optional[GraphQLSchema] = None,
         operation_name: Optional[str] = None,
         branch: Optional[Branch] = None,
+        schema_hash: Optional[str] = None,
+        data: Optional[AnalyzedQueryData] = None,
     ) -> None:
+        """Analyze a query, if the hash of the schema is provided the result of the analysis is shared through the cache.
+
+        The result of a previous analysis of the same query against the same schema can also be provided with data.
+        """
         self.branch: Optional[Branch] = branch
         self.operation_name: Optional[str] = operation_name
         self.query_variables: dict[str, Any] = query_variables or {}
-        super().__init__(query=query, schema=schema)
+        self.query: str = query
+        self.schema: Optional[GraphQLSchema] = schema
+        self._fields: Optional[dict] = None
+
+        if data:
+            self.data = data
+        elif schema and schema_hash:
+            self.data = graphql_query_cache.get(key=(query, schema_hash), query=query)
+        else:
+            self.data = AnalyzedQueryData(document=parse(query))
+        self.document: DocumentNode = self.data.document
 
     @property
     def operation_names(self) -> list[str]:
         return [operation.name for operation in self.operations if operation.name is not None]
 
+    @property
+    def operations(self) -> list[GraphQLOperation]:
+        if self.data.operations is None:
+            self.data.operations = super().operations
+        return self.data.operations
+
+    @property
+    def variables(self) -> list[GraphQLQueryVariable]:
+        if self.data.variables is None:
+            self.data.variables = super().variables
+        return self.data.variables
+
+    @property
+    def is_valid(self) -> tuple[bool, Optional[list[GraphQLError]]]:
+        if self.schema is None:
+            return super().is_valid
+
+        if not self.data.validated:
+            _, self.data.errors = super().is_valid
+            self.data.validated = True
+
+        return not self.data.errors, self.data.errors
+
+    async def get_fields(self) -> dict[str, Any]:
+        if self.data.fields is None:
+            self.data.fields = await super().get_fields()
+        return self.data.fields
+
+    async def calculate_depth(self) -> int:
+        if self.data.depth is None:
+            self.data.depth = await super().calculate_depth()
+        return self.data.depth
+
+    async def calculate_height(self) -> int:
+        if self.data.height is None:
+            self.data.height = await super().calculate_height()
+        return self.data.height
+
     async def get_models_in_use(self, types: dict[str, Any]) -> set[str]:
         """List of Infrahub models that are referenced in the query."""
+        if self.data.models_in_use is None:
+            self.data.models_in_use = await self._extract_models_in_use(types=types)
+        return set(self.data.models_in_use)
+
+    async def _extract_models_in_use(self, types: dict[str, Any]) -> set[str]:
         graphql_types = set()
         models = set()
 
@@ -58,3 +181,33 @@ class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
                 continue
 
         return models
+
+    async def execute(
+        self,
+        context_value: Any,
+        root_value: Any = None,
+        variable_values: Optional[dict[str, Any]] = None,
+        middleware: Optional[Middleware] = None,
+        execution_context_class: Optional[type[ExecutionContext]] = None,
+    ) -> ExecutionResult:
+        """Execute the parsed document against the schema, the document is only validated once."""
+        if self.schema is None:
+            raise ValueError("Schema must be provided to execute the query.")
+
+        valid, errors = self.is_valid
+        if not valid:
+            return ExecutionResult(data=None, errors=errors)
+
+        result = execute(
+            schema=self.schema,
+            document=self.document,
+            root_value=root_value,
+            context_value=context_value,
+            variable_values=variable_values,
+            operation_name=self.operation_name,
+            middleware=middleware,
+            execution_context_class=execution_context_class,
+        )
+        if isawaitable(result):
+            return await cast(Awaitable[ExecutionResult], result)
+        return cast(ExecutionResult, result)
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import asyncio
 import time
+from contextlib import AsyncExitStack
 from inspect import isawaitable
 from typing import (
     TYPE_CHECKING,
@@ -27,7 +28,6 @@ from graphql import (
     GraphQLFormattedError,
     Middleware,
     OperationType,
-    graphql,
     parse,
     subscribe,
     validate,
@@ -213,6 +213,7 @@ class InfrahubGraphQLApp:
             schema=graphql_params.schema,
             operation_name=operation_name,
             branch=branch,
+            schema_hash=registry.schema.get_schema_branch(name=branch.name).get_hash(),
         )
         await self._evaluate_permissions(
             db=db,
@@ -227,7 +228,7 @@ class InfrahubGraphQLApp:
         if analyzed_query.contains_mutation:
             graphql_params.context.at = Timestamp()
         elif at and branch.schema_changed_at and Timestamp(branch.schema_changed_at) > Timestamp(at):
-            schema_branch = await registry.schema.load_schema_from_db(db=db, branch=branch, at=Timestamp(at))
+            schema_branch = await registry.schema.load_schema_at(db=db, branch=branch, at=Timestamp(at))
             db.add_schema(name=branch.name, schema=schema_branch)
 
         if operation_name == "IntrospectionQuery":
@@ -241,17 +242,19 @@ class InfrahubGraphQLApp:
         with trace.get_tracer(__name__).start_as_current_span("execute_graphql") as span:
             span.set_attributes(labels)
 
-            with GRAPHQL_DURATION_METRICS.labels(**labels).time():
-                result = await graphql(
-                    schema=graphql_params.schema,
-                    source=query,
-                    context_value=graphql_params.context,
-                    root_value=self.root_value,
-                    middleware=self.middleware,
-                    variable_values=variable_values,
-                    operation_name=operation_name,
-                    execution_context_class=self.execution_context_class,
-                )
+            async with AsyncExitStack() as stack:
+                # Queries without mutation are executed on the read replicas, if any
+                if not analyzed_query.contains_mutation and db.has_read_replicas:
+                    graphql_params.context.db = await stack.enter_async_context(db.start_session(read_only=True))
+
+                with GRAPHQL_DURATION_METRICS.labels(**labels).time():
+                    result = await analyzed_query.execute(
+                        context_value=graphql_params.context,
+                        root_value=self.root_value,
+                        variable_values=variable_values,
+                        middleware=self.middleware,
+                        execution_context_class=self.execution_context_class,
+                    )
 
         response: dict[str, Any] = {"data": result.data}
         if result.errors:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Optional, Union
 
 from starlette.background import BackgroundTasks
@@ -9,6 +9,7 @@ from infrahub.core import registry
 from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import InitializationError
 
+from .loaders import PeerLoader
 from .manager import GraphQLSchemaManager
 
 if TYPE_CHECKING:
@@ -38,6 +39,14 @@ class GraphqlContext:
     account_session: Optional[AccountSession] = None
     background: Optional[BackgroundTasks] = None
     request: Optional[HTTPConnection] = None
+    _peer_loader: Optional[PeerLoader] = field(default=None, init=False, repr=False)
+
+    @property
+    def peer_loader(self) -> PeerLoader:
+        """Return the loader batching the lookups of relationship peers for this request."""
+        if self._peer_loader is None:
+            self._peer_loader = PeerLoader(context=self)
+        return self._peer_loader
 
     @property
     def active_account_session(self) -> AccountSession:
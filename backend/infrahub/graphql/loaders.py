@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+import ujson
+
+from infrahub.core.constants import BranchSupportType
+from infrahub.core.manager import NodeManager
+
+if TYPE_CHECKING:
+    from infrahub.core.schema import RelationshipSchema
+    from infrahub.graphql.initialization import GraphqlContext
+
+
+@dataclass
+class PeerRequest:
+    """Lookup of the peers of a relationship, shared by all the source nodes of a batch."""
+
+    source_kind: str
+    schema: RelationshipSchema
+    filters: dict
+    fields: Optional[dict] = None
+
+    @property
+    def key(self) -> tuple[str, str, str, str]:
+        return (
+            self.source_kind,
+            self.schema.name,
+            ujson.dumps(self.filters, sort_keys=True, default=str),
+            ujson.dumps(self.fields, sort_keys=True, default=str),
+        )
+
+
+@dataclass
+class _PeerBatch:
+    operation: str
+    request: PeerRequest
+    futures: dict[str, asyncio.Future] = field(default_factory=dict)
+
+
+class PeerLoader:
+    """Batch the lookups of relationship peers done by the resolvers of a single GraphQL request.
+
+    The lookups for the same relationship, filters and fields issued within the same iteration of the event loop,
+    typically by the resolvers of all the items of a list, are resolved with a single query for all the source nodes.
+    """
+
+    def __init__(self, context: GraphqlContext) -> None:
+        self.context = context
+        self._pending: dict[tuple, _PeerBatch] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load_peers(self, source_id: str, request: PeerRequest) -> list[dict[str, Any]]:
+        """Return the peers of a source node, already formatted for GraphQL."""
+        return await self._load(operation="peers", source_id=source_id, request=request)
+
+    async def load_count(self, source_id: str, request: PeerRequest) -> int:
+        """Return the number of peers of a source node."""
+        return await self._load(operation="count", source_id=source_id, request=request)
+
+    async def _load(self, operation: str, source_id: str, request: PeerRequest) -> Any:
+        loop = asyncio.get_running_loop()
+        key = (operation, request.key)
+
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _PeerBatch(operation=operation, request=request)
+            loop.call_soon(self._dispatch, key)
+
+        if source_id not in batch.futures:
+            batch.futures[source_id] = loop.create_future()
+        return await batch.futures[source_id]
+
+    def _dispatch(self, key: tuple) -> None:
+        batch = self._pending.pop(key)
+        task = asyncio.ensure_future(self._resolve(batch=batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: _PeerBatch) -> None:
+        try:
+            if batch.operation == "count":
+                results: dict[str, Any] = await self._count_peers(batch=batch)
+            else:
+                results = await self._query_peers(batch=batch)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            for future in batch.futures.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for source_id, future in batch.futures.items():
+            if not future.done():
+                future.set_result(results[source_id])
+
+    async def _count_peers(self, batch: _PeerBatch) -> dict[str, int]:
+        request = batch.request
+        async with self.context.db.start_session(read_only=self.context.db.is_read_only) as db:
+            return await NodeManager.count_peers_per_source(
+                db=db,
+                ids=list(batch.futures),
+                source_kind=request.source_kind,
+                schema=request.schema,
+                filters=request.filters,
+                at=self.context.at,
+                branch=self.context.branch,
+                branch_agnostic=request.schema.branch is BranchSupportType.AGNOSTIC,
+            )
+
+    async def _query_peers(self, batch: _PeerBatch) -> dict[str, list[dict[str, Any]]]:
+        request = batch.request
+        async with self.context.db.start_session(read_only=self.context.db.is_read_only) as db:
+            peers_per_source = await NodeManager.query_peers_per_source(
+                db=db,
+                ids=list(batch.futures),
+                source_kind=request.source_kind,
+                schema=request.schema,
+                filters=request.filters,
+                fields=request.fields,
+                at=self.context.at,
+                branch=self.context.branch,
+                branch_agnostic=request.schema.branch is BranchSupportType.AGNOSTIC,
+                fetch_peers=True,
+            )
+
+            return {
+                source_id: [
+                    await peer.to_graphql(db=db, fields=request.fields, related_node_ids=self.context.related_node_ids)
+                    for peer in peers
+                ]
+                for source_id, peers in peers_per_source.items()
+            }
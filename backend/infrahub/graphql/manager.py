@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import weakref
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
 
@@ -945,3 +946,39 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
         }
 
         return type(f"NestedPaginated{schema.kind}", (InfrahubObject,), main_attrs)
+
+
+@dataclass
+class GraphQLSchemaEntry:
+    manager: GraphQLSchemaManager
+    schema: Optional[GraphQLSchema] = None
+
+
+class GraphQLSchemaRegistry:
+    """Process-wide registry of the GraphQL schemas, shared by all the schema branches with the same hash.
+
+    The entries are only referenced weakly by the registry and strongly by the schema branches using them,
+    an entry is released once the last schema branch referencing it has been cleared or garbage collected.
+    """
+
+    def __init__(self) -> None:
+        self._entries: weakref.WeakValueDictionary[tuple[str, bool], GraphQLSchemaEntry] = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, schema: SchemaBranch) -> GraphQLSchemaEntry:
+        # The GraphQL types generated also depend on the support of the enums
+        key = (schema.get_hash(), config.SETTINGS.experimental_features.graphql_enums)
+        entry = self._entries.get(key)
+        if entry is None:
+            # The manager works on a copy since the schema branch can be updated in place after it has been cleared
+            entry = GraphQLSchemaEntry(manager=GraphQLSchemaManager(schema=schema.duplicate(name=schema.name)))
+            self._entries[key] = entry
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+graphql_schema_registry = GraphQLSchemaRegistry()
@@ -1,4 +1,4 @@
-from prometheus_client import Histogram
+from prometheus_client import Counter, Histogram
 
 METRIC_PREFIX = "infrahub_graphql"
 
@@ -57,3 +57,14 @@ GRAPHQL_TOP_LEVEL_QUERIES_METRICS = Histogram(
     labelnames=["type", "operation", "branch", "name", "query_id"],
     buckets=[1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 15, 25, 50, 100],
 )
+
+GRAPHQL_QUERY_CACHE_HITS = Counter(
+    f"{METRIC_PREFIX}_query_cache_hits",
+    "Number of queries for which the parsed document was found in the cache",
+    labelnames=["cache"],
+)
+GRAPHQL_QUERY_CACHE_MISSES = Counter(
+    f"{METRIC_PREFIX}_query_cache_misses",
+    "Number of queries that had to be parsed",
+    labelnames=["cache"],
+)
@@ -6,7 +6,7 @@ from infrahub_sdk.utils import extract_fields
 from infrahub_sdk.uuidt import UUIDT
 from typing_extensions import Self
 
-from infrahub.auth import AuthType
+from infrahub.auth import AuthType, api_key_cache
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
@@ -14,6 +14,7 @@ from infrahub.core.protocols import CoreAccount, CoreNode, InternalAccountToken
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase, retry_db_transaction
 from infrahub.exceptions import NodeNotFoundError, PermissionDeniedError
+from infrahub.message_bus import messages
 
 from ..types import InfrahubObjectType
 
@@ -121,6 +122,12 @@ class AccountMixin:
         async with db.start_transaction() as dbt:
             await results[0].delete(db=dbt)  # type: ignore[arg-type]
 
+        # The deleted token must no longer be accepted, neither by this worker nor by the other ones
+        context: GraphqlContext = info.context
+        api_key_cache.evict_account(account_id=account.id)
+        if context.service:
+            await context.service.send(message=messages.RefreshRegistryAccounts(account_id=account.id))
+
         return cls(ok=True)  # type: ignore[call-arg]
 
     @classmethod
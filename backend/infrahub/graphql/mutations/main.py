@@ -9,11 +9,12 @@ from typing_extensions import Self
 
 from infrahub import config
 from infrahub.auth import (
+    api_key_cache,
     validate_mutation_permissions,
     validate_mutation_permissions_update_node,
 )
 from infrahub.core import registry
-from infrahub.core.constants import MutationAction
+from infrahub.core.constants import InfrahubKind, MutationAction
 from infrahub.core.constraint.node.runner import NodeConstraintRunner
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
@@ -26,6 +27,8 @@ from infrahub.dependencies.registry import get_component_registry
 from infrahub.events import EventMeta, NodeMutatedEvent
 from infrahub.exceptions import ValidationError
 from infrahub.log import get_log_data, get_logger
+from infrahub.message_bus import messages
+from infrahub.permissions.cache import PERMISSION_KINDS, invalidate_permission_cache
 from infrahub.worker import WORKER_IDENTITY
 
 from .node_getter.by_default_filter import MutationNodeGetterByDefaultFilter
@@ -94,6 +97,21 @@ class InfrahubMutationMixin:
         # Reset the time of the query to guarantee that all resolvers executed after this point will account for the changes
         context.at = Timestamp()
 
+        # Changing an account, a group, a role or a permission can change the permissions of any account
+        if context.service and obj.get_kind() in PERMISSION_KINDS:
+            await invalidate_permission_cache(cache=context.service.cache)
+
+        # The API tokens validated recently must be checked again on every worker, the status of the account
+        # or the tokens themselves may have changed
+        if obj.get_kind() in (InfrahubKind.ACCOUNT, InfrahubKind.ACCOUNTTOKEN):
+            account_id = obj.id if obj.get_kind() == InfrahubKind.ACCOUNT else None
+            if account_id:
+                api_key_cache.evict_account(account_id=account_id)
+            else:
+                api_key_cache.clear()
+            if context.service:
+                await context.service.send(message=messages.RefreshRegistryAccounts(account_id=account_id))
+
         if config.SETTINGS.broker.enable and context.background:
             log_data = get_log_data()
             request_id = log_data.get("request_id", "")
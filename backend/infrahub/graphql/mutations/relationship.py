@@ -14,6 +14,7 @@ from infrahub.core.query.relationship import (
 from infrahub.core.relationship import Relationship
 from infrahub.database import retry_db_transaction
 from infrahub.exceptions import NodeNotFoundError, ValidationError
+from infrahub.permissions.cache import PERMISSION_KINDS, invalidate_permission_cache
 
 from ..types import RelatedNodeInput
 
@@ -133,6 +134,10 @@ class RelationshipMixin:
                         await rel.load(db=db, data=existing_peers[node_data.get("id")])
                         await rel.delete(db=db)
 
+        # Changing the members of a group or the roles of a group can change the permissions of the accounts
+        if context.service and PERMISSION_KINDS & {source.get_kind(), rel_schema.peer}:
+            await invalidate_permission_cache(cache=context.service.cache)
+
         return cls(ok=True)
 
 
@@ -130,6 +130,7 @@ class DiffTree(DiffSummaryCounts):
     num_untracked_diff_changes = Int(required=False)
     name = String(required=False)
     nodes = List(DiffNode)
+    next_cursor = String(required=False)
 
 
 class DiffTreeSummary(DiffSummaryCounts):
@@ -378,6 +379,7 @@ class DiffTreeResolver:
         root_node_uuids: list[str] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        after: str | None = None,
     ) -> Optional[Union[list[dict[str, Any]], dict[str, Any]]]:
         component_registry = get_component_registry()
         context: GraphqlContext = info.context
@@ -401,7 +403,7 @@ class DiffTreeResolver:
         elif root_node_uuids:
             filters_dict["ids"] = root_node_uuids
 
-        enriched_diffs = await diff_repo.get(
+        diff_page = await diff_repo.get_page(
             base_branch_name=base_branch.name,
             diff_branch_names=[diff_branch.name],
             from_time=from_timestamp,
@@ -412,7 +414,9 @@ class DiffTreeResolver:
             offset=offset,
             tracking_id=NameTrackingId(name) if name else None,
             include_empty=True,
+            after=after,
         )
+        enriched_diffs = diff_page.diff_roots
         if not enriched_diffs:
             return None
         if len(enriched_diffs) > 0:
@@ -427,6 +431,7 @@ class DiffTreeResolver:
 
         full_fields = await extract_fields(info.field_nodes[0].selection_set)
         diff_tree = await self.to_diff_tree(enriched_diff_root=enriched_diff, context=context)
+        diff_tree.next_cursor = diff_page.next_cursor
         need_base_changes = "num_untracked_base_changes" in full_fields
         need_branch_changes = "num_untracked_diff_changes" in full_fields
         if need_base_changes or need_branch_changes:
@@ -526,6 +531,7 @@ DiffTreeQuery = Field(
     filters=DiffTreeQueryFilters(),
     limit=Int(),
     offset=Int(),
+    after=String(),
 )
 
 DiffTreeSummaryQuery = Field(
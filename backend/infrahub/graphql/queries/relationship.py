@@ -34,7 +34,7 @@ class Relationships(ObjectType):
 
         response: dict[str, Any] = {"edges": [], "count": None}
 
-        async with context.db.start_session() as db:
+        async with context.db.start_session(read_only=context.db.is_read_only) as db:
             query = await RelationshipGetByIdentifierQuery.init(
                 db=db,
                 branch=context.branch,
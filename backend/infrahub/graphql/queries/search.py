@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Optional
 
-from graphene import Boolean, Field, Int, List, ObjectType, String
+from graphene import Boolean, Field, Float, Int, List, ObjectType, String
 from infrahub_sdk.utils import extract_fields_first_node, is_valid_uuid
 
+from infrahub.core import registry
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.manager import NodeManager
+from infrahub.core.query.search import SearchQuery, build_fulltext_query
+from infrahub.database import DatabaseType
 
 if TYPE_CHECKING:
     from graphql import GraphQLResolveInfo
@@ -18,6 +21,8 @@ if TYPE_CHECKING:
 class Node(ObjectType):
     id = Field(String, required=True)
     kind = Field(String, required=True, description="The node kind")
+    display_label = Field(String, required=False, description="The display label of the node")
+    score = Field(Float, required=False, description="The relevance of the node for the search, higher is better")
 
 
 class NodeEdge(ObjectType):
@@ -29,6 +34,38 @@ class NodeEdges(ObjectType):
     edges = Field(List(of_type=NodeEdge, required=True), required=False)
 
 
+async def _search_with_index(
+    context: GraphqlContext, q: str, limit: int, partial_match: bool, include_display_label: bool
+) -> list[dict[str, Any]]:
+    search_query = build_fulltext_query(q=q, partial_match=partial_match)
+    if not search_query:
+        return []
+
+    schema_branch = registry.schema.get_schema_branch(name=context.branch.name)
+    query = await SearchQuery.init(
+        db=context.db,
+        branch=context.branch,
+        at=context.at,
+        limit=limit,
+        search_query=search_query,
+        searchable_attributes=schema_branch.get_searchable_attributes(),
+    )
+    await query.execute(db=context.db)
+    matches = query.get_matches()
+
+    display_labels: dict[str, str] = {}
+    if include_display_label and matches:
+        nodes = await NodeManager.get_many(
+            db=context.db, ids=[node_id for node_id, _, _ in matches], branch=context.branch, at=context.at
+        )
+        display_labels = {node_id: await node.render_display_label(db=context.db) for node_id, node in nodes.items()}
+
+    return [
+        {"id": node_id, "kind": kind, "display_label": display_labels.get(node_id), "score": score}
+        for node_id, kind, score in matches
+    ]
+
+
 async def search_resolver(
     root: dict,  # pylint: disable=unused-argument
     info: GraphQLResolveInfo,
@@ -39,8 +76,10 @@ async def search_resolver(
     context: GraphqlContext = info.context
     response: dict[str, Any] = {}
     result: list[CoreNode] = []
+    matches: list[dict[str, Any]] = []
 
     fields = await extract_fields_first_node(info)
+    include_display_label = "display_label" in (fields.get("edges") or {}).get("node", {})
 
     if is_valid_uuid(q):
         matching: Optional[CoreNode] = await NodeManager.get_one(
@@ -48,7 +87,12 @@ async def search_resolver(
         )
         if matching:
             result.append(matching)
+    elif context.db.db_type == DatabaseType.NEO4J and context.db.manager.index.initialized:
+        matches = await _search_with_index(
+            context=context, q=q, limit=limit, partial_match=partial_match, include_display_label=include_display_label
+        )
     else:
+        # The full-text index is only available with Neo4j, once the indexes have been loaded
         result.extend(
             await NodeManager.query(
                 db=context.db,
@@ -60,11 +104,15 @@ async def search_resolver(
             )
         )
 
-    if "edges" in fields and result:
-        response["edges"] = [{"node": {"id": obj.id, "kind": obj.get_kind()}} for obj in result]
+    for obj in result:
+        display_label = await obj.render_display_label(db=context.db) if include_display_label else None
+        matches.append({"id": obj.id, "kind": obj.get_kind(), "display_label": display_label, "score": None})
+
+    if "edges" in fields and matches:
+        response["edges"] = [{"node": match} for match in matches]
 
     if "count" in fields:
-        response["count"] = len(result)
+        response["count"] = len(matches)
 
     return response
 
@@ -9,6 +9,7 @@ from infrahub.core.manager import NodeManager
 from infrahub.core.query.node import NodeGetHierarchyQuery
 from infrahub.exceptions import NodeNotFoundError
 
+from .loaders import PeerRequest
 from .parser import extract_selection
 from .permissions import get_permissions
 from .types import RELATIONS_PROPERTY_MAP, RELATIONS_PROPERTY_MAP_REVERSED
@@ -27,7 +28,7 @@ async def account_resolver(
     fields = await extract_fields(info.field_nodes[0].selection_set)
     context: GraphqlContext = info.context
 
-    async with context.db.start_session() as db:
+    async with context.db.start_session(read_only=context.db.is_read_only) as db:
         results = await NodeManager.query(
             schema=InfrahubKind.GENERICACCOUNT,
             filters={"ids": [context.account_session.account_id]},
@@ -92,7 +93,7 @@ async def default_resolver(*args: Any, **kwargs) -> dict | list[dict] | None:
         if "__" in key and value or key in ["id", "ids"]
     }
 
-    async with context.db.start_session() as db:
+    async with context.db.start_session(read_only=context.db.is_read_only) as db:
         objs = await NodeManager.query_peers(
             db=db,
             ids=[parent["id"]],
@@ -139,7 +140,7 @@ async def default_paginated_list_resolver(
     fields = await extract_selection(info.field_nodes[0], schema=schema)
 
     context: GraphqlContext = info.context
-    async with context.db.start_session() as db:
+    async with context.db.start_session(read_only=context.db.is_read_only) as db:
         response: dict[str, Any] = {"edges": []}
         filters = {
             key: value for key, value in kwargs.items() if ("__" in key and value is not None) or key in ("ids", "hfid")
@@ -237,31 +238,21 @@ async def single_relationship_resolver(parent: dict, info: GraphQLResolveInfo, *
 
     response: dict[str, Any] = {"node": None, "properties": {}}
 
-    async with context.db.start_session() as db:
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=[parent["id"]],
-            source_kind=node_schema.kind,
-            schema=node_rel,
-            filters=filters,
-            fields=node_fields,
-            at=context.at,
-            branch=context.branch,
-            branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
-            fetch_peers=True,
-        )
-
-        if not objs:
-            return response
-
-        node_graph = await objs[0].to_graphql(db=db, fields=node_fields, related_node_ids=context.related_node_ids)
-        for key, mapped in RELATIONS_PROPERTY_MAP_REVERSED.items():
-            value = node_graph.pop(key, None)
-            if value:
-                response["properties"][mapped] = value
-        response["node"] = node_graph
+    peers = await context.peer_loader.load_peers(
+        source_id=parent["id"],
+        request=PeerRequest(source_kind=node_schema.kind, schema=node_rel, filters=filters, fields=node_fields),
+    )
+    if not peers:
         return response
 
+    node_graph = dict(peers[0])
+    for key, mapped in RELATIONS_PROPERTY_MAP_REVERSED.items():
+        value = node_graph.pop(key, None)
+        if value:
+            response["properties"][mapped] = value
+    response["node"] = node_graph
+    return response
+
 
 async def many_relationship_resolver(
     parent: dict, info: GraphQLResolveInfo, include_descendants: Optional[bool] = False, **kwargs
@@ -302,7 +293,21 @@ async def many_relationship_resolver(
 
     source_kind = node_schema.kind
 
-    async with context.db.start_session() as db:
+    # Without descendants, the lookups of all the parents resolved together are batched by the peer loader
+    if not include_descendants:
+        request = PeerRequest(source_kind=source_kind, schema=node_rel, filters=filters, fields=node_fields)
+        if "count" in fields:
+            response["count"] = await context.peer_loader.load_count(source_id=parent["id"], request=request)
+
+        if not node_fields:
+            return response
+
+        if offset is None and limit is None:
+            peers = await context.peer_loader.load_peers(source_id=parent["id"], request=request)
+            response["edges"] = _get_relationship_edges(node_graph=[dict(peer) for peer in peers])
+            return response
+
+    async with context.db.start_session(read_only=context.db.is_read_only) as db:
         ids = [parent["id"]]
         if include_descendants:
             query = await NodeGetHierarchyQuery.init(
@@ -319,20 +324,20 @@ async def many_relationship_resolver(
             descendants_ids = list(query.get_peer_ids())
             ids.extend(descendants_ids)
 
-        if "count" in fields:
-            response["count"] = await NodeManager.count_peers(
-                db=db,
-                ids=ids,
-                source_kind=source_kind,
-                schema=node_rel,
-                filters=filters,
-                at=context.at,
-                branch=context.branch,
-                branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
-            )
+            if "count" in fields:
+                response["count"] = await NodeManager.count_peers(
+                    db=db,
+                    ids=ids,
+                    source_kind=source_kind,
+                    schema=node_rel,
+                    filters=filters,
+                    at=context.at,
+                    branch=context.branch,
+                    branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
+                )
 
-        if not node_fields:
-            return response
+            if not node_fields:
+                return response
 
         objs = await NodeManager.query_peers(
             db=db,
@@ -354,21 +359,24 @@ async def many_relationship_resolver(
         node_graph = [
             await obj.to_graphql(db=db, fields=node_fields, related_node_ids=context.related_node_ids) for obj in objs
         ]
-
-        entries = []
-        for node in node_graph:
-            entry = {"node": {}, "properties": {}}
-            for key, mapped in RELATIONS_PROPERTY_MAP_REVERSED.items():
-                value = node.pop(key, None)
-                if value:
-                    entry["properties"][mapped] = value
-            entry["node"] = node
-            entries.append(entry)
-        response["edges"] = entries
+        response["edges"] = _get_relationship_edges(node_graph=node_graph)
 
         return response
 
 
+def _get_relationship_edges(node_graph: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    entries = []
+    for node in node_graph:
+        entry: dict[str, Any] = {"node": {}, "properties": {}}
+        for key, mapped in RELATIONS_PROPERTY_MAP_REVERSED.items():
+            value = node.pop(key, None)
+            if value:
+                entry["properties"][mapped] = value
+        entry["node"] = node
+        entries.append(entry)
+    return entries
+
+
 async def ancestors_resolver(parent: dict, info: GraphQLResolveInfo, **kwargs) -> dict[str, Any]:
     return await hierarchy_resolver(
         direction=RelationshipHierarchyDirection.ANCESTORS, parent=parent, info=info, **kwargs
@@ -411,7 +419,7 @@ async def hierarchy_resolver(
 
     response: dict[str, Any] = {"edges": [], "count": None}
 
-    async with context.db.start_session() as db:
+    async with context.db.start_session(read_only=context.db.is_read_only) as db:
         if "count" in fields:
             response["count"] = await NodeManager.count_hierarchy(
                 db=db,
@@ -28,7 +28,7 @@ async def resolver_graphql_query(
     context: GraphqlContext = info.context
     at = Timestamp()
 
-    async with context.db.start_session() as db:
+    async with context.db.start_session(read_only=context.db.is_read_only) as db:
         # Find the GraphQLQuery and the GraphQL Schema
         graphql_query = await NodeManager.get_one_by_default_filter(
             db=db, id=name, kind=CoreGraphQLQuery, branch=context.branch, at=at
@@ -40,7 +40,7 @@ async def resolver_graphql_query(
         graphql_schema = schema_branch.get_graphql_schema()
 
     while True:
-        async with context.db.start_session() as db:
+        async with context.db.start_session(read_only=context.db.is_read_only) as db:
             result = await graphql(
                 schema=graphql_schema,
                 source=graphql_query.query.value,
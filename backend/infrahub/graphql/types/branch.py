@@ -37,7 +37,7 @@ class BranchType(InfrahubObjectType):
         context: GraphqlContext,
         **kwargs: Any,
     ) -> list[dict[str, Any]]:
-        async with context.db.start_session() as db:
+        async with context.db.start_session(read_only=context.db.is_read_only) as db:
             objs = await Branch.get_list(db=db, **kwargs)
 
             if not objs:
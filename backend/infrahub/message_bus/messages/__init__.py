@@ -28,6 +28,7 @@ from .proposed_change.request_proposedchange_repositorychecks import RequestProp
 from .proposed_change.request_proposedchange_rungenerators import RequestProposedChangeRunGenerators
 from .proposed_change.request_proposedchange_runtests import RequestProposedChangeRunTests
 from .proposed_change.request_proposedchange_schemaintegrity import RequestProposedChangeSchemaIntegrity
+from .refresh_registry_accounts import RefreshRegistryAccounts
 from .refresh_registry_branches import RefreshRegistryBranches
 from .refresh_registry_rebasedbranch import RefreshRegistryRebasedBranch
 from .refresh_webhook_configuration import RefreshWebhookConfiguration
@@ -79,6 +80,7 @@ MESSAGE_MAP: dict[str, type[InfrahubMessage]] = {
     "git.repository.pull_read_only": GitRepositoryPullReadOnly,
     "schema.migration.path": SchemaMigrationPath,
     "schema.validator.path": SchemaValidatorPath,
+    "refresh.registry.accounts": RefreshRegistryAccounts,
     "refresh.registry.branches": RefreshRegistryBranches,
     "refresh.registry.rebased_branch": RefreshRegistryRebasedBranch,
     "refresh.webhook.configuration": RefreshWebhookConfiguration,
@@ -0,0 +1,13 @@
+from typing import Optional
+
+from pydantic import Field
+
+from infrahub.message_bus import InfrahubMessage
+
+
+class RefreshRegistryAccounts(InfrahubMessage):
+    """Sent to evict the credentials of accounts validated recently from the local cache."""
+
+    account_id: Optional[str] = Field(
+        default=None, description="The account that was modified, all the accounts are evicted if not provided"
+    )
@@ -42,6 +42,7 @@ COMMAND_MAP = {
     "git.repository.import_objects": git.repository.import_objects,
     "git.repository.pull_read_only": git.repository.pull_read_only,
     "git.repository.merge": git.repository.merge,
+    "refresh.registry.accounts": refresh.registry.accounts,
     "refresh.registry.branches": refresh.registry.branches,
     "refresh.registry.rebased_branch": refresh.registry.rebased_branch,
     "refresh.webhook.configuration": refresh.webhook.configuration,
@@ -8,6 +8,7 @@ from infrahub.core.diff.repository.repository import DiffRepository
 from infrahub.dependencies.registry import get_component_registry
 from infrahub.log import get_logger
 from infrahub.message_bus import InfrahubMessage, messages
+from infrahub.permissions.cache import invalidate_permission_cache
 from infrahub.services import InfrahubServices
 from infrahub.workflows.catalogue import GIT_REPOSITORIES_CREATE_BRANCH, IPAM_RECONCILIATION
 
@@ -47,6 +48,8 @@ async def delete(message: messages.EventBranchDelete, service: InfrahubServices)
 @flow(name="branch-event-merge")
 async def merge(message: messages.EventBranchMerge, service: InfrahubServices) -> None:
     log.info("Branch merged", source_branch=message.source_branch, target_branch=message.target_branch)
+    # The nodes merged are not sent as events, any of them might define permissions
+    await invalidate_permission_cache(cache=service.cache)
 
     events: List[InfrahubMessage] = [
         messages.RefreshRegistryBranches(),
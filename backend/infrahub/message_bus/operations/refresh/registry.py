@@ -1,4 +1,5 @@
 from infrahub import lock
+from infrahub.auth import api_key_cache
 from infrahub.core.registry import registry
 from infrahub.message_bus import messages
 from infrahub.services import InfrahubServices
@@ -6,13 +7,22 @@ from infrahub.tasks.registry import refresh_branches
 from infrahub.worker import WORKER_IDENTITY
 
 
+async def accounts(message: messages.RefreshRegistryAccounts, service: InfrahubServices) -> None:
+    if message.account_id:
+        service.log.debug("Evicting account from the API key cache", account_id=message.account_id)
+        api_key_cache.evict_account(account_id=message.account_id)
+    else:
+        service.log.debug("Clearing the API key cache")
+        api_key_cache.clear()
+
+
 async def branches(message: messages.RefreshRegistryBranches, service: InfrahubServices) -> None:
     if message.meta and message.meta.initiator_id == WORKER_IDENTITY:
         service.log.info("Ignoring refresh registry refresh request originating from self", worker=WORKER_IDENTITY)
         return
 
     async with service.database.start_session() as db:
-        await refresh_branches(db=db)
+        await refresh_branches(db=db, cache=service.cache)
 
     await service.component.refresh_schema_hash()
 
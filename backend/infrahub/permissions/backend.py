@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from infrahub.core.account import GlobalPermission, ObjectPermission
     from infrahub.core.branch import Branch
     from infrahub.database import InfrahubDatabase
     from infrahub.permissions.constants import AssignedPermissions, PermissionDecisionFlag
+    from infrahub.services.adapters.cache import InfrahubCache
 
 
 class PermissionBackend(ABC):
+    # Set by initialize_permission_backends, the constructor of the backends is not expected to take the cache
+    cache: Optional[InfrahubCache] = None
+
     @abstractmethod
     async def load_permissions(self, db: InfrahubDatabase, account_id: str, branch: Branch) -> AssignedPermissions: ...
 
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Optional
+from uuid import uuid4
+
+import ujson
+
+from infrahub.core.account import GlobalPermission, ObjectPermission
+from infrahub.core.constants import InfrahubKind
+from infrahub.message_bus.types import KVTTL
+
+from .metrics import PERMISSION_CACHE_HITS, PERMISSION_CACHE_INVALIDATIONS, PERMISSION_CACHE_MISSES
+
+if TYPE_CHECKING:
+    from infrahub.permissions.constants import AssignedPermissions
+    from infrahub.services.adapters.cache import InfrahubCache
+
+PERMISSION_CACHE_KEY_PREFIX = "permissions:account"
+PERMISSION_CACHE_GENERATION_KEY = "permissions:generation"
+
+# Changing a node of one of these kinds can change the permissions of any account
+PERMISSION_KINDS = frozenset(
+    {
+        InfrahubKind.ACCOUNT,
+        InfrahubKind.GENERICACCOUNT,
+        InfrahubKind.ACCOUNTGROUP,
+        InfrahubKind.ACCOUNTROLE,
+        InfrahubKind.BASEPERMISSION,
+        InfrahubKind.GLOBALPERMISSION,
+        InfrahubKind.OBJECTPERMISSION,
+    }
+)
+
+
+def _get_key(account_id: str, branch_name: str) -> str:
+    return f"{PERMISSION_CACHE_KEY_PREFIX}:{account_id}:{branch_name}"
+
+
+async def get_cached_permissions(
+    cache: InfrahubCache, account_id: str, branch_name: str
+) -> tuple[Optional[AssignedPermissions], str]:
+    """Return the permissions of an account in the cache, if any, and the current generation of the cache.
+
+    The generation must be provided when storing permissions resolved after this call, so that the ones resolved
+    before an invalidation of the cache are never used.
+    """
+    generation, value = await cache.get_values(
+        keys=[PERMISSION_CACHE_GENERATION_KEY, _get_key(account_id=account_id, branch_name=branch_name)]
+    )
+    generation = generation or ""
+    if value:
+        data = ujson.loads(value)
+        if data["generation"] == generation:
+            PERMISSION_CACHE_HITS.inc()
+            return {
+                "global_permissions": [GlobalPermission(**item) for item in data["global_permissions"]],
+                "object_permissions": [ObjectPermission(**item) for item in data["object_permissions"]],
+            }, generation
+
+    PERMISSION_CACHE_MISSES.inc()
+    return None, generation
+
+
+async def set_cached_permissions(
+    cache: InfrahubCache, account_id: str, branch_name: str, permissions: AssignedPermissions, generation: str
+) -> None:
+    data = {
+        "generation": generation,
+        "global_permissions": [asdict(permission) for permission in permissions["global_permissions"]],
+        "object_permissions": [asdict(permission) for permission in permissions["object_permissions"]],
+    }
+    await cache.set(
+        key=_get_key(account_id=account_id, branch_name=branch_name),
+        value=ujson.dumps(data),
+        expires=KVTTL.TWO_HOURS,
+    )
+
+
+async def invalidate_permission_cache(cache: InfrahubCache) -> None:
+    """Invalidate the permissions of all the accounts stored in the cache.
+
+    The entries of the previous generation are no longer used and expire on their own.
+    """
+    await cache.set(key=PERMISSION_CACHE_GENERATION_KEY, value=str(uuid4()))
+    PERMISSION_CACHE_INVALIDATIONS.inc()
@@ -7,6 +7,7 @@ from infrahub.core.constants import GlobalPermissions, PermissionDecision
 from infrahub.permissions.constants import PermissionDecisionFlag
 
 from .backend import PermissionBackend
+from .cache import get_cached_permissions, set_cached_permissions
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
@@ -83,7 +84,22 @@ class LocalPermissionBackend(PermissionBackend):
         return grant_permission
 
     async def load_permissions(self, db: InfrahubDatabase, account_id: str, branch: Branch) -> AssignedPermissions:
-        return await fetch_permissions(db=db, account_id=account_id, branch=branch)
+        if not self.cache:
+            return await fetch_permissions(db=db, account_id=account_id, branch=branch)
+
+        permissions, generation = await get_cached_permissions(
+            cache=self.cache, account_id=account_id, branch_name=branch.name
+        )
+        if permissions is None:
+            permissions = await fetch_permissions(db=db, account_id=account_id, branch=branch)
+            await set_cached_permissions(
+                cache=self.cache,
+                account_id=account_id,
+                branch_name=branch.name,
+                permissions=permissions,
+                generation=generation,
+            )
+        return permissions
 
     async def has_permission(
         self, db: InfrahubDatabase, account_id: str, permission: GlobalPermission | ObjectPermission, branch: Branch
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from prometheus_client import Counter
+
+METRIC_PREFIX = "infrahub_permissions"
+
+PERMISSION_CACHE_HITS = Counter(
+    f"{METRIC_PREFIX}_cache_hits",
+    "Number of lookups of the permissions of an account found in the cache",
+)
+
+PERMISSION_CACHE_MISSES = Counter(
+    f"{METRIC_PREFIX}_cache_misses",
+    "Number of lookups of the permissions of an account that had to be resolved from the database",
+)
+
+PERMISSION_CACHE_INVALIDATIONS = Counter(
+    f"{METRIC_PREFIX}_cache_invalidations",
+    "Number of times the permissions in the cache have been invalidated",
+)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
 from infrahub.core.query.resource_manager import NumberPoolGetAllocated
 from infrahub.core.registry import registry
@@ -65,3 +66,135 @@ class NumberUtilizationGetter:
     @property
     def total_pool_size(self) -> int:
         return self.end_range - self.start_range + 1
+
+
+class NumberRanges:
+    """Sorted list of the free ranges of a number pool, both bounds of a range are included.
+
+    Looking up, reserving or releasing a number is a binary search on the start of the ranges,
+    the size of the structure depends on the fragmentation of the pool and not on the number of values used.
+    """
+
+    def __init__(self, start: int, end: int, used: Optional[Iterable[int]] = None) -> None:
+        self.start = start
+        self.end = end
+        self._starts: list[int] = [start] if start <= end else []
+        self._ends: list[int] = [end] if start <= end else []
+        self.available = max(end - start + 1, 0)
+        for number in used or []:
+            self.reserve(number)
+
+    def __contains__(self, number: int) -> bool:
+        return self._find(number) is not None
+
+    @property
+    def ranges(self) -> list[tuple[int, int]]:
+        return list(zip(self._starts, self._ends))
+
+    def _find(self, number: int) -> Optional[int]:
+        """Return the index of the free range containing the number."""
+        index = bisect_right(self._starts, number) - 1
+        if index >= 0 and self._ends[index] >= number:
+            return index
+        return None
+
+    def get_first(self, count: int = 1) -> list[int]:
+        """Return the lowest free numbers of the pool without reserving them, less than count if the pool is too small."""
+        numbers: list[int] = []
+        for start, end in zip(self._starts, self._ends):
+            numbers.extend(range(start, min(end + 1, start + count - len(numbers))))
+            if len(numbers) >= count:
+                break
+        return numbers
+
+    def reserve(self, number: int) -> bool:
+        """Remove a number from the free ranges, return False if it wasn't free."""
+        index = self._find(number)
+        if index is None:
+            return False
+
+        start, end = self._starts[index], self._ends[index]
+        if start == end:
+            del self._starts[index]
+            del self._ends[index]
+        elif number == start:
+            self._starts[index] = number + 1
+        elif number == end:
+            self._ends[index] = number - 1
+        else:
+            self._ends[index] = number - 1
+            self._starts.insert(index + 1, number + 1)
+            self._ends.insert(index + 1, end)
+
+        self.available -= 1
+        return True
+
+    def release(self, number: int) -> bool:
+        """Add a number back to the free ranges, return False if it's outside of the pool or already free."""
+        if not self.start <= number <= self.end:
+            return False
+
+        index = bisect_right(self._starts, number) - 1
+        if index >= 0 and self._ends[index] >= number:
+            return False
+
+        merge_previous = index >= 0 and self._ends[index] == number - 1
+        merge_next = index + 1 < len(self._starts) and self._starts[index + 1] == number + 1
+        if merge_previous and merge_next:
+            self._ends[index] = self._ends[index + 1]
+            del self._starts[index + 1]
+            del self._ends[index + 1]
+        elif merge_previous:
+            self._ends[index] = number
+        elif merge_next:
+            self._starts[index + 1] = number
+        else:
+            self._starts.insert(index + 1, number)
+            self._ends.insert(index + 1, number)
+
+        self.available += 1
+        return True
+
+
+@dataclass
+class CachedNumberPool:
+    free_ranges: NumberRanges
+    synced_at: Timestamp
+
+
+class NumberPoolCache:
+    """Free ranges of the number pools used by this process, indexed by the id of the pool.
+
+    An entry is only valid for the range of the pool it has been built for.
+    """
+
+    def __init__(self) -> None:
+        self._pools: dict[str, CachedNumberPool] = {}
+
+    def __len__(self) -> int:
+        return len(self._pools)
+
+    def get(self, pool_id: str, start: int, end: int) -> Optional[CachedNumberPool]:
+        entry = self._pools.get(pool_id)
+        if entry is None:
+            return None
+
+        if entry.free_ranges.start != start or entry.free_ranges.end != end:
+            del self._pools[pool_id]
+            return None
+
+        return entry
+
+    def set(self, pool_id: str, free_ranges: NumberRanges, synced_at: Timestamp) -> CachedNumberPool:
+        entry = CachedNumberPool(free_ranges=free_ranges, synced_at=synced_at)
+        self._pools[pool_id] = entry
+        return entry
+
+    def invalidate(self, pool_id: str) -> None:
+        self._pools.pop(pool_id, None)
+
+    def clear(self) -> None:
+        self._pools.clear()
+
+
+number_pool_cache = NumberPoolCache()
@@ -25,7 +25,7 @@ from infrahub.api.exception_handlers import generic_api_exception_handler
 from infrahub.components import ComponentType
 from infrahub.core.graph.index import node_indexes, rel_indexes
 from infrahub.core.initialization import initialization
-from infrahub.database import InfrahubDatabase, InfrahubDatabaseMode, get_db
+from infrahub.database import InfrahubDatabase, InfrahubDatabaseMode, get_db, get_read_replica_drivers
 from infrahub.dependencies.registry import build_component_registry
 from infrahub.exceptions import Error
 from infrahub.graphql.api.endpoints import router as graphql_router
@@ -59,7 +59,9 @@ async def app_initialization(application: FastAPI) -> None:
         )
 
     # Initialize database Driver and load local registry
-    database = application.state.db = InfrahubDatabase(mode=InfrahubDatabaseMode.DRIVER, driver=await get_db())
+    database = application.state.db = InfrahubDatabase(
+        mode=InfrahubDatabaseMode.DRIVER, driver=await get_db(), read_drivers=get_read_replica_drivers()
+    )
     database.manager.index.init(nodes=node_indexes, rels=rel_indexes)
 
     build_component_registry()
@@ -87,7 +89,7 @@ async def app_initialization(application: FastAPI) -> None:
     initialize_lock(service=service)
     # We must initialize DB after initialize lock and initialize lock depends on cache initialization
     async with application.state.db.start_session() as db:
-        await initialization(db=db)
+        await initialization(db=db, cache=service.cache)
     services.prepare(service=service)
     application.state.service = service
     application.state.response_delay = config.SETTINGS.miscellaneous.response_delay
@@ -22,6 +22,8 @@ class NATSCache(InfrahubCache):
         # FIXME: remove once NATS supports TTL for keys (2.11)
         self.kv_buckets = {
             self._tokenize_key_name("validator_execution_id:"): KVTTL.TWO_HOURS,
+            self._tokenize_key_name("schema:snapshot:"): KVTTL.TWO_HOURS,
+            self._tokenize_key_name("permissions:account:"): KVTTL.TWO_HOURS,
             self._tokenize_key_name("workers:primary:"): KVTTL.FIFTEEN,
             self._tokenize_key_name("workers:schema_hash:branch:"): KVTTL.TWO_HOURS,
             self._tokenize_key_name("workers:active:"): KVTTL.FIFTEEN,
@@ -113,7 +115,7 @@ class NATSCache(InfrahubCache):
             keys = await self._keys(self.kv[KVTTL.FIFTEEN.value], filter_pattern) + await self._keys(
                 self.kv[KVTTL.TWO_HOURS.value], filter_pattern
             )
-        elif filter_pattern.startswith("validator_execution_id."):
+        elif filter_pattern.startswith(("validator_execution_id.", "permissions.account.")):
             keys = await self._keys(self.kv[KVTTL.TWO_HOURS.value], filter_pattern)
         else:
             keys = await self._keys(self.kv[0], filter_pattern)
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
 async def trigger_branch_refresh(service: InfrahubServices) -> None:
     service.log.debug("Running branch refresh task")
     async with service.database.start_session() as db:
-        await refresh_branches(db=db)
+        await refresh_branches(db=db, cache=service.cache)
 
     await service.component.refresh_schema_hash()
 
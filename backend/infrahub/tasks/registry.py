@@ -1,22 +1,26 @@
-from typing import TYPE_CHECKING
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
 
 from infrahub import lock
 from infrahub.core import registry
-from infrahub.database import InfrahubDatabase
 from infrahub.log import get_logger
 from infrahub.worker import WORKER_IDENTITY
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
+    from infrahub.database import InfrahubDatabase
+    from infrahub.services.adapters.cache import InfrahubCache
 
 log = get_logger()
 
 
-async def refresh_branches(db: InfrahubDatabase) -> None:
+async def refresh_branches(db: InfrahubDatabase, cache: Optional[InfrahubCache] = None) -> None:
     """Pull all the branches from the database and update the registry.
 
     If a branch is already present with a different value for the hash
     We pull the new schema from the database and we update the registry.
+    If a cache is provided, the schema is pulled from the snapshot stored by another worker when available.
     """
 
     async with lock.registry.local_schema_lock():
@@ -38,12 +42,12 @@ async def refresh_branches(db: InfrahubDatabase) -> None:
                     )
                     registry.branch[new_branch.name] = new_branch
 
-                    await registry.schema.load_schema(db=db, branch=new_branch)
+                    await registry.schema.load_schema(db=db, branch=new_branch, cache=cache)
 
             else:
                 registry.branch[new_branch.name] = new_branch
                 log.info("New branch detected, pulling schema", branch=new_branch.name, worker=WORKER_IDENTITY)
-                await registry.schema.load_schema(db=db, branch=new_branch)
+                await registry.schema.load_schema(db=db, branch=new_branch, cache=cache)
 
         for branch_name in list(registry.branch.keys()):
             if branch_name not in active_branches:
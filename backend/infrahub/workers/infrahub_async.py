@@ -142,7 +142,7 @@ class InfrahubWorkerAsync(BaseWorker):
             initialize_lock(service=service)
 
             async with service.database.start_session() as db:
-                await initialization(db=db)
+                await initialization(db=db, cache=service.cache)
 
             await service.component.refresh_schema_hash()
 
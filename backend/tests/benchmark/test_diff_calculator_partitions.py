@@ -0,0 +1,80 @@
+import tracemalloc
+
+import pytest
+
+from infrahub.core import registry
+from infrahub.core.branch import Branch
+from infrahub.core.diff.calculator import DiffCalculator
+from infrahub.core.diff.model.path import CalculatedDiffs
+from infrahub.core.initialization import create_branch
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.core.schema import SchemaRoot, internal_schema
+from infrahub.core.schema.manager import SchemaManager
+from infrahub.core.timestamp import Timestamp
+from infrahub.database import InfrahubDatabase
+from infrahub.dependencies.registry import build_component_registry
+
+NB_KINDS = 8
+NB_NODES_PER_KIND = 50
+
+
+@pytest.fixture
+async def diff_branch(db: InfrahubDatabase, default_branch: Branch) -> Branch:
+    build_component_registry()
+    registry.schema = SchemaManager()
+    registry.schema.register_schema(schema=SchemaRoot(**internal_schema), branch=default_branch.name)
+
+    nodes = [
+        {
+            "name": f"Device{idx}",
+            "namespace": "Bench",
+            "attributes": [{"name": "name", "kind": "Text"}, {"name": "description", "kind": "Text", "optional": True}],
+        }
+        for idx in range(NB_KINDS)
+    ]
+    registry.schema.register_schema(schema=SchemaRoot(nodes=nodes), branch=default_branch.name)
+
+    branch = await create_branch(db=db, branch_name="bench")
+    objs = []
+    for kind_idx in range(NB_KINDS):
+        for idx in range(NB_NODES_PER_KIND):
+            obj = await Node.init(db=db, schema=f"BenchDevice{kind_idx}", branch=branch)
+            await obj.new(db=db, name=f"device{kind_idx}-{idx}", description="new")
+            objs.append(obj)
+    await NodeManager.create_many(db=db, nodes=objs)
+    return branch
+
+
+async def _calculate_diff(
+    db: InfrahubDatabase, default_branch: Branch, branch: Branch, nb_partitions: int
+) -> CalculatedDiffs:
+    return await DiffCalculator(db=db, nb_partitions=nb_partitions).calculate_diff(
+        base_branch=default_branch, diff_branch=branch, from_time=Timestamp(branch.created_at), to_time=Timestamp()
+    )
+
+
+@pytest.mark.parametrize("nb_partitions", [1, 2, 4, 8])
+def test_diff_calculator_partitions(
+    benchmark,
+    aio_benchmark,
+    event_loop,
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    diff_branch: Branch,
+    nb_partitions: int,
+):
+    tracemalloc.start()
+    calculated_diffs = event_loop.run_until_complete(
+        _calculate_diff(db=db, default_branch=default_branch, branch=diff_branch, nb_partitions=nb_partitions)
+    )
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    benchmark.extra_info["nbr_nodes"] = NB_KINDS * NB_NODES_PER_KIND
+    benchmark.extra_info["peak_memory_bytes"] = peak_memory
+    assert len(calculated_diffs.diff_branch_diff.nodes) == NB_KINDS * NB_NODES_PER_KIND
+
+    aio_benchmark(
+        _calculate_diff, db=db, default_branch=default_branch, branch=diff_branch, nb_partitions=nb_partitions
+    )
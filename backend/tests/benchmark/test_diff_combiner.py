@@ -0,0 +1,114 @@
+from uuid import uuid4
+
+import pytest
+
+from infrahub.core.constants import DiffAction, RelationshipCardinality
+from infrahub.core.constants.database import DatabaseEdgeType
+from infrahub.core.diff.combiner import DiffCombiner
+from infrahub.core.diff.model.path import (
+    EnrichedDiffAttribute,
+    EnrichedDiffNode,
+    EnrichedDiffProperty,
+    EnrichedDiffRelationship,
+    EnrichedDiffRoot,
+    EnrichedDiffs,
+)
+from infrahub.core.timestamp import Timestamp
+
+NB_CHILDREN_PER_PARENT = 9
+
+
+def _build_node(node_uuid: str, action: DiffAction, changed_at: Timestamp, value: str) -> EnrichedDiffNode:
+    return EnrichedDiffNode(
+        uuid=node_uuid,
+        kind="BenchInterface",
+        label=f"interface-{node_uuid}",
+        changed_at=changed_at,
+        action=action,
+        attributes={
+            EnrichedDiffAttribute(
+                name="description",
+                changed_at=changed_at,
+                action=action,
+                properties={
+                    EnrichedDiffProperty(
+                        property_type=DatabaseEdgeType.HAS_VALUE,
+                        changed_at=changed_at,
+                        previous_value=None,
+                        new_value=value,
+                        action=action,
+                    )
+                },
+            )
+        },
+    )
+
+
+def _build_diff(
+    node_uuids: list[str], action: DiffAction, from_time: Timestamp, to_time: Timestamp
+) -> EnrichedDiffRoot:
+    """Build a diff where the nodes are split in groups of a parent followed by its children."""
+    nodes = []
+    parent = None
+    for idx, node_uuid in enumerate(node_uuids):
+        node = _build_node(node_uuid=node_uuid, action=action, changed_at=to_time, value=to_time.to_string())
+        if idx % (NB_CHILDREN_PER_PARENT + 1) == 0:
+            parent = node
+        elif parent:
+            node.relationships.add(
+                EnrichedDiffRelationship(
+                    name="parent",
+                    label="Parent",
+                    cardinality=RelationshipCardinality.ONE,
+                    changed_at=to_time,
+                    action=DiffAction.UNCHANGED,
+                    nodes={parent},
+                )
+            )
+        nodes.append(node)
+    return EnrichedDiffRoot(
+        base_branch_name="main",
+        diff_branch_name="branch",
+        from_time=from_time,
+        to_time=to_time,
+        uuid=str(uuid4()),
+        partner_uuid=str(uuid4()),
+        nodes=set(nodes),
+    )
+
+
+def _build_diffs(nb_nodes: int) -> tuple[EnrichedDiffs, EnrichedDiffs]:
+    """Build two consecutive diffs, the later one updates half of the nodes of the earlier one and adds as many."""
+    earlier_uuids = [str(uuid4()) for _ in range(nb_nodes)]
+    later_uuids = earlier_uuids[nb_nodes // 2 :] + [str(uuid4()) for _ in range(nb_nodes // 2)]
+    start_time = Timestamp("2024-06-15T18:35:20Z")
+    middle_time = start_time.add_delta(hours=1)
+    end_time = start_time.add_delta(hours=2)
+
+    diffs = []
+    for node_uuids, action, from_time, to_time in (
+        (earlier_uuids, DiffAction.ADDED, start_time, middle_time),
+        (later_uuids, DiffAction.UPDATED, middle_time, end_time),
+    ):
+        diffs.append(
+            EnrichedDiffs(
+                base_branch_name="main",
+                diff_branch_name="branch",
+                base_branch_diff=_build_diff(node_uuids=[], action=action, from_time=from_time, to_time=to_time),
+                diff_branch_diff=_build_diff(
+                    node_uuids=node_uuids, action=action, from_time=from_time, to_time=to_time
+                ),
+            )
+        )
+    return diffs[0], diffs[1]
+
+
+async def _combine(earlier_diffs: EnrichedDiffs, later_diffs: EnrichedDiffs) -> EnrichedDiffs:
+    return await DiffCombiner().combine(earlier_diffs=earlier_diffs, later_diffs=later_diffs)
+
+
+@pytest.mark.parametrize("nb_nodes", [1000, 10000])
+def test_diff_combiner(aio_benchmark, nb_nodes: int):
+    earlier_diffs, later_diffs = _build_diffs(nb_nodes=nb_nodes)
+
+    aio_benchmark(_combine, earlier_diffs=earlier_diffs, later_diffs=later_diffs)
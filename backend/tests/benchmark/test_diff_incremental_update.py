@@ -0,0 +1,87 @@
+import pytest
+
+from infrahub.core import registry
+from infrahub.core.branch import Branch
+from infrahub.core.diff.calculator import DiffCalculator
+from infrahub.core.diff.model.path import CalculatedDiffs, NodeFieldSpecifier
+from infrahub.core.initialization import create_branch
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.core.schema import SchemaRoot, internal_schema
+from infrahub.core.schema.manager import SchemaManager
+from infrahub.core.timestamp import Timestamp
+from infrahub.database import InfrahubDatabase
+from infrahub.dependencies.registry import build_component_registry
+
+
+@pytest.fixture
+async def interface_schema(db: InfrahubDatabase, default_branch: Branch) -> None:
+    build_component_registry()
+    registry.schema = SchemaManager()
+    registry.schema.register_schema(schema=SchemaRoot(**internal_schema), branch=default_branch.name)
+    schema = {
+        "name": "Interface",
+        "namespace": "Bench",
+        "attributes": [{"name": "name", "kind": "Text"}, {"name": "description", "kind": "Text", "optional": True}],
+    }
+    registry.schema.register_schema(schema=SchemaRoot(nodes=[schema]), branch=default_branch.name)
+
+
+async def _age_branch(db: InfrahubDatabase, branch: Branch, nb_nodes: int) -> tuple[set[NodeFieldSpecifier], Node]:
+    """Create nodes on the branch, as the changes already included in the previous diff, then update one of them."""
+    objs = []
+    for idx in range(nb_nodes):
+        obj = await Node.init(db=db, schema="BenchInterface", branch=branch)
+        await obj.new(db=db, name=f"eth{idx}", description="old")
+        objs.append(obj)
+    await NodeManager.create_many(db=db, nodes=objs)
+
+    previous_node_specifiers = {
+        NodeFieldSpecifier(node_uuid=obj.id, field_name=field_name)
+        for obj in objs
+        for field_name in ("name", "description")
+    }
+    return previous_node_specifiers, objs[0]
+
+
+async def _calculate_update(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    branch: Branch,
+    from_time: Timestamp,
+    previous_node_specifiers: set[NodeFieldSpecifier],
+) -> CalculatedDiffs:
+    return await DiffCalculator(db=db).calculate_diff(
+        base_branch=default_branch,
+        diff_branch=branch,
+        from_time=from_time,
+        to_time=Timestamp(),
+        previous_node_specifiers=previous_node_specifiers,
+    )
+
+
+@pytest.mark.parametrize("nb_previous_nodes", [100, 400, 1600])
+def test_diff_incremental_update(
+    aio_benchmark,
+    event_loop,
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    interface_schema,
+    nb_previous_nodes: int,
+):
+    branch = event_loop.run_until_complete(create_branch(db=db, branch_name="bench"))
+    previous_node_specifiers, obj = event_loop.run_until_complete(
+        _age_branch(db=db, branch=branch, nb_nodes=nb_previous_nodes)
+    )
+    from_time = Timestamp()
+    obj.description.value = "new"
+    event_loop.run_until_complete(obj.save(db=db))
+
+    aio_benchmark(
+        _calculate_update,
+        db=db,
+        default_branch=default_branch,
+        branch=branch,
+        from_time=from_time,
+        previous_node_specifiers=previous_node_specifiers,
+    )
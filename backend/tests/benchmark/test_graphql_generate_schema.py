@@ -1,10 +1,15 @@
+import tracemalloc
+
 from graphql import GraphQLSchema
 
 from infrahub.core import registry
 from infrahub.core.branch import Branch
+from infrahub.core.schema.schema_branch import SchemaBranch
 from infrahub.database import InfrahubDatabase
 from infrahub.graphql.manager import GraphQLSchemaManager
 
+NB_BRANCHES = 20
+
 
 def test_graphql_generate_schema(
     benchmark, db: InfrahubDatabase, default_branch: Branch, data_schema, car_person_schema
@@ -14,3 +19,24 @@ def test_graphql_generate_schema(
     schema = benchmark(gqlm.generate)
 
     assert isinstance(schema, GraphQLSchema)
+
+
+def _generate_branches_schema(schema: SchemaBranch) -> list[GraphQLSchema]:
+    return [schema.duplicate(name=f"branch{idx}").get_graphql_schema() for idx in range(NB_BRANCHES)]
+
+
+def test_graphql_generate_schema_multi_branch(
+    benchmark, db: InfrahubDatabase, default_branch: Branch, data_schema, car_person_schema
+):
+    schema = registry.schema.get_schema_branch(name=default_branch.name)
+
+    tracemalloc.start()
+    graphql_schemas = _generate_branches_schema(schema=schema)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    benchmark.extra_info["nbr_branches"] = NB_BRANCHES
+    benchmark.extra_info["peak_memory_bytes"] = peak_memory
+    assert len({id(graphql_schema) for graphql_schema in graphql_schemas}) == 1
+
+    benchmark(_generate_branches_schema, schema=schema)
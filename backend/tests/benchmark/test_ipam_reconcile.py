@@ -0,0 +1,101 @@
+import ipaddress
+import random
+
+import pytest
+
+from infrahub.core import registry
+from infrahub.core.branch import Branch
+from infrahub.core.constants import BranchSupportType, InfrahubKind
+from infrahub.core.ipam.reconciler import IpamReconciler
+from infrahub.core.ipam.trie import calculate_parents
+from infrahub.core.node import Node
+from infrahub.core.query.ipam import IPNodeData
+from infrahub.core.schema import SchemaRoot
+from infrahub.core.utils import convert_ip_to_binary_str
+from infrahub.database import InfrahubDatabase
+
+NB_PREFIXES = 100
+NB_ADDRESSES = 100
+NB_PREFIXES_IN_MEMORY = 20000
+
+
+@pytest.fixture
+async def ipam_dataset(db: InfrahubDatabase, default_branch: Branch, register_core_models_schema) -> dict:
+    schema = {
+        "nodes": [
+            {
+                "name": "IPPrefix",
+                "namespace": "Ipam",
+                "display_labels": ["prefix__value"],
+                "branch": BranchSupportType.AWARE.value,
+                "inherit_from": [InfrahubKind.IPPREFIX],
+            },
+            {
+                "name": "IPAddress",
+                "namespace": "Ipam",
+                "display_labels": ["address__value"],
+                "branch": BranchSupportType.AWARE.value,
+                "inherit_from": [InfrahubKind.IPADDRESS],
+            },
+        ],
+    }
+    registry.schema.register_schema(schema=SchemaRoot(**schema), branch=default_branch.name)
+
+    namespace = await Node.init(db=db, schema=InfrahubKind.NAMESPACE)
+    await namespace.new(db=db, name="bench")
+    await namespace.save(db=db)
+
+    # The nodes are created without any parent, the first round of each benchmark does all the updates
+    ip_values = []
+    for idx in range(NB_PREFIXES):
+        prefix = await Node.init(db=db, schema="IpamIPPrefix")
+        await prefix.new(db=db, prefix=f"10.{idx // 64}.{(idx % 64) * 4}.0/{22 + idx % 3}", ip_namespace=namespace)
+        await prefix.save(db=db)
+        ip_values.append((prefix.id, ipaddress.ip_network(prefix.prefix.value)))
+    for idx in range(NB_ADDRESSES):
+        address = await Node.init(db=db, schema="IpamIPAddress")
+        await address.new(db=db, address=f"10.{idx // 64}.{(idx % 64) * 4}.{idx % 250 + 1}/24", ip_namespace=namespace)
+        await address.save(db=db)
+        ip_values.append((address.id, ipaddress.ip_interface(address.address.value)))
+
+    return {"namespace": namespace, "ip_values": ip_values}
+
+
+async def _reconcile_one_by_one(db: InfrahubDatabase, branch: Branch, ipam_dataset: dict) -> None:
+    reconciler = IpamReconciler(db=db, branch=branch)
+    for node_id, ip_value in ipam_dataset["ip_values"]:
+        await reconciler.reconcile(ip_value=ip_value, namespace=ipam_dataset["namespace"], node_uuid=node_id)
+
+
+async def _reconcile_namespace(db: InfrahubDatabase, branch: Branch, ipam_dataset: dict) -> None:
+    reconciler = IpamReconciler(db=db, branch=branch)
+    await reconciler.reconcile_namespace(namespace=ipam_dataset["namespace"])
+
+
+def test_ipam_reconcile_one_by_one(aio_benchmark, db: InfrahubDatabase, default_branch: Branch, ipam_dataset):
+    aio_benchmark(_reconcile_one_by_one, db=db, branch=default_branch, ipam_dataset=ipam_dataset)
+
+
+def test_ipam_reconcile_namespace(aio_benchmark, db: InfrahubDatabase, default_branch: Branch, ipam_dataset):
+    aio_benchmark(_reconcile_namespace, db=db, branch=default_branch, ipam_dataset=ipam_dataset)
+
+
+def test_ipam_calculate_parents(benchmark):
+    rand = random.Random(42)
+    ip_nodes = []
+    for idx in range(NB_PREFIXES_IN_MEMORY):
+        network = ipaddress.ip_network(
+            f"10.{rand.randint(0, 255)}.{rand.randint(0, 255)}.0/{rand.randint(8, 30)}", strict=False
+        )
+        ip_nodes.append(
+            IPNodeData(
+                id=str(idx),
+                is_address=False,
+                version=network.version,
+                binary_address=convert_ip_to_binary_str(network),
+                prefixlen=network.prefixlen,
+            )
+        )
+
+    parents = benchmark(calculate_parents, ip_nodes=ip_nodes)
+    assert len(parents) == NB_PREFIXES_IN_MEMORY
@@ -0,0 +1,58 @@
+import pytest
+
+from infrahub.core import registry
+from infrahub.core.branch import Branch
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.core.schema import NodeSchema, SchemaRoot, internal_schema
+from infrahub.core.schema.manager import SchemaManager
+from infrahub.database import InfrahubDatabase
+from infrahub.dependencies.registry import build_component_registry
+
+NB_NODES = 100
+
+
+@pytest.fixture
+def interface_schema(db: InfrahubDatabase, default_branch: Branch) -> NodeSchema:
+    build_component_registry()
+    registry.schema = SchemaManager()
+    registry.schema.register_schema(schema=SchemaRoot(**internal_schema), branch=default_branch.name)
+
+    schema = {
+        "name": "Interface",
+        "namespace": "Bench",
+        "attributes": [
+            {"name": "name", "kind": "Text"},
+            {"name": "speed", "kind": "Number"},
+            {"name": "enabled", "kind": "Boolean", "default_value": True},
+            {"name": "description", "kind": "Text", "optional": True},
+        ],
+    }
+    registry.schema.register_schema(schema=SchemaRoot(nodes=[schema]), branch=default_branch.name)
+    return registry.schema.get_node_schema(name="BenchInterface", branch=default_branch.name)
+
+
+async def _init_nodes(db: InfrahubDatabase, schema: NodeSchema, branch: Branch) -> list[Node]:
+    nodes = []
+    for idx in range(NB_NODES):
+        node = await Node.init(db=db, schema=schema, branch=branch)
+        await node.new(db=db, name=f"eth{idx}", speed=1000)
+        nodes.append(node)
+    return nodes
+
+
+async def _save_one_by_one(db: InfrahubDatabase, schema: NodeSchema, branch: Branch) -> None:
+    for node in await _init_nodes(db=db, schema=schema, branch=branch):
+        await node.save(db=db)
+
+
+async def _create_many(db: InfrahubDatabase, schema: NodeSchema, branch: Branch) -> None:
+    await NodeManager.create_many(db=db, nodes=await _init_nodes(db=db, schema=schema, branch=branch))
+
+
+def test_nodes_save_one_by_one(aio_benchmark, db: InfrahubDatabase, default_branch: Branch, interface_schema):
+    aio_benchmark(_save_one_by_one, db=db, schema=interface_schema, branch=default_branch)
+
+
+def test_nodemanager_create_many(aio_benchmark, db: InfrahubDatabase, default_branch: Branch, interface_schema):
+    aio_benchmark(_create_many, db=db, schema=interface_schema, branch=default_branch)
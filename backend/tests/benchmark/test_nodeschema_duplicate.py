@@ -1,10 +1,40 @@
+import tracemalloc
+from typing import Callable
+
 from infrahub.core import registry
+from infrahub.core.schema import MainSchemaTypes
 from infrahub.database import InfrahubDatabase
 
+NB_REQUESTS = 100
+
+
+def _get_allocated_memory(get_schema: Callable[[], MainSchemaTypes]) -> int:
+    """Return the memory allocated by a request for a schema, averaged over NB_REQUESTS requests."""
+    schemas = []
+    tracemalloc.start()
+    for _ in range(NB_REQUESTS):
+        schemas.append(get_schema())
+    allocated_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated_memory // NB_REQUESTS
+
 
 def test_base_schema_duplicate_CoreProposedChange(
     benchmark, db: InfrahubDatabase, default_branch, register_core_models_schema
 ):
     model = registry.schema.get(name="CoreProposedChange")
+    benchmark.extra_info["allocated_bytes_per_request"] = _get_allocated_memory(model.duplicate)
     new_node = benchmark(model.duplicate)
     assert new_node.kind == model.kind
+
+
+def test_base_schema_read_only_CoreProposedChange(
+    benchmark, db: InfrahubDatabase, default_branch, register_core_models_schema
+):
+    def get_schema() -> MainSchemaTypes:
+        return db.schema.get(name="CoreProposedChange", branch=default_branch, read_only=True)
+
+    benchmark.extra_info["allocated_bytes_per_request"] = _get_allocated_memory(get_schema)
+    view = benchmark(get_schema)
+    assert view.kind == "CoreProposedChange"
+    assert view.is_read_only
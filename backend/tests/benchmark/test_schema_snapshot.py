@@ -0,0 +1,36 @@
+import pytest
+
+from infrahub.core import registry
+from infrahub.core.branch import Branch
+from infrahub.core.schema.schema_branch import SchemaBranch
+from infrahub.database import InfrahubDatabase
+from tests.adapters.cache import MemoryCache
+
+
+@pytest.fixture
+async def core_schema_db(db: InfrahubDatabase, default_branch: Branch, register_core_models_schema) -> SchemaBranch:
+    await registry.schema.load_schema_to_db(schema=register_core_models_schema, branch=default_branch, db=db)
+    schema_branch = await registry.schema.load_schema_from_db(db=db, branch=default_branch)
+    registry.schema.set_schema_branch(name=default_branch.name, schema=schema_branch)
+    return schema_branch
+
+
+async def _load_schema_from_db(db: InfrahubDatabase, branch: Branch) -> SchemaBranch:
+    return await registry.schema.load_schema_from_db(db=db, branch=branch)
+
+
+async def _load_schema_from_snapshot(cache: MemoryCache, schema_hash: str) -> SchemaBranch | None:
+    return await registry.schema.load_schema_snapshot(cache=cache, schema_hash=schema_hash)
+
+
+def test_schema_cold_start_from_db(aio_benchmark, db: InfrahubDatabase, default_branch: Branch, core_schema_db):
+    aio_benchmark(_load_schema_from_db, db=db, branch=default_branch)
+
+
+def test_schema_cold_start_from_snapshot(
+    aio_benchmark, event_loop, default_branch: Branch, core_schema_db: SchemaBranch
+):
+    cache = MemoryCache()
+    event_loop.run_until_complete(registry.schema.save_schema_snapshot(cache=cache, schema=core_schema_db))
+
+    aio_benchmark(_load_schema_from_snapshot, cache=cache, schema_hash=core_schema_db.get_hash())
@@ -19,6 +19,7 @@ from testcontainers.core.container import DockerContainer
 from testcontainers.core.waiting_utils import wait_for_logs
 
 from infrahub import config
+from infrahub.auth import api_key_cache
 from infrahub.config import load_and_exit
 from infrahub.core import registry
 from infrahub.core.branch import Branch
@@ -372,6 +373,12 @@ def load_settings_before_session():
     load_and_exit()
 
 
+@pytest.fixture(autouse=True)
+def clear_api_key_cache():
+    # The fixtures recreate the accounts with the same API tokens, a cached validation could point to a deleted account
+    api_key_cache.clear()
+
+
 @pytest.fixture(scope="module", autouse=True)
 def reload_settings_before_each_module(tmpdir_factory):
     # Settings need to be reloaded between each test module, as some module might modify settings that might break tests within other modules.
@@ -0,0 +1,75 @@
+import inspect
+import time
+from pathlib import Path
+
+import pytest
+
+from infrahub import config
+from infrahub.core import registry
+from infrahub.core.query.node import NodeListGetAttributeQuery
+from infrahub.log import get_logger
+from tests.helpers.constants import NEO4J_ENTERPRISE_IMAGE
+from tests.helpers.query_benchmark.car_person_generators import CarGenerator
+from tests.helpers.query_benchmark.db_query_profiler import GraphProfileGenerator, QueryMeasurement
+from tests.query_benchmark.conftest import RESULTS_FOLDER
+from tests.query_benchmark.utils import start_db_and_create_default_branch
+
+log = get_logger()
+
+
+class NodeListGetAttributeSkipQuery(NodeListGetAttributeQuery):
+    """Same query paginated with SKIP/LIMIT, used as a reference."""
+
+    name = "node_list_get_attribute_skip"
+    cursor_key = None
+
+
+@pytest.mark.parametrize("query_size_limit", [500, 1000])
+async def test_cursor_vs_skip_pagination(
+    query_size_limit, car_person_schema_root, graph_generator: GraphProfileGenerator
+):
+    """
+    Compare the total duration of an unbounded READ query paginated with a cursor and with SKIP/LIMIT,
+    as the number of rows returned grows.
+    """
+
+    original_query_size_limit = config.SETTINGS.database.query_size_limit
+    config.SETTINGS.database.query_size_limit = query_size_limit
+
+    db, default_branch = await start_db_and_create_default_branch(neo4j_image=NEO4J_ENTERPRISE_IMAGE, load_indexes=True)
+    registry.schema.register_schema(schema=car_person_schema_root, branch=default_branch.name)
+
+    cars_generator = CarGenerator(db=db)
+    await cars_generator.init()
+
+    nb_batches = 10
+    nb_cars_per_batch = 1_000
+    measurements: list[QueryMeasurement] = []
+    car_ids: list[str] = []
+
+    try:
+        for _ in range(nb_batches):
+            cars = await cars_generator.load_cars(nb_cars=nb_cars_per_batch)
+            car_ids.extend(car.id for car in cars.values())
+
+            for query_class in (NodeListGetAttributeQuery, NodeListGetAttributeSkipQuery):
+                query = await query_class.init(db=db, branch=default_branch, ids=car_ids)
+                time_start = time.time()
+                await query.execute(db=db)
+                measurements.append(
+                    QueryMeasurement(
+                        duration=time.time() - time_start,
+                        query_name=query_class.name,
+                        start_time=time_start,
+                        nb_elements_loaded=len(car_ids),
+                    )
+                )
+                assert len(query.get_attributes_group_by_node()) == len(car_ids)
+    finally:
+        config.SETTINGS.database.query_size_limit = original_query_size_limit
+
+    graph_generator.create_graphs(
+        measurements=measurements,
+        output_location=RESULTS_FOLDER / Path(__file__).stem / inspect.currentframe().f_code.co_name,
+        label=f"query_size_limit={query_size_limit}",
+    )
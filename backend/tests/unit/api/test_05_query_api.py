@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 import pytest
 
 from infrahub.core.initialization import create_branch
+from infrahub.graphql.analyzer import stored_query_cache
 from infrahub.message_bus import messages
 
 if TYPE_CHECKING:
@@ -190,6 +191,32 @@ async def test_query_endpoint_branch1(
     assert len(result_per_name["Jane"]["node"]["cars"]["edges"]) == 1
 
 
+async def test_query_endpoint_compiled_once(
+    db: InfrahubDatabase, client: TestClient, client_headers, default_branch, car_person_data
+):
+    stored_query_cache.clear()
+
+    # Must execute in a with block to execute the startup/shutdown events
+    with client:
+        for _ in range(3):
+            response = client.get("/api/query/query01", headers=client_headers)
+            assert response.status_code == 200
+            assert len(response.json()["data"]["TestPerson"]["edges"]) == 2
+
+    assert len(stored_query_cache) == 1
+
+    q1 = car_person_data["q1"]
+    q1.query.value = q1.query.value.replace("edges", " edges")
+    await q1.save(db=db)
+
+    with client:
+        response = client.get("/api/query/query01", headers=client_headers)
+        assert response.status_code == 200
+        assert len(response.json()["data"]["TestPerson"]["edges"]) == 2
+
+    assert len(stored_query_cache) == 2
+
+
 async def test_query_endpoint_wrong_query(
     db: InfrahubDatabase,
     client: TestClient,
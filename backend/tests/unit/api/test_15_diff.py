@@ -45,6 +45,55 @@ async def test_get_display_labels(db: InfrahubDatabase, default_branch, car_pers
     assert len(display_labels["main"]) == len(car_ids) + len(person_ids)
 
 
+async def test_get_display_labels_one_query_per_branch(
+    db: InfrahubDatabase, default_branch, car_person_data, monkeypatch
+):
+    branch2 = await create_branch(branch_name="branch2", db=db)
+    persons_list = await NodeManager.query(db=db, schema="TestPerson", branch=default_branch)
+    person_ids = [item.id for item in persons_list]
+    cars_list = await NodeManager.query(db=db, schema="TestCar", branch=default_branch)
+    car_ids = [item.id for item in cars_list]
+
+    expected = {
+        **await get_display_labels_per_kind(kind="TestPerson", ids=person_ids, branch_name=default_branch.name, db=db),
+        **await get_display_labels_per_kind(kind="TestCar", ids=car_ids, branch_name=default_branch.name, db=db),
+    }
+
+    get_many = NodeManager.get_many
+    branches_queried = []
+
+    async def count_get_many(*args, **kwargs):
+        branches_queried.append(kwargs["branch"].name)
+        return await get_many(*args, **kwargs)
+
+    monkeypatch.setattr(NodeManager, "get_many", count_get_many)
+    display_labels = await get_display_labels(
+        nodes={
+            default_branch.name: {"TestPerson": person_ids, "TestCar": car_ids},
+            branch2.name: {"TestPerson": person_ids, "TestCar": car_ids},
+        },
+        db=db,
+    )
+
+    assert sorted(branches_queried) == sorted([default_branch.name, branch2.name])
+    assert display_labels[default_branch.name] == expected
+    assert display_labels[branch2.name] == expected
+
+
+async def test_get_display_labels_in_transaction(db: InfrahubDatabase, default_branch, car_person_data):
+    branch2 = await create_branch(branch_name="branch2", db=db)
+    persons_list = await NodeManager.query(db=db, schema="TestPerson", branch=default_branch)
+    person_ids = [item.id for item in persons_list]
+
+    async with db.start_transaction() as dbt:
+        display_labels = await get_display_labels(
+            nodes={default_branch.name: {"TestPerson": person_ids}, branch2.name: {"TestPerson": person_ids}}, db=dbt
+        )
+
+    assert len(display_labels[default_branch.name]) == len(person_ids)
+    assert display_labels[branch2.name] == display_labels[default_branch.name]
+
+
 async def test_get_display_labels_with_branch(db: InfrahubDatabase, default_branch, car_person_data):
     branch2 = await create_branch(branch_name="branch2", db=db)
 
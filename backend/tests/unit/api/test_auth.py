@@ -1,6 +1,7 @@
 import jwt
 
 from infrahub import config
+from infrahub.auth import api_key_cache
 from infrahub.database import InfrahubDatabase
 
 EXPIRED_ACCESS_TOKEN = (
@@ -305,3 +306,6 @@ async def test_generate_api_token(db: InfrahubDatabase, default_branch, client,
     assert token_query_response.status_code == 200
     tokens = token_query_response.json()["data"]["InfrahubAccountToken"]["edges"]
     assert token_id not in [token["node"]["id"] for token in tokens]
+
+    # The token has been validated recently but it is no longer accepted once deleted
+    assert api_key_cache.get(token=api_token) is None
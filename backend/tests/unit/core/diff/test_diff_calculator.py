@@ -1,13 +1,17 @@
 import pytest
 
+from infrahub import config
+from infrahub.core import registry
 from infrahub.core.branch import Branch
-from infrahub.core.constants import DiffAction, RelationshipCardinality
+from infrahub.core.constants import BranchSupportType, DiffAction, RelationshipCardinality
 from infrahub.core.constants.database import DatabaseEdgeType
 from infrahub.core.diff.calculator import DiffCalculator
 from infrahub.core.diff.model.path import NodeFieldSpecifier
 from infrahub.core.initialization import create_branch
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
+from infrahub.core.query.diff import DiffAllPathsQuery, DiffChangedFieldsQuery
+from infrahub.core.schema import SchemaRoot
 from infrahub.core.schema.schema_branch import SchemaBranch
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
@@ -2289,3 +2293,174 @@ async def test_property_update_then_relationship_deleted(
 
     base_diff_root = calculated_diffs.base_branch_diff
     assert base_diff_root.nodes == []
+
+
+async def test_diff_kind_partitions(
+    db: InfrahubDatabase, default_branch: Branch, person_alfred_main, person_john_main, car_accord_main
+):
+    branch = await create_branch(db=db, branch_name="branch")
+    from_time = Timestamp(branch.created_at)
+    alfred_main = await NodeManager.get_one(db=db, branch=default_branch, id=person_alfred_main.id)
+    alfred_main.name.value = "Big Alfred"
+    await alfred_main.save(db=db)
+    car_branch = await NodeManager.get_one(db=db, branch=branch, id=car_accord_main.id)
+    car_branch.color.value = "#222222"
+    await car_branch.owner.update(db=db, data={"id": person_alfred_main.id})
+    await car_branch.save(db=db)
+    john_branch = await NodeManager.get_one(db=db, branch=branch, id=person_john_main.id)
+    john_branch.height.value = 155
+    await john_branch.save(db=db)
+    to_time = Timestamp()
+
+    def summarize(diff_root):
+        return {
+            (
+                node.uuid,
+                node.kind,
+                node.action,
+                frozenset(attr.name for attr in node.attributes),
+                frozenset(rel.name for rel in node.relationships),
+            )
+            for node in diff_root.nodes
+        }
+
+    calculated_diffs = await DiffCalculator(db=db, nb_partitions=1).calculate_diff(
+        base_branch=default_branch, diff_branch=branch, from_time=from_time, to_time=to_time
+    )
+    partitioned_diffs = await DiffCalculator(db=db, nb_partitions=3, parallelism=2).calculate_diff(
+        base_branch=default_branch, diff_branch=branch, from_time=from_time, to_time=to_time
+    )
+
+    assert summarize(partitioned_diffs.diff_branch_diff) == summarize(calculated_diffs.diff_branch_diff)
+    assert summarize(partitioned_diffs.base_branch_diff) == summarize(calculated_diffs.base_branch_diff)
+    assert {node.uuid for node in partitioned_diffs.diff_branch_diff.nodes} == {
+        person_alfred_main.id,
+        person_john_main.id,
+        car_accord_main.id,
+    }
+
+
+async def test_diff_flushed_per_page(
+    db: InfrahubDatabase, default_branch: Branch, person_alfred_main, person_john_main, car_accord_main, monkeypatch
+):
+    branch = await create_branch(db=db, branch_name="branch")
+    from_time = Timestamp(branch.created_at)
+    alfred_main = await NodeManager.get_one(db=db, branch=default_branch, id=person_alfred_main.id)
+    alfred_main.name.value = "Big Alfred"
+    await alfred_main.save(db=db)
+    alfred_branch = await NodeManager.get_one(db=db, branch=branch, id=person_alfred_main.id)
+    alfred_branch.name.value = "Little Alfred"
+    await alfred_branch.save(db=db)
+    car_branch = await NodeManager.get_one(db=db, branch=branch, id=car_accord_main.id)
+    await car_branch.owner.update(db=db, data={"id": person_alfred_main.id})
+    await car_branch.save(db=db)
+    to_time = Timestamp()
+
+    calculated_diffs = await DiffCalculator(db=db).calculate_diff(
+        base_branch=default_branch, diff_branch=branch, from_time=from_time, to_time=to_time
+    )
+    monkeypatch.setattr(config.SETTINGS.database, "query_size_limit", 1)
+    paged_diffs = await DiffCalculator(db=db).calculate_diff(
+        base_branch=default_branch, diff_branch=branch, from_time=from_time, to_time=to_time
+    )
+
+    def summarize_properties(properties):
+        return {(prop.property_type, prop.previous_value, prop.new_value, prop.action) for prop in properties}
+
+    def summarize_node(node):
+        return (
+            node.action,
+            {attr.name: summarize_properties(attr.properties) for attr in node.attributes},
+            {
+                (rel.name, element.peer_id): summarize_properties(element.properties)
+                for rel in node.relationships
+                for element in rel.relationships
+            },
+        )
+
+    for diff_root, paged_diff_root in (
+        (calculated_diffs.diff_branch_diff, paged_diffs.diff_branch_diff),
+        (calculated_diffs.base_branch_diff, paged_diffs.base_branch_diff),
+    ):
+        nodes_by_id = {node.uuid: node for node in diff_root.nodes}
+        paged_nodes_by_id = {node.uuid: node for node in paged_diff_root.nodes}
+        assert len(paged_diff_root.nodes) == len(paged_nodes_by_id)
+        assert set(paged_nodes_by_id) == set(nodes_by_id)
+        for node_id, node in nodes_by_id.items():
+            assert summarize_node(paged_nodes_by_id[node_id]) == summarize_node(node)
+
+
+async def test_diff_change_journal(
+    db: InfrahubDatabase, default_branch: Branch, person_alfred_main, person_john_main, car_accord_main
+):
+    branch = await create_branch(db=db, branch_name="branch")
+    from_time = Timestamp()
+    alfred_branch = await NodeManager.get_one(db=db, branch=branch, id=person_alfred_main.id)
+    alfred_branch.name.value = "Little Alfred"
+    await alfred_branch.save(db=db)
+    car_branch = await NodeManager.get_one(db=db, branch=branch, id=car_accord_main.id)
+    await car_branch.owner.update(db=db, data={"id": person_alfred_main.id})
+    await car_branch.save(db=db)
+    john_main = await NodeManager.get_one(db=db, branch=default_branch, id=person_john_main.id)
+    john_main.height.value = 175
+    await john_main.save(db=db)
+    to_time = Timestamp()
+
+    owner_identifier = car_branch.owner.schema.get_identifier()
+    query = await DiffChangedFieldsQuery.init(db=db, branch=branch, diff_from=from_time, diff_to=to_time)
+    await query.execute(db=db)
+    assert query.get_node_field_specifiers() == {
+        (person_alfred_main.id, "name"),
+        (person_alfred_main.id, owner_identifier),
+        (person_john_main.id, owner_identifier),
+        (car_accord_main.id, owner_identifier),
+    }
+    query = await DiffChangedFieldsQuery.init(db=db, branch=default_branch, diff_from=from_time, diff_to=to_time)
+    await query.execute(db=db)
+    assert query.get_node_field_specifiers() == {(person_john_main.id, "height")}
+
+    calculated_diffs = await DiffCalculator(db=db).calculate_diff(
+        base_branch=default_branch,
+        diff_branch=branch,
+        from_time=from_time,
+        to_time=to_time,
+        previous_node_specifiers={
+            NodeFieldSpecifier(node_uuid=person_john_main.id, field_name="height"),
+            NodeFieldSpecifier(node_uuid=person_john_main.id, field_name="name"),
+            NodeFieldSpecifier(node_uuid=car_accord_main.id, field_name="color"),
+        },
+    )
+
+    branch_nodes_by_id = {node.uuid: node for node in calculated_diffs.diff_branch_diff.nodes}
+    assert set(branch_nodes_by_id) == {person_alfred_main.id, person_john_main.id, car_accord_main.id}
+    assert {attr.name for attr in branch_nodes_by_id[person_alfred_main.id].attributes} == {"name"}
+    base_nodes = calculated_diffs.base_branch_diff.nodes
+    assert len(base_nodes) == 1
+    assert base_nodes[0].uuid == person_john_main.id
+    assert {attr.name for attr in base_nodes[0].attributes} == {"height"}
+
+
+async def test_diff_change_journal_node_without_fields(db: InfrahubDatabase, default_branch: Branch, node_group_schema):
+    schema = SchemaRoot(nodes=[{"name": "Thing", "namespace": "Test", "branch": BranchSupportType.AWARE.value}])
+    registry.schema.register_schema(schema=schema, branch=default_branch.name)
+    branch = await create_branch(db=db, branch_name="branch")
+    from_time = Timestamp()
+    thing = await Node.init(db=db, schema="TestThing", branch=branch)
+    await thing.new(db=db)
+    await thing.save(db=db)
+    to_time = Timestamp()
+
+    query = await DiffChangedFieldsQuery.init(db=db, branch=branch, diff_from=from_time, diff_to=to_time)
+    await query.execute(db=db)
+    assert query.get_node_field_specifiers() == set()
+    assert query.get_node_uuids() == {thing.id}
+
+    diff_query = await DiffAllPathsQuery.init(
+        db=db,
+        branch=branch,
+        base_branch=default_branch,
+        diff_branch_from_time=Timestamp(branch.get_branched_from()),
+        diff_from=from_time,
+        diff_to=to_time,
+    )
+    assert await diff_query.get_cursor_keys(db=db) == [thing.id]
@@ -192,6 +192,30 @@ class TestDiffRepositorySaveAndLoad:
         retrieved_pair = retrieved[0]
         assert retrieved_pair == enriched_diffs
 
+    async def test_save_again_is_idempotent(self, diff_repository: DiffRepository, reset_database):
+        diff_repository.MAX_SAVE_BATCH_SIZE = 3
+        enriched_diff = EnrichedRootFactory.build(
+            base_branch_name=self.base_branch_name,
+            diff_branch_name=self.diff_branch_name,
+            from_time=Timestamp(self.diff_from_time),
+            to_time=Timestamp(self.diff_to_time),
+            nodes=self._build_nodes(num_nodes=5, num_sub_fields=2),
+            tracking_id=NameTrackingId(name="the-best-diff"),
+        )
+        enriched_diffs = await self._save_single_diff(diff_repository=diff_repository, enriched_diff=enriched_diff)
+
+        # saving again, as a retry of a save that failed midway would, must not duplicate the nodes or their links
+        await diff_repository.save(enriched_diffs=enriched_diffs)
+
+        retrieved = await diff_repository.get_pairs(
+            base_branch_name=self.base_branch_name,
+            diff_branch_name=self.diff_branch_name,
+            from_time=Timestamp(self.diff_from_time),
+            to_time=Timestamp(self.diff_to_time),
+        )
+        assert len(retrieved) == 1
+        assert retrieved[0] == enriched_diffs
+
     async def test_base_branch_name_filter(self, diff_repository: DiffRepository, reset_database):
         name_uuid_map = {name: str(uuid4()) for name in (self.base_branch_name, "more-main", "most-main")}
         for base_branch_name, root_uuid in name_uuid_map.items():
@@ -616,6 +640,112 @@ class TestDiffRepositorySaveAndLoad:
     #         assert len(root_nodes) == 1
     #         assert root_nodes == {third_nodes[index]}
 
+    async def test_get_page_with_cursor(self, diff_repository: DiffRepository, reset_database):
+        ordered_nodes = []
+        for kind, label in (("A", "a"), ("A", "b"), ("AB", "a"), ("B", "a"), ("B", "b")):
+            ordered_nodes.append(EnrichedNodeFactory.build(kind=kind, label=label, relationships=set()))
+        enriched_diff = EnrichedRootFactory.build(
+            base_branch_name=self.base_branch_name,
+            diff_branch_name=self.diff_branch_name,
+            from_time=Timestamp(self.diff_from_time),
+            to_time=Timestamp(self.diff_to_time),
+            nodes=set(ordered_nodes),
+        )
+        await self._save_single_diff(diff_repository=diff_repository, enriched_diff=enriched_diff)
+
+        retrieved_nodes = []
+        next_cursors = []
+        cursor = None
+        for _ in range(3):
+            diff_page = await diff_repository.get_page(
+                base_branch_name=self.base_branch_name,
+                diff_branch_names=[self.diff_branch_name],
+                from_time=Timestamp(self.diff_from_time),
+                to_time=Timestamp(self.diff_to_time),
+                limit=2,
+                after=cursor,
+            )
+            assert len(diff_page.diff_roots) == 1
+            retrieved_nodes.append(diff_page.diff_roots[0].nodes)
+            next_cursors.append(diff_page.next_cursor)
+            cursor = diff_page.next_cursor
+
+        assert retrieved_nodes == [set(ordered_nodes[:2]), set(ordered_nodes[2:4]), set(ordered_nodes[4:])]
+        assert next_cursors == [ordered_nodes[1].sort_key, ordered_nodes[3].sort_key, None]
+
+    async def test_get_page_with_cursor_full_last_page(self, diff_repository: DiffRepository, reset_database):
+        ordered_nodes = [
+            EnrichedNodeFactory.build(kind="A", label=label, relationships=set()) for label in ("a", "b", "c", "d")
+        ]
+        enriched_diff = EnrichedRootFactory.build(
+            base_branch_name=self.base_branch_name,
+            diff_branch_name=self.diff_branch_name,
+            from_time=Timestamp(self.diff_from_time),
+            to_time=Timestamp(self.diff_to_time),
+            nodes=set(ordered_nodes),
+        )
+        await self._save_single_diff(diff_repository=diff_repository, enriched_diff=enriched_diff)
+
+        retrieved_nodes = []
+        next_cursors = []
+        cursor = None
+        for _ in range(2):
+            diff_page = await diff_repository.get_page(
+                base_branch_name=self.base_branch_name,
+                diff_branch_names=[self.diff_branch_name],
+                from_time=Timestamp(self.diff_from_time),
+                to_time=Timestamp(self.diff_to_time),
+                limit=2,
+                after=cursor,
+            )
+            retrieved_nodes.append(diff_page.diff_roots[0].nodes)
+            next_cursors.append(diff_page.next_cursor)
+            cursor = diff_page.next_cursor
+
+        # The last page is full but there is no node after it
+        assert retrieved_nodes == [set(ordered_nodes[:2]), set(ordered_nodes[2:])]
+        assert next_cursors == [ordered_nodes[1].sort_key, None]
+
+    async def test_get_page_with_cursor_label_changed(self, diff_repository: DiffRepository, reset_database):
+        # the label of node_x and node_w changes between the two diffs, the pages follow their latest label
+        node_uuids = {label: str(uuid4()) for label in ("x", "y", "w")}
+        labels_per_diff = ({"x": "a", "y": "m", "w": "y"}, {"x": "z", "y": "m", "w": "b"})
+        start_time = self.diff_from_time.add(seconds=1)
+        for index, labels in enumerate(labels_per_diff):
+            enriched_diff = EnrichedRootFactory.build(
+                base_branch_name=self.base_branch_name,
+                diff_branch_name=self.diff_branch_name,
+                from_time=Timestamp(start_time.add(minutes=index * 5)),
+                to_time=Timestamp(start_time.add(minutes=(index * 5) + 4)),
+                nodes={
+                    EnrichedNodeFactory.build(uuid=node_uuids[name], kind="A", label=label, relationships=set())
+                    for name, label in labels.items()
+                },
+            )
+            await self._save_single_diff(diff_repository=diff_repository, enriched_diff=enriched_diff)
+
+        retrieved_uuids = []
+        cursor = None
+        for _ in range(4):
+            diff_page = await diff_repository.get_page(
+                base_branch_name=self.base_branch_name,
+                diff_branch_names=[self.diff_branch_name],
+                from_time=Timestamp(self.diff_from_time),
+                to_time=Timestamp(self.diff_to_time),
+                limit=1,
+                after=cursor,
+            )
+            retrieved_uuids.append([{node.uuid for node in diff_root.nodes} for diff_root in diff_page.diff_roots])
+            cursor = diff_page.next_cursor
+            if cursor is None:
+                break
+
+        assert retrieved_uuids == [
+            [{node_uuids["w"]}, {node_uuids["w"]}],
+            [{node_uuids["y"]}, {node_uuids["y"]}],
+            [{node_uuids["x"]}, {node_uuids["x"]}],
+        ]
+
     async def test_save_and_retrieve_many_diffs(self, diff_repository: DiffRepository, reset_database):
         diffs_to_retrieve: list[EnrichedDiffRoot] = []
         start_time = self.diff_from_time.add(seconds=1)
@@ -251,3 +251,59 @@ async def test_ipprefix_reconciler_prefix_value_update(db: InfrahubDatabase, def
         child_parent_rels = await child.ip_prefix.get_relationships(db=db)
         assert len(child_parent_rels) == 1
         assert child_parent_rels[0].peer_id == updated_prefix.id
+
+
+async def test_reconcile_namespace_new_prefix(db: InfrahubDatabase, default_branch: Branch, ip_dataset_01):
+    await create_ipam_namespace(db=db)
+    default_ipnamespace = await get_default_ipnamespace(db=db)
+    registry.default_ipnamespace = default_ipnamespace.id
+    prefix_schema = registry.schema.get_node_schema(name="IpamIPPrefix", branch=default_branch)
+    namespace = ip_dataset_01["ns1"]
+    new_prefix = await Node.init(db=db, schema=prefix_schema)
+    await new_prefix.new(db=db, prefix="10.10.0.0/18", ip_namespace=namespace, parent=ip_dataset_01["net146"])
+    await new_prefix.save(db=db)
+
+    reconciler = IpamReconciler(db=db, branch=default_branch)
+    updated_uuids = await reconciler.reconcile_namespace(namespace=namespace)
+
+    expected_child_prefix_ids = [ip_dataset_01["net142"].id, ip_dataset_01["net144"].id, ip_dataset_01["net145"].id]
+    expected_child_address_ids = [ip_dataset_01["address10"].id]
+    assert updated_uuids == {new_prefix.id} | set(expected_child_prefix_ids) | set(expected_child_address_ids)
+
+    updated_prefix = await NodeManager.get_one(db=db, branch=default_branch, id=new_prefix.id)
+    parent_rels = await updated_prefix.parent.get_relationships(db=db)
+    assert [rel.peer_id for rel in parent_rels] == [ip_dataset_01["net140"].id]
+    assert updated_prefix.is_top_level.value is False
+    child_rels = await updated_prefix.children.get_relationships(db=db)
+    assert {rel.peer_id for rel in child_rels} == set(expected_child_prefix_ids)
+    address_rels = await updated_prefix.ip_addresses.get_relationships(db=db)
+    assert {rel.peer_id for rel in address_rels} == set(expected_child_address_ids)
+
+    # Everything is up to date, a second reconciliation doesn't update anything
+    assert await reconciler.reconcile_namespace(namespace=namespace) == set()
+
+
+async def test_reconcile_namespace_delete_prefix(db: InfrahubDatabase, default_branch: Branch, ip_dataset_01):
+    await create_ipam_namespace(db=db)
+    default_ipnamespace = await get_default_ipnamespace(db=db)
+    registry.default_ipnamespace = default_ipnamespace.id
+    namespace = ip_dataset_01["ns1"]
+    net_140_prefix = ip_dataset_01["net140"]
+
+    reconciler = IpamReconciler(db=db, branch=default_branch)
+    await reconciler.reconcile_namespace(namespace=namespace, deleted_uuids={net_140_prefix.id})
+
+    deleted = await NodeManager.get_one(db=db, branch=default_branch, id=net_140_prefix.id)
+    assert deleted is None
+    expected_child_prefix_ids = [ip_dataset_01["net142"].id, ip_dataset_01["net144"].id, ip_dataset_01["net145"].id]
+    expected_child_address_ids = [ip_dataset_01["address10"].id]
+    updated_parent = await NodeManager.get_one(db=db, branch=default_branch, id=ip_dataset_01["net146"].id)
+    updated_prefix_child_rels = await updated_parent.children.get_relationships(db=db)
+    assert {rel.peer_id for rel in updated_prefix_child_rels} == set(expected_child_prefix_ids)
+    updated_address_child_rels = await updated_parent.ip_addresses.get_relationships(db=db)
+    assert {rel.peer_id for rel in updated_address_child_rels} == set(expected_child_address_ids)
+
+    # The prefixes of the other namespace are not modified
+    net_241_prefix = await NodeManager.get_one(db=db, branch=default_branch, id=ip_dataset_01["net241"].id)
+    parent_rels = await net_241_prefix.parent.get_relationships(db=db)
+    assert [rel.peer_id for rel in parent_rels] == [ip_dataset_01["net240"].id]
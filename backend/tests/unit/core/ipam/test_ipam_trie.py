@@ -0,0 +1,123 @@
+import ipaddress
+import random
+from typing import Optional
+
+from infrahub.core.ipam.trie import IPPrefixTrie, calculate_parents
+from infrahub.core.query.ipam import IPNodeData
+from infrahub.core.utils import convert_ip_to_binary_str
+
+
+def _ip_node(node_id: str, value: str, is_address: bool = False, current_parent_id: Optional[str] = None) -> IPNodeData:
+    ip_value = ipaddress.ip_interface(value) if is_address else ipaddress.ip_network(value)
+    return IPNodeData(
+        id=node_id,
+        is_address=is_address,
+        version=ip_value.version,
+        binary_address=convert_ip_to_binary_str(ip_value),
+        prefixlen=ip_value.network.prefixlen if is_address else ip_value.prefixlen,
+        current_parent_id=current_parent_id,
+    )
+
+
+def test_ip_prefix_trie():
+    trie = IPPrefixTrie()
+    for node_id, value in (("net8", "10.0.0.0/8"), ("net16", "10.10.0.0/16"), ("net24", "10.10.1.0/24")):
+        network = ipaddress.ip_network(value)
+        trie.insert(binary_address=convert_ip_to_binary_str(network), prefixlen=network.prefixlen, value=node_id)
+    trie.insert(binary_address=convert_ip_to_binary_str(ipaddress.ip_network("10.0.0.0/8")), prefixlen=8, value="dup")
+
+    assert len(trie) == 3
+    address = convert_ip_to_binary_str(ipaddress.ip_interface("10.10.1.1"))
+    assert trie.get_parent(binary_address=address, max_prefixlen=32) == "net24"
+    assert trie.get_parent(binary_address=address, max_prefixlen=23) == "net16"
+    assert trie.get_parent(binary_address=address, max_prefixlen=8) == "net8"
+    assert trie.get_parent(binary_address=address, max_prefixlen=7) is None
+    assert trie.get_parent(binary_address=address, max_prefixlen=-1) is None
+    other = convert_ip_to_binary_str(ipaddress.ip_interface("192.168.0.1"))
+    assert trie.get_parent(binary_address=other, max_prefixlen=32) is None
+
+
+def test_calculate_parents():
+    ip_nodes = [
+        _ip_node("net8", "10.0.0.0/8"),
+        _ip_node("net16", "10.10.0.0/16", current_parent_id="net8"),
+        _ip_node("net24", "10.10.1.0/24", current_parent_id="net8"),
+        _ip_node("net6", "2001:db8::/48"),
+        _ip_node("net6_64", "2001:db8::/64"),
+        _ip_node("addr1", "10.10.1.1/32", is_address=True),
+        _ip_node("addr2", "10.10.2.1/24", is_address=True),
+        _ip_node("addr3", "10.10.1.1/16", is_address=True),
+        _ip_node("addr6", "2001:db8::1/128", is_address=True),
+        _ip_node("addr_orphan", "192.168.1.1/32", is_address=True),
+    ]
+
+    assert calculate_parents(ip_nodes=ip_nodes) == {
+        "net8": None,
+        "net16": "net8",
+        "net24": "net16",
+        "net6": None,
+        "net6_64": "net6",
+        "addr1": "net24",
+        "addr2": "net16",
+        "addr3": "net16",
+        "addr6": "net6_64",
+        "addr_orphan": None,
+    }
+
+
+def test_calculate_parents_default_route():
+    ip_nodes = [
+        _ip_node("net0", "0.0.0.0/0"),
+        _ip_node("net8", "10.0.0.0/8"),
+        _ip_node("net6_0", "::/0"),
+        _ip_node("addr1", "10.10.1.1/32", is_address=True),
+        _ip_node("addr_orphan", "192.168.1.1/32", is_address=True),
+        _ip_node("addr6", "2001:db8::1/128", is_address=True),
+    ]
+
+    assert calculate_parents(ip_nodes=ip_nodes) == {
+        "net0": None,
+        "net8": None,
+        "net6_0": None,
+        "addr1": "net8",
+        "addr_orphan": None,
+        "addr6": None,
+    }
+
+
+def _brute_force_parent(ip_node: IPNodeData, prefixes: list[tuple[str, ipaddress.IPv4Network]]) -> Optional[str]:
+    max_prefixlen = ip_node.prefixlen if ip_node.is_address else ip_node.prefixlen - 1
+    value = ipaddress.ip_address(int(ip_node.binary_address, 2))
+    candidates = [
+        (network.prefixlen, node_id)
+        for node_id, network in prefixes
+        if network.prefixlen <= max_prefixlen and value in network
+    ]
+    return max(candidates)[1] if candidates else None
+
+
+def test_calculate_parents_random():
+    rand = random.Random(42)
+    ip_nodes = []
+    prefixes = []
+    values = set()
+    for idx in range(300):
+        prefixlen = rand.randint(8, 30)
+        network = ipaddress.ip_network(f"10.{rand.randint(0, 3)}.{rand.randint(0, 255)}.0/{prefixlen}", strict=False)
+        if network in values:
+            continue
+        values.add(network)
+        ip_nodes.append(_ip_node(f"net{idx}", str(network)))
+        prefixes.append((f"net{idx}", network))
+    for idx in range(300):
+        ip_nodes.append(
+            _ip_node(
+                f"addr{idx}",
+                f"10.{rand.randint(0, 3)}.{rand.randint(0, 255)}.{rand.randint(0, 255)}/{rand.randint(8, 32)}",
+                is_address=True,
+            )
+        )
+
+    parents = calculate_parents(ip_nodes=ip_nodes)
+    for ip_node in ip_nodes:
+        assert parents[ip_node.id] == _brute_force_parent(ip_node=ip_node, prefixes=prefixes)
@@ -1,8 +1,14 @@
+import pytest
+
 from infrahub.core.branch import Branch
 from infrahub.core.initialization import initialize_registry
+from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
 from infrahub.core.schema import SchemaRoot
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
+from infrahub.exceptions import PoolExhaustedError
+from infrahub.pools.number import number_pool_cache
 from tests.helpers.schema import TICKET, load_schema
 
 
@@ -24,3 +30,56 @@ async def test_allocate_from_number_pool(db: InfrahubDatabase, default_branch: B
 
     assert ticket1.ticket_id.value == 1
     assert ticket2.ticket_id.value == 2
+
+
+async def test_allocate_many_from_number_pool(
+    db: InfrahubDatabase, default_branch: Branch, register_core_models_schema
+):
+    await load_schema(db=db, schema=SchemaRoot(nodes=[TICKET]))
+    await initialize_registry(db=db)
+
+    np1 = await Node.init(db=db, schema="CoreNumberPool")
+    await np1.new(db=db, name="pool1", node="TestingTicket", node_attribute="ticket_id", start_range=1, end_range=10)
+    await np1.save(db=db)
+
+    ticket1 = await Node.init(db=db, schema=TICKET.kind)
+    await ticket1.new(db=db, title="ticket1", ticket_id={"from_pool": {"id": np1.id}})
+    await ticket1.save(db=db)
+
+    pool = await NodeManager.get_one(db=db, id=np1.id, branch=default_branch)
+    numbers = await pool.get_resources(db=db, branch=default_branch, count=3, identifiers=["a", "b", "c"])
+    assert numbers == [2, 3, 4]
+
+    # The reservations already made are returned as is
+    numbers = await pool.get_resources(db=db, branch=default_branch, count=3, identifiers=["b", "d", "e"])
+    assert numbers == [3, 5, 6]
+
+    # The numbers reserved by another process are read from the database when the cache is synchronized
+    number_pool_cache.clear()
+    assert await pool.get_next(db=db, branch=default_branch) == 7
+
+    with pytest.raises(PoolExhaustedError):
+        await pool.get_resources(db=db, branch=default_branch, count=5)
+
+
+async def test_allocate_from_number_pool_stale_cache(
+    db: InfrahubDatabase, default_branch: Branch, register_core_models_schema
+):
+    await load_schema(db=db, schema=SchemaRoot(nodes=[TICKET]))
+    await initialize_registry(db=db)
+
+    np1 = await Node.init(db=db, schema="CoreNumberPool")
+    await np1.new(db=db, name="pool1", node="TestingTicket", node_attribute="ticket_id", start_range=1, end_range=10)
+    await np1.save(db=db)
+
+    pool = await NodeManager.get_one(db=db, id=np1.id, branch=default_branch)
+    assert await pool.get_resources(db=db, branch=default_branch, count=2, identifiers=["a", "b"]) == [1, 2]
+
+    # Numbers reserved in the database but missing from the cache are skipped when they are reserved
+    cached = number_pool_cache.get(pool_id=np1.id, start=1, end=10)
+    cached.free_ranges.release(1)
+    cached.free_ranges.release(2)
+    cached.synced_at = Timestamp()
+    assert await pool.get_resources(db=db, branch=default_branch, count=2, identifiers=["c", "d"]) == [3, 4]
+    assert 1 not in cached.free_ranges
+    assert 2 not in cached.free_ranges
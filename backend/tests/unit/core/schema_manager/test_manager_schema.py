@@ -25,8 +25,10 @@ from infrahub.core.schema import (
 )
 from infrahub.core.schema.manager import SchemaManager
 from infrahub.core.schema.schema_branch import SchemaBranch
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.exceptions import SchemaNotFoundError, ValidationError
+from tests.adapters.cache import MemoryCache
 
 from .conftest import _get_schema_by_kind
 
@@ -74,6 +76,31 @@ async def test_schema_branch_get(default_branch: Branch):
     assert schema11 == schema
 
 
+async def test_schema_branch_get_read_only():
+    schema = NodeSchema(
+        name="Criticality",
+        namespace="Builtin",
+        attributes=[{"name": "name", "kind": "Text", "unique": True}],
+    )
+    schema_branch = SchemaBranch(cache={}, name="test")
+    schema_branch.set(name="BuiltinCriticality", schema=schema)
+
+    view = schema_branch.get(name="BuiltinCriticality", read_only=True)
+    assert view == schema
+    assert view.is_read_only
+    assert view is schema_branch.get(name="BuiltinCriticality", read_only=True)
+    with pytest.raises(TypeError):
+        view.label = "Critical"
+    with pytest.raises(TypeError):
+        view.attributes[0].unique = False
+
+    copy = view.duplicate()
+    copy.attributes[0].unique = False
+    assert not copy.is_read_only
+    assert view.attributes[0].unique is True
+    assert schema_branch.get(name="BuiltinCriticality", duplicate=False).attributes[0].unique is True
+
+
 async def test_schema_branch_load_schema_initial(schema_all_in_one):
     schema = SchemaBranch(cache={}, name="test")
     schema.load_schema(schema=SchemaRoot(**schema_all_in_one))
@@ -114,6 +141,30 @@ async def test_schema_branch_process_inheritance(schema_all_in_one):
     }
 
 
+async def test_schema_branch_get_searchable_attributes(schema_all_in_one):
+    tag = [node for node in schema_all_in_one["nodes"] if node["name"] == "Tag"][0]
+    tag["attributes"][1]["searchable"] = False
+
+    schema = SchemaBranch(cache={}, name="test")
+    assert schema.get_searchable_attributes() == {}
+
+    schema.load_schema(schema=SchemaRoot(**schema_all_in_one))
+    schema.process_inheritance()
+
+    searchable = schema.get_searchable_attributes()
+    assert searchable["BuiltinTag"] == ["name"]
+    assert set(searchable["BuiltinCriticality"]) == {
+        "name",
+        "level",
+        "color",
+        "description",
+        "my_generic_name",
+        "mybool",
+        "local_attr",
+    }
+    assert "InfraGenericInterface" not in searchable
+
+
 async def test_schema_process_inheritance_different_generic_attribute_types(schema_diff_attr_inheritance_types):
     """Test that we raise an exception if a node is inheriting from two generics with different attribute types for a specific attribute."""
     schema = SchemaBranch(cache={}, name="test")
@@ -2230,6 +2281,31 @@ async def test_load_schema_from_db(
     assert schema11.get(name="TestGenericInterface").get_hash() == schema2.get(name="TestGenericInterface").get_hash()
 
 
+async def test_load_schema_at(
+    db: InfrahubDatabase, reset_registry, default_branch: Branch, register_internal_models_schema
+):
+    SCHEMA = {
+        "nodes": [
+            {
+                "namespace": "Test",
+                "name": "Criticality",
+                "default_filter": "name__value",
+                "attributes": [{"name": "name", "kind": "Text", "unique": True}],
+            }
+        ]
+    }
+    schema = registry.schema.register_schema(schema=SchemaRoot(**SCHEMA), branch=default_branch.name)
+    await registry.schema.load_schema_to_db(schema=schema, db=db, branch=default_branch.name)
+    after_load = Timestamp()
+
+    schema1 = await registry.schema.load_schema_at(db=db, branch=default_branch, at=after_load)
+    schema2 = await registry.schema.load_schema_at(db=db, branch=default_branch, at=Timestamp())
+
+    assert schema1 is schema2
+    assert "TestCriticality" in schema1.nodes
+    assert schema1.get(name="TestCriticality").get_hash() == schema.get(name="TestCriticality").get_hash()
+
+
 async def test_load_schema(
     db: InfrahubDatabase, reset_registry, default_branch: Branch, register_internal_models_schema
 ):
@@ -2441,3 +2517,19 @@ def test_schema_branch_conflicting_required_relationships(schema_all_in_one):
     assert "BuiltinTag" in exc.value.args[0]
     assert "BuiltinCriticality" in exc.value.args[0]
     assert "cannot both have required relationships" in exc.value.args[0]
+
+
+async def test_schema_snapshot(schema_all_in_one):
+    schema_branch = SchemaBranch(cache={}, name="test")
+    schema_branch.load_schema(schema=SchemaRoot(**schema_all_in_one))
+    cache = MemoryCache()
+    schema_manager = SchemaManager()
+
+    await schema_manager.save_schema_snapshot(cache=cache, schema=schema_branch)
+    snapshot_schema = await schema_manager.load_schema_snapshot(cache=cache, schema_hash=schema_branch.get_hash())
+
+    assert snapshot_schema
+    assert snapshot_schema.get_hash() == schema_branch.get_hash()
+    assert snapshot_schema.to_dict() == schema_branch.to_dict()
+    assert snapshot_schema.get(name="BuiltinCriticality") == schema_branch.get(name="BuiltinCriticality")
+    assert await schema_manager.load_schema_snapshot(cache=cache, schema_hash="unknown") is None
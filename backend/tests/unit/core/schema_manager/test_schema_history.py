@@ -0,0 +1,84 @@
+from infrahub.core.schema import NodeSchema
+from infrahub.core.schema.history import SchemaHistoryCache
+from infrahub.core.schema.schema_branch import SchemaBranch
+
+
+def _build_schema_branch(label: str, branch_name: str = "main") -> SchemaBranch:
+    schema_branch = SchemaBranch(cache={}, name=branch_name)
+    schema_branch.set(
+        name="BuiltinCriticality",
+        schema=NodeSchema(
+            name="Criticality", namespace="Builtin", label=label, attributes=[{"name": "name", "kind": "Text"}]
+        ),
+    )
+    return schema_branch
+
+
+def test_schema_history_cache_get_set():
+    cache = SchemaHistoryCache(max_size=1024 * 1024)
+    schema1 = _build_schema_branch(label="first")
+
+    assert cache.get(branch_name="main", changed_at="2024-01-01T00:00:00Z") is None
+    assert cache.set(branch_name="main", changed_at="2024-01-01T00:00:00Z", schema=schema1) is schema1
+    assert cache.get(branch_name="main", changed_at="2024-01-01T00:00:00Z") is schema1
+    assert cache.get(branch_name="main", changed_at="2024-02-01T00:00:00Z") is None
+
+    # Another point in time with the same schema reuses the schema already in the cache
+    same_schema = _build_schema_branch(label="first")
+    assert cache.set(branch_name="main", changed_at="2024-02-01T00:00:00Z", schema=same_schema) is schema1
+    assert len(cache) == 1
+
+    branch_schema = cache.set(
+        branch_name="branch1",
+        changed_at="2024-01-01T00:00:00Z",
+        schema=_build_schema_branch(label="first", branch_name="branch1"),
+    )
+    assert branch_schema.name == "branch1"
+    assert branch_schema.get_hash() == schema1.get_hash()
+    assert len(cache) == 1
+
+
+def test_schema_history_cache_eviction():
+    schema1 = _build_schema_branch(label="first")
+    schema2 = _build_schema_branch(label="second")
+    schema3 = _build_schema_branch(label="third")
+    cache = SchemaHistoryCache(
+        max_size=SchemaHistoryCache._get_size(schema=schema1) + SchemaHistoryCache._get_size(schema=schema2)
+    )
+
+    cache.set(branch_name="main", changed_at="1", schema=schema1)
+    cache.set(branch_name="main", changed_at="2", schema=schema2)
+    assert cache.get(branch_name="main", changed_at="1") is schema1
+
+    # The least recently used schema is evicted
+    cache.set(branch_name="main", changed_at="3", schema=schema3)
+    assert len(cache) == 2
+    assert cache.size <= cache.max_size
+    assert cache.get(branch_name="main", changed_at="1") is schema1
+    assert cache.get(branch_name="main", changed_at="2") is None
+    assert cache.get(branch_name="main", changed_at="3") is schema3
+
+
+def test_schema_history_cache_too_large():
+    schema1 = _build_schema_branch(label="first")
+    cache = SchemaHistoryCache(max_size=1)
+
+    assert cache.set(branch_name="main", changed_at="1", schema=schema1) is schema1
+    assert len(cache) == 0
+    assert cache.get(branch_name="main", changed_at="1") is None
+
+
+def test_schema_history_cache_max_points():
+    schema1 = _build_schema_branch(label="first")
+    cache = SchemaHistoryCache(max_size=1024 * 1024, max_points=2)
+
+    cache.set(branch_name="main", changed_at="1", schema=schema1)
+    cache.set(branch_name="main", changed_at="2", schema=schema1)
+    assert cache.get(branch_name="main", changed_at="1") is schema1
+
+    # The least recently used point in time is forgotten, the schema itself stays in the cache
+    cache.set(branch_name="main", changed_at="3", schema=schema1)
+    assert len(cache) == 1
+    assert cache.get(branch_name="main", changed_at="1") is schema1
+    assert cache.get(branch_name="main", changed_at="2") is None
+    assert cache.get(branch_name="main", changed_at="3") is schema1
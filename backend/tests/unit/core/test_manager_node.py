@@ -252,6 +252,14 @@ async def test_get_many(db: InfrahubDatabase, default_branch: Branch, criticalit
     assert len(nodes) == 2
 
 
+async def test_get_many_without_attributes(
+    db: InfrahubDatabase, default_branch: Branch, criticality_low, criticality_medium
+):
+    nodes = await NodeManager.get_many(db=db, ids=[criticality_low.id, criticality_medium.id], include_attributes=False)
+    assert len(nodes) == 2
+    assert nodes[criticality_low.id].name.value is None
+
+
 async def test_get_many_prefetch(db: InfrahubDatabase, default_branch: Branch, person_jack_tags_main):
     nodes = await NodeManager.get_many(db=db, ids=[person_jack_tags_main.id], prefetch_relationships=True)
 
@@ -1,5 +1,6 @@
 from typing import Optional
 
+import pytest
 from deepdiff import DeepDiff
 
 from infrahub.core.constants import HashableModelState
@@ -291,3 +292,28 @@ def test_diff_nested_objects():
         "changed": {"subs": None, "value4": {"added": {}, "changed": {"value2": None}, "removed": {}}},
         "removed": {},
     }
+
+
+def test_model_read_only():
+    class MySubElement(HashableModel):
+        name: str
+
+    class MyTopElement(HashableModel):
+        name: str
+        subs: list[MySubElement]
+
+    node = MyTopElement(name="node1", subs=[MySubElement(name="orange")]).freeze()
+
+    assert node.is_read_only
+    with pytest.raises(TypeError):
+        node.name = "node2"
+    with pytest.raises(TypeError):
+        node.subs[0].name = "apple"
+
+    copy = node.duplicate()
+    assert copy == node
+    copy.name = "node2"
+    copy.subs[0].name = "apple"
+    assert not copy.subs[0].is_read_only
+    assert node.name == "node1"
+    assert node.subs[0].name == "orange"
@@ -11,7 +11,7 @@ from infrahub.core.schema import NodeSchema, SchemaRoot
 from infrahub.core.timestamp import Timestamp
 from infrahub.core.utils import count_relationships, get_paths_between_nodes
 from infrahub.database import InfrahubDatabase
-from infrahub.exceptions import ValidationError
+from infrahub.exceptions import QueryError, ValidationError
 
 
 async def test_node_init(
@@ -705,6 +705,50 @@ async def test_node_update_local_attrs(db: InfrahubDatabase, default_branch: Bra
     assert await count_relationships(db=db) == nbr_rels
 
 
+async def test_node_update_only_changed_fields(db: InfrahubDatabase, default_branch: Branch, criticality_schema):
+    obj1 = await Node.init(db=db, schema=criticality_schema)
+    await obj1.new(db=db, name="low", level=4)
+    await obj1.save(db=db)
+    assert not obj1.name.has_changed
+
+    obj2 = await NodeManager.get_one(db=db, id=obj1.id)
+    assert not any(getattr(obj2, name).has_changed for name in obj2._attributes)
+    assert not any(getattr(obj2, name).has_changed for name in obj2._relationships)
+
+    obj2.name.value = "high"
+    obj2.level.is_protected = True
+    assert {name for name in obj2._attributes if getattr(obj2, name).has_changed} == {"name", "level"}
+
+    await obj2.save(db=db)
+    assert not obj2.name.has_changed
+    assert not obj2.level.has_changed
+
+    obj3 = await NodeManager.get_one(db=db, id=obj1.id)
+    assert obj3.name.value == "high"
+    assert obj3.level.value == 4
+    assert obj3.level.is_protected is True
+    assert obj3.name.is_protected is False
+
+
+async def test_node_update_unknown_node_property(db: InfrahubDatabase, default_branch: Branch, criticality_schema):
+    obj1 = await Node.init(db=db, schema=criticality_schema)
+    await obj1.new(db=db, name="low", level=4)
+    await obj1.save(db=db)
+    nbr_rels = await count_relationships(db=db)
+
+    obj2 = await NodeManager.get_one(db=db, id=obj1.id)
+    obj2.name.value = "high"
+    obj2.name.source = str(UUIDT())
+
+    with pytest.raises(QueryError):
+        await obj2.save(db=db)
+
+    # Nothing has been written, not even the changes of the value
+    assert await count_relationships(db=db) == nbr_rels
+    obj3 = await NodeManager.get_one(db=db, id=obj1.id)
+    assert obj3.name.value == "low"
+
+
 async def test_node_update_local_attrs_with_flags(db: InfrahubDatabase, default_branch: Branch, criticality_schema):
     fields_to_query = {"name": True, "level": True}
     obj1 = await Node.init(db=db, schema=criticality_schema)
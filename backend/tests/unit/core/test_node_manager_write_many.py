@@ -0,0 +1,204 @@
+from collections import Counter
+
+import pytest
+
+from infrahub.core.branch import Branch
+from infrahub.core.initialization import create_branch
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.core.schema.schema_branch import SchemaBranch
+from infrahub.core.timestamp import Timestamp
+from infrahub.database import InfrahubDatabase
+from infrahub.exceptions import ValidationError
+
+
+async def test_create_many(db: InfrahubDatabase, default_branch: Branch, car_person_schema: SchemaBranch):
+    persons = []
+    for name in ["John", "Jane", "Bill"]:
+        person = await Node.init(db=db, schema="TestPerson", branch=default_branch)
+        await person.new(db=db, name=name, height=180)
+        persons.append(person)
+
+    created_persons = await NodeManager.create_many(db=db, nodes=persons, batch_size=2)
+    assert all(person.db_id for person in created_persons)
+
+    cars = []
+    for name, person in [("accord", persons[0]), ("camry", persons[1])]:
+        car = await Node.init(db=db, schema="TestCar", branch=default_branch)
+        await car.new(db=db, name=name, owner=person)
+        cars.append(car)
+    await NodeManager.create_many(db=db, nodes=cars)
+
+    nodes = await NodeManager.get_many(db=db, ids=[node.id for node in persons + cars], branch=default_branch)
+    assert {nodes[person.id].name.value for person in persons} == {"John", "Jane", "Bill"}
+    assert nodes[persons[2].id].height.value == 180
+    for car in cars:
+        assert nodes[car.id].name.value == car.name.value
+        assert nodes[car.id].name.id == car.name.id
+        assert (await nodes[car.id].owner.get_peer(db=db)).id == (await car.owner.get_peer(db=db)).id
+
+
+async def test_create_many_duplicate_in_batch(
+    db: InfrahubDatabase, default_branch: Branch, car_person_schema: SchemaBranch
+):
+    persons = []
+    for name in ["John", "John"]:
+        person = await Node.init(db=db, schema="TestPerson", branch=default_branch)
+        await person.new(db=db, name=name)
+        persons.append(person)
+
+    with pytest.raises(ValidationError, match="Violates uniqueness constraint 'name'"):
+        await NodeManager.create_many(db=db, nodes=persons)
+
+    assert not await NodeManager.query(db=db, schema="TestPerson", branch=default_branch)
+
+
+async def test_create_many_duplicate_in_database(
+    db: InfrahubDatabase, default_branch: Branch, person_albert_main: Node
+):
+    person = await Node.init(db=db, schema="TestPerson", branch=default_branch)
+    await person.new(db=db, name=person_albert_main.name.value)
+
+    with pytest.raises(ValidationError):
+        await NodeManager.create_many(db=db, nodes=[person])
+
+
+async def test_update_many(
+    db: InfrahubDatabase, default_branch: Branch, person_albert_main: Node, person_jane_main: Node
+):
+    person_albert_main.height.value = 150
+    person_jane_main.height.value = 160
+    await NodeManager.update_many(db=db, nodes=[person_albert_main, person_jane_main])
+
+    nodes = await NodeManager.get_many(db=db, ids=[person_albert_main.id, person_jane_main.id])
+    assert nodes[person_albert_main.id].height.value == 150
+    assert nodes[person_jane_main.id].height.value == 160
+
+
+async def test_update_many_duplicate_in_batch(
+    db: InfrahubDatabase, default_branch: Branch, person_albert_main: Node, person_jane_main: Node
+):
+    person_albert_main.name.value = "Alice"
+    person_jane_main.name.value = "Alice"
+
+    with pytest.raises(ValidationError, match="Violates uniqueness constraint 'name'"):
+        await NodeManager.update_many(db=db, nodes=[person_albert_main, person_jane_main])
+
+
+async def test_delete_many(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    car_camry_main: Node,
+    car_accord_main: Node,
+    person_albert_main: Node,
+):
+    deleted = await NodeManager.delete_many(
+        db=db, branch=default_branch, nodes=[car_camry_main, car_accord_main, person_albert_main]
+    )
+
+    assert {node.id for node in deleted} == {car_camry_main.id, car_accord_main.id, person_albert_main.id}
+    assert not await NodeManager.get_many(
+        db=db, ids=[car_camry_main.id, car_accord_main.id, person_albert_main.id], branch=default_branch
+    )
+
+
+async def test_delete_many_relationships(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    car_camry_main: Node,
+    car_accord_main: Node,
+    person_john_main: Node,
+    person_jane_main: Node,
+):
+    nodes = [car_camry_main, car_accord_main]
+    await NodeManager.delete_many(db=db, branch=default_branch, nodes=nodes)
+    assert nodes == [car_camry_main, car_accord_main]
+
+    john = await NodeManager.get_one(db=db, id=person_john_main.id, branch=default_branch)
+    jane = await NodeManager.get_one(db=db, id=person_jane_main.id, branch=default_branch)
+    assert john.name.value == "John"
+    assert not await john.cars.get_peers(db=db)
+    assert not await jane.cars.get_peers(db=db)
+
+
+async def _create_cars_to_delete(
+    db: InfrahubDatabase, default_branch: Branch, branch: Branch, suffix: str
+) -> tuple[list[str], list[Node]]:
+    """Create cars on main and on a branch, return the ids of all the nodes and the cars to delete."""
+    person = await Node.init(db=db, schema="TestPerson", branch=default_branch)
+    await person.new(db=db, name=f"person-{suffix}")
+    await person.save(db=db)
+
+    car_ids = []
+    for name in ("main", "updated", "other"):
+        car = await Node.init(db=db, schema="TestCar", branch=default_branch)
+        await car.new(db=db, name=f"{name}-{suffix}", nbr_seats=4, owner=person)
+        await car.save(db=db)
+        car_ids.append(car.id)
+
+    updated_car = await NodeManager.get_one(db=db, id=car_ids[1], branch=branch)
+    updated_car.nbr_seats.value = 5
+    await updated_car.save(db=db)
+
+    branch_car = await Node.init(db=db, schema="TestCar", branch=branch)
+    await branch_car.new(db=db, name=f"branch-{suffix}", is_electric=True, owner=person.id)
+    await branch_car.save(db=db)
+
+    branch_nodes = await NodeManager.get_many(db=db, ids=[car_ids[0], car_ids[1], branch_car.id], branch=branch)
+    main_nodes = await NodeManager.get_many(db=db, ids=[car_ids[2]], branch=default_branch)
+    return [person.id, *car_ids, branch_car.id], [*branch_nodes.values(), *main_nodes.values()]
+
+
+async def _get_fields_edges(db: InfrahubDatabase, node_ids: list[str]) -> Counter:
+    query = """
+    MATCH (n:Node)-[:HAS_ATTRIBUTE|IS_RELATED]-(field)
+    WHERE n.uuid IN $node_ids
+    WITH DISTINCT field
+    MATCH (field)-[edge]-()
+    WITH DISTINCT field, edge
+    RETURN
+        field.name AS field_name,
+        type(edge) AS edge_type,
+        labels(startNode(edge)) AS start_labels,
+        labels(endNode(edge)) AS end_labels,
+        edge.branch AS branch,
+        edge.status AS status,
+        edge.to IS NULL AS is_current,
+        edge.hierarchy AS hierarchy
+    """
+    results = await db.execute_query(query=query, params={"node_ids": node_ids}, name="get_fields_edges")
+    return Counter(
+        (
+            result["field_name"],
+            result["edge_type"],
+            tuple(sorted(result["start_labels"])),
+            tuple(sorted(result["end_labels"])),
+            result["branch"],
+            result["status"],
+            result["is_current"],
+            result["hierarchy"],
+        )
+        for result in results
+    )
+
+
+async def test_delete_many_same_edges_as_delete(
+    db: InfrahubDatabase, default_branch: Branch, car_person_schema: SchemaBranch
+):
+    branch = await create_branch(db=db, branch_name="branch2")
+
+    single_ids, single_nodes = await _create_cars_to_delete(
+        db=db, default_branch=default_branch, branch=branch, suffix="single"
+    )
+    many_ids, many_nodes = await _create_cars_to_delete(
+        db=db, default_branch=default_branch, branch=branch, suffix="many"
+    )
+
+    delete_at = Timestamp()
+    for node in single_nodes:
+        await node.delete(db=db, at=delete_at)
+    await NodeManager.delete_many(db=db, branch=branch, nodes=many_nodes, at=delete_at)
+
+    single_edges = await _get_fields_edges(db=db, node_ids=single_ids)
+    assert single_edges
+    assert await _get_fields_edges(db=db, node_ids=many_ids) == single_edges
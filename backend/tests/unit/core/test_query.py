@@ -1,6 +1,9 @@
+from unittest.mock import MagicMock
+
 import pendulum
 import pytest
 
+from infrahub import config
 from infrahub.core.query import (
     Query,
     QueryNode,
@@ -11,7 +14,9 @@ from infrahub.core.query import (
     cleanup_return_labels,
     sort_results_by_time,
 )
+from infrahub.core.query.cache import query_text_cache
 from infrahub.database import InfrahubDatabase
+from infrahub.database.constants import DatabaseType
 
 
 class Query01(Query):
@@ -41,6 +46,44 @@ class Query02(Query):
         self.add_to_query(query)
 
 
+class Query03(Query):
+    cursor_key = "at.uuid"
+
+    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
+        query = """
+        MATCH (n) WHERE n.uuid = $uuid
+        MATCH (n)-[r1]-(at:Attribute)-[r2]-(av)
+        WHERE %(cursor_filter)s
+        """ % {"cursor_filter": self.get_cursor_filter(key="at.uuid")}
+
+        self.return_labels = ["n", "at", "av", "r1", "r2"]
+        self.params["uuid"] = "5ffa45d4"
+
+        self.add_to_query(query)
+
+
+class Query04(Query):
+    nbr_generated = 0
+
+    def __init__(self, kind: str, **kwargs) -> None:
+        self.kind = kind
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
+        self.params["kind"] = self.kind
+        if self.load_query_from_cache(db=db, key=self.kind == "Car"):
+            return
+
+        Query04.nbr_generated += 1
+        self.add_to_query("MATCH (n:Node) WHERE n.kind = $kind")
+        if self.kind == "Car":
+            self.add_to_query("MATCH (n)-[:IS_RELATED]-(:Relationship)-[:IS_RELATED]-(p:Person)")
+            self.params["label"] = "Car"
+        self.return_labels = ["n"]
+        self.order_by = ["n.uuid"]
+        self.save_query_to_cache(params={"label": "Car"} if self.kind == "Car" else None)
+
+
 def test_cleanup_return_labels():
     assert cleanup_return_labels(["r", "n", "l"]) == ["r", "n", "l"]
     assert cleanup_return_labels(["r.uuid", "n", "l"]) == ["r.uuid", "n", "l"]
@@ -54,6 +97,39 @@ async def test_query_base(db: InfrahubDatabase):
     assert query.get_query() == expected_query
 
 
+async def test_query_text_cache():
+    db = MagicMock(db_type=DatabaseType.NEO4J)
+    query_text_cache.clear()
+
+    query1 = await Query04.init(db=db, kind="Car")
+    query2 = await Query04.init(db=db, kind="Car")
+    query3 = await Query04.init(db=db, kind="Person")
+    assert Query04.nbr_generated == 2
+    assert len(query_text_cache) == 2
+
+    assert query1.get_query() == query2.get_query()
+    assert query2.get_query() is query2.get_query()
+    assert query2.params == {"kind": "Car", "label": "Car"}
+    assert query2.order_by == ["n.uuid"]
+    assert query3.get_query() == "MATCH (n:Node) WHERE n.kind = $kind\nRETURN n\nORDER BY n.uuid"
+    assert query3.params == {"kind": "Person"}
+
+    # Modifying a query restored from the cache doesn't impact the cache
+    query2.add_to_query("WITH n")
+    assert query2.get_query() != query1.get_query()
+    query4 = await Query04.init(db=db, kind="Car")
+    assert query4.get_query() == query1.get_query()
+
+    # The limit and the offset are parameters, all the pages of a query share the same text
+    query5 = await Query04.init(db=db, kind="Person")
+    pages = {query5.get_query(limit=100, offset=offset) for offset in range(100, 1000, 100)}
+    assert pages == {
+        "MATCH (n:Node) WHERE n.kind = $kind\nRETURN n\nORDER BY n.uuid\nSKIP $query_offset\nLIMIT $query_limit"
+    }
+    assert len(query5._query_cache_entry.rendered) == 2
+    assert query5.get_params(limit=100, offset=200) == {"kind": "Person", "query_limit": 100, "query_offset": 200}
+
+
 async def test_insert_variables_in_query(db: InfrahubDatabase, simple_dataset_01):
     params = {
         "my": "tooshort",
@@ -128,6 +204,69 @@ async def test_query_results_limit_offset(db: InfrahubDatabase, simple_dataset_0
     assert expected_values == [5]
 
 
+async def test_query_cursor(db: InfrahubDatabase):
+    query = await Query03.init(db=db)
+    assert query.supports_cursor
+
+    expected_query = (
+        "MATCH (n) WHERE n.uuid = $uuid\nMATCH (n)-[r1]-(at:Attribute)-[r2]-(av)\n"
+        "WHERE ($cursor_keys IS NULL OR at.uuid IN $cursor_keys)\nRETURN n,at,av,r1,r2,at.uuid AS query_cursor\n"
+        "ORDER BY query_cursor\nLIMIT $query_limit"
+    )
+    assert query.get_query(limit=10, cursor=True) == expected_query
+
+    query = await Query01.init(db=db)
+    assert not query.supports_cursor
+    with pytest.raises(ValueError):
+        query.get_query(cursor=True)
+
+
+@pytest.mark.parametrize("query_size_limit", [1, 2, 5000])
+async def test_query_results_cursor(db: InfrahubDatabase, simple_dataset_01, monkeypatch, query_size_limit: int):
+    monkeypatch.setattr(config.SETTINGS.database, "query_size_limit", query_size_limit)
+    query = await Query03.init(db=db)
+    await query.execute(db=db)
+
+    assert query.num_of_results == 3
+    values = [result.get("av").get("value") for result in query.results]
+    assert sorted(values, key=str) == [5, "accord", "volt"]
+
+
+async def test_query_stream_pages(db: InfrahubDatabase, simple_dataset_01, monkeypatch):
+    monkeypatch.setattr(config.SETTINGS.database, "query_size_limit", 1)
+    query = await Query03.init(db=db)
+
+    pages = [page async for page in query.stream_pages(db=db)]
+    assert query.has_been_executed is True
+    assert query.results == []
+
+    values = [result.get("av").get("value") for page in pages for result in page]
+    assert sorted(values, key=str) == [5, "accord", "volt"]
+    keys = [page[0].get("at").get("uuid") for page in pages if page]
+    assert keys == sorted(keys)
+
+    query = await Query01.init(db=db)
+    with pytest.raises(ValueError):
+        async for _ in query.stream_pages(db=db):
+            pass
+
+
+async def test_query_stream(db: InfrahubDatabase, simple_dataset_01):
+    query = await Query01.init(db=db)
+
+    results = [result async for result in query.stream(db=db)]
+    assert query.has_been_executed is True
+    assert query.results == []
+
+    assert len(results) == 3
+    assert {result.get("av").get("value") for result in results} == {"accord", "volt", 5}
+
+    query = await Query02.init(db=db)
+    with pytest.raises(TypeError):
+        async for _ in query.stream(db=db):
+            pass
+
+
 async def test_query_async(db: InfrahubDatabase, simple_dataset_01):
     query = await Query01.init(db=db)
 
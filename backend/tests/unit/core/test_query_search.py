@@ -0,0 +1,26 @@
+from infrahub.core.graph.index import node_indexes
+from infrahub.core.query.search import SEARCH_INDEX_NAME, build_fulltext_query
+from infrahub.database.constants import IndexType
+from infrahub.database.neo4j import IndexNodeNeo4j
+
+
+def test_search_index_name():
+    fulltext_indexes = [item for item in node_indexes if item.type == IndexType.FULLTEXT]
+    assert len(fulltext_indexes) == 1
+    assert IndexNodeNeo4j(**fulltext_indexes[0].model_dump())._index_name == SEARCH_INDEX_NAME
+
+
+def test_fulltext_index_add_query():
+    item = IndexNodeNeo4j(name="attr_value", label="AttributeValue", properties=["value"], type=IndexType.FULLTEXT)
+    assert item.get_add_query() == (
+        "CREATE FULLTEXT INDEX node_fulltext_attr_value_value IF NOT EXISTS FOR (n:AttributeValue) ON EACH [n.value]"
+    )
+
+
+def test_build_fulltext_query():
+    assert build_fulltext_query(q="Prius") == "(prius OR prius*)"
+    assert build_fulltext_query(q="atl1-edge1") == "(atl1 OR atl1*) AND (edge1 OR edge1*)"
+    assert build_fulltext_query(q="10.0.0.0/24") == "(10.0.0.0 OR 10.0.0.0*) AND (24 OR 24*)"
+    assert build_fulltext_query(q="Atl1 Edge", partial_match=False) == '"atl1 edge"'
+    assert build_fulltext_query(q='name:"x" OR (y)') == "(name OR name*) AND (x OR x*) AND (or OR or*) AND (y OR y*)"
+    assert build_fulltext_query(q=" -*?") is None
@@ -21,6 +21,7 @@ from infrahub.core.query.relationship import (
     RelData,
 )
 from infrahub.core.relationship import Relationship
+from infrahub.core.schema import SchemaRoot
 from infrahub.core.timestamp import Timestamp
 from infrahub.core.utils import get_paths_between_nodes
 from infrahub.database import InfrahubDatabase
@@ -571,6 +572,46 @@ async def test_query_RelationshipGetPeerQuery_with_multiple_filter(
     assert query.get_peer_ids() == [car_volt_main.id]
 
 
+async def test_query_RelationshipGetPeerQuery_sources_peers_of_each_other(
+    db: InfrahubDatabase, default_branch: Branch, node_group_schema
+):
+    schema = SchemaRoot(
+        nodes=[
+            {
+                "name": "Person",
+                "namespace": "Test",
+                "attributes": [{"name": "name", "kind": "Text", "unique": True}],
+                "relationships": [
+                    {"name": "friends", "peer": "TestPerson", "identifier": "person__friend", "cardinality": "many"}
+                ],
+            }
+        ]
+    )
+    registry.schema.register_schema(schema=schema, branch=default_branch.name)
+
+    person1 = await Node.init(db=db, schema="TestPerson")
+    await person1.new(db=db, name="John")
+    await person1.save(db=db)
+    person2 = await Node.init(db=db, schema="TestPerson")
+    await person2.new(db=db, name="Jane", friends=[person1])
+    await person2.save(db=db)
+
+    rel_schema = registry.schema.get(name="TestPerson").get_relationship("friends")
+    query = await RelationshipGetPeerQuery.init(
+        db=db,
+        source_ids=[person1.id, person2.id],
+        schema=rel_schema,
+        rel=Relationship,
+        branch=default_branch,
+        at=Timestamp(),
+    )
+    await query.execute(db=db)
+
+    peers = {(peer.source_id, peer.peer_id) for peer in query.get_peers(per_source=True)}
+    assert peers == {(person1.id, person2.id), (person2.id, person1.id)}
+    assert await query.count_per_source(db=db) == {person1.id: 1, person2.id: 1}
+
+
 async def test_query_RelationshipDataDeleteQuery(
     db: InfrahubDatabase, tag_blue_main: Node, person_jack_tags_main: Node, branch: Branch
 ):
@@ -1,8 +1,11 @@
+import pytest
 from graphql import graphql
 
 from infrahub.core.branch import Branch
+from infrahub.core.graph.index import node_indexes, rel_indexes
+from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
-from infrahub.database import InfrahubDatabase
+from infrahub.database import DatabaseType, InfrahubDatabase
 from infrahub.graphql.initialization import prepare_graphql_params
 
 SEARCH_QUERY = """
@@ -19,6 +22,34 @@ query ($search: String!) {
 }
 """
 
+SEARCH_QUERY_WITH_LABEL = """
+query ($search: String!, $partial_match: Boolean) {
+    InfrahubSearchAnywhere(q: $search, partial_match: $partial_match) {
+        count
+        edges {
+            node {
+                id
+                kind
+                display_label
+                score
+            }
+        }
+    }
+}
+"""
+
+
+@pytest.fixture
+async def search_index(db: InfrahubDatabase):
+    if db.db_type != DatabaseType.NEO4J:
+        pytest.skip("The full-text index is only available with Neo4j")
+
+    db.manager.index.init(nodes=node_indexes, rels=rel_indexes)
+    await db.manager.index.add()
+    await db.execute_query(query="CALL db.awaitIndexes()", name="index_wait")
+    yield
+    db.manager.index.initialized = False
+
 
 async def test_search_anywhere_by_uuid(
     db: InfrahubDatabase,
@@ -93,3 +124,94 @@ async def test_search_anywhere_by_string(
 
     assert sorted(node_ids) == sorted([person_john_main.id, person_jane_main.id])
     assert sorted(node_kinds) == sorted([person_john_main.get_kind(), person_jane_main.get_kind()])
+
+
+async def test_search_anywhere_with_index(
+    db: InfrahubDatabase,
+    search_index,
+    person_john_main: Node,
+    person_jane_main: Node,
+    car_accord_main: Node,
+    car_prius_main: Node,
+    branch: Branch,
+):
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=branch)
+
+    result = await graphql(
+        schema=gql_params.schema,
+        source=SEARCH_QUERY_WITH_LABEL,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={"search": "Pri"},
+    )
+
+    assert result.errors is None
+    assert result.data
+    assert result.data["InfrahubSearchAnywhere"]["count"] == 1
+    node = result.data["InfrahubSearchAnywhere"]["edges"][0]["node"]
+    assert node["id"] == car_prius_main.id
+    assert node["kind"] == car_prius_main.get_kind()
+    assert node["display_label"] == await car_prius_main.render_display_label(db=db)
+    assert node["score"] > 0
+
+    result = await graphql(
+        schema=gql_params.schema,
+        source=SEARCH_QUERY_WITH_LABEL,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={"search": "Pri", "partial_match": False},
+    )
+
+    assert result.errors is None
+    assert result.data
+    assert result.data["InfrahubSearchAnywhere"]["count"] == 0
+
+    car = await Node.init(db=db, schema="TestCar", branch=branch)
+    await car.new(db=db, name="priusv", nbr_seats=7, is_electric=True, owner=person_jane_main.id)
+    await car.save(db=db)
+    prius = await NodeManager.get_one(db=db, id=car_prius_main.id, branch=branch)
+    await prius.delete(db=db)
+
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=SEARCH_QUERY_WITH_LABEL,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={"search": "prius"},
+    )
+
+    assert result.errors is None
+    assert result.data
+    assert [edge["node"]["id"] for edge in result.data["InfrahubSearchAnywhere"]["edges"]] == [car.id]
+
+
+async def test_search_anywhere_with_index_updated_value(
+    db: InfrahubDatabase,
+    search_index,
+    default_branch: Branch,
+    car_accord_main: Node,
+    car_prius_main: Node,
+    branch: Branch,
+):
+    prius = await NodeManager.get_one(db=db, id=car_prius_main.id, branch=branch)
+    prius.name.value = "corolla"
+    await prius.save(db=db)
+
+    for search, search_branch, expected_ids in (
+        ("prius", branch, []),
+        ("corolla", branch, [car_prius_main.id]),
+        ("prius", default_branch, [car_prius_main.id]),
+    ):
+        gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=search_branch)
+        result = await graphql(
+            schema=gql_params.schema,
+            source=SEARCH_QUERY_WITH_LABEL,
+            context_value=gql_params.context,
+            root_value=None,
+            variable_values={"search": search},
+        )
+
+        assert result.errors is None
+        assert result.data
+        assert [edge["node"]["id"] for edge in result.data["InfrahubSearchAnywhere"]["edges"]] == expected_ids
@@ -641,6 +641,82 @@ async def test_double_nested_query(db: InfrahubDatabase, default_branch: Branch,
     assert gql_params.context.related_node_ids == {p1.id, p2.id, c1.id, c2.id, c3.id}
 
 
+async def test_nested_query_peers_batched(
+    db: InfrahubDatabase, default_branch: Branch, car_person_schema: SchemaBranch, monkeypatch: pytest.MonkeyPatch
+):
+    person = registry.schema.get(name="TestPerson")
+
+    persons = []
+    for name in ["John", "Jane", "Bill"]:
+        obj = await Node.init(db=db, schema=person)
+        await obj.new(db=db, name=name, height=180)
+        await obj.save(db=db)
+        persons.append(obj)
+
+    for idx, owner in enumerate([persons[0], persons[0], persons[1]]):
+        obj = await Node.init(db=db, schema="TestCar")
+        await obj.new(db=db, name=f"car{idx}", nbr_seats=4, is_electric=True, owner=owner)
+        await obj.save(db=db)
+
+    calls = []
+    query_peers_per_source = NodeManager.query_peers_per_source
+
+    async def tracked_query_peers_per_source(**kwargs):
+        calls.append(kwargs["ids"])
+        return await query_peers_per_source(**kwargs)
+
+    monkeypatch.setattr(NodeManager, "query_peers_per_source", tracked_query_peers_per_source)
+
+    query = """
+    query {
+        TestPerson {
+            edges {
+                node {
+                    name {
+                        value
+                    }
+                    cars {
+                        count
+                        edges {
+                            node {
+                                name {
+                                    value
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(
+        db=db, include_mutation=False, include_subscription=False, branch=default_branch
+    )
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors is None
+
+    result_per_name = {result["node"]["name"]["value"]: result["node"] for result in result.data["TestPerson"]["edges"]}
+    assert result_per_name["John"]["cars"]["count"] == 2
+    assert result_per_name["Jane"]["cars"]["count"] == 1
+    assert result_per_name["Bill"]["cars"]["count"] == 0
+    assert sorted(edge["node"]["name"]["value"] for edge in result_per_name["John"]["cars"]["edges"]) == [
+        "car0",
+        "car1",
+    ]
+    assert result_per_name["Bill"]["cars"]["edges"] == []
+
+    assert len(calls) == 1
+    assert sorted(calls[0]) == sorted(obj.id for obj in persons)
+
+
 async def test_display_label_nested_query(
     db: InfrahubDatabase, default_branch: Branch, car_person_schema: SchemaBranch
 ):
@@ -258,3 +258,20 @@ async def test_generate_filters(db: InfrahubDatabase, default_branch: Branch, da
         "subscriber_of_groups__name__values",
     ]
     assert sorted(list(filters.keys())) == sorted(expected_filters)
+
+
+async def test_graphql_schema_shared_between_branches(
+    db: InfrahubDatabase, default_branch: Branch, data_schema, car_person_schema
+):
+    schema = registry.schema.get_schema_branch(name=default_branch.name)
+    graphql_schema = schema.get_graphql_schema()
+
+    other_schema = schema.duplicate(name="branch2")
+    assert other_schema.get_graphql_schema() is graphql_schema
+    assert other_schema.get_graphql_manager() is schema.get_graphql_manager()
+
+    car_schema = other_schema.get(name="TestCar")
+    car_schema.description = "updated description"
+    other_schema.set(name="TestCar", schema=car_schema)
+    other_schema.clear_cache()
+    assert other_schema.get_graphql_schema() is not graphql_schema
@@ -3,7 +3,7 @@ from graphql import DocumentNode, GraphQLSchema
 from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
 from infrahub.database import InfrahubDatabase
-from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
+from infrahub.graphql.analyzer import GraphQLQueryCache, InfrahubGraphQLQueryAnalyzer, graphql_query_cache
 from infrahub.graphql.initialization import prepare_graphql_params
 
 
@@ -16,6 +16,44 @@ async def test_analyzer_init_with_schema(
     assert isinstance(gqa.schema, GraphQLSchema)
 
 
+async def test_analyzer_cache(
+    db: InfrahubDatabase, default_branch: Branch, car_person_schema_generics, query_01: str, bad_query_01: str
+):
+    graphql_query_cache.clear()
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+
+    gqa1 = InfrahubGraphQLQueryAnalyzer(
+        query=query_01, schema=gql_params.schema, branch=default_branch, schema_hash="schema1"
+    )
+    assert gqa1.is_valid == (True, None)
+    models = await gqa1.get_models_in_use(types=gql_params.context.types)
+
+    gqa2 = InfrahubGraphQLQueryAnalyzer(
+        query=query_01, schema=gql_params.schema, branch=default_branch, schema_hash="schema1"
+    )
+    assert gqa2.document is gqa1.document
+    assert gqa2.data.validated
+    assert gqa2.data.models_in_use == models
+
+    gqa3 = InfrahubGraphQLQueryAnalyzer(
+        query=query_01, schema=gql_params.schema, branch=default_branch, schema_hash="schema2"
+    )
+    assert gqa3.document is not gqa1.document
+    assert len(graphql_query_cache) == 2
+
+
+def test_query_cache_lru(query_01: str, query_02: str, query_03: str):
+    cache = GraphQLQueryCache(name="test", max_size=2)
+    entry1 = cache.get(key=(query_01, "schema"), query=query_01)
+    cache.get(key=(query_02, "schema"), query=query_02)
+    assert cache.get(key=(query_01, "schema"), query=query_01) is entry1
+
+    cache.get(key=(query_03, "schema"), query=query_03)
+    assert len(cache) == 2
+    assert (query_02, "schema") not in cache._entries
+    assert cache.get(key=(query_01, "schema"), query=query_01) is entry1
+
+
 async def test_is_valid_simple_schema(
     db: InfrahubDatabase,
     default_branch: Branch,
@@ -1,11 +1,17 @@
+import pytest
+
+from infrahub import config
 from infrahub.core.account import GlobalPermission, ObjectPermission
 from infrahub.core.branch import Branch
 from infrahub.core.constants import GlobalPermissions, InfrahubKind, PermissionAction, PermissionDecision
+from infrahub.core.initialization import initialize_permission_backends
 from infrahub.core.node import Node
 from infrahub.core.protocols import CoreAccount
 from infrahub.database import InfrahubDatabase
 from infrahub.permissions import LocalPermissionBackend
+from infrahub.permissions.cache import get_cached_permissions, invalidate_permission_cache
 from infrahub.permissions.constants import PermissionDecisionFlag
+from tests.adapters.cache import MemoryCache
 
 
 async def test_load_permissions(db: InfrahubDatabase, default_branch: Branch, create_test_admin, first_account):
@@ -36,6 +42,28 @@ async def test_load_permissions(db: InfrahubDatabase, default_branch: Branch, cr
     assert not permissions["object_permissions"]
 
 
+async def test_load_permissions_with_cache(
+    db: InfrahubDatabase, default_branch: Branch, create_test_admin, first_account
+):
+    cache = MemoryCache()
+    backend = LocalPermissionBackend()
+    backend.cache = cache
+
+    permissions = await backend.load_permissions(db=db, account_id=create_test_admin.id, branch=default_branch)
+    assert permissions == await LocalPermissionBackend().load_permissions(
+        db=db, account_id=create_test_admin.id, branch=default_branch
+    )
+    assert await backend.load_permissions(db=db, account_id=create_test_admin.id, branch=default_branch) == permissions
+    assert len(await cache.list_keys(filter_pattern="permissions:account:*")) == 1
+
+    await invalidate_permission_cache(cache=cache)
+    cached_permissions, _ = await get_cached_permissions(
+        cache=cache, account_id=create_test_admin.id, branch_name=default_branch.name
+    )
+    assert cached_permissions is None
+    assert await backend.load_permissions(db=db, account_id=create_test_admin.id, branch=default_branch) == permissions
+
+
 async def test_has_permission_global(
     db: InfrahubDatabase,
     default_branch: Branch,
@@ -305,3 +333,29 @@ async def test_report_permission_object(
         )
         == PermissionDecisionFlag.DENY
     )
+
+
+class CachelessPermissionBackend(LocalPermissionBackend):
+    def __init__(self) -> None:
+        self.initialized = True
+
+
+def test_initialize_permission_backends_without_cache_argument(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        config.SETTINGS.main,
+        "permission_backends",
+        [
+            "infrahub.permissions.LocalPermissionBackend",
+            f"{CachelessPermissionBackend.__module__}.{CachelessPermissionBackend.__name__}",
+        ],
+    )
+    cache = MemoryCache()
+
+    local_backend, cacheless_backend = initialize_permission_backends(cache=cache)
+
+    assert isinstance(local_backend, LocalPermissionBackend)
+    assert local_backend.cache is cache
+    assert isinstance(cacheless_backend, CachelessPermissionBackend)
+    assert cacheless_backend.initialized
+    assert cacheless_backend.cache is cache
+    assert initialize_permission_backends()[1].cache is None
@@ -0,0 +1,66 @@
+from infrahub.core.account import GlobalPermission, ObjectPermission
+from infrahub.core.constants import GlobalPermissions, PermissionAction, PermissionDecision
+from infrahub.permissions.cache import (
+    get_cached_permissions,
+    invalidate_permission_cache,
+    set_cached_permissions,
+)
+from infrahub.permissions.constants import AssignedPermissions
+from tests.adapters.cache import MemoryCache
+
+PERMISSIONS: AssignedPermissions = {
+    "global_permissions": [
+        GlobalPermission(
+            id="1",
+            name="Super Admin",
+            action=GlobalPermissions.SUPER_ADMIN.value,
+            decision=PermissionDecision.ALLOW_ALL.value,
+        )
+    ],
+    "object_permissions": [
+        ObjectPermission(
+            id="2",
+            namespace="*",
+            name="*",
+            action=PermissionAction.ANY.value,
+            decision=PermissionDecision.ALLOW_ALL.value,
+        )
+    ],
+}
+
+
+async def test_cached_permissions():
+    cache = MemoryCache()
+
+    permissions, generation = await get_cached_permissions(cache=cache, account_id="account1", branch_name="main")
+    assert permissions is None
+
+    await set_cached_permissions(
+        cache=cache, account_id="account1", branch_name="main", permissions=PERMISSIONS, generation=generation
+    )
+    permissions, _ = await get_cached_permissions(cache=cache, account_id="account1", branch_name="main")
+    assert permissions == PERMISSIONS
+
+    permissions, _ = await get_cached_permissions(cache=cache, account_id="account1", branch_name="branch1")
+    assert permissions is None
+
+
+async def test_cached_permissions_invalidation():
+    cache = MemoryCache()
+
+    _, generation = await get_cached_permissions(cache=cache, account_id="account1", branch_name="main")
+    await set_cached_permissions(
+        cache=cache, account_id="account1", branch_name="main", permissions=PERMISSIONS, generation=generation
+    )
+    await invalidate_permission_cache(cache=cache)
+
+    permissions, new_generation = await get_cached_permissions(cache=cache, account_id="account1", branch_name="main")
+    assert permissions is None
+    assert new_generation != generation
+
+    # Permissions resolved before the invalidation are ignored even if they are stored after it
+    await set_cached_permissions(
+        cache=cache, account_id="account1", branch_name="main", permissions=PERMISSIONS, generation=generation
+    )
+    permissions, _ = await get_cached_permissions(cache=cache, account_id="account1", branch_name="main")
+    assert permissions is None
@@ -0,0 +1,77 @@
+import random
+
+from infrahub.core.timestamp import Timestamp
+from infrahub.pools.number import NumberPoolCache, NumberRanges
+
+
+def test_number_ranges_reserve():
+    free_ranges = NumberRanges(start=1, end=10, used=[1, 5, 10])
+
+    assert free_ranges.ranges == [(2, 4), (6, 9)]
+    assert free_ranges.available == 7
+    assert free_ranges.get_first() == [2]
+    assert free_ranges.get_first(count=5) == [2, 3, 4, 6, 7]
+    assert free_ranges.get_first(count=20) == [2, 3, 4, 6, 7, 8, 9]
+
+    assert free_ranges.reserve(number=2)
+    assert not free_ranges.reserve(number=2)
+    assert not free_ranges.reserve(number=11)
+    assert free_ranges.reserve(number=4)
+    assert free_ranges.reserve(number=3)
+
+    assert free_ranges.ranges == [(6, 9)]
+    assert free_ranges.available == 4
+    assert 6 in free_ranges
+    assert 5 not in free_ranges
+
+
+def test_number_ranges_release():
+    free_ranges = NumberRanges(start=1, end=10, used=range(1, 11))
+
+    assert free_ranges.ranges == []
+    assert free_ranges.get_first() == []
+
+    assert free_ranges.release(number=5)
+    assert not free_ranges.release(number=5)
+    assert not free_ranges.release(number=0)
+    assert free_ranges.release(number=7)
+    assert free_ranges.ranges == [(5, 5), (7, 7)]
+
+    assert free_ranges.release(number=6)
+    assert free_ranges.release(number=4)
+    assert free_ranges.release(number=8)
+    assert free_ranges.ranges == [(4, 8)]
+    assert free_ranges.available == 5
+
+
+def test_number_ranges_random():
+    rand = random.Random(42)
+    free_ranges = NumberRanges(start=100, end=1100)
+    free_set = set(range(100, 1101))
+
+    for _ in range(5000):
+        number = rand.randint(90, 1110)
+        if rand.random() < 0.6:
+            assert free_ranges.reserve(number=number) is (number in free_set)
+            free_set.discard(number)
+        else:
+            assert free_ranges.release(number=number) is (100 <= number <= 1100 and number not in free_set)
+            if 100 <= number <= 1100:
+                free_set.add(number)
+
+        assert free_ranges.available == len(free_set)
+
+    assert free_ranges.get_first(count=10) == sorted(free_set)[:10]
+    assert [number for start, end in free_ranges.ranges for number in range(start, end + 1)] == sorted(free_set)
+
+
+def test_number_pool_cache():
+    cache = NumberPoolCache()
+    cache.set(pool_id="pool1", free_ranges=NumberRanges(start=1, end=10), synced_at=Timestamp())
+
+    assert cache.get(pool_id="pool1", start=1, end=10)
+    assert cache.get(pool_id="pool2", start=1, end=10) is None
+
+    # The entry is dropped once the range of the pool has changed
+    assert cache.get(pool_id="pool1", start=1, end=20) is None
+    assert len(cache) == 0
@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+from infrahub import config
+from infrahub.auth import ApiKeyCache
+
+
+def test_api_key_cache_get_set():
+    cache = ApiKeyCache()
+    assert cache.get(token="token1") is None
+
+    cache.set(token="token1", account_id="account1", role="admin")
+    entry = cache.get(token="token1")
+    assert entry
+    assert entry.account_id == "account1"
+    assert entry.role == "admin"
+    assert "token1" not in cache._entries
+
+
+def test_api_key_cache_expiry():
+    cache = ApiKeyCache()
+    cache.set(token="token1", account_id="account1", role="admin")
+
+    with patch("infrahub.auth.time.monotonic", return_value=10**12):
+        assert cache.get(token="token1") is None
+    assert len(cache) == 0
+
+
+def test_api_key_cache_disabled(monkeypatch):
+    monkeypatch.setattr(config.SETTINGS.security, "api_key_cache_ttl", 0)
+    cache = ApiKeyCache()
+    cache.set(token="token1", account_id="account1", role="admin")
+    assert cache.get(token="token1") is None
+
+
+def test_api_key_cache_size(monkeypatch):
+    monkeypatch.setattr(config.SETTINGS.security, "api_key_cache_size", 2)
+    cache = ApiKeyCache()
+    cache.set(token="token1", account_id="account1", role="admin")
+    cache.set(token="token2", account_id="account2", role="admin")
+    assert cache.get(token="token1")
+
+    cache.set(token="token3", account_id="account3", role="admin")
+    assert len(cache) == 2
+    assert cache.get(token="token1")
+    assert cache.get(token="token2") is None
+    assert cache.get(token="token3")
+
+
+def test_api_key_cache_evict_account():
+    cache = ApiKeyCache()
+    cache.set(token="token1", account_id="account1", role="admin")
+    cache.set(token="token2", account_id="account1", role="read-only")
+    cache.set(token="token3", account_id="account2", role="admin")
+
+    cache.evict_account(account_id="account1")
+    assert len(cache) == 1
+    assert cache.get(token="token3")
+
+    cache.clear()
+    assert len(cache) == 0
@@ -1,7 +1,11 @@
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
+from neo4j import Bookmarks
 from neo4j.exceptions import ClientError
 
 from infrahub.database import InfrahubDatabase
+from infrahub.database.constants import DatabaseRoute
 
 # @pytest.fixture
 # async def dbs_for_test(db: InfrahubDatabase):
@@ -53,3 +57,67 @@ async def test_database_transaction(empty_database, db: InfrahubDatabase):
 
     results = await db.execute_query(query=query_books)
     assert len(results) == 2
+
+
+def test_database_read_replica_routing():
+    primary_driver = MagicMock()
+    replica_driver = MagicMock()
+
+    db = InfrahubDatabase(driver=primary_driver, read_drivers=[replica_driver])
+    assert db.has_read_replicas
+    assert db.route == DatabaseRoute.PRIMARY
+
+    write_session = db.start_session()
+    assert write_session.route == DatabaseRoute.PRIMARY
+    read_session = write_session.start_session(read_only=True)
+    assert read_session.route == DatabaseRoute.REPLICA
+    assert read_session.is_read_only
+    # Nested sessions open in write mode unless they explicitly ask for a read-only session
+    assert read_session.start_session().route == DatabaseRoute.PRIMARY
+    assert read_session.start_session(read_only=read_session.is_read_only).route == DatabaseRoute.REPLICA
+    assert read_session.start_transaction().route == DatabaseRoute.REPLICA
+
+    read_session._open_session()
+    replica_driver.session.assert_called_once()
+    assert replica_driver.session.call_args.kwargs["bookmarks"] is None
+    primary_driver.session.assert_not_called()
+
+    write_session._open_session()
+    primary_driver.session.assert_called_once()
+    assert primary_driver.session.call_args.kwargs["bookmarks"] is None
+
+
+def test_database_without_read_replica():
+    primary_driver = MagicMock()
+
+    db = InfrahubDatabase(driver=primary_driver)
+    assert not db.has_read_replicas
+    read_session = db.start_session(read_only=True)
+    assert read_session.route == DatabaseRoute.PRIMARY
+
+    read_session._open_session()
+    primary_driver.session.assert_called_once()
+    assert primary_driver.session.call_args.kwargs["bookmarks"] is None
+
+
+async def test_database_read_session_bookmarks():
+    primary_driver = MagicMock()
+    replica_driver = MagicMock()
+    write_db_session = MagicMock()
+    write_db_session.begin_transaction = AsyncMock()
+    write_db_session.last_bookmarks = AsyncMock(return_value=Bookmarks.from_raw_values(["bookmark1"]))
+    write_db_session.close = AsyncMock()
+    primary_driver.session.return_value = write_db_session
+
+    db = InfrahubDatabase(driver=primary_driver, read_drivers=[replica_driver])
+    request_db = db.start_session()
+    async with request_db.start_transaction() as dbt:
+        assert dbt.is_transaction
+
+    # A read-only session of the same request waits for the transaction committed before
+    request_db.start_session(read_only=True)._open_session()
+    assert replica_driver.session.call_args.kwargs["bookmarks"].raw_values == frozenset(["bookmark1"])
+
+    # The sessions of another request don't share the bookmarks
+    db.start_session(read_only=True)._open_session()
+    assert replica_driver.session.call_args.kwargs["bookmarks"] is None